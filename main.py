@@ -61,6 +61,12 @@ def parse_arguments() -> argparse.Namespace:
         help="로그 레벨 설정"
     )
 
+    parser.add_argument(
+        "--profile-events",
+        action="store_true",
+        help="이벤트 버스 프로파일링 (종료 시 구독자별 실행 시간 보고서 출력)"
+    )
+
     parser.add_argument(
         "--config",
         type=str,
@@ -142,6 +148,12 @@ def main() -> int:
             config.set("development.enabled", False)  # 개발 모드 표시 없음
             config.set("development.debug_mode", False)  # 디버그 모드 표시 없음
 
+        if args.profile_events:
+            config.set("development.profile_events", True)
+
+        if config.get("development.profile_events", False):
+            event_bus.enable_profiling(report_on_exit=True)
+
         # 로거 초기화 (먼저 해야 pygame 초기화에서 사용 가능)
         logger = get_logger(Loggers.SYSTEM)
 
@@ -0,0 +1,83 @@
+"""몬테카를로 밸런스 스윕 스크립트
+
+직업 × 층 × 난이도 조합마다 시드 고정 헤드리스 전투를 대량으로 실행하고
+승률, 처치 턴 수, 피해량 분포, BREAK 빈도를 집계합니다.
+
+사용 예:
+    python scripts/run_balance_sweep.py --battles 50 --floors 1 5 10
+    python scripts/run_balance_sweep.py --jobs warrior archmage --composition mixed
+"""
+
+import sys
+import os
+import argparse
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.combat.balance_sweep import (
+    build_sweep,
+    run_sweep,
+    COMPOSITION_MONO,
+    COMPOSITION_MIXED,
+)
+
+
+def print_summary(summary):
+    """집계 결과 표 출력"""
+    print("=" * 106)
+    print(f"{'직업':16s} {'층':>3s} {'난이도':6s} {'전투':>5s} {'실패':>5s} {'승률':>7s} "
+          f"{'처치턴':>7s} {'타격평균':>9s} {'타격P90':>9s} {'BRK(아군)':>10s} {'BRK(적)':>8s}")
+    print("=" * 106)
+
+    for i in range(len(summary["job"])):
+        print(
+            f"{summary['job'][i]:16s} {summary['floor'][i]:3d} {summary['difficulty'][i]:6s} "
+            f"{summary['battles'][i]:5d} {summary['failures'][i]:5d} {summary['win_rate'][i] * 100:6.1f}% "
+            f"{summary['turns_mean'][i]:7.1f} {summary['hit_mean'][i]:9.1f} {summary['hit_p90'][i]:9.1f} "
+            f"{summary['ally_breaks_mean'][i]:10.2f} {summary['enemy_breaks_mean'][i]:8.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="몬테카를로 밸런스 스윕")
+    parser.add_argument("--jobs", nargs="*", help="대상 직업 ID (기본: 전체)")
+    parser.add_argument("--floors", nargs="*", type=int, default=[1, 5, 10], help="층 번호")
+    parser.add_argument("--difficulties", nargs="*", help="난이도 (기본: 전체)")
+    parser.add_argument("--battles", type=int, default=20, help="조합당 전투 수")
+    parser.add_argument("--party-size", type=int, default=4, help="파티 인원")
+    parser.add_argument("--composition", choices=[COMPOSITION_MONO, COMPOSITION_MIXED],
+                        default=COMPOSITION_MONO, help="파티 구성 모드")
+    parser.add_argument("--level", type=int, help="아군 레벨 (기본: 층 번호)")
+    parser.add_argument("--seed", type=int, default=0, help="시드 시작값")
+    parser.add_argument("--workers", type=int, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--output", default="balance_sweep.npz", help="전투별 결과 파일 (.npz)")
+    args = parser.parse_args()
+
+    specs = build_sweep(
+        jobs=args.jobs,
+        floors=args.floors,
+        difficulties=args.difficulties,
+        battles_per_cell=args.battles,
+        party_size=args.party_size,
+        composition=args.composition,
+        level=args.level,
+        base_seed=args.seed
+    )
+    print(f"전투 {len(specs)}회 실행 중...")
+
+    results = run_sweep(specs, workers=args.workers)
+
+    summary_path = os.path.splitext(args.output)[0] + "_summary.npz"
+    results.save(args.output)
+    results.save_summary(summary_path)
+
+    print_summary(results.summarize())
+    print(f"\n전투별 결과: {args.output}")
+    print(f"집계 결과: {summary_path}")
+
+    if results.failure_count:
+        print(f"\n예외로 끝난 전투 {results.failure_count}회 (error 열 참고, 집계에서 제외)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,5 +3,9 @@ AI 시스템
 """
 
 from src.ai.enemy_ai import EnemyAI, BossAI, SephirothAI, create_ai_for_enemy
+from src.ai.mcts_ai import MCTSBossAI, SearchStats, get_search_worker
 
-__all__ = ["EnemyAI", "BossAI", "SephirothAI", "create_ai_for_enemy"]
+__all__ = [
+    "EnemyAI", "BossAI", "SephirothAI", "create_ai_for_enemy",
+    "MCTSBossAI", "SearchStats", "get_search_worker",
+]
@@ -5,10 +5,11 @@
 """
 
 from typing import List, Optional, Any
-import random
 
+from src.combat.battlefield_analysis import BattlefieldAnalysis, SideAnalysis, agro_hp_percent, is_support_job
 from src.combat.enemy_skills import EnemySkill, SkillTargetType
 from src.core.logger import get_logger
+from src.core.rng import RngStreams, get_rng
 
 
 logger = get_logger("enemy_ai")
@@ -29,6 +30,7 @@ class EnemyAI:
         """
         self.enemy = enemy
         self.difficulty = difficulty
+        self.rng = get_rng(RngStreams.ENEMY_AI)
 
         # 난이도별 스킬 사용 확률 조정 (확률을 적당히 낮춤)
         self.skill_use_multiplier = {
@@ -45,10 +47,14 @@ class EnemyAI:
             "hell": 1.5
         }.get(difficulty, 0.9)  # 기본값 0.9배
 
+        # 공유 전장 분석 (CombatManager.get_battlefield_analysis, 없으면 직접 계산)
+        self.battlefield: Optional[BattlefieldAnalysis] = None
+
     def decide_action(
         self,
         allies: List[Any],
-        enemies: List[Any]
+        enemies: List[Any],
+        analysis: Optional[BattlefieldAnalysis] = None
     ) -> dict:
         """
         행동 결정
@@ -56,6 +62,7 @@ class EnemyAI:
         Args:
             allies: 아군 목록 (적 입장에서)
             enemies: 적군 목록 (플레이어 파티)
+            analysis: 공유 전장 분석 (같은 틱의 다른 적/봇과 공유)
 
         Returns:
             행동 정보 딕셔너리
@@ -65,6 +72,8 @@ class EnemyAI:
                 "target": target_character
             }
         """
+        self.battlefield = analysis
+
         # 스킬이 없으면 일반 공격
         if not hasattr(self.enemy, 'skills') or not self.enemy.skills:
             return self._decide_basic_attack(enemies)
@@ -94,7 +103,7 @@ class EnemyAI:
             adjusted_probability = selected_skill.use_probability * self.skill_use_multiplier
             # 최소 확률 보장 (스킬이 있으면 최소 12% 확률로 사용)
             adjusted_probability = max(adjusted_probability, 0.12)
-            if random.random() < min(adjusted_probability, 1.0):
+            if self.rng.random() < min(adjusted_probability, 1.0):
                 # 대상 선택
                 target = self._select_target(selected_skill, allies, enemies)
                 if target:
@@ -163,6 +172,11 @@ class EnemyAI:
             # 계산 실패 시 대략적인 추정
             return max(5, int(brv_points * 0.15))
 
+    def _side_analysis(self, members: List[Any]) -> SideAnalysis:
+        """진영 분석 (공유 분석에 있으면 재사용, 없으면 직접 계산)"""
+        side = self.battlefield.side(members) if self.battlefield is not None else None
+        return side if side is not None else SideAnalysis(members)
+
     def _analyze_situation(
         self,
         allies: List[Any],
@@ -180,41 +194,17 @@ class EnemyAI:
         # 자신의 BRV 정보 (절대값만 사용)
         self_brv = getattr(self.enemy, 'current_brv', 0)
 
-        # 아군 평균 HP
-        ally_hp_total = sum(getattr(a, 'current_hp', 0) for a in allies if getattr(a, 'is_alive', True))
-        ally_hp_avg = ally_hp_total / len(allies) if allies else 0
-
-        # 적군 평균 HP
-        enemy_hp_total = sum(getattr(e, 'current_hp', 0) for e in enemies if getattr(e, 'is_alive', True))
-        enemy_hp_avg = enemy_hp_total / len(enemies) if enemies else 0
-
-        # 적군 평균 BRV
-        enemy_brv_total = sum(getattr(e, 'current_brv', 0) for e in enemies if getattr(e, 'is_alive', True))
-        enemy_brv_avg = enemy_brv_total / len(enemies) if enemies else 0
-
-        # 생존한 아군/적군 수
-        alive_allies = sum(1 for a in allies if getattr(a, 'is_alive', True))
-        alive_enemies = sum(1 for e in enemies if getattr(e, 'is_alive', True))
-
-        # 가장 약한 적 (HP 기준)
-        weakest_enemy = None
-        lowest_hp = float('inf')
-        for enemy in enemies:
-            if getattr(enemy, 'is_alive', True):
-                hp = getattr(enemy, 'current_hp', 0)
-                if hp < lowest_hp:
-                    lowest_hp = hp
-                    weakest_enemy = enemy
-
-        # 가장 강한 적 (HP 기준)
-        strongest_enemy = None
-        highest_hp = 0
-        for enemy in enemies:
-            if getattr(enemy, 'is_alive', True):
-                hp = getattr(enemy, 'current_hp', 0)
-                if hp > highest_hp:
-                    highest_hp = hp
-                    strongest_enemy = enemy
+        # 진영별 평균 HP/BRV, 생존 수, 최약/최강 대상 (공유 분석 사용)
+        ally_side = self._side_analysis(allies)
+        enemy_side = self._side_analysis(enemies)
+
+        ally_hp_avg = ally_side.hp_avg
+        enemy_hp_avg = enemy_side.hp_avg
+        enemy_brv_avg = enemy_side.brv_avg
+        alive_allies = ally_side.alive_count
+        alive_enemies = enemy_side.alive_count
+        weakest_enemy = enemy_side.weakest
+        strongest_enemy = enemy_side.strongest
 
         # 현재 BRV로 각 적에게 줄 수 있는 예상 데미지 계산
         can_deal_meaningful_damage = False
@@ -222,19 +212,18 @@ class EnemyAI:
         max_estimated_damage = 0
         
         if self_brv > 0:
-            for enemy in enemies:
-                if getattr(enemy, 'is_alive', True):
-                    enemy_hp = getattr(enemy, 'current_hp', 0)
-                    if enemy_hp > 0:
-                        estimated_damage = self._estimate_hp_damage(enemy, self_brv)
-                        
-                        # 의미있는 데미지인지 판단 (적 HP의 최소 5% 이상, 또는 최소 50 이상)
-                        damage_threshold = max(50, enemy_hp * 0.05)
-                        if estimated_damage >= damage_threshold:
-                            can_deal_meaningful_damage = True
-                            if estimated_damage > max_estimated_damage:
-                                max_estimated_damage = estimated_damage
-                                best_target_for_hp_attack = enemy
+            for enemy in enemy_side.alive:
+                enemy_hp = getattr(enemy, 'current_hp', 0)
+                if enemy_hp > 0:
+                    estimated_damage = self._estimate_hp_damage(enemy, self_brv)
+
+                    # 의미있는 데미지인지 판단 (적 HP의 최소 5% 이상, 또는 최소 50 이상)
+                    damage_threshold = max(50, enemy_hp * 0.05)
+                    if estimated_damage >= damage_threshold:
+                        can_deal_meaningful_damage = True
+                        if estimated_damage > max_estimated_damage:
+                            max_estimated_damage = estimated_damage
+                            best_target_for_hp_attack = enemy
 
         return {
             "self_hp_percent": self_hp_percent,
@@ -333,14 +322,15 @@ class EnemyAI:
 
         # 가중치 기반 랜덤 선택
         skills, scores = zip(*skill_scores)
-        selected = random.choices(skills, weights=scores, k=1)[0]
+        selected = self.rng.choices(skills, weights=scores, k=1)[0]
 
         return selected
 
     def _calculate_agro_weight(
         self,
         enemy: Any,
-        skill: Optional[EnemySkill] = None
+        skill: Optional[EnemySkill] = None,
+        side: Optional[SideAnalysis] = None
     ) -> int:
         """
         적의 어그로 가중치 계산 (난이도별 지능 적용)
@@ -348,6 +338,7 @@ class EnemyAI:
         Args:
             enemy: 적 캐릭터
             skill: 사용할 스킬 (선택사항)
+            side: 대상 진영 분석 (있으면 HP 비율/힐러 여부 재사용)
             
         Returns:
             어그로 가중치
@@ -359,23 +350,27 @@ class EnemyAI:
         
         agro = enemy._agro_value
         base_agro = agro
+
+        # 힐러/서포터 여부, HP 비율 (공유 분석 우선)
+        if side is not None and id(enemy) in side.hp_percent:
+            is_support = side.is_support[id(enemy)]
+            hp_percent = side.hp_percent[id(enemy)]
+        else:
+            is_support = is_support_job(enemy)
+            hp_percent = agro_hp_percent(enemy)
         
         # 난이도별 지능 적용
         if self.difficulty in ["평온", "easy"]:
             # 평온: 기본 어그로만 사용, 랜덤성 높음
-            job_name = getattr(enemy, 'job_name', '').lower()
-            if any(keyword in job_name for keyword in ['heal', '힐', 'support', '지원', 'white', '백']):
+            if is_support:
                 agro += 10  # 힐러는 어그로 +10
-            hp_percent = getattr(enemy, 'current_hp', 1000) / getattr(enemy, 'max_hp', 1000) if getattr(enemy, 'max_hp', 1000) > 0 else 1.0
             if hp_percent < 0.3:
                 agro += 10  # HP 30% 이하면 어그로 +10
 
         elif self.difficulty in ["보통", "normal"]:
             # 보통: 기본 어그로 시스템
-            job_name = getattr(enemy, 'job_name', '').lower()
-            if any(keyword in job_name for keyword in ['heal', '힐', 'support', '지원', 'white', '백']):
+            if is_support:
                 agro += 30  # 힐러는 어그로 +30
-            hp_percent = getattr(enemy, 'current_hp', 1000) / getattr(enemy, 'max_hp', 1000) if getattr(enemy, 'max_hp', 1000) > 0 else 1.0
             if hp_percent < 0.3:
                 agro += 40  # HP 30% 이하면 어그로 +40
             elif hp_percent < 0.5:
@@ -383,11 +378,9 @@ class EnemyAI:
 
         elif self.difficulty in ["도전", "hard"]:
             # 도전: 더 지능적으로 타겟팅
-            job_name = getattr(enemy, 'job_name', '').lower()
-            hp_percent = getattr(enemy, 'current_hp', 1000) / getattr(enemy, 'max_hp', 1000) if getattr(enemy, 'max_hp', 1000) > 0 else 1.0
 
             # 힐러/서포터 매우 우선 (어그로 +50)
-            if any(keyword in job_name for keyword in ['heal', '힐', 'support', '지원', 'white', '백']):
+            if is_support:
                 agro += 50
 
             # 약한 적 우선 (어그로 +30~70)
@@ -407,11 +400,9 @@ class EnemyAI:
 
         elif self.difficulty in ["악몽", "insane"]:
             # 악몽: 매우 지능적으로 타겟팅
-            job_name = getattr(enemy, 'job_name', '').lower()
-            hp_percent = getattr(enemy, 'current_hp', 1000) / getattr(enemy, 'max_hp', 1000) if getattr(enemy, 'max_hp', 1000) > 0 else 1.0
 
             # 힐러/서포터 최우선 (어그로 +80)
-            if any(keyword in job_name for keyword in ['heal', '힐', 'support', '지원', 'white', '백']):
+            if is_support:
                 agro += 80
 
             # 약한 적 매우 우선 (어그로 +50~100)
@@ -436,11 +427,9 @@ class EnemyAI:
 
         elif self.difficulty in ["지옥", "hell"]:
             # 지옥: 완벽한 최적화 타겟팅
-            job_name = getattr(enemy, 'job_name', '').lower()
-            hp_percent = getattr(enemy, 'current_hp', 1000) / getattr(enemy, 'max_hp', 1000) if getattr(enemy, 'max_hp', 1000) > 0 else 1.0
 
             # 힐러/서포터 절대 우선 (어그로 +100)
-            if any(keyword in job_name for keyword in ['heal', '힐', 'support', '지원', 'white', '백']):
+            if is_support:
                 agro += 100
 
             # 약한 적 최우선 (어그로 +60~120)
@@ -465,10 +454,8 @@ class EnemyAI:
 
         else:
             # 기본값: 보통과 동일
-            job_name = getattr(enemy, 'job_name', '').lower()
-            if any(keyword in job_name for keyword in ['heal', '힐', 'support', '지원', 'white', '백']):
+            if is_support:
                 agro += 30
-            hp_percent = getattr(enemy, 'current_hp', 1000) / getattr(enemy, 'max_hp', 1000) if getattr(enemy, 'max_hp', 1000) > 0 else 1.0
             if hp_percent < 0.3:
                 agro += 40
             elif hp_percent < 0.5:
@@ -514,7 +501,8 @@ class EnemyAI:
 
         elif skill.target_type == SkillTargetType.SINGLE_ENEMY:
             # 단일 적 선택 (난이도별 어그로 시스템 사용)
-            alive_enemies = [e for e in enemies if getattr(e, 'is_alive', True)]
+            side = self._side_analysis(enemies)
+            alive_enemies = side.alive
             if not alive_enemies:
                 return None
 
@@ -525,37 +513,37 @@ class EnemyAI:
                 best_score = -1
 
                 for enemy in alive_enemies:
-                    agro_weight = self._calculate_agro_weight(enemy, skill)
+                    agro_weight = self._calculate_agro_weight(enemy, skill, side)
                     if agro_weight > best_score:
                         best_score = agro_weight
                         best_target = enemy
 
                 if best_target:
                     # 선택된 타겟의 어그로 증가
-                    best_target._agro_value = getattr(best_target, '_agro_value', 50) + random.randint(20, 30)
+                    best_target._agro_value = getattr(best_target, '_agro_value', 50) + self.rng.randint(20, 30)
                     return best_target
-                return random.choice(alive_enemies)
+                return self.rng.choice(alive_enemies)
 
             elif self.difficulty in ["평온", "easy"]:
                 # 평온: 높은 랜덤성 (60% 확률로 랜덤, 40% 확률로 어그로 기반)
-                if random.random() < 0.6:
-                    selected = random.choice(alive_enemies)
+                if self.rng.random() < 0.6:
+                    selected = self.rng.choice(alive_enemies)
                 else:
                     # 어그로 기반 선택
-                    enemy_weights = [self._calculate_agro_weight(e, skill) for e in alive_enemies]
+                    enemy_weights = [self._calculate_agro_weight(e, skill, side) for e in alive_enemies]
                     min_weight = max(10, min(enemy_weights) * 0.8)  # 매우 균등하게
                     enemy_weights = [max(w, min_weight) for w in enemy_weights]
-                    selected = random.choices(alive_enemies, weights=enemy_weights, k=1)[0]
+                    selected = self.rng.choices(alive_enemies, weights=enemy_weights, k=1)[0]
 
                 # 선택된 타겟의 어그로 증가 (적게 증가)
-                selected._agro_value = getattr(selected, '_agro_value', 50) + random.randint(3, 10)
+                selected._agro_value = getattr(selected, '_agro_value', 50) + self.rng.randint(3, 10)
                 return selected
 
             else:
                 # 보통, 도전, 악몽: 어그로 가중치 기반 랜덤 선택
                 enemy_weights = []
                 for enemy in alive_enemies:
-                    agro_weight = self._calculate_agro_weight(enemy, skill)
+                    agro_weight = self._calculate_agro_weight(enemy, skill, side)
                     enemy_weights.append(agro_weight)
 
                 # 가중치 기반 랜덤 선택
@@ -568,21 +556,21 @@ class EnemyAI:
                     min_weight = max(10, min(enemy_weights) * 0.7)  # 보통: 균등
 
                 enemy_weights = [max(w, min_weight) for w in enemy_weights]
-                selected = random.choices(alive_enemies, weights=enemy_weights, k=1)[0]
+                selected = self.rng.choices(alive_enemies, weights=enemy_weights, k=1)[0]
 
                 # 선택된 타겟의 어그로 증가
                 if self.difficulty in ["악몽", "insane"]:
-                    selected._agro_value = getattr(selected, '_agro_value', 50) + random.randint(15, 25)
+                    selected._agro_value = getattr(selected, '_agro_value', 50) + self.rng.randint(15, 25)
                 elif self.difficulty in ["도전", "hard"]:
-                    selected._agro_value = getattr(selected, '_agro_value', 50) + random.randint(12, 20)
+                    selected._agro_value = getattr(selected, '_agro_value', 50) + self.rng.randint(12, 20)
                 else:
-                    selected._agro_value = getattr(selected, '_agro_value', 50) + random.randint(8, 15)
+                    selected._agro_value = getattr(selected, '_agro_value', 50) + self.rng.randint(8, 15)
 
                 return selected
 
         elif skill.target_type == SkillTargetType.RANDOM_ENEMY:
             alive_enemies = [e for e in enemies if getattr(e, 'is_alive', True)]
-            return random.choice(alive_enemies) if alive_enemies else None
+            return self.rng.choice(alive_enemies) if alive_enemies else None
 
         return None
 
@@ -599,7 +587,8 @@ class EnemyAI:
         Returns:
             공격 행동 정보
         """
-        alive_enemies = [e for e in enemies if getattr(e, 'is_alive', True)]
+        side = self._side_analysis(enemies)
+        alive_enemies = side.alive
 
         if not alive_enemies:
             return {"type": "defend", "target": None}
@@ -619,7 +608,7 @@ class EnemyAI:
 
                 for enemy in alive_enemies:
                     try:
-                        agro_weight = self._calculate_agro_weight(enemy, None)
+                        agro_weight = self._calculate_agro_weight(enemy, None, side)
                         if agro_weight > best_score:
                             best_score = agro_weight
                             best_target = enemy
@@ -629,34 +618,34 @@ class EnemyAI:
 
                 if best_target:
                     target = best_target
-                    target._agro_value = getattr(target, '_agro_value', 50) + random.randint(20, 30)
+                    target._agro_value = getattr(target, '_agro_value', 50) + self.rng.randint(20, 30)
                 else:
-                    target = random.choice(alive_enemies)
+                    target = self.rng.choice(alive_enemies)
 
             elif self.difficulty in ["평온", "easy"]:
                 # 평온: 높은 랜덤성 (60% 확률로 랜덤, 40% 확률로 어그로 기반)
-                if random.random() < 0.6:
-                    target = random.choice(alive_enemies)
+                if self.rng.random() < 0.6:
+                    target = self.rng.choice(alive_enemies)
                 else:
                     try:
-                        enemy_weights = [self._calculate_agro_weight(e, None) for e in alive_enemies]
+                        enemy_weights = [self._calculate_agro_weight(e, None, side) for e in alive_enemies]
                         if enemy_weights and min(enemy_weights) > 0:
                             min_weight = max(10, min(enemy_weights) * 0.8)
                             enemy_weights = [max(w, min_weight) for w in enemy_weights]
-                            target = random.choices(alive_enemies, weights=enemy_weights, k=1)[0]
+                            target = self.rng.choices(alive_enemies, weights=enemy_weights, k=1)[0]
                         else:
-                            target = random.choice(alive_enemies)
+                            target = self.rng.choice(alive_enemies)
                     except Exception as e:
                         logger.warning(f"어그로 기반 선택 오류: {e}")
-                        target = random.choice(alive_enemies)
+                        target = self.rng.choice(alive_enemies)
 
                 if target:
-                    target._agro_value = getattr(target, '_agro_value', 50) + random.randint(3, 10)
+                    target._agro_value = getattr(target, '_agro_value', 50) + self.rng.randint(3, 10)
 
             else:
                 # 보통, 도전, 악몽: 어그로 가중치 기반 랜덤 선택
                 try:
-                    enemy_weights = [self._calculate_agro_weight(e, None) for e in alive_enemies]
+                    enemy_weights = [self._calculate_agro_weight(e, None, side) for e in alive_enemies]
 
                     if enemy_weights and min(enemy_weights) > 0:
                         # 악몽은 매우 편중, 도전은 편중, 보통은 균등
@@ -668,28 +657,28 @@ class EnemyAI:
                             min_weight = max(10, min(enemy_weights) * 0.7)
 
                         enemy_weights = [max(w, min_weight) for w in enemy_weights]
-                        target = random.choices(alive_enemies, weights=enemy_weights, k=1)[0]
+                        target = self.rng.choices(alive_enemies, weights=enemy_weights, k=1)[0]
                     else:
-                        target = random.choice(alive_enemies)
+                        target = self.rng.choice(alive_enemies)
 
                     # 선택된 타겟의 어그로 증가
                     if target:
                         if self.difficulty in ["악몽", "insane"]:
-                            target._agro_value = getattr(target, '_agro_value', 50) + random.randint(15, 25)
+                            target._agro_value = getattr(target, '_agro_value', 50) + self.rng.randint(15, 25)
                         elif self.difficulty in ["도전", "hard"]:
-                            target._agro_value = getattr(target, '_agro_value', 50) + random.randint(12, 20)
+                            target._agro_value = getattr(target, '_agro_value', 50) + self.rng.randint(12, 20)
                         else:
-                            target._agro_value = getattr(target, '_agro_value', 50) + random.randint(8, 15)
+                            target._agro_value = getattr(target, '_agro_value', 50) + self.rng.randint(8, 15)
                 except Exception as e:
                     logger.warning(f"어그로 기반 선택 오류: {e}")
-                    target = random.choice(alive_enemies)
+                    target = self.rng.choice(alive_enemies)
         except Exception as e:
             logger.error(f"타겟 선택 오류: {e}")
-            target = random.choice(alive_enemies) if alive_enemies else None
+            target = self.rng.choice(alive_enemies) if alive_enemies else None
         
         # 타겟이 선택되지 않았으면 안전장치
         if not target:
-            target = random.choice(alive_enemies) if alive_enemies else None
+            target = self.rng.choice(alive_enemies) if alive_enemies else None
             if not target:
                 return {"type": "defend", "target": None}
 
@@ -719,7 +708,7 @@ class EnemyAI:
                     if estimated_damage >= target_hp * 0.1:
                         hp_attack_probability = min(0.95, hp_attack_probability + 0.1)
                     
-                    if random.random() < hp_attack_probability:
+                    if self.rng.random() < hp_attack_probability:
                         return {
                             "type": "hp_attack",
                             "target": target
@@ -727,7 +716,7 @@ class EnemyAI:
                 
                 # 데미지가 작더라도 BRV가 충분히 쌓였으면 (200 이상) 일정 확률로 HP 공격
                 elif current_brv >= 200:
-                    if random.random() < 0.4:  # 40% 확률
+                    if self.rng.random() < 0.4:  # 40% 확률
                         return {
                             "type": "hp_attack",
                             "target": target
@@ -805,7 +794,8 @@ class SephirothAI(BossAI):
     def decide_action(
         self,
         allies: List[Any],
-        enemies: List[Any]
+        enemies: List[Any],
+        analysis: Optional[BattlefieldAnalysis] = None
     ) -> dict:
         """
         세피로스의 행동 결정
@@ -835,7 +825,7 @@ class SephirothAI(BossAI):
                     }
 
         # 일반 결정 로직
-        return super().decide_action(allies, enemies)
+        return super().decide_action(allies, enemies, analysis)
 
 
 def create_ai_for_enemy(enemy: Any, game_difficulty: str = None) -> EnemyAI:
@@ -855,8 +845,12 @@ def create_ai_for_enemy(enemy: Any, game_difficulty: str = None) -> EnemyAI:
     if 'sephiroth' in enemy_name or '세피로스' in enemy_name:
         return SephirothAI(enemy)
 
-    # 보스
+    # 보스 (ai.mcts.enabled이면 MCTS 탐색 AI)
     if 'boss' in enemy_name or '보스' in enemy_name or 'dragon' in enemy_name or '드래곤' in enemy_name:
+        from src.core.config import get_config
+        if get_config().get("ai.mcts.enabled", False):
+            from src.ai.mcts_ai import MCTSBossAI
+            return MCTSBossAI(enemy, game_difficulty)
         return BossAI(enemy)
 
     # 일반 적은 게임 난이도 사용 (없으면 "도전" 기본값)
@@ -0,0 +1,920 @@
+"""
+MCTS 보스 AI - 시간 예산 기반 몬테카를로 트리 탐색
+
+보스의 행동(BRV/HP 공격, EnemySkill × 대상)을 UCT로 탐색하여 결정합니다.
+
+- 탐색은 실제 전투 객체를 건드리지 않습니다. 메인 스레드에서 값만 복사한
+  SearchState(HP/BRV/ATB/쿨다운 등)를 만들고 작업 스레드는 그 사본만 시뮬레이션합니다.
+  (CombatUI가 같은 객체를 렌더링하므로 실제 객체를 스레드에서 바꾸면 안 됨)
+- 플레이어가 행동을 고르는 동안 prefetch로 미리 탐색하고, 보스 ATB가 차면
+  결과를 꺼내 대상 인덱스를 실제 전투원에 다시 매핑합니다.
+- 모델은 BRV 탈취/BREAK/HP 공격/INT BRV 회복/스킬 계수를 따르지만
+  명중 판정, 특성, 세부 상태이상 효과는 근사합니다.
+"""
+
+import math
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.ai.enemy_ai import BossAI
+from src.combat.battlefield_analysis import BattlefieldAnalysis
+from src.combat.enemy_skills import SkillTargetType
+from src.core.config import get_config
+from src.core.logger import get_logger
+
+
+logger = get_logger("mcts_ai")
+
+
+# 행동: (종류, 스킬 인덱스, 대상 유닛 인덱스) - 기본 공격은 스킬 -1, 전체 대상은 대상 -1
+Action = Tuple[str, int, int]
+
+PARTY_SIDE = 0
+BOSS_SIDE = 1
+
+# 행동 불가 상태이상 (적 스킬 실행과 같이 최대 2턴)
+_DISABLE_STATUSES = frozenset({"stun", "sleep", "freeze", "paralyze", "petrify", "time_stop"})
+# 지속 피해 상태이상 (턴 시작마다 최대 HP 비율 피해)
+_DOT_STATUSES = frozenset({"poison", "burn", "bleed", "bleeding", "corrupt", "curse"})
+_DOT_RATE = 0.05
+
+# 버프/디버프 이름 → 공격/방어 보정 (한 번에 한 보정만 유지)
+_ATTACK_KEYWORDS = ("attack", "strength", "magic", "all_stats")
+_DEFENSE_KEYWORDS = ("defense", "vitality", "all_stats")
+_MODIFIER_TURNS = 3
+
+# 난이도별 탐색 예산 기본값 (ms)
+_DEFAULT_BUDGET_MS = {"평온": 10, "보통": 20, "도전": 40, "악몽": 80, "지옥": 150}
+
+
+@dataclass
+class SearchRules:
+    """탐색 모델이 사용하는 전투 수치 (DamageCalculator/ATB 설정에서 복사)"""
+    brv_multiplier: float = 75.0
+    hp_multiplier: float = 0.15
+    critical_chance: float = 0.1
+    critical_multiplier: float = 1.5
+    break_bonus: float = 1.5
+    level_scaling: float = 0.3
+    threshold: float = 1000.0
+
+    @classmethod
+    def from_runtime(cls, atb: Any = None) -> "SearchRules":
+        """현재 전투 설정으로 생성 (메인 스레드에서 호출)"""
+        from src.combat.damage_calculator import get_damage_calculator
+
+        calc = get_damage_calculator()
+        return cls(
+            brv_multiplier=calc.brv_damage_multiplier,
+            hp_multiplier=calc.hp_damage_multiplier,
+            critical_chance=calc.critical_base_chance,
+            critical_multiplier=calc.critical_multiplier,
+            break_bonus=calc.break_damage_bonus,
+            level_scaling=calc.level_scaling_per_level,
+            threshold=getattr(atb, "threshold", 1000),
+        )
+
+
+@dataclass
+class SearchStats:
+    """탐색 통계 (난이도별 예산 조정용)"""
+    budget_ms: float = 0.0
+    elapsed_ms: float = 0.0
+    rollouts: int = 0
+    nodes: int = 0
+    max_depth: int = 0
+    simulated_actions: int = 0
+    prefetched: bool = False
+
+    @property
+    def rollouts_per_ms(self) -> float:
+        return self.rollouts / self.elapsed_ms if self.elapsed_ms > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "budget_ms": self.budget_ms,
+            "elapsed_ms": round(self.elapsed_ms, 2),
+            "rollouts": self.rollouts,
+            "nodes": self.nodes,
+            "max_depth": self.max_depth,
+            "simulated_actions": self.simulated_actions,
+            "prefetched": self.prefetched,
+        }
+
+
+@dataclass
+class SearchResult:
+    """탐색 결과 (루트 행동별 방문 수/평균 가치, 방문 수 내림차순)"""
+    actions: List[Tuple[Action, int, float]] = field(default_factory=list)
+    stats: SearchStats = field(default_factory=SearchStats)
+    state_key: Tuple = ()
+
+
+@dataclass(frozen=True)
+class _SkillModel:
+    """EnemySkill 값 사본"""
+    target_type: SkillTargetType
+    mp_cost: int
+    hp_cost: int
+    damage: int
+    damage_multiplier: float
+    is_magical: bool
+    brv_damage: int
+    hp_attack: bool
+    heal_amount: int
+    disable_turns: int
+    dot_turns: int
+    buff_attack: bool
+    buff_defense: bool
+    debuff_attack: bool
+    debuff_defense: bool
+    cooldown: int
+    min_hp_percent: float
+    max_hp_percent: float
+
+    @classmethod
+    def from_skill(cls, skill: Any) -> "_SkillModel":
+        statuses = [str(s).lower() for s in skill.status_effects]
+        buffs = [str(k).lower() for k in skill.buff_stats]
+        debuffs = [str(k).lower() for k in skill.debuff_stats]
+        disable = any(s in _DISABLE_STATUSES for s in statuses)
+        dot = any(s in _DOT_STATUSES for s in statuses)
+        return cls(
+            target_type=skill.target_type,
+            mp_cost=skill.mp_cost,
+            hp_cost=skill.hp_cost,
+            damage=skill.damage,
+            damage_multiplier=skill.damage_multiplier,
+            is_magical=skill.is_magical,
+            brv_damage=skill.brv_damage,
+            hp_attack=skill.hp_attack,
+            heal_amount=skill.heal_amount,
+            disable_turns=min(skill.status_duration, 2) if disable else 0,
+            dot_turns=skill.status_duration if dot else 0,
+            buff_attack=any(w in b for b in buffs for w in _ATTACK_KEYWORDS),
+            buff_defense=any(w in b for b in buffs for w in _DEFENSE_KEYWORDS),
+            debuff_attack=any(w in d for d in debuffs for w in _ATTACK_KEYWORDS),
+            debuff_defense=any(w in d for d in debuffs for w in _DEFENSE_KEYWORDS),
+            cooldown=skill.cooldown,
+            min_hp_percent=skill.min_hp_percent,
+            max_hp_percent=skill.max_hp_percent,
+        )
+
+
+class _Unit:
+    """전투원 값 사본"""
+
+    __slots__ = (
+        "side", "hp", "max_hp", "mp", "brv", "max_brv", "int_brv", "broken",
+        "level", "phys_atk", "mag_atk", "phys_def", "mag_def", "efficiency", "resistance",
+        "atb", "rate", "disabled", "dot_turns", "atk_mod", "def_mod", "mod_turns",
+        "skills", "cooldowns", "statuses", "casting",
+    )
+
+    def copy(self) -> "_Unit":
+        clone = _Unit.__new__(_Unit)
+        for name in _Unit.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone.cooldowns = list(self.cooldowns)
+        return clone
+
+    @property
+    def alive(self) -> bool:
+        return self.hp > 0
+
+    def signature(self) -> Tuple:
+        return (self.side, self.hp, self.max_hp, self.brv, int(self.atb), self.broken, tuple(self.cooldowns))
+
+
+class SearchState:
+    """탐색용 전투 상태 (실제 전투 객체 참조 없음)"""
+
+    __slots__ = ("units", "rules", "boss")
+
+    def __init__(self, units: List[_Unit], rules: SearchRules, boss: int) -> None:
+        self.units = units
+        self.rules = rules
+        self.boss = boss
+
+    def copy(self) -> "SearchState":
+        return SearchState([u.copy() for u in self.units], self.rules, self.boss)
+
+    @classmethod
+    def from_combat(
+        cls,
+        boss: Any,
+        allies: List[Any],
+        enemies: List[Any],
+        atb: Any = None,
+        rules: Optional[SearchRules] = None
+    ) -> "SearchState":
+        """
+        실제 전투에서 상태 복사 (메인 스레드에서 호출)
+
+        Args:
+            boss: 탐색할 보스
+            allies: 보스 편 전투원 목록 (보스 포함)
+            enemies: 플레이어 파티
+            atb: ATB 시스템 (없으면 속도로 근사)
+            rules: 전투 수치 (없으면 현재 설정)
+        """
+        from src.combat.brave_system import get_brave_system
+        from src.combat.casting_system import get_casting_system
+        from src.combat.damage_calculator import get_damage_calculator
+
+        calc = get_damage_calculator()
+        brave = get_brave_system()
+        casting = get_casting_system()
+        rules = rules or SearchRules.from_runtime(atb)
+
+        units: List[_Unit] = []
+        boss_index = -1
+        for side, group in ((PARTY_SIDE, enemies), (BOSS_SIDE, allies)):
+            for combatant in group:
+                if combatant is boss:
+                    boss_index = len(units)
+                units.append(cls._capture_unit(combatant, side, calc, brave, casting, atb, rules))
+
+        if boss_index < 0:
+            raise ValueError("보스가 아군 목록에 없습니다")
+        return cls(units, rules, boss_index)
+
+    @staticmethod
+    def _capture_unit(
+        combatant: Any, side: int, calc: Any, brave: Any, casting: Any, atb: Any, rules: SearchRules
+    ) -> _Unit:
+        unit = _Unit()
+        unit.side = side
+        unit.hp = combatant.current_hp if getattr(combatant, "is_alive", True) else 0
+        unit.max_hp = max(1, combatant.max_hp)
+        unit.mp = getattr(combatant, "current_mp", 0)
+        unit.brv = getattr(combatant, "current_brv", 0)
+        unit.max_brv = getattr(combatant, "max_brv", 9999)
+        unit.int_brv = brave.calculate_int_brv(combatant)
+        unit.broken = bool(getattr(combatant, "is_broken", False))
+        unit.level = getattr(combatant, "level", 1)
+        unit.phys_atk = calc._get_attack_stat(combatant)
+        unit.mag_atk = calc._get_magic_stat(combatant)
+        unit.phys_def = calc._get_defense_stat(combatant)
+        unit.mag_def = calc._get_spirit_stat(combatant)
+        unit.efficiency = getattr(combatant, "brv_efficiency", 1.0)
+        unit.resistance = getattr(combatant, "brv_loss_resistance", 1.0) or 1.0
+
+        gauge = atb.get_gauge(combatant) if atb is not None else None
+        if gauge is not None:
+            unit.atb = float(gauge.current)
+            unit.rate = atb.calculate_atb_increase(combatant)
+        else:
+            unit.atb = 0.0
+            unit.rate = float(getattr(combatant, "speed", 10))
+
+        status_manager = getattr(combatant, "status_manager", None)
+        unit.disabled = 1 if status_manager is not None and not status_manager.can_act() else 0
+        # 상태이상/시전 정보는 모델에는 근사로만 쓰이고, prefetch 결과 재사용 판단(_state_key)에 쓰임
+        unit.statuses = tuple(sorted(
+            (str(getattr(effect.status_type, "name", effect.status_type)), effect.duration, effect.stack_count)
+            for effect in (status_manager.status_effects if status_manager is not None else ())
+        ))
+        cast_info = casting.get_cast_info(combatant)
+        unit.casting = (
+            (getattr(cast_info.skill, "skill_id", None) or getattr(cast_info.skill, "name", ""),
+             id(cast_info.target), cast_info.state.value)
+            if cast_info is not None else ()
+        )
+        unit.dot_turns = 0
+        unit.atk_mod = 1.0
+        unit.def_mod = 1.0
+        unit.mod_turns = 0
+
+        skills = getattr(combatant, "skills", None) if side == BOSS_SIDE else None
+        if skills and all(hasattr(s, "target_type") for s in skills):
+            unit.skills = tuple(_SkillModel.from_skill(s) for s in skills)
+            unit.cooldowns = [s.current_cooldown for s in skills]
+        else:
+            unit.skills = ()
+            unit.cooldowns = []
+        return unit
+
+    # ------------------------------------------------------------------
+    # 진행
+    # ------------------------------------------------------------------
+
+    def winner(self) -> Optional[int]:
+        """전투가 끝났으면 이긴 편, 아니면 None"""
+        party_alive = any(u.alive for u in self.units if u.side == PARTY_SIDE)
+        boss_alive = any(u.alive for u in self.units if u.side == BOSS_SIDE)
+        if party_alive and boss_alive:
+            return None
+        return BOSS_SIDE if boss_alive else PARTY_SIDE
+
+    def next_actor(self) -> Optional[int]:
+        """ATB가 가장 먼저 차는 전투원까지 시간을 진행하고 인덱스 반환"""
+        threshold = self.rules.threshold
+        best = None
+        best_ticks = math.inf
+        for i, unit in enumerate(self.units):
+            if not unit.alive or unit.rate <= 0:
+                continue
+            ticks = max(0.0, (threshold - unit.atb) / unit.rate)
+            if ticks < best_ticks:
+                best, best_ticks = i, ticks
+
+        if best is None:
+            return None
+        if best_ticks > 0:
+            for unit in self.units:
+                if unit.alive and unit.atb < threshold:
+                    unit.atb = min(threshold, unit.atb + unit.rate * best_ticks)
+        return best
+
+    def begin_turn(self, index: int) -> bool:
+        """턴 시작 처리 (INT BRV 회복, 지속 피해, 쿨다운) - 행동 가능하면 True"""
+        unit = self.units[index]
+        if unit.broken:
+            unit.broken = False
+            unit.brv = unit.int_brv
+        elif unit.brv <= 0:
+            unit.brv = unit.int_brv
+
+        if unit.dot_turns > 0:
+            unit.dot_turns -= 1
+            unit.hp = max(0, unit.hp - max(1, int(unit.max_hp * _DOT_RATE)))
+        if unit.mod_turns > 0:
+            unit.mod_turns -= 1
+            if unit.mod_turns == 0:
+                unit.atk_mod = unit.def_mod = 1.0
+        for i, cooldown in enumerate(unit.cooldowns):
+            if cooldown > 0:
+                unit.cooldowns[i] = cooldown - 1
+
+        if unit.disabled > 0:
+            unit.disabled -= 1
+            self.end_turn(index)
+            return False
+        return unit.alive
+
+    def end_turn(self, index: int) -> None:
+        unit = self.units[index]
+        unit.atb = max(0.0, unit.atb - self.rules.threshold)
+
+    def opponents(self, index: int) -> List[int]:
+        side = self.units[index].side
+        return [i for i, u in enumerate(self.units) if u.side != side and u.alive]
+
+    def teammates(self, index: int) -> List[int]:
+        side = self.units[index].side
+        return [i for i, u in enumerate(self.units) if u.side == side and u.alive]
+
+    def skill_usable(self, unit: _Unit, skill_index: int) -> bool:
+        skill = unit.skills[skill_index]
+        if unit.cooldowns[skill_index] > 0 or unit.mp < skill.mp_cost:
+            return False
+        hp_percent = unit.hp / unit.max_hp
+        if hp_percent < skill.min_hp_percent or hp_percent > skill.max_hp_percent:
+            return False
+        return unit.hp > skill.hp_cost
+
+    def legal_actions(self, index: int) -> List[Action]:
+        """가능한 행동 목록"""
+        unit = self.units[index]
+        foes = self.opponents(index)
+        actions: List[Action] = [("attack", -1, t) for t in foes]
+        if unit.brv > 0:
+            actions.extend(("hp_attack", -1, t) for t in foes)
+
+        for s, skill in enumerate(unit.skills):
+            if not self.skill_usable(unit, s):
+                continue
+            if skill.target_type in (SkillTargetType.SINGLE_ENEMY, SkillTargetType.RANDOM_ENEMY):
+                actions.extend(("skill", s, t) for t in foes)
+            elif skill.target_type == SkillTargetType.SINGLE_ALLY:
+                actions.extend(("skill", s, t) for t in self.teammates(index))
+            else:
+                actions.append(("skill", s, -1))
+        return actions
+
+    # ------------------------------------------------------------------
+    # 행동 적용 (BraveSystem / 적 스킬 실행 규칙 근사)
+    # ------------------------------------------------------------------
+
+    def apply(self, index: int, action: Action, rng: random.Random) -> None:
+        kind, skill_index, target = action
+        if kind == "attack":
+            self._brv_attack(index, target, 1.0, False, rng)
+        elif kind == "hp_attack":
+            self._hp_attack(index, target, 1.0, False)
+        else:
+            self._use_skill(index, skill_index, target)
+            self._skill_effects(index, skill_index, target, rng)
+        self.end_turn(index)
+
+    def _brv_attack(self, index: int, target: int, multiplier: float, magical: bool, rng: random.Random) -> None:
+        rules = self.rules
+        attacker = self.units[index]
+        defender = self.units[target]
+
+        attack = (attacker.mag_atk if magical else attacker.phys_atk) * attacker.atk_mod
+        defense = (defender.mag_def if magical else defender.phys_def) * defender.def_mod
+        damage = max(1, int(attack / (defense + 1.0) * multiplier * rules.brv_multiplier))
+        damage *= rng.uniform(0.9, 1.1)
+        if rng.random() < rules.critical_chance:
+            damage *= rules.critical_multiplier
+        damage = max(1, int(damage))
+        damage = int(damage * (1.0 + (attacker.level - 1) * rules.level_scaling))
+        damage = int(damage / defender.resistance)
+
+        old_brv = defender.brv
+        defender.brv = max(0, old_brv - damage)
+        stolen = damage if old_brv == 0 else min(damage, max(0, old_brv))
+        attacker.brv = min(attacker.brv + int(stolen * attacker.efficiency), attacker.max_brv)
+
+        if old_brv == 0 and damage > 0 and not defender.broken:
+            defender.broken = True
+            defender.atb = 0.0
+
+    def _hp_attack(self, index: int, target: int, multiplier: float, magical: bool) -> None:
+        rules = self.rules
+        attacker = self.units[index]
+        defender = self.units[target]
+        if attacker.brv <= 0:
+            return
+
+        attack = (attacker.mag_atk if magical else attacker.phys_atk) * attacker.atk_mod
+        defense = (defender.mag_def if magical else defender.phys_def) * defender.def_mod
+        damage = int(attacker.brv * multiplier * (attack / (defense + 1.0)) * rules.hp_multiplier)
+        if defender.broken:
+            damage = int(damage * rules.break_bonus)
+        defender.hp = max(0, defender.hp - max(5, damage))
+        attacker.brv = 0
+
+    def _use_skill(self, index: int, skill_index: int, target: int) -> None:
+        unit = self.units[index]
+        skill = unit.skills[skill_index]
+        unit.mp = max(0, unit.mp - skill.mp_cost)
+        unit.hp = max(1, unit.hp - skill.hp_cost)
+        unit.cooldowns[skill_index] = skill.cooldown
+
+    def _skill_targets(self, index: int, skill: _SkillModel, target: int) -> List[int]:
+        if skill.target_type == SkillTargetType.SELF:
+            return [index]
+        if skill.target_type == SkillTargetType.ALL_ALLIES:
+            return self.teammates(index)
+        if skill.target_type == SkillTargetType.ALL_ENEMIES:
+            return self.opponents(index)
+        return [target] if target >= 0 and self.units[target].alive else []
+
+    def _skill_effects(self, index: int, skill_index: int, target: int, rng: random.Random) -> None:
+        unit = self.units[index]
+        skill = unit.skills[skill_index]
+        targets = self._skill_targets(index, skill, target)
+
+        if skill.damage > 0:
+            # 고정 공식: 스킬 데미지 + 공격력 × 계수 - 방어력 // 2
+            brv_mult = hp_mult = skill.damage_multiplier
+            if skill.brv_damage > 0:
+                brv_mult = skill.damage_multiplier * 2.0
+            if skill.hp_attack:
+                hp_mult = skill.damage_multiplier * 0.75
+            attack = (unit.mag_atk if skill.is_magical else unit.phys_atk) * unit.atk_mod
+            for t in targets:
+                defender = self.units[t]
+                defense = int((defender.mag_def if skill.is_magical else defender.phys_def) * defender.def_mod)
+                if skill.brv_damage > 0:
+                    brv_hit = max(1, int(skill.damage + attack * brv_mult) - defense // 2)
+                    defender.brv = max(0, defender.brv - min(brv_hit, defender.brv))
+                if skill.hp_attack or not skill.brv_damage:
+                    hp_hit = max(1, int(skill.damage + attack * hp_mult) - defense // 2)
+                    defender.hp = max(0, defender.hp - hp_hit)
+        elif skill.brv_damage > 0:
+            # BRV 시스템을 사용하는 스킬 (BRV 2배, HP 0.75배)
+            for t in targets:
+                self._brv_attack(index, t, skill.damage_multiplier * 2.0, skill.is_magical, rng)
+                if skill.hp_attack:
+                    self._hp_attack(index, t, skill.damage_multiplier * 0.75, skill.is_magical)
+
+        for t in targets:
+            target_unit = self.units[t]
+            if skill.heal_amount > 0 and target_unit.alive:
+                target_unit.hp = min(target_unit.max_hp, target_unit.hp + skill.heal_amount)
+            if skill.disable_turns:
+                target_unit.disabled = max(target_unit.disabled, skill.disable_turns)
+            if skill.dot_turns:
+                target_unit.dot_turns = max(target_unit.dot_turns, skill.dot_turns)
+            if skill.buff_attack or skill.debuff_attack:
+                target_unit.atk_mod = 1.2 if skill.buff_attack else 0.8
+                target_unit.mod_turns = _MODIFIER_TURNS
+            if skill.buff_defense or skill.debuff_defense:
+                target_unit.def_mod = 1.2 if skill.buff_defense else 0.8
+                target_unit.mod_turns = _MODIFIER_TURNS
+
+    # ------------------------------------------------------------------
+    # 롤아웃 정책 / 평가
+    # ------------------------------------------------------------------
+
+    def policy_action(self, index: int, rng: random.Random, skill_chance: float = 0.25) -> Optional[Action]:
+        """
+        기본 정책: 가장 약한 대상을 노리고 BRV가 충분하면 HP 공격
+
+        스킬이 있으면 skill_chance 확률로 사용 가능한 스킬 중 하나를 무작위 선택합니다.
+        """
+        unit = self.units[index]
+        foes = self.opponents(index)
+        if not foes:
+            return None
+
+        if unit.skills and rng.random() < skill_chance:
+            skill_actions = [a for a in self.legal_actions(index) if a[0] == "skill"]
+            if skill_actions:
+                return rng.choice(skill_actions)
+
+        if rng.random() < 0.3:
+            target = rng.choice(foes)
+        else:
+            target = min(foes, key=lambda t: self.units[t].hp)
+        defender = self.units[target]
+        if unit.brv > 0 and (defender.broken or unit.brv >= unit.max_brv * 0.4 or unit.brv >= defender.hp):
+            return ("hp_attack", -1, target)
+        return ("attack", -1, target)
+
+    def evaluate(self, root: "SearchState") -> float:
+        """
+        보스 편 관점의 가치 [0, 1]
+
+        편별 손실(HP 손실 비율과 쓰러진 전투원 비율의 평균) 차이를 기본으로 하고, 전투가 끝났으면 승패(1/0)와 반씩 섞습니다.
+        (승패가 정해진 국면에서도 더 크게 이기거나 덜 지는 수를 구분하기 위함)
+        """
+        side_loss = [0.0, 0.0]
+        for side in (PARTY_SIDE, BOSS_SIDE):
+            pairs = [(b, a) for b, a in zip(root.units, self.units) if a.side == side and b.alive]
+            if not pairs:
+                continue
+            hp_before = sum(b.hp for b, _ in pairs)
+            hp_lost = sum(b.hp - a.hp for b, a in pairs)
+            downed = sum(1 for _, a in pairs if not a.alive)
+            side_loss[side] = 0.5 * hp_lost / hp_before + 0.5 * downed / len(pairs)
+        party_loss, boss_loss = side_loss[PARTY_SIDE], side_loss[BOSS_SIDE]
+        margin = min(1.0, max(0.0, 0.5 + 0.5 * (party_loss - boss_loss)))
+
+        winner = self.winner()
+        if winner is None:
+            return margin
+        return 0.5 * margin + (0.5 if winner == BOSS_SIDE else 0.0)
+
+    def signature(self) -> Tuple:
+        """결정론적 시드/비교용 상태 요약 (정수/불리언만)"""
+        return (self.boss,) + tuple(u.signature() for u in self.units)
+
+
+class _Node:
+    """개방 루프 탐색 트리 노드 (보스의 결정 지점)"""
+
+    __slots__ = ("children", "visits", "value")
+
+    def __init__(self) -> None:
+        self.children: Dict[Action, "_Node"] = {}
+        self.visits = 0
+        self.value = 0.0
+
+
+class MCTSSearch:
+    """
+    보스 행동 UCT 탐색
+
+    개방 루프(open-loop) 방식: 트리는 보스의 결정 순서만 기록하고,
+    그 사이 파티/다른 적의 행동은 매 반복마다 롤아웃 정책으로 새로 샘플링합니다.
+    """
+
+    def __init__(
+        self,
+        state: SearchState,
+        budget_ms: float,
+        exploration: float = 1.4,
+        horizon: int = 12,
+        seed: Optional[int] = None,
+        max_rollouts: Optional[int] = None
+    ) -> None:
+        self.root_state = state
+        self.budget_ms = budget_ms
+        self.exploration = exploration
+        self.horizon = horizon
+        self.max_rollouts = max_rollouts
+        self.rng = random.Random(hash(state.signature()) if seed is None else seed)
+        self.root = _Node()
+        self.stats = SearchStats(budget_ms=budget_ms)
+        self.stop_event = threading.Event()
+
+    def run(self) -> SearchResult:
+        """예산(또는 max_rollouts)이 다할 때까지 탐색"""
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000.0
+        stats = self.stats
+
+        while not self.stop_event.is_set():
+            if self.max_rollouts is not None:
+                if stats.rollouts >= self.max_rollouts:
+                    break
+            elif stats.rollouts and time.perf_counter() >= deadline:
+                break
+            self._iterate()
+
+        stats.elapsed_ms = (time.perf_counter() - start) * 1000.0
+        ranked = sorted(
+            ((action, node.visits, node.value / node.visits if node.visits else 0.0)
+             for action, node in self.root.children.items()),
+            key=lambda item: (item[1], item[2]),
+            reverse=True,
+        )
+        return SearchResult(actions=ranked, stats=stats, state_key=_state_key(self.root_state))
+
+    def _iterate(self) -> None:
+        state = self.root_state.copy()
+        rng = self.rng
+        node = self.root
+        path = [node]
+        expanded = False
+        steps = 0
+        depth = 0
+
+        while steps < self.horizon and state.winner() is None:
+            actor = state.next_actor()
+            if actor is None:
+                break
+            steps += 1
+            if not state.begin_turn(actor):
+                continue
+
+            if actor != state.boss or expanded:
+                action = state.policy_action(actor, rng)
+                if action is not None:
+                    state.apply(actor, action, rng)
+                else:
+                    state.end_turn(actor)
+                continue
+
+            legal = state.legal_actions(actor)
+            if not legal:
+                state.end_turn(actor)
+                continue
+            untried = [a for a in legal if a not in node.children]
+            if untried:
+                action = rng.choice(untried)
+                node.children[action] = _Node()
+                self.stats.nodes += 1
+                expanded = True
+            else:
+                action = self._select(node, legal)
+            node = node.children[action]
+            path.append(node)
+            depth += 1
+            state.apply(actor, action, rng)
+
+        value = state.evaluate(self.root_state)
+        for visited in path:
+            visited.visits += 1
+            visited.value += value
+
+        stats = self.stats
+        stats.rollouts += 1
+        stats.simulated_actions += steps
+        stats.max_depth = max(stats.max_depth, depth)
+
+    def _select(self, node: _Node, legal: List[Action]) -> Action:
+        """UCB1 선택 (이번 샘플에서 가능한 자식만)"""
+        log_visits = math.log(max(1, node.visits))
+        best_action = legal[0]
+        best_score = -math.inf
+        for action in legal:
+            child = node.children[action]
+            score = child.value / child.visits + self.exploration * math.sqrt(log_visits / child.visits)
+            if score > best_score:
+                best_action, best_score = action, score
+        return best_action
+
+
+def _state_key(state: SearchState) -> Tuple:
+    """
+    prefetch 결과를 그대로 써도 되는지 비교할 상태 요약
+
+    구성(편/최대 HP)에 더해 HP/MP/BRV/BREAK/행동 불가/상태이상/시전/쿨다운을 포함합니다.
+    ATB는 prefetch 이후 보스 턴까지 항상 진행하므로 제외합니다.
+    """
+    return (state.boss,) + tuple(
+        (u.side, u.max_hp, u.hp, u.mp, u.brv, u.broken, u.disabled, u.statuses, u.casting, tuple(u.cooldowns))
+        for u in state.units
+    )
+
+
+class SearchWorker:
+    """
+    백그라운드 탐색 작업자
+
+    prefetch()로 보스별 탐색을 작업 스레드에서 시작하고 take()로 결과를 꺼냅니다.
+    같은 보스에 대해 새로 prefetch하면 이전 탐색은 중단됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Tuple[MCTSSearch, Future]] = {}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcts-search")
+        return self._executor
+
+    def prefetch(self, enemy: Any, search: MCTSSearch) -> Future:
+        """탐색을 작업 스레드에서 시작"""
+        key = id(enemy)
+        with self._lock:
+            previous = self._pending.pop(key, None)
+            if previous is not None:
+                previous[0].stop_event.set()
+            future = self._get_executor().submit(search.run)
+            self._pending[key] = (search, future)
+        return future
+
+    def is_pending(self, enemy: Any) -> bool:
+        with self._lock:
+            return id(enemy) in self._pending
+
+    def take(self, enemy: Any, timeout: Optional[float] = None) -> Optional[SearchResult]:
+        """
+        미리 시작한 탐색 결과 꺼내기
+
+        Args:
+            enemy: 보스
+            timeout: 아직 탐색 중일 때 기다릴 최대 시간 (초, None이면 남은 예산만큼)
+
+        Returns:
+            탐색 결과 (prefetch가 없었거나 실패하면 None)
+        """
+        with self._lock:
+            pending = self._pending.pop(id(enemy), None)
+        if pending is None:
+            return None
+
+        search, future = pending
+        if timeout is None:
+            timeout = search.budget_ms / 1000.0 + 0.05
+        try:
+            result = future.result(timeout=timeout)
+        except Exception as e:
+            search.stop_event.set()
+            logger.warning(f"MCTS prefetch 결과 사용 실패: {e}")
+            return None
+        result.stats.prefetched = True
+        return result
+
+    def cancel(self, enemy: Any = None) -> None:
+        """진행 중인 탐색 중단 (enemy가 None이면 전체)"""
+        with self._lock:
+            if enemy is None:
+                pending = list(self._pending.values())
+                self._pending.clear()
+            else:
+                item = self._pending.pop(id(enemy), None)
+                pending = [item] if item else []
+        for search, _ in pending:
+            search.stop_event.set()
+
+    def shutdown(self) -> None:
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# 전역 인스턴스
+_search_worker: Optional[SearchWorker] = None
+
+
+def get_search_worker() -> SearchWorker:
+    """전역 탐색 작업자"""
+    global _search_worker
+    if _search_worker is None:
+        _search_worker = SearchWorker()
+    return _search_worker
+
+
+def get_mcts_settings(difficulty: Optional[str] = None) -> Dict[str, Any]:
+    """
+    MCTS 설정 (config.yaml의 ai.mcts)
+
+    Args:
+        difficulty: 게임 난이도 (없으면 현재 난이도 시스템, 그것도 없으면 "도전")
+    """
+    config = get_config()
+    if difficulty is None:
+        from src.core.difficulty import get_difficulty_system
+        system = get_difficulty_system()
+        difficulty = system.current_difficulty.value if system is not None else "도전"
+
+    budgets = config.get("ai.mcts.budget_ms", None) or _DEFAULT_BUDGET_MS
+    return {
+        "enabled": config.get("ai.mcts.enabled", False),
+        "prefetch": config.get("ai.mcts.prefetch", True),
+        "budget_ms": budgets.get(difficulty, _DEFAULT_BUDGET_MS.get(difficulty, 40)),
+        "exploration": config.get("ai.mcts.exploration", 1.4),
+        "horizon": config.get("ai.mcts.horizon", 12),
+    }
+
+
+class MCTSBossAI(BossAI):
+    """
+    MCTS 보스 AI
+
+    보스의 스킬/대상 조합을 시간 예산 안에서 탐색합니다.
+    탐색이 가능한 행동을 찾지 못하면 일반 공격 결정으로 대체합니다.
+    """
+
+    def __init__(self, enemy: Any, game_difficulty: Optional[str] = None, atb: Any = None):
+        super().__init__(enemy)
+        settings = get_mcts_settings(game_difficulty)
+        self.budget_ms = settings["budget_ms"]
+        self.exploration = settings["exploration"]
+        self.horizon = settings["horizon"]
+        self.prefetch_enabled = settings["prefetch"]
+        self.atb = atb
+        self.last_stats: Optional[SearchStats] = None
+
+    def _get_atb(self) -> Any:
+        if self.atb is None:
+            from src.combat.atb_system import get_atb_system
+            self.atb = get_atb_system()
+        return self.atb
+
+    def _create_search(self, allies: List[Any], enemies: List[Any]) -> MCTSSearch:
+        state = SearchState.from_combat(self.enemy, allies, enemies, self._get_atb())
+        return MCTSSearch(state, self.budget_ms, self.exploration, self.horizon)
+
+    def start_search(self, allies: List[Any], enemies: List[Any]) -> bool:
+        """
+        플레이어가 행동을 고르는 동안 미리 탐색 시작
+
+        Returns:
+            탐색을 시작했는지 여부
+        """
+        if not self.prefetch_enabled or not getattr(self.enemy, "is_alive", True):
+            return False
+        if not any(getattr(e, "is_alive", True) for e in enemies):
+            return False
+        get_search_worker().prefetch(self.enemy, self._create_search(allies, enemies))
+        return True
+
+    def decide_action(self, allies: List[Any], enemies: List[Any],
+                      analysis: Optional[BattlefieldAnalysis] = None) -> dict:
+        """
+        행동 결정 (미리 탐색한 결과가 있으면 사용, 없으면 예산만큼 바로 탐색)
+        """
+        self.battlefield = analysis
+        alive_enemies = [e for e in enemies if getattr(e, "is_alive", True)]
+        if not alive_enemies:
+            return super().decide_action(allies, enemies, analysis)
+
+        # 쿨다운 감소 전 상태로 탐색 (모델이 보스 턴 시작에 쿨다운을 줄임)
+        search = self._create_search(allies, enemies)
+        result = get_search_worker().take(self.enemy)
+        if result is None or result.state_key != _state_key(search.root_state):
+            # prefetch 이후 상태가 달라졌으면 (플레이어 행동, 상태이상, 시전 중단 등) 다시 탐색
+            result = search.run()
+        self.last_stats = result.stats
+
+        for skill in getattr(self.enemy, "skills", None) or []:
+            skill.reduce_cooldown()
+
+        logger.debug(f"{self.enemy.name} MCTS 탐색: {result.stats.to_dict()}")
+
+        decision = self._to_decision(result, allies, enemies)
+        if decision is None:
+            return self._decide_basic_attack(enemies)
+        return decision
+
+    def _to_decision(self, result: SearchResult, allies: List[Any], enemies: List[Any]) -> Optional[dict]:
+        """탐색 결과를 실제 전투원 대상의 행동으로 변환 (유효한 첫 행동)"""
+        combatants = list(enemies) + list(allies)
+        skills = getattr(self.enemy, "skills", None) or []
+
+        for (kind, skill_index, target_index), _, _ in result.actions:
+            target = combatants[target_index] if target_index >= 0 else None
+            if target is not None and not getattr(target, "is_alive", True):
+                continue
+
+            if kind == "attack":
+                return {"type": "attack", "target": target}
+            if kind == "hp_attack":
+                if getattr(self.enemy, "current_brv", 0) <= 0:
+                    continue
+                return {"type": "hp_attack", "target": target}
+
+            skill = skills[skill_index] if skill_index < len(skills) else None
+            if skill is None or not skill.can_use(self.enemy):
+                continue
+            if target is None:
+                target = self._select_target(skill, allies, enemies)
+            logger.info(f"{self.enemy.name}이(가) {skill.name} 사용! (MCTS)")
+            return {"type": "skill", "skill": skill, "target": target}
+        return None
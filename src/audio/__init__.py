@@ -8,7 +8,9 @@ from src.audio.audio_manager import (
     play_bgm,
     stop_bgm,
     play_sfx,
-    play_teamwork_sfx
+    play_teamwork_sfx,
+    set_audio_muted,
+    is_audio_muted
 )
 
 __all__ = [
@@ -17,5 +19,7 @@ __all__ = [
     "play_bgm",
     "stop_bgm",
     "play_sfx",
-    "play_teamwork_sfx"
+    "play_teamwork_sfx",
+    "set_audio_muted",
+    "is_audio_muted"
 ]
@@ -389,6 +389,9 @@ class AudioManager:
 # 전역 인스턴스
 _audio_manager: Optional[AudioManager] = None
 
+# 음소거 플래그 (헤드리스 시뮬레이션 등에서 믹서 초기화/재생을 모두 건너뜀)
+_audio_muted: bool = False
+
 
 def get_audio_manager() -> AudioManager:
     """전역 오디오 매니저 인스턴스"""
@@ -398,6 +401,25 @@ def get_audio_manager() -> AudioManager:
     return _audio_manager
 
 
+def set_audio_muted(muted: bool) -> None:
+    """
+    전역 음소거 설정
+
+    음소거 중에는 편의 함수(play_bgm, stop_bgm, play_sfx, play_teamwork_sfx)가
+    AudioManager를 생성하지 않고 즉시 반환합니다.
+
+    Args:
+        muted: 음소거 여부
+    """
+    global _audio_muted
+    _audio_muted = muted
+
+
+def is_audio_muted() -> bool:
+    """전역 음소거 여부"""
+    return _audio_muted
+
+
 def play_bgm(track_name: str, loop: bool = True, fade_in: bool = True) -> bool:
     """
     BGM 재생 (편의 함수)
@@ -410,6 +432,8 @@ def play_bgm(track_name: str, loop: bool = True, fade_in: bool = True) -> bool:
     Returns:
         재생 성공 여부
     """
+    if _audio_muted:
+        return False
     return get_audio_manager().play_bgm(track_name, loop, fade_in)
 
 
@@ -420,6 +444,8 @@ def stop_bgm(fade_out: bool = True) -> None:
     Args:
         fade_out: 페이드 아웃
     """
+    if _audio_muted:
+        return
     get_audio_manager().stop_bgm(fade_out)
 
 
@@ -435,6 +461,8 @@ def play_sfx(category: str, sfx_name: str, volume_multiplier: float = 1.0) -> bo
     Returns:
         재생 성공 여부
     """
+    if _audio_muted:
+        return False
     return get_audio_manager().play_sfx(category, sfx_name, volume_multiplier)
 
 
@@ -452,4 +480,6 @@ def play_teamwork_sfx(category: str, sfx_name: str, chain_count: int = 1) -> boo
     Returns:
         재생 성공 여부
     """
+    if _audio_muted:
+        return False
     return get_audio_manager().play_teamwork_sfx(category, sfx_name, chain_count)
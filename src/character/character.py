@@ -1666,7 +1666,6 @@ class Character:
         # trait_id가 available_trait_ids에 있거나, passives.yaml에 정의된 패시브 특성이면 허용
         if trait_id not in available_trait_ids:
             # 패시브 특성인지 확인 (passives.yaml의 특성들)
-            from src.character.trait_effects import get_trait_effect_manager
             trait_manager = get_trait_effect_manager()
             if trait_id not in trait_manager.trait_definitions:
                 self.logger.warning(f"특성 {trait_id}는 사용할 수 없습니다")
@@ -1674,6 +1673,7 @@ class Character:
 
         # 특성 활성화
         self.active_traits.append(trait_id)
+        get_trait_effect_manager().invalidate_traits(self)
         self.logger.info(f"특성 활성화: {trait_id}")
 
         # 특성 효과 적용 (패시브 스탯 보너스 등)
@@ -1695,6 +1695,7 @@ class Character:
         for i, trait in enumerate(self.active_traits):
             if (trait if isinstance(trait, str) else trait.get('id')) == trait_id:
                 self.active_traits.pop(i)
+                get_trait_effect_manager().invalidate_traits(self)
                 self.logger.info(f"특성 비활성화: {trait_id}")
                 return True
 
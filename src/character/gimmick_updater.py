@@ -1,4 +1,6 @@
 """Gimmick Updater - 기믹 자동 업데이트 시스템"""
+from typing import Any, Callable, Dict, List, Optional
+
 from src.core.logger import get_logger
 
 logger = get_logger("gimmick")
@@ -6,6 +8,60 @@ logger = get_logger("gimmick")
 class GimmickUpdater:
     """기믹 자동 업데이트 관리자"""
 
+    # 기믹 타입별 처리 함수 맵 (register_gimmick으로 등록)
+    TURN_END_HANDLERS: Dict[str, Callable[[Any], None]] = {}
+    TURN_START_HANDLERS: Dict[str, Callable[[Any, Optional[Dict[str, Any]]], None]] = {}
+    SKILL_USE_HANDLERS: Dict[str, Callable[[Any, Any], None]] = {}
+
+    @staticmethod
+    def register_gimmick(
+        gimmick_type: str,
+        turn_end: Optional[Callable[[Any], None]] = None,
+        turn_start: Optional[Callable[[Any, Optional[Dict[str, Any]]], None]] = None,
+        skill_use: Optional[Callable[[Any, Any], None]] = None
+    ) -> None:
+        """
+        기믹 핸들러 등록
+
+        Args:
+            gimmick_type: 기믹 타입 (캐릭터 YAML의 gimmick.type)
+            turn_end: 턴 종료 시 호출 (character)
+            turn_start: 턴 시작 시 호출 (character, context)
+            skill_use: 스킬 사용 시 호출 (character, skill)
+        """
+        if turn_end:
+            GimmickUpdater.TURN_END_HANDLERS[gimmick_type] = turn_end
+        if turn_start:
+            GimmickUpdater.TURN_START_HANDLERS[gimmick_type] = turn_start
+        if skill_use:
+            GimmickUpdater.SKILL_USE_HANDLERS[gimmick_type] = skill_use
+
+    @staticmethod
+    def get_unhandled_gimmicks(gimmick_types: Optional[List[str]] = None) -> List[str]:
+        """
+        등록된 핸들러가 하나도 없는 기믹 타입 목록
+
+        Args:
+            gimmick_types: 확인할 기믹 타입 (None이면 모든 직업 데이터의 기믹)
+
+        Returns:
+            핸들러 없는 기믹 타입 (정렬됨)
+        """
+        if gimmick_types is None:
+            from src.character.character_loader import get_all_classes, get_gimmick
+            gimmick_types = []
+            for class_name in get_all_classes():
+                gimmick = get_gimmick(class_name)
+                if gimmick and gimmick.get("type"):
+                    gimmick_types.append(gimmick["type"])
+
+        handled = (
+            GimmickUpdater.TURN_END_HANDLERS.keys()
+            | GimmickUpdater.TURN_START_HANDLERS.keys()
+            | GimmickUpdater.SKILL_USE_HANDLERS.keys()
+        )
+        return sorted(set(gimmick_types) - handled)
+
     @staticmethod
     def on_turn_end(character):
         """턴 종료 시 기믹 업데이트"""
@@ -13,73 +69,9 @@ class GimmickUpdater:
         if not gimmick_type:
             return
 
-        # 기존 구현된 기믹들
-        if gimmick_type == "heat_management":
-            GimmickUpdater._update_heat_management(character)
-        elif gimmick_type == "timeline_system":
-            GimmickUpdater._update_timeline_system(character)
-        elif gimmick_type == "yin_yang_flow":
-            GimmickUpdater._update_yin_yang_flow(character)
-        elif gimmick_type == "madness_threshold":
-            GimmickUpdater._update_madness_threshold(character)
-        elif gimmick_type == "thirst_gauge":
-            GimmickUpdater._update_thirst_gauge(character)
-        elif gimmick_type == "probability_distortion":
-            GimmickUpdater._update_probability_distortion(character)
-        elif gimmick_type == "stealth_exposure":
-            GimmickUpdater._update_stealth_exposure(character)
-        # ISSUE-004: 신규 추가 기믹들
-        elif gimmick_type == "sword_aura":
-            GimmickUpdater._update_sword_aura(character)
-        elif gimmick_type == "crowd_cheer":
-            GimmickUpdater._update_crowd_cheer(character)
-        elif gimmick_type == "duty_system":
-            GimmickUpdater._update_duty_system(character)
-        elif gimmick_type == "stance_system":
-            GimmickUpdater._update_stance_system(character)
-        elif gimmick_type == "iaijutsu_system":
-            GimmickUpdater._update_iaijutsu_system(character)
-        elif gimmick_type == "dragon_marks":
-            GimmickUpdater._update_dragon_marks(character)
-        elif gimmick_type == "holy_system":
-            GimmickUpdater._update_holy_system(character)
-        elif gimmick_type == "divinity_system":
-            GimmickUpdater._update_divinity_system(character)
-        # charge_system은 별도로 처리됨 (on_turn_start, on_turn_end에서)
-        elif gimmick_type == "undead_legion":
-            GimmickUpdater._update_undead_legion(character)
-        elif gimmick_type == "theft_system":
-            GimmickUpdater._update_theft_system(character)
-        elif gimmick_type == "shapeshifting_system":
-            GimmickUpdater._update_shapeshifting_system(character)
-        elif gimmick_type == "enchant_system":
-            GimmickUpdater._update_enchant_system(character)
-        elif gimmick_type == "curse_system" or gimmick_type == "totem_system":
-            GimmickUpdater._update_curse_system(character)
-        elif gimmick_type == "melody_system":
-            GimmickUpdater._update_melody_system(character)
-        elif gimmick_type == "break_system":
-            GimmickUpdater._update_break_system(character)
-        elif gimmick_type == "elemental_counter":
-            GimmickUpdater._update_elemental_counter(character)
-        elif gimmick_type == "alchemy_system":
-            GimmickUpdater._update_alchemy_system(character)
-        elif gimmick_type == "elemental_spirits":
-            GimmickUpdater._update_elemental_spirits(character)
-        elif gimmick_type == "plunder_system":
-            GimmickUpdater._update_plunder_system(character)
-        elif gimmick_type == "multithread_system":
-            GimmickUpdater._update_multithread_system(character)
-        elif gimmick_type == "dilemma_choice":
-            GimmickUpdater._update_dilemma_choice(character)
-        elif gimmick_type == "rune_resonance":
-            GimmickUpdater._update_rune_resonance(character)
-        elif gimmick_type == "charge_system":
-            GimmickUpdater._update_charge_system_turn_end(character)
-        elif gimmick_type == "dimension_refraction":
-            GimmickUpdater._update_dimension_refraction(character)
-        elif gimmick_type == "trick_deck":
-            GimmickUpdater._update_trick_deck(character)
+        handler = GimmickUpdater.TURN_END_HANDLERS.get(gimmick_type)
+        if handler:
+            handler(character)
 
     @staticmethod
     def on_turn_start(character, context=None):
@@ -93,56 +85,44 @@ class GimmickUpdater:
         if not gimmick_type:
             return
 
-        # 확률 왜곡 게이지 - 턴 시작 시 +10
-        if gimmick_type == "probability_distortion":
-            gauge_gain = getattr(character, 'gauge_per_turn', 10)
-            character.distortion_gauge = min(character.max_gauge, character.distortion_gauge + gauge_gain)
-            logger.debug(f"{character.name} 확률 왜곡 게이지 +{gauge_gain} (총: {character.distortion_gauge})")
-
-        # 갈증 게이지 - 턴 시작 시 증가 (특성에서 설정된 값 사용, 기본값 5)
-        elif gimmick_type == "thirst_gauge":
-            # 특성에서 thirst_per_turn 값 확인
-            thirst_per_turn = 5  # 기본값
-            if hasattr(character, 'active_traits'):
-                from src.character.trait_effects import get_trait_effect_manager
-                trait_manager = get_trait_effect_manager()
-                for trait_data in character.active_traits:
-                    trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-                    if trait_id == "blood_control":
-                        # blood_control 특성의 thirst_per_turn 값 사용
-                        thirst_per_turn = 5  # 특성에서 정의된 값
-                        break
-            
-            character.thirst = min(character.max_thirst, character.thirst + thirst_per_turn)
-            logger.debug(f"{character.name} 갈증 +{thirst_per_turn} (총: {character.thirst})")
-
-        # ISSUE-004: 추가 턴 시작 기믹 업데이트
-        # 군중 환호 - 턴 시작 시 +5
-        elif gimmick_type == "crowd_cheer":
-            cheer = getattr(character, 'cheer', 0)
-            max_cheer = getattr(character, 'max_cheer', 100)
-            character.cheer = min(max_cheer, cheer + 5)
-            logger.debug(f"{character.name} 환호 증가: +5 (총: {character.cheer})")
-        
-        # 전사 - 스탠스 시스템 효과 적용
-        elif gimmick_type == "stance_system":
-            GimmickUpdater._apply_stance_effects(character)
-        
-        # 네크로맨서 - 언데드 자동 공격
-        elif gimmick_type == "undead_legion":
-            GimmickUpdater._undead_auto_attack(character, context)
-
-        # 암흑기사 - 충전 시스템 턴 시작
-        elif gimmick_type == "charge_system":
-            GimmickUpdater._update_charge_system_turn_start(character)
-        
-        # 마술사 - 트릭 덱 시스템 턴 시작
-        elif gimmick_type == "trick_deck":
-            GimmickUpdater._update_trick_deck_turn_start(character)
+        handler = GimmickUpdater.TURN_START_HANDLERS.get(gimmick_type)
+        if handler:
+            handler(character, context)
 
         # 일반 특성 처리 (기믹과 무관한 특성들)
         GimmickUpdater._process_turn_start_traits(character, context)
 
+    @staticmethod
+    def _turn_start_probability_distortion(character, context=None):
+        """확률 왜곡 게이지 - 턴 시작 시 +10"""
+        gauge_gain = getattr(character, 'gauge_per_turn', 10)
+        character.distortion_gauge = min(character.max_gauge, character.distortion_gauge + gauge_gain)
+        logger.debug(f"{character.name} 확률 왜곡 게이지 +{gauge_gain} (총: {character.distortion_gauge})")
+
+    @staticmethod
+    def _turn_start_thirst_gauge(character, context=None):
+        """갈증 게이지 - 턴 시작 시 증가 (특성에서 설정된 값 사용, 기본값 5)"""
+        # 특성에서 thirst_per_turn 값 확인
+        thirst_per_turn = 5  # 기본값
+        if hasattr(character, 'active_traits'):
+            for trait_data in character.active_traits:
+                trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
+                if trait_id == "blood_control":
+                    # blood_control 특성의 thirst_per_turn 값 사용
+                    thirst_per_turn = 5  # 특성에서 정의된 값
+                    break
+
+        character.thirst = min(character.max_thirst, character.thirst + thirst_per_turn)
+        logger.debug(f"{character.name} 갈증 +{thirst_per_turn} (총: {character.thirst})")
+
+    @staticmethod
+    def _turn_start_crowd_cheer(character, context=None):
+        """군중 환호 - 턴 시작 시 +5"""
+        cheer = getattr(character, 'cheer', 0)
+        max_cheer = getattr(character, 'max_cheer', 100)
+        character.cheer = min(max_cheer, cheer + 5)
+        logger.debug(f"{character.name} 환호 증가: +5 (총: {character.cheer})")
+
     @staticmethod
     def _process_turn_start_traits(character, context):
         """턴 시작 시 특성 효과 처리"""
@@ -232,39 +212,48 @@ class GimmickUpdater:
         if not gimmick_type:
             return
 
-        if gimmick_type == "magazine_system":
-            GimmickUpdater._consume_bullet(character, skill)
-        elif gimmick_type == "stealth_exposure":
-            # 공격 스킬 사용 시 은신 해제 체크
-            if skill.metadata.get("breaks_stealth", False):
-                character.stealth_active = False
-                character.exposed_turns = 0
-                logger.info(f"{character.name} 은신 해제 (공격 스킬 사용)")
-        elif gimmick_type == "support_fire":
-            # 직접 공격 시 콤보 초기화
-            if skill.metadata.get("breaks_combo", False):
-                character.support_fire_combo = 0
-                logger.debug(f"{character.name} 직접 공격으로 지원 콤보 초기화")
-        elif gimmick_type == "stance_system":
-            # 스탠스 변경 스킬 사용 시 스탠스 효과 재적용
-            if skill.metadata.get("stance"):
-                GimmickUpdater._apply_stance_effects(character)
-        elif gimmick_type == "shapeshifting_system":
-            # 드루이드: 변신 스킬 사용 시 형태 변경
-            form = skill.metadata.get("form")
-            if form:
-                character.current_form = form
-                form_names = {
-                    "bear": "곰",
-                    "cat": "표범",
-                    "panther": "표범",
-                    "eagle": "독수리",
-                    "wolf": "늑대",
-                    "primal": "진 변신",
-                    "elemental": "원소"
-                }
-                form_name = form_names.get(form, form)
-                logger.info(f"{character.name} {form_name} 형태로 변신!")
+        handler = GimmickUpdater.SKILL_USE_HANDLERS.get(gimmick_type)
+        if handler:
+            handler(character, skill)
+
+    @staticmethod
+    def _skill_use_stealth_exposure(character, skill):
+        """공격 스킬 사용 시 은신 해제 체크"""
+        if skill.metadata.get("breaks_stealth", False):
+            character.stealth_active = False
+            character.exposed_turns = 0
+            logger.info(f"{character.name} 은신 해제 (공격 스킬 사용)")
+
+    @staticmethod
+    def _skill_use_support_fire(character, skill):
+        """직접 공격 시 콤보 초기화"""
+        if skill.metadata.get("breaks_combo", False):
+            character.support_fire_combo = 0
+            logger.debug(f"{character.name} 직접 공격으로 지원 콤보 초기화")
+
+    @staticmethod
+    def _skill_use_stance_system(character, skill):
+        """스탠스 변경 스킬 사용 시 스탠스 효과 재적용"""
+        if skill.metadata.get("stance"):
+            GimmickUpdater._apply_stance_effects(character)
+
+    @staticmethod
+    def _skill_use_shapeshifting_system(character, skill):
+        """드루이드: 변신 스킬 사용 시 형태 변경"""
+        form = skill.metadata.get("form")
+        if form:
+            character.current_form = form
+            form_names = {
+                "bear": "곰",
+                "cat": "표범",
+                "panther": "표범",
+                "eagle": "독수리",
+                "wolf": "늑대",
+                "primal": "진 변신",
+                "elemental": "원소"
+            }
+            form_name = form_names.get(form, form)
+            logger.info(f"{character.name} {form_name} 형태로 변신!")
 
     @staticmethod
     def on_ally_attack(attacker, all_allies, target=None):
@@ -506,7 +495,7 @@ class GimmickUpdater:
         - 광기 71-99 (위험): 공격력 +80%, 속도 +40%, 크리티컬 +20%, 받는 피해 +30%
         - 광기 100 (폭주): 공격력 +150%, 통제 불가, 무작위 공격
         """
-        from src.character.stat_manager import Stats
+        from src.character.stats import Stats
         
         # 먼저 기존 광기 관련 스탯 보너스 제거
         try:
@@ -549,8 +538,8 @@ class GimmickUpdater:
         
         # === 기본 효과 적용 (특성 불필요) ===
         madness = character.madness
-        base_attack = character.stat_manager.get_base_value(Stats.STRENGTH)
-        base_speed = character.stat_manager.get_base_value(Stats.SPEED)
+        base_attack = character.stat_manager.get_value(Stats.STRENGTH, use_total=False)
+        base_speed = character.stat_manager.get_value(Stats.SPEED, use_total=False)
         
         # 폭주 상태 (광기 100) - 통제 가능하지만 대가가 큼
         if madness >= character.rampage_threshold:
@@ -1447,7 +1436,7 @@ class GimmickStateChecker:
         """마술사: 트릭 덱 시스템 턴 시작 업데이트"""
         # 덱 초기화 체크
         if not hasattr(character, 'card_deck') or character.card_deck is None:
-            GimmickUpdater.initialize_trick_deck(character)
+            GimmickStateChecker.initialize_trick_deck(character)
         
         # 손패 표시
         hand = getattr(character, 'card_hand', [])
@@ -1524,3 +1513,65 @@ class GimmickStateChecker:
         
         # 현재 조합이 필요 조합보다 같거나 높으면 True
         return current_rank >= required_rank
+
+
+def _register_builtin_gimmicks() -> None:
+    """직업별 기본 기믹 핸들러 등록"""
+    U = GimmickUpdater
+    register = GimmickUpdater.register_gimmick
+
+    # 기존 구현된 기믹들
+    register("heat_management", turn_end=U._update_heat_management)
+    register("timeline_system", turn_end=U._update_timeline_system)
+    register("yin_yang_flow", turn_end=U._update_yin_yang_flow)
+    register("madness_threshold", turn_end=U._update_madness_threshold)
+    register("thirst_gauge", turn_end=U._update_thirst_gauge,
+             turn_start=U._turn_start_thirst_gauge)
+    register("probability_distortion", turn_end=U._update_probability_distortion,
+             turn_start=U._turn_start_probability_distortion)
+    register("stealth_exposure", turn_end=U._update_stealth_exposure,
+             skill_use=U._skill_use_stealth_exposure)
+    register("magazine_system", skill_use=U._consume_bullet)
+    register("support_fire", skill_use=U._skill_use_support_fire)
+
+    # ISSUE-004: 신규 추가 기믹들
+    register("sword_aura", turn_end=U._update_sword_aura)
+    register("crowd_cheer", turn_end=U._update_crowd_cheer,
+             turn_start=U._turn_start_crowd_cheer)
+    register("duty_system", turn_end=U._update_duty_system)
+    register("stance_system", turn_end=U._update_stance_system,
+             turn_start=lambda character, context: U._apply_stance_effects(character),
+             skill_use=U._skill_use_stance_system)
+    register("iaijutsu_system", turn_end=U._update_iaijutsu_system)
+    register("dragon_marks", turn_end=U._update_dragon_marks)
+    register("holy_system", turn_end=U._update_holy_system)
+    register("divinity_system", turn_end=U._update_divinity_system)
+    register("undead_legion", turn_end=U._update_undead_legion,
+             turn_start=U._undead_auto_attack)
+    register("theft_system", turn_end=U._update_theft_system)
+    register("shapeshifting_system", turn_end=U._update_shapeshifting_system,
+             skill_use=U._skill_use_shapeshifting_system)
+    register("enchant_system", turn_end=U._update_enchant_system)
+    register("curse_system", turn_end=U._update_curse_system)
+    register("totem_system", turn_end=U._update_curse_system)
+    register("melody_system", turn_end=U._update_melody_system)
+    register("break_system", turn_end=U._update_break_system)
+    register("elemental_counter", turn_end=U._update_elemental_counter)
+    register("alchemy_system", turn_end=U._update_alchemy_system)
+    register("elemental_spirits", turn_end=U._update_elemental_spirits)
+    register("plunder_system", turn_end=U._update_plunder_system)
+    register("multithread_system", turn_end=U._update_multithread_system)
+    register("dilemma_choice", turn_end=U._update_dilemma_choice)
+    register("rune_resonance", turn_end=U._update_rune_resonance)
+    register("dimension_refraction", turn_end=U._update_dimension_refraction)
+
+    # 암흑기사 - 충전 시스템
+    register("charge_system", turn_end=U._update_charge_system_turn_end,
+             turn_start=lambda character, context: U._update_charge_system_turn_start(character))
+
+    # 마술사 - 트릭 덱 시스템 (GimmickStateChecker에 구현됨)
+    register("trick_deck", turn_end=GimmickStateChecker._update_trick_deck,
+             turn_start=lambda character, context: GimmickStateChecker._update_trick_deck_turn_start(character))
+
+
+_register_builtin_gimmicks()
@@ -46,6 +46,15 @@ class DamageEffect(SkillEffect):
             context['_aoe_hp_initial_brv'] = initial_brv
             context['_aoe_hp_target_index'] = 0  # 첫 번째 타겟 추적
         
+        # 광역 BRV 공격: 배율과 공격자 보정을 한 번만 계산하고 대상별 데미지를 일괄 계산
+        batch_results = {}
+        if self.damage_type == DamageType.BRV and len(targets) > 1:
+            alive_targets = [t for t in targets if t.is_alive]
+            if len(alive_targets) > 1:
+                final_mult = self._calculate_final_multiplier(user, context)
+                dmg_results = self._calculate_brv_batch(user, alive_targets, final_mult, context)
+                batch_results = {id(t): r for t, r in zip(alive_targets, dmg_results)}
+
         # 실제로 처리된 살아있는 타겟 추적
         alive_targets_processed = 0
         
@@ -62,7 +71,9 @@ class DamageEffect(SkillEffect):
             if is_aoe_hp:
                 context['_aoe_hp_target_index'] = alive_targets_processed
             
-            single_result = self._execute_single(user, single_target, context)
+            single_result = self._execute_single(
+                user, single_target, context, dmg_result=batch_results.get(id(single_target))
+            )
             result.merge(single_result)
             
             # 살아있는 타겟이 처리되었음을 기록
@@ -75,11 +86,82 @@ class DamageEffect(SkillEffect):
         
         return result
     
-    def _execute_single(self, user, target, context):
-        """단일 타겟 데미지"""
+    def _execute_single(self, user, target, context, dmg_result=None):
+        """단일 타겟 데미지 (dmg_result: 광역 BRV 공격에서 미리 계산된 데미지)"""
         result = EffectResult(effect_type=EffectType.DAMAGE, success=True)
 
-        # 최종 배율 계산
+        # 최종 배율 계산 (광역 BRV 공격은 배율이 이미 반영된 dmg_result를 받음)
+        if dmg_result is None:
+            final_mult = self._calculate_final_multiplier(user, context)
+
+        if self.damage_type == DamageType.BRV:
+            if dmg_result is None:
+                dmg_result = self._calculate_brv_batch(user, [target], final_mult, context)[0]
+
+            brv_result = self.brave_system.brv_attack(user, target, dmg_result.final_damage)
+            result.brv_damage = brv_result['brv_stolen']
+            result.brv_gained = brv_result['actual_gain']
+            result.brv_broken = brv_result['is_break']
+            result.critical = dmg_result.is_critical
+            result.message = f"BRV 공격! {result.brv_damage}"
+        
+        elif self.damage_type == DamageType.HP:
+            # 물리/마법 구분하여 HP 공격
+            # 탄환 정보를 전달 (관통탄 방어 관통력용)
+            hp_kwargs = {}
+            if context and 'defense_pierce_fixed' in context:
+                hp_kwargs['defense_pierce_fixed'] = context['defense_pierce_fixed']
+            
+            # AOE HP 공격의 경우, 첫 번째 타겟에서만 실제로 BRV를 소모
+            # 나머지 타겟들에는 초기 BRV를 사용하되, 실제 소모는 하지 않음
+            is_aoe_hp = context and '_aoe_hp_initial_brv' in context
+            target_index = context.get('_aoe_hp_target_index', 0) if context else 0
+            is_first_target = (is_aoe_hp and target_index == 0)
+            
+            # 첫 번째 타겟이 아닌 경우, BRV를 임시로 초기값으로 설정 (데미지 계산용)
+            # 하지만 실제 소모는 하지 않음 (hp_attack 후 복원)
+            saved_brv = None
+            if is_aoe_hp and not is_first_target:
+                saved_brv = user.current_brv
+                user.current_brv = context['_aoe_hp_initial_brv']
+            
+            hp_result = self.brave_system.hp_attack(user, target, final_mult, damage_type=self.stat_type, **hp_kwargs)
+            
+            # 첫 번째 타겟이 아닌 경우, BRV를 복원 (실제로 소모하지 않음)
+            # 첫 번째 타겟에서는 BRV가 0이 되어야 하므로 그대로 둠
+            if is_aoe_hp and not is_first_target and saved_brv is not None:
+                # BRV를 복원 (실제로 소모하지 않았으므로 초기값 유지)
+                user.current_brv = context['_aoe_hp_initial_brv']
+            
+            result.hp_damage = hp_result['hp_damage']
+            result.damage_dealt = hp_result['hp_damage']
+            result.message = f"HP 공격! {result.hp_damage}"
+            if context is not None:
+                context['last_damage'] = result.hp_damage
+        
+        elif self.damage_type == DamageType.BRV_HP:
+            # 물리/마법 구분
+            if self.stat_type == "magical":
+                dmg_result = self.damage_calculator.calculate_magic_damage(user, target, final_mult)
+            else:
+                dmg_result = self.damage_calculator.calculate_brv_damage(user, target, final_mult)
+
+            brv_result = self.brave_system.brv_attack(user, target, dmg_result.final_damage)
+            result.brv_damage = brv_result['brv_stolen']
+            result.brv_gained = brv_result['actual_gain']
+            result.brv_broken = brv_result['is_break']
+            # HP 공격도 물리/마법 구분 - final_mult 사용 (기믹 보너스 적용)
+            hp_result = self.brave_system.hp_attack(user, target, final_mult, damage_type=self.stat_type)
+            result.hp_damage = hp_result['hp_damage']
+            result.damage_dealt = hp_result['hp_damage']
+            result.message = f"BRV+HP 공격! BRV:{result.brv_damage} HP:{result.hp_damage}"
+            if context is not None:
+                context['last_damage'] = result.hp_damage
+        
+        return result
+
+    def _calculate_final_multiplier(self, user, context):
+        """최종 배율 계산 (기믹 보너스, 조건부 보너스, HP 스케일링 - 타겟과 무관)"""
         final_mult = self.multiplier
 
         # 기믹 보너스
@@ -190,77 +272,16 @@ class DamageEffect(SkillEffect):
                 final_mult *= 2.0
             elif hp_percent < 0.5:
                 final_mult *= 1.5
-        
-        if self.damage_type == DamageType.BRV:
-            # 물리/마법 구분
-            # 탄환 정보를 kwargs에 전달 (관통탄 방어 관통력용)
-            calc_kwargs = {}
-            if context and 'defense_pierce_fixed' in context:
-                calc_kwargs['defense_pierce_fixed'] = context['defense_pierce_fixed']
-            
-            if self.stat_type == "magical":
-                dmg_result = self.damage_calculator.calculate_magic_damage(user, target, final_mult, **calc_kwargs)
-            else:
-                dmg_result = self.damage_calculator.calculate_brv_damage(user, target, final_mult, **calc_kwargs)
 
-            brv_result = self.brave_system.brv_attack(user, target, dmg_result.final_damage)
-            result.brv_damage = brv_result['brv_stolen']
-            result.brv_gained = brv_result['actual_gain']
-            result.brv_broken = brv_result['is_break']
-            result.critical = dmg_result.is_critical
-            result.message = f"BRV 공격! {result.brv_damage}"
-        
-        elif self.damage_type == DamageType.HP:
-            # 물리/마법 구분하여 HP 공격
-            # 탄환 정보를 전달 (관통탄 방어 관통력용)
-            hp_kwargs = {}
-            if context and 'defense_pierce_fixed' in context:
-                hp_kwargs['defense_pierce_fixed'] = context['defense_pierce_fixed']
-            
-            # AOE HP 공격의 경우, 첫 번째 타겟에서만 실제로 BRV를 소모
-            # 나머지 타겟들에는 초기 BRV를 사용하되, 실제 소모는 하지 않음
-            is_aoe_hp = context and '_aoe_hp_initial_brv' in context
-            target_index = context.get('_aoe_hp_target_index', 0) if context else 0
-            is_first_target = (is_aoe_hp and target_index == 0)
-            
-            # 첫 번째 타겟이 아닌 경우, BRV를 임시로 초기값으로 설정 (데미지 계산용)
-            # 하지만 실제 소모는 하지 않음 (hp_attack 후 복원)
-            saved_brv = None
-            if is_aoe_hp and not is_first_target:
-                saved_brv = user.current_brv
-                user.current_brv = context['_aoe_hp_initial_brv']
-            
-            hp_result = self.brave_system.hp_attack(user, target, final_mult, damage_type=self.stat_type, **hp_kwargs)
-            
-            # 첫 번째 타겟이 아닌 경우, BRV를 복원 (실제로 소모하지 않음)
-            # 첫 번째 타겟에서는 BRV가 0이 되어야 하므로 그대로 둠
-            if is_aoe_hp and not is_first_target and saved_brv is not None:
-                # BRV를 복원 (실제로 소모하지 않았으므로 초기값 유지)
-                user.current_brv = context['_aoe_hp_initial_brv']
-            
-            result.hp_damage = hp_result['hp_damage']
-            result.damage_dealt = hp_result['hp_damage']
-            result.message = f"HP 공격! {result.hp_damage}"
-            if context is not None:
-                context['last_damage'] = result.hp_damage
-        
-        elif self.damage_type == DamageType.BRV_HP:
-            # 물리/마법 구분
-            if self.stat_type == "magical":
-                dmg_result = self.damage_calculator.calculate_magic_damage(user, target, final_mult)
-            else:
-                dmg_result = self.damage_calculator.calculate_brv_damage(user, target, final_mult)
+        return final_mult
 
-            brv_result = self.brave_system.brv_attack(user, target, dmg_result.final_damage)
-            result.brv_damage = brv_result['brv_stolen']
-            result.brv_gained = brv_result['actual_gain']
-            result.brv_broken = brv_result['is_break']
-            # HP 공격도 물리/마법 구분 - final_mult 사용 (기믹 보너스 적용)
-            hp_result = self.brave_system.hp_attack(user, target, final_mult, damage_type=self.stat_type)
-            result.hp_damage = hp_result['hp_damage']
-            result.damage_dealt = hp_result['hp_damage']
-            result.message = f"BRV+HP 공격! BRV:{result.brv_damage} HP:{result.hp_damage}"
-            if context is not None:
-                context['last_damage'] = result.hp_damage
-        
-        return result
+    def _calculate_brv_batch(self, user, targets, final_mult, context):
+        """BRV 데미지 일괄 계산 (물리/마법 구분)"""
+        # 탄환 정보를 kwargs에 전달 (관통탄 방어 관통력용)
+        calc_kwargs = {}
+        if context and 'defense_pierce_fixed' in context:
+            calc_kwargs['defense_pierce_fixed'] = context['defense_pierce_fixed']
+
+        if self.stat_type == "magical":
+            return self.damage_calculator.calculate_magic_damage_batch(user, targets, final_mult, **calc_kwargs)
+        return self.damage_calculator.calculate_brv_damage_batch(user, targets, final_mult, **calc_kwargs)
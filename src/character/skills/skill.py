@@ -2,6 +2,8 @@
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+from src.character.skills.skill_plan import SkillPlan, compile_skill, get_character_facts, plan_key
+
 @dataclass
 class SkillResult:
     """스킬 실행 결과"""
@@ -25,6 +27,20 @@ class Skill:
         self.is_ultimate = False
         self.metadata = {}
         self.sfx: Optional[Tuple[str, str]] = None  # (category, sfx_name) 튜플
+        self._plan: Optional[SkillPlan] = None
+
+    @property
+    def plan(self) -> SkillPlan:
+        """실행 계획 (등록 시 컴파일, effects/costs 교체 시 재컴파일)"""
+        plan = getattr(self, '_plan', None)
+        if plan is None or plan.key != plan_key(self):
+            plan = self._plan = compile_skill(self)
+        return plan
+
+    def compile(self) -> SkillPlan:
+        """실행 계획 강제 재컴파일"""
+        self._plan = compile_skill(self)
+        return self._plan
 
     def can_use(self, user: Any, context: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
         """스킬 사용 가능 여부"""
@@ -247,67 +263,22 @@ class Skill:
         if not can_use:
             return SkillResult(success=False, message=f"사용 불가: {reason}")
 
-        # target_type이 "all_enemies"인 경우, context에서 all_enemies 가져오기
-        if hasattr(self, 'target_type') and self.target_type == "all_enemies":
-            all_enemies = context.get('all_enemies', [])
-            if all_enemies:
-                target = all_enemies
-            else:
-                # all_enemies가 없으면 combat_manager에서 가져오기
-                combat_manager = context.get('combat_manager')
-                if combat_manager:
-                    # 아군이 사용하는 경우 적 전체, 적이 사용하는 경우 아군 전체
-                    if hasattr(combat_manager, 'allies') and user in getattr(combat_manager, 'allies', []):
-                        target = getattr(combat_manager, 'enemies', [])
-                    elif hasattr(combat_manager, 'enemies') and user in getattr(combat_manager, 'enemies', []):
-                        target = getattr(combat_manager, 'allies', [])
-                    else:
-                        # 기본값: 적 전체
-                        target = getattr(combat_manager, 'enemies', [])
-                else:
-                    # combat_manager도 없으면 원래 target 유지 (하위 호환성)
-                    pass
-
-        # target_type이 "ALL_ALLIES"인 경우, context에서 아군 전체 가져오기
-        from src.character.skill_types import SkillTargetType
-        if hasattr(self, 'target_type') and (self.target_type == SkillTargetType.ALL_ALLIES or self.target_type == "all_allies"):
-            combat_manager = context.get('combat_manager')
-            if combat_manager:
-                # 아군이 사용하는 경우 아군 전체, 적이 사용하는 경우 적 전체
-                if hasattr(combat_manager, 'allies') and user in getattr(combat_manager, 'allies', []):
-                    target = getattr(combat_manager, 'allies', [])
-                elif hasattr(combat_manager, 'enemies') and user in getattr(combat_manager, 'enemies', []):
-                    target = getattr(combat_manager, 'enemies', [])
-                else:
-                    # 기본값: 아군 전체
-                    target = getattr(combat_manager, 'allies', [])
-            elif isinstance(target, list):
-                # 이미 리스트로 전달된 경우 그대로 사용
-                pass
-            else:
-                # combat_manager도 없고 리스트도 아니면 단일 타겟을 리스트로 변환
-                target = [target] if target else []
+        plan = self.plan
+        facts = get_character_facts(user)
+
+        # 대상 해석 (all_enemies / ALL_ALLIES는 context 또는 combat_manager에서 가져오기)
+        target = plan.resolve_target(user, target, context)
 
         # 비용 소비
         # 스냅샷 컨텍스트가 있으면 캐스팅 완료 후이므로 StackCost 건너뛰기
         # (스택은 effects의 GimmickEffect.CONSUME에서 처리)
         has_snapshot = 'snapshot_context' in context
-        is_dark_knight_for_cost = (hasattr(user, 'gimmick_type') and user.gimmick_type == "charge_system") or \
-                                  (hasattr(user, 'character_class') and 'dark_knight' in str(user.character_class).lower()) or \
-                                  (hasattr(user, 'job_id') and 'dark_knight' in str(user.job_id).lower())
-        
-        for cost in self.costs:
-            # 스냅샷이 있거나 암흑기사이고 StackCost인 경우 건너뛰기
-            if has_snapshot or is_dark_knight_for_cost:
-                from src.character.skills.costs.stack_cost import StackCost
-                if isinstance(cost, StackCost):
-                    continue  # StackCost는 건너뛰고 effects의 GimmickEffect.CONSUME에서 처리
-            
+        for cost in plan.cost_list(has_snapshot or facts.is_charge_user):
             if not cost.consume(user, context):
                 return SkillResult(success=False, message="비용 소비 실패")
 
         # 랜덤 룬 추가 처리 (배틀메이지)
-        if self.metadata.get("random_rune") and hasattr(user, 'gimmick_type') and user.gimmick_type == "rune_resonance":
+        if self.metadata.get("random_rune") and facts.gimmick_type == "rune_resonance":
             import random
             rune_types = ["fire", "ice", "lightning", "earth", "arcane"]
             selected_rune = random.choice(rune_types)
@@ -341,7 +312,7 @@ class Skill:
         custom_damage_refraction = None
         if self.metadata.get("custom_damage", False) and "refraction_consumption" in self.metadata:
             # 굴절량 소모 전 값을 저장 (고정 피해 계산용)
-            if hasattr(user, 'gimmick_type') and user.gimmick_type == "dimension_refraction":
+            if facts.gimmick_type == "dimension_refraction":
                 custom_damage_refraction = getattr(user, 'refraction_stacks', 0)
 
         # 효과 실행 (ISSUE-003: 효과 메시지 수집)
@@ -351,23 +322,15 @@ class Skill:
 
         # 수호의 맹세 스킬: 본인에게 보호막을 두르고 선택한 아군을 보호
         # ProtectEffect가 있으면 protect_self 플래그 설정
-        has_protect_effect = any(
-            effect.__class__.__name__ == 'ProtectEffect' 
-            for effect in self.effects
-        )
-        if has_protect_effect:
+        if plan.has_protect_effect:
             context['protect_self'] = True  # ShieldEffect는 본인에게 적용
-        
-        # 공격력 기반 보호막 배율 설정 (metadata에서 가져오기)
-        if self.metadata and 'attack_multiplier' in self.metadata:
-            context['attack_multiplier'] = self.metadata['attack_multiplier']
-        
-        # 보호막 중첩 방지 설정 (metadata에서 가져오기)
-        if self.metadata and 'replace_shield' in self.metadata:
-            context['replace_shield'] = self.metadata['replace_shield']
-        
+
+        # 공격력 기반 보호막 배율, 보호막 중첩 방지 설정 (metadata에서 가져오기)
+        if plan.static_context:
+            context.update(plan.static_context)
+
         # 저격수 탄환 정보를 context에 추가 (데미지 계산 전에)
-        if hasattr(user, 'gimmick_type') and user.gimmick_type == "magazine_system":
+        if facts.gimmick_type == "magazine_system":
             if hasattr(user, 'magazine') and user.magazine:
                 current_bullet = user.magazine[0]  # 다음 발사할 탄환
                 if hasattr(user, 'bullet_types') and current_bullet in user.bullet_types:
@@ -380,55 +343,30 @@ class Skill:
 
         # 암흑기사 한정: 효과 실행 순서 조정 (CONSUME/SET 연산은 데미지 계산 후에 실행)
         # 충전 보너스가 데미지 계산에 반영되도록 하기 위함
-        is_dark_knight = (hasattr(user, 'gimmick_type') and user.gimmick_type == "charge_system") or \
-                        (hasattr(user, 'character_class') and 'dark_knight' in str(user.character_class).lower()) or \
-                        (hasattr(user, 'job_id') and 'dark_knight' in str(user.job_id).lower())
-        
-        if is_dark_knight:
-            from src.character.skills.effects.gimmick_effect import GimmickEffect, GimmickOperation
-            
-            # 효과를 두 그룹으로 분리: 데미지/힐 효과와 기믹 소모 효과
-            damage_heal_effects = []
-            gimmick_consume_effects = []
-            
-            for effect in self.effects:
-                # CONSUME 또는 SET 연산인 GimmickEffect는 나중에 실행
-                if isinstance(effect, GimmickEffect) and effect.operation in [GimmickOperation.CONSUME, GimmickOperation.SET]:
-                    gimmick_consume_effects.append(effect)
-                else:
-                    damage_heal_effects.append(effect)
-            
-            # 먼저 데미지/힐 효과 실행 (충전 보너스가 적용됨)
-            for effect in damage_heal_effects:
-                if hasattr(effect, 'execute'):
-                    result = effect.execute(user, target, context)
-                    if hasattr(result, 'damage_dealt'):
-                        total_dmg += result.damage_dealt
-                    if hasattr(result, 'heal_amount'):
-                        total_heal += result.heal_amount
-                    # 효과 메시지 수집
-                    if hasattr(result, 'message') and result.message:
-                        effect_messages.append(result.message)
-            
-            # 그 다음 기믹 소모 효과 실행 (데미지 계산 후)
-            for effect in gimmick_consume_effects:
-                if hasattr(effect, 'execute'):
-                    result = effect.execute(user, target, context)
-                    # 효과 메시지 수집
-                    if hasattr(result, 'message') and result.message:
-                        effect_messages.append(result.message)
+        if facts.is_charge_user:
+            primary_effects = plan.charge_primary_effects
+            deferred_effects = plan.charge_deferred_effects
         else:
             # 다른 직업은 기존 순서대로 실행
-            for effect in self.effects:
-                if hasattr(effect, 'execute'):
-                    result = effect.execute(user, target, context)
-                    if hasattr(result, 'damage_dealt'):
-                        total_dmg += result.damage_dealt
-                    if hasattr(result, 'heal_amount'):
-                        total_heal += result.heal_amount
-                    # 효과 메시지 수집
-                    if hasattr(result, 'message') and result.message:
-                        effect_messages.append(result.message)
+            primary_effects = plan.effects
+            deferred_effects = ()
+
+        for effect in primary_effects:
+            result = effect.execute(user, target, context)
+            if hasattr(result, 'damage_dealt'):
+                total_dmg += result.damage_dealt
+            if hasattr(result, 'heal_amount'):
+                total_heal += result.heal_amount
+            # 효과 메시지 수집
+            if hasattr(result, 'message') and result.message:
+                effect_messages.append(result.message)
+
+        # 기믹 소모 효과 실행 (데미지 계산 후)
+        for effect in deferred_effects:
+            result = effect.execute(user, target, context)
+            # 효과 메시지 수집
+            if hasattr(result, 'message') and result.message:
+                effect_messages.append(result.message)
 
         # AOE 효과 실행 (적 전체 대상)
         if hasattr(self, 'aoe_effect') and self.aoe_effect:
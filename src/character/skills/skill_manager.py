@@ -14,6 +14,8 @@ class SkillManager:
     def register_skill(self, skill: Skill):
         """스킬 등록"""
         self._skills[skill.skill_id] = skill
+        # 실행 계획 컴파일 (대상 해석, 비용, 효과 순서, SFX)
+        skill.compile()
         self.logger.debug(f"스킬 등록: {skill.name}")
 
     def get_skill(self, skill_id: str) -> Optional[Skill]:
@@ -118,58 +120,13 @@ class SkillManager:
         return result
 
     def _play_skill_sfx(self, skill: Skill):
-        """스킬 타입에 따라 SFX 재생"""
+        """스킬 타입에 따라 SFX 재생 (실행 계획에 미리 결정된 SFX 사용)"""
         from src.audio import play_sfx
-        from src.character.skills.effects.damage_effect import DamageEffect, DamageType
-        from src.character.skills.effects.buff_effect import BuffEffect
-        from src.character.skills.effects.heal_effect import HealEffect
-
-        # 스킬에 직접 SFX가 지정되어 있으면 우선 사용
-        if skill.sfx:
-            if isinstance(skill.sfx, tuple):
-                category, sfx_name = skill.sfx
-                play_sfx(category, sfx_name)
-            return
-
-        # 스킬 effects 분석
-        has_brv_damage = False
-        has_hp_damage = False
-        has_buff = False
-        has_heal = False
-        is_magical = False
-
-        for effect in skill.effects:
-            if isinstance(effect, DamageEffect):
-                if effect.damage_type == DamageType.BRV:
-                    has_brv_damage = True
-                elif effect.damage_type == DamageType.HP:
-                    has_hp_damage = True
-                # 마법 속성 체크
-                if hasattr(effect, 'element') and effect.element in ['fire', 'ice', 'lightning', 'holy', 'dark']:
-                    is_magical = True
-            elif isinstance(effect, BuffEffect):
-                has_buff = True
-            elif isinstance(effect, HealEffect):
-                has_heal = True
-
-        # 우선순위에 따라 SFX 재생
-        if has_heal:
-            play_sfx("character", "hp_heal")
-        elif has_buff:
-            play_sfx("character", "status_buff")
-        elif has_hp_damage:
-            if is_magical:
-                play_sfx("combat", "attack_magic")
-            else:
-                play_sfx("combat", "attack_physical")
-        elif has_brv_damage:
-            if is_magical:
-                play_sfx("skill", "cast_complete")
-            else:
-                play_sfx("combat", "attack_physical")
-        else:
-            # 기본 SFX
-            play_sfx("skill", "cast_start")
+
+        sfx = skill.plan.sfx
+        if sfx:
+            category, sfx_name = sfx
+            play_sfx(category, sfx_name)
 
     # 쿨다운 시스템 제거됨 - 아래 메서드들은 더 이상 사용되지 않음
     # def is_on_cooldown(self, character: Any, skill_id: str) -> bool:
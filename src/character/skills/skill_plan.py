@@ -0,0 +1,227 @@
+"""
+Skill Plan - 스킬 실행 계획
+
+스킬 등록 시 대상 해석 함수, 비용 목록, 효과 실행 순서, 정적 컨텍스트 값을
+미리 계산해 두어 Skill.execute()가 매 호출마다 효과/비용을 다시 분석하지 않도록 합니다.
+플레이어 스킬, 봇 동료, 헤드리스 시뮬레이터 모두 Skill.execute()를 거치므로
+같은 계획을 공유합니다.
+"""
+
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.character.skill_types import SkillTargetType
+
+
+# 대상 해석 함수: (user, target, context) -> target
+TargetResolver = Callable[[Any, Any, Dict[str, Any]], Any]
+
+
+def _keep_target(user: Any, target: Any, context: Dict[str, Any]) -> Any:
+    """대상 변경 없음"""
+    return target
+
+
+def _user_is_ally(user: Any, combat_manager: Any) -> Optional[bool]:
+    """사용자 진영: CombatManager의 진영 맵(O(1)) 우선, 없으면 리스트 검색"""
+    is_ally = getattr(combat_manager, 'is_ally', None)
+    if is_ally is not None:
+        return is_ally(user)
+    if user in getattr(combat_manager, 'allies', []):
+        return True
+    if user in getattr(combat_manager, 'enemies', []):
+        return False
+    return None
+
+
+def _resolve_all_enemies(user: Any, target: Any, context: Dict[str, Any]) -> Any:
+    """적 전체: context의 all_enemies 우선, 없으면 combat_manager에서 진영 판정"""
+    all_enemies = context.get('all_enemies', [])
+    if all_enemies:
+        return all_enemies
+
+    combat_manager = context.get('combat_manager')
+    if not combat_manager:
+        # combat_manager도 없으면 원래 target 유지 (하위 호환성)
+        return target
+
+    # 아군이 사용하는 경우 적 전체, 적이 사용하는 경우 아군 전체 (기본값: 적 전체)
+    if _user_is_ally(user, combat_manager) is False:
+        return getattr(combat_manager, 'allies', [])
+    return getattr(combat_manager, 'enemies', [])
+
+
+def _resolve_all_allies(user: Any, target: Any, context: Dict[str, Any]) -> Any:
+    """아군 전체: combat_manager에서 사용자 진영 전체, 없으면 target을 리스트로"""
+    combat_manager = context.get('combat_manager')
+    if combat_manager:
+        # 아군이 사용하는 경우 아군 전체, 적이 사용하는 경우 적 전체 (기본값: 아군 전체)
+        if _user_is_ally(user, combat_manager) is False:
+            return getattr(combat_manager, 'enemies', [])
+        return getattr(combat_manager, 'allies', [])
+
+    if isinstance(target, list):
+        return target
+    return [target] if target else []
+
+
+def _select_target_resolver(target_type: Any) -> TargetResolver:
+    """target_type에 맞는 대상 해석 함수 선택"""
+    if target_type == "all_enemies":
+        return _resolve_all_enemies
+    if target_type == SkillTargetType.ALL_ALLIES or target_type == "all_allies":
+        return _resolve_all_allies
+    return _keep_target
+
+
+def _select_sfx(skill: Any) -> Tuple[str, str]:
+    """스킬 effects를 분석해 실행 SFX 결정"""
+    from src.character.skills.effects.damage_effect import DamageEffect, DamageType
+    from src.character.skills.effects.buff_effect import BuffEffect
+    from src.character.skills.effects.heal_effect import HealEffect
+
+    has_brv_damage = False
+    has_hp_damage = False
+    has_buff = False
+    has_heal = False
+    is_magical = False
+
+    for effect in skill.effects:
+        if isinstance(effect, DamageEffect):
+            if effect.damage_type == DamageType.BRV:
+                has_brv_damage = True
+            elif effect.damage_type == DamageType.HP:
+                has_hp_damage = True
+            # 마법 속성 체크
+            if hasattr(effect, 'element') and effect.element in ['fire', 'ice', 'lightning', 'holy', 'dark']:
+                is_magical = True
+        elif isinstance(effect, BuffEffect):
+            has_buff = True
+        elif isinstance(effect, HealEffect):
+            has_heal = True
+
+    # 우선순위에 따라 SFX 결정
+    if has_heal:
+        return ("character", "hp_heal")
+    if has_buff:
+        return ("character", "status_buff")
+    if has_hp_damage:
+        return ("combat", "attack_magic") if is_magical else ("combat", "attack_physical")
+    if has_brv_damage:
+        return ("skill", "cast_complete") if is_magical else ("combat", "attack_physical")
+    # 기본 SFX
+    return ("skill", "cast_start")
+
+
+def plan_key(skill: Any) -> Tuple:
+    """계획 무효화 판정용 키 (effects/costs 목록 교체 또는 추가 시 변경)"""
+    return (
+        id(skill.effects), len(skill.effects),
+        id(skill.costs), len(skill.costs),
+        skill.target_type, getattr(skill, 'sfx', None),
+    )
+
+
+class SkillPlan:
+    """스킬 실행 계획 (등록 시 1회 컴파일)"""
+
+    __slots__ = (
+        "key", "resolve_target", "costs", "costs_without_stack",
+        "effects", "charge_primary_effects", "charge_deferred_effects",
+        "has_protect_effect", "static_context", "sfx",
+    )
+
+    def __init__(self, skill: Any):
+        from src.character.skills.costs.stack_cost import StackCost
+        from src.character.skills.effects.gimmick_effect import GimmickEffect, GimmickOperation
+
+        self.key = plan_key(skill)
+        self.resolve_target: TargetResolver = _select_target_resolver(skill.target_type)
+
+        # 비용: 스냅샷/암흑기사는 StackCost를 건너뜀 (GimmickEffect.CONSUME에서 처리)
+        self.costs = tuple(skill.costs)
+        self.costs_without_stack = tuple(c for c in skill.costs if not isinstance(c, StackCost))
+
+        # 효과: 기본 순서와 암흑기사 순서 (CONSUME/SET 연산은 데미지 계산 후)
+        self.effects = tuple(e for e in skill.effects if hasattr(e, 'execute'))
+        deferred_ops = (GimmickOperation.CONSUME, GimmickOperation.SET)
+        self.charge_primary_effects = tuple(
+            e for e in self.effects
+            if not (isinstance(e, GimmickEffect) and e.operation in deferred_ops)
+        )
+        self.charge_deferred_effects = tuple(
+            e for e in self.effects
+            if isinstance(e, GimmickEffect) and e.operation in deferred_ops
+        )
+
+        # 수호의 맹세: ProtectEffect가 있으면 ShieldEffect는 본인에게 적용
+        self.has_protect_effect = any(
+            effect.__class__.__name__ == 'ProtectEffect' for effect in skill.effects
+        )
+
+        # metadata에서 context로 복사되는 정적 값 (보호막 배율, 중첩 방지)
+        self.static_context: Dict[str, Any] = {}
+        if skill.metadata:
+            for key in ('attack_multiplier', 'replace_shield'):
+                if key in skill.metadata:
+                    self.static_context[key] = skill.metadata[key]
+
+        # SFX: 직접 지정된 값 우선, 없으면 effects 분석 결과
+        self.sfx: Optional[Tuple[str, str]] = skill.sfx if isinstance(skill.sfx, tuple) else None
+        if not skill.sfx:
+            self.sfx = _select_sfx(skill)
+
+    def cost_list(self, skip_stack_cost: bool) -> Tuple:
+        """소비할 비용 목록"""
+        return self.costs_without_stack if skip_stack_cost else self.costs
+
+
+def compile_skill(skill: Any) -> SkillPlan:
+    """스킬 실행 계획 컴파일"""
+    return SkillPlan(skill)
+
+
+def _facts_source(user: Any) -> Tuple[Any, Any, Any]:
+    """CharacterFacts를 파생하는 필드 (기믹 타입, 직업, 직업 ID)"""
+    return (
+        getattr(user, 'gimmick_type', None),
+        getattr(user, 'character_class', None),
+        getattr(user, 'job_id', None),
+    )
+
+
+class CharacterFacts:
+    """스킬 실행에 쓰이는 캐릭터별 파생 정보 (직업 플래그, 기믹 타입)"""
+
+    __slots__ = ("source", "gimmick_type", "is_charge_user", "__weakref__")
+
+    def __init__(self, user: Any, source: Optional[Tuple[Any, Any, Any]] = None):
+        self.source = source if source is not None else _facts_source(user)
+        gimmick_type, character_class, job_id = self.source
+        self.gimmick_type = gimmick_type
+        # 암흑기사 판정: 충전 기믹 또는 직업명
+        self.is_charge_user = (
+            gimmick_type == "charge_system" or
+            'dark_knight' in str(character_class).lower() or
+            'dark_knight' in str(job_id).lower()
+        )
+
+
+_facts_cache: "weakref.WeakKeyDictionary[Any, CharacterFacts]" = weakref.WeakKeyDictionary()
+
+
+def get_character_facts(user: Any) -> CharacterFacts:
+    """캐릭터 파생 정보 (직업/기믹 필드가 그대로면 캐시 재사용, 바뀌면 다시 계산)"""
+    source = _facts_source(user)
+    try:
+        facts = _facts_cache.get(user)
+    except TypeError:
+        # 약한 참조/해시 불가 객체는 매번 계산
+        return CharacterFacts(user, source)
+    if facts is None or facts.source != source:
+        facts = CharacterFacts(user, source)
+        try:
+            _facts_cache[user] = facts
+        except TypeError:
+            pass
+    return facts
@@ -22,6 +22,7 @@ class Stat:
     개별 스탯 클래스
 
     각 스탯은 기본값, 보너스, 성장 방식을 가집니다.
+    총 값은 캐시되며 기본값/보너스/범위가 바뀔 때만 다시 계산됩니다 (version 증가).
     """
 
     def __init__(
@@ -38,13 +39,47 @@ class Stat:
         self._base_value = base_value
         self.growth_rate = growth_rate
         self.growth_type = growth_type
-        self.min_value = min_value
-        self.max_value = max_value
+        self._min_value = min_value
+        self._max_value = max_value
         self.custom_growth_func = custom_growth_func
 
         # 보너스 (장비, 버프 등)
         self._bonuses: Dict[str, float] = {}
 
+        # 총 값 캐시 (None이면 재계산 필요)
+        self._total: Optional[float] = None
+        self.version = 0
+
+        # 변경 통지 대상 (StatManager가 등록)
+        self._manager: Optional["StatManager"] = None
+
+    def _invalidate(self) -> None:
+        """총 값 캐시 무효화"""
+        self._total = None
+        self.version += 1
+        if self._manager is not None:
+            self._manager._invalidate()
+
+    @property
+    def min_value(self) -> float:
+        """최소 값"""
+        return self._min_value
+
+    @min_value.setter
+    def min_value(self, value: float) -> None:
+        self._min_value = value
+        self._invalidate()
+
+    @property
+    def max_value(self) -> Optional[float]:
+        """최대 값 (None이면 제한 없음)"""
+        return self._max_value
+
+    @max_value.setter
+    def max_value(self, value: Optional[float]) -> None:
+        self._max_value = value
+        self._invalidate()
+
     @property
     def base_value(self) -> float:
         """기본 값"""
@@ -54,12 +89,16 @@ class Stat:
     def base_value(self, value: float) -> None:
         """기본 값 설정 (최소/최대 제한 적용)"""
         self._base_value = self._clamp(value)
+        self._invalidate()
 
     @property
     def total_value(self) -> float:
-        """총 값 (기본 + 모든 보너스)"""
-        total = self._base_value + sum(self._bonuses.values())
-        return self._clamp(total)
+        """총 값 (기본 + 모든 보너스, 캐시됨)"""
+        total = self._total
+        if total is None:
+            total = self._clamp(self._base_value + sum(self._bonuses.values()))
+            self._total = total
+        return total
 
     def add_bonus(self, source: str, value: float) -> None:
         """
@@ -69,11 +108,15 @@ class Stat:
             source: 보너스 출처 (예: "장비", "버프")
             value: 보너스 값
         """
+        if source in self._bonuses and self._bonuses[source] == value:
+            return
         self._bonuses[source] = value
+        self._invalidate()
 
     def remove_bonus(self, source: str) -> None:
         """보너스 제거"""
-        self._bonuses.pop(source, None)
+        if self._bonuses.pop(source, None) is not None:
+            self._invalidate()
 
     def get_bonus(self, source: str) -> float:
         """특정 출처의 보너스 조회"""
@@ -81,7 +124,9 @@ class Stat:
 
     def clear_bonuses(self) -> None:
         """모든 보너스 제거"""
-        self._bonuses.clear()
+        if self._bonuses:
+            self._bonuses.clear()
+            self._invalidate()
 
     def calculate_growth(self, level: int) -> float:
         """
@@ -121,9 +166,9 @@ class Stat:
 
     def _clamp(self, value: float) -> float:
         """값을 최소/최대 범위 내로 제한"""
-        value = max(value, self.min_value)
-        if self.max_value is not None:
-            value = min(value, self.max_value)
+        value = max(value, self._min_value)
+        if self._max_value is not None:
+            value = min(value, self._max_value)
         return value
 
     def to_dict(self) -> Dict[str, Any]:
@@ -143,6 +188,7 @@ class StatManager:
     스탯 매니저
 
     캐릭터의 모든 스탯을 관리하는 중앙 시스템
+    어떤 스탯이든 바뀌면 version이 증가하고 snapshot() 캐시가 무효화됩니다.
     """
 
     def __init__(self, stats_config: Dict[str, Any]) -> None:
@@ -151,19 +197,35 @@ class StatManager:
             stats_config: 스탯 설정 딕셔너리
         """
         self.stats: Dict[str, Stat] = {}
+        self.version = 0
+        self._snapshot: Optional[Dict[str, float]] = None
         self._initialize_stats(stats_config)
 
     def _initialize_stats(self, config: Dict[str, Any]) -> None:
         """설정에서 스탯 초기화"""
         for stat_name, stat_config in config.items():
-            self.stats[stat_name] = Stat(
+            self._register(Stat(
                 name=stat_name,
                 base_value=stat_config.get("base_value", 0),
                 growth_rate=stat_config.get("growth_rate", 1.0),
                 growth_type=GrowthType(stat_config.get("growth_type", "linear")),
                 min_value=stat_config.get("min_value", 0),
                 max_value=stat_config.get("max_value")
-            )
+            ))
+
+    def _register(self, stat: Stat) -> None:
+        """스탯 등록 (변경 통지 연결)"""
+        old = self.stats.get(stat.name)
+        if old is not None:
+            old._manager = None
+        stat._manager = self
+        self.stats[stat.name] = stat
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """스냅샷 캐시 무효화"""
+        self._snapshot = None
+        self.version += 1
 
     def get(self, stat_name: str) -> Optional[Stat]:
         """스탯 가져오기"""
@@ -180,10 +242,10 @@ class StatManager:
         Returns:
             스탯 값 (스탯이 없으면 0)
         """
-        stat = self.get(stat_name)
+        stat = self.stats.get(stat_name)
         if stat is None:
             return 0.0
-        return stat.total_value if use_total else stat.base_value
+        return stat.total_value if use_total else stat._base_value
 
     def set_base_value(self, stat_name: str, value: float) -> None:
         """기본 값 설정"""
@@ -255,11 +317,14 @@ class StatManager:
             growth_rate: 성장률
             growth_type: 성장 타입
         """
-        self.stats[name] = Stat(name, base_value, growth_rate, growth_type)
+        self._register(Stat(name, base_value, growth_rate, growth_type))
 
     def remove_stat(self, name: str) -> None:
         """스탯 제거"""
-        self.stats.pop(name, None)
+        stat = self.stats.pop(name, None)
+        if stat is not None:
+            stat._manager = None
+            self._invalidate()
 
     def has_stat(self, name: str) -> bool:
         """스탯 존재 여부"""
@@ -267,7 +332,22 @@ class StatManager:
 
     def get_all_stats(self) -> Dict[str, float]:
         """모든 스탯의 총 값"""
-        return {name: stat.total_value for name, stat in self.stats.items()}
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        모든 스탯의 총 값을 한 번에 가져오기 (직렬화/네트워크 동기화용)
+
+        스탯이 바뀌지 않았으면 이전 결과를 재사용합니다.
+
+        Returns:
+            {스탯 이름: 총 값} (호출자가 수정해도 캐시에 영향 없는 사본)
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = {name: stat.total_value for name, stat in self.stats.items()}
+            self._snapshot = snapshot
+        return dict(snapshot)
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환 (저장용)"""
@@ -280,14 +360,16 @@ class StatManager:
         """딕셔너리에서 복원"""
         manager = cls.__new__(cls)
         manager.stats = {}
+        manager.version = 0
+        manager._snapshot = None
 
         for name, stat_data in data.items():
-            manager.stats[name] = Stat(
+            manager._register(Stat(
                 name=stat_data["name"],
                 base_value=stat_data["base_value"],
                 growth_rate=stat_data["growth_rate"],
                 growth_type=GrowthType(stat_data["growth_type"])
-            )
+            ))
             # 보너스 복원
             for source, value in stat_data.get("bonuses", {}).items():
                 manager.stats[name].add_bonus(source, value)
@@ -4,7 +4,7 @@ Trait Effects - 특성 효과 시스템
 특성(Trait)이 실제 게임플레이에 영향을 주도록 구현
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -67,6 +67,35 @@ class TraitEffect:
     metadata: Optional[Dict[str, Any]] = None
 
 
+# 매번 캐릭터 상태를 읽어야 하는 스탯 효과 대상 (컴파일 시 정적 테이블에서 제외)
+DYNAMIC_STAT_TARGETS = ("all_stats_per_program", "stats_per_1000gold")
+
+
+class CompiledTraits:
+    """
+    캐릭터별 특성 효과 테이블
+
+    활성 특성 + 시스템 특성의 효과를 한 번 펼쳐 두고, 스탯/효과 타입별
+    계산 결과(정적 배율·합계와 동적 효과 목록)를 지연 생성해 캐시합니다.
+    특성 목록이 바뀌면 TraitEffectManager.compile_traits()가 새로 만듭니다.
+    """
+
+    def __init__(self, key: Tuple[Tuple[Any, ...], Tuple[Any, ...]], entries: List[Tuple[str, TraitEffect]]):
+        self.key = key
+        self.entries = entries  # (특성 ID, 효과) - 원래 적용 순서
+
+        # 효과 타입별 목록
+        self.by_type: Dict[TraitEffectType, List[Tuple[str, TraitEffect]]] = {}
+        for trait_id, effect in entries:
+            self.by_type.setdefault(effect.effect_type, []).append((trait_id, effect))
+
+        # 스탯별 연산 목록 (calculate_stat_bonus)
+        self.stat_ops: Dict[str, List[tuple]] = {}
+
+        # 기타 계산 캐시 (정적 값, 동적 효과 목록)
+        self.cache: Dict[tuple, tuple] = {}
+
+
 class TraitEffectManager:
     """
     특성 효과 관리자
@@ -3457,152 +3486,236 @@ class TraitEffectManager:
             traits.extend(character.system_traits)
         return traits
 
-    def calculate_stat_bonus(
-        self,
-        character: Any,
-        stat_name: str,
-        base_value: float
-    ) -> float:
+    def _trait_key(self, character: Any) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+        """특성 목록 식별 키 (특성 ID 순서 - 목록 교체/추가/제거/같은 길이의 제자리 교체 감지용)"""
+        active = getattr(character, 'active_traits', None) or ()
+        system = getattr(character, 'system_traits', None) or ()
+        return (
+            tuple(t if isinstance(t, str) else t.get('id') for t in active),
+            tuple(t if isinstance(t, str) else t.get('id') for t in system),
+        )
+
+    def compile_traits(self, character: Any) -> CompiledTraits:
         """
-        특성에 의한 스탯 보너스 계산
+        캐릭터의 특성 효과 테이블 가져오기 (없거나 특성 목록이 바뀌었으면 재컴파일)
 
         Args:
             character: 캐릭터
-            stat_name: 스탯 이름
-            base_value: 기본 스탯 값
 
         Returns:
-            보너스 적용된 최종 값
+            컴파일된 특성 효과 테이블
         """
-        final_value = base_value
-        all_traits = self._get_all_traits(character)
+        key = self._trait_key(character)
+        compiled = getattr(character, '_compiled_traits', None)
+        if compiled is not None and compiled.key == key:
+            return compiled
 
-        for trait_data in all_traits:
+        entries = []
+        for trait_data in self._get_all_traits(character):
             trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
+            for effect in self.get_trait_effects(trait_id):
+                entries.append((trait_id, effect))
+
+        compiled = CompiledTraits(key, entries)
+        try:
+            character._compiled_traits = compiled
+        except AttributeError:
+            pass
+        return compiled
+
+    def invalidate_traits(self, character: Any) -> None:
+        """특성 활성화/비활성화 시 컴파일된 테이블 폐기"""
+        if getattr(character, '_compiled_traits', None) is not None:
+            character._compiled_traits = None
+
+    @staticmethod
+    def _static_stat_op(effect: TraitEffect, stat_name: str) -> Optional[Tuple[str, float]]:
+        """
+        상태와 무관한 스탯 효과를 연산으로 변환
 
-            for effect in effects:
-                # 조건 확인
-                if effect.condition and not self._check_condition(character, effect.condition):
-                    continue
+        Returns:
+            ("mul", 배율) / ("add", 고정값) / None (해당 스탯에 영향 없음)
+        """
+        effect_type = effect.effect_type
+        if effect.target_stat and effect.target_stat != stat_name:
+            if effect.target_stat == "all_stats":
+                if effect_type == TraitEffectType.STAT_MULTIPLIER:
+                    return ("mul", effect.value)
+                if effect_type == TraitEffectType.STAT_FLAT:
+                    return ("add", effect.value)
+            elif effect_type == TraitEffectType.ALL_STATS_MULTIPLIER:
+                return ("mul", effect.value)
+            elif effect.target_stat == "all_stats_in_stance":
+                if effect_type == TraitEffectType.STAT_MULTIPLIER:
+                    return ("mul", effect.value)
+            return None
+
+        if effect_type in (TraitEffectType.STAT_MULTIPLIER, TraitEffectType.ALL_STATS_MULTIPLIER):
+            return ("mul", effect.value)
+        if effect_type == TraitEffectType.STAT_FLAT:
+            return ("add", effect.value)
+        return None
+
+    def _compile_stat_ops(self, compiled: CompiledTraits, stat_name: str) -> List[tuple]:
+        """
+        스탯 하나에 대한 연산 목록 생성 (원래 적용 순서 유지)
 
-                # hp_low_scaling 조건은 target_stat과 독립적으로 체크 (HP 비례 스케일링)
-                if effect.condition == "hp_low_scaling":
-                    if hasattr(character, 'current_hp') and hasattr(character, 'max_hp') and character.max_hp > 0:
-                        hp_ratio = character.current_hp / character.max_hp
-                        # HP가 낮을수록 증가 (1.0 - hp_ratio)
-                        # effect.value가 1.50이면 최대 50% 증가
-                        # 최종 배율 = 1.0 + (value - 1.0) * (1 - hp_ratio)
-                        bonus = (effect.value - 1.0) * (1.0 - hp_ratio)
-                        scaling_multiplier = 1.0 + bonus
-
-                        # target_stat이 현재 stat_name과 일치하는지 확인
-                        if effect.target_stat == stat_name or effect.target_stat == "all_stats":
-                            final_value *= scaling_multiplier
-                            self.logger.debug(
-                                f"[{trait_id}] {stat_name} HP 스케일링 적용: HP {hp_ratio*100:.1f}% → x{scaling_multiplier:.3f} → {final_value}"
-                            )
-                    continue  # hp_low_scaling 처리 후 다음 효과로
-
-                # 스탯 타겟 확인
-                if effect.target_stat and effect.target_stat != stat_name:
-                    # all_stats_per_program은 모든 스탯에 적용 (프로그램 수에 비례)
-                    if effect.target_stat == "all_stats_per_program":
-                        # 해커의 활성 프로그램 수 계산
-                        program_fields = ['program_virus', 'program_backdoor', 'program_ddos', 'program_ransomware', 'program_spyware']
-                        active_programs = sum(1 for field in program_fields if getattr(character, field, 0) > 0)
-                        if active_programs > 0:
-                            # 프로그램당 보너스 적용 (value는 프로그램당 배율)
-                            program_bonus = effect.value ** active_programs  # 1.15^프로그램수
-                            final_value *= program_bonus
-                            self.logger.debug(
-                                f"[{trait_id}] {stat_name} 프로그램 보너스 적용: 프로그램 {active_programs}개 × {effect.value} → x{program_bonus:.3f} → {final_value}"
-                            )
-                    # all_stats는 모든 스탯에 적용
-                    elif effect.target_stat == "all_stats":
-                        # 모든 스탯에 보너스 적용
-                        if effect.effect_type == TraitEffectType.STAT_MULTIPLIER:
-                            final_value *= effect.value
-                            self.logger.debug(
-                                f"[{trait_id}] {stat_name} 전체 스탯 보너스 적용: x{effect.value} → {final_value}"
-                            )
-                        elif effect.effect_type == TraitEffectType.STAT_FLAT:
-                            final_value += effect.value
-                            self.logger.debug(
-                                f"[{trait_id}] {stat_name} 전체 스탯 고정값 보너스 적용: +{effect.value} → {final_value}"
-                            )
-                    # ALL_STATS_MULTIPLIER 타입은 모든 스탯에 적용
-                    elif effect.effect_type == TraitEffectType.ALL_STATS_MULTIPLIER:
-                        final_value *= effect.value
-                        self.logger.debug(
-                            f"[{trait_id}] {stat_name} 모든 스탯 배율 적용: x{effect.value} → {final_value}"
-                        )
-                    # all_stats_in_stance는 모든 스탯에 적용 (전사 특성)
-                    elif effect.target_stat == "all_stats_in_stance":
-                        # 모든 스탯에 보너스 적용
-                        if effect.effect_type == TraitEffectType.STAT_MULTIPLIER:
-                            final_value *= effect.value
-                            self.logger.debug(
-                                f"[{trait_id}] {stat_name} 자세 전체 스탯 보너스 적용: x{effect.value} → {final_value}"
-                            )
-                    # stats_per_1000gold는 골드 보유량에 비례한 스탯 증가 (해적 탐욕 특성)
-                    elif effect.target_stat == "stats_per_1000gold":
-                        # 골드 보유량 가져오기
-                        gold_amount = 0
-                        
-                        # 1. character에 inventory 속성이 있는 경우
-                        if hasattr(character, 'inventory') and hasattr(character.inventory, 'gold'):
-                            gold_amount = character.inventory.gold
-                        # 2. character에 직접 gold 속성이 있는 경우
-                        elif hasattr(character, 'gold'):
-                            gold_amount = character.gold
-                        # 3. 파티에서 골드 가져오기 시도
-                        elif hasattr(character, 'party') and character.party:
-                            for member in character.party:
-                                if hasattr(member, 'inventory') and hasattr(member.inventory, 'gold'):
-                                    gold_amount = member.inventory.gold
-                                    break
-                        # 4. 전역 게임 상태에서 골드 가져오기 시도
-                        else:
-                            try:
-                                # main.py의 전역 변수에서 골드 가져오기
-                                import main
-                                if hasattr(main, 'inventory') and hasattr(main.inventory, 'gold'):
-                                    gold_amount = main.inventory.gold
-                            except:
-                                pass
-                        
-                        # 70골드당 +2% (기존: 250골드당 +2%)
-                        gold_units = gold_amount // 70
-                        bonus_multiplier = 1.0 + (gold_units * 0.02)  # 70골드당 +2%
-                        
-                        # 최대값 50%로 제한
-                        max_multiplier = 1.50  # 최대 +50%
-                        bonus_multiplier = min(bonus_multiplier, max_multiplier)
-                        
-                        if bonus_multiplier > 1.0:
-                            final_value *= bonus_multiplier
-                            self.logger.debug(
-                                f"[{trait_id}] {stat_name} 골드 보너스 적용: {gold_amount}골드 ({gold_units}×70) → x{bonus_multiplier:.3f} → {final_value}"
-                            )
-                    continue
+        연속된 정적 배율/고정값은 하나로 합치고, 조건부·상태 의존 효과는
+        ("dynamic", 특성 ID, 효과)로 남겨 계산 시점에 평가합니다.
+        """
+        ops: List[tuple] = []
+        for trait_id, effect in compiled.entries:
+            op = self._static_stat_op(effect, stat_name)
+
+            if effect.condition or effect.target_stat in DYNAMIC_STAT_TARGETS:
+                # 이 스탯에 영향을 줄 수 있는 효과만 동적 평가 대상으로 남김
+                hp_scaling = (
+                    effect.condition == "hp_low_scaling"
+                    and effect.target_stat in (stat_name, "all_stats")
+                )
+                if op is not None or hp_scaling or effect.target_stat in DYNAMIC_STAT_TARGETS:
+                    ops.append(("dynamic", trait_id, effect))
+                continue
+
+            if op is None:
+                continue
+            kind, value = op
+            if ops and ops[-1][0] == kind:
+                merged = ops[-1][1] * value if kind == "mul" else ops[-1][1] + value
+                ops[-1] = (kind, merged)
+            else:
+                ops.append(op)
+        return ops
 
-                # 효과 적용
-                if effect.effect_type == TraitEffectType.STAT_MULTIPLIER:
-                    final_value *= effect.value
+    def _apply_dynamic_stat_effect(
+        self,
+        character: Any,
+        trait_id: str,
+        effect: TraitEffect,
+        stat_name: str,
+        final_value: float
+    ) -> float:
+        """조건부·상태 의존 스탯 효과 하나를 적용"""
+        # 조건 확인
+        if effect.condition and not self._check_condition(character, effect.condition):
+            return final_value
+
+        # hp_low_scaling 조건은 target_stat과 독립적으로 체크 (HP 비례 스케일링)
+        if effect.condition == "hp_low_scaling":
+            if hasattr(character, 'current_hp') and hasattr(character, 'max_hp') and character.max_hp > 0:
+                hp_ratio = character.current_hp / character.max_hp
+                # HP가 낮을수록 증가 (1.0 - hp_ratio)
+                # effect.value가 1.50이면 최대 50% 증가
+                # 최종 배율 = 1.0 + (value - 1.0) * (1 - hp_ratio)
+                bonus = (effect.value - 1.0) * (1.0 - hp_ratio)
+                scaling_multiplier = 1.0 + bonus
+
+                # target_stat이 현재 stat_name과 일치하는지 확인
+                if effect.target_stat == stat_name or effect.target_stat == "all_stats":
+                    final_value *= scaling_multiplier
                     self.logger.debug(
-                        f"[{trait_id}] {stat_name} 배율 적용: x{effect.value} → {final_value}"
+                        f"[{trait_id}] {stat_name} HP 스케일링 적용: HP {hp_ratio*100:.1f}% → x{scaling_multiplier:.3f} → {final_value}"
                     )
-                elif effect.effect_type == TraitEffectType.STAT_FLAT:
-                    final_value += effect.value
+            return final_value
+
+        # 스탯 타겟 확인
+        if effect.target_stat and effect.target_stat != stat_name:
+            # all_stats_per_program은 모든 스탯에 적용 (프로그램 수에 비례)
+            if effect.target_stat == "all_stats_per_program":
+                # 해커의 활성 프로그램 수 계산
+                program_fields = ['program_virus', 'program_backdoor', 'program_ddos', 'program_ransomware', 'program_spyware']
+                active_programs = sum(1 for field in program_fields if getattr(character, field, 0) > 0)
+                if active_programs > 0:
+                    # 프로그램당 보너스 적용 (value는 프로그램당 배율)
+                    program_bonus = effect.value ** active_programs  # 1.15^프로그램수
+                    final_value *= program_bonus
                     self.logger.debug(
-                        f"[{trait_id}] {stat_name} 고정값 적용: +{effect.value} → {final_value}"
+                        f"[{trait_id}] {stat_name} 프로그램 보너스 적용: 프로그램 {active_programs}개 × {effect.value} → x{program_bonus:.3f} → {final_value}"
                     )
-                elif effect.effect_type == TraitEffectType.ALL_STATS_MULTIPLIER:
-                    final_value *= effect.value
+            # stats_per_1000gold는 골드 보유량에 비례한 스탯 증가 (해적 탐욕 특성)
+            elif effect.target_stat == "stats_per_1000gold":
+                # 골드 보유량 가져오기
+                gold_amount = 0
+
+                # 1. character에 inventory 속성이 있는 경우
+                if hasattr(character, 'inventory') and hasattr(character.inventory, 'gold'):
+                    gold_amount = character.inventory.gold
+                # 2. character에 직접 gold 속성이 있는 경우
+                elif hasattr(character, 'gold'):
+                    gold_amount = character.gold
+                # 3. 파티에서 골드 가져오기 시도
+                elif hasattr(character, 'party') and character.party:
+                    for member in character.party:
+                        if hasattr(member, 'inventory') and hasattr(member.inventory, 'gold'):
+                            gold_amount = member.inventory.gold
+                            break
+                # 4. 전역 게임 상태에서 골드 가져오기 시도
+                else:
+                    try:
+                        # main.py의 전역 변수에서 골드 가져오기
+                        import main
+                        if hasattr(main, 'inventory') and hasattr(main.inventory, 'gold'):
+                            gold_amount = main.inventory.gold
+                    except:
+                        pass
+
+                # 70골드당 +2% (기존: 250골드당 +2%)
+                gold_units = gold_amount // 70
+                bonus_multiplier = 1.0 + (gold_units * 0.02)  # 70골드당 +2%
+
+                # 최대값 50%로 제한
+                max_multiplier = 1.50  # 최대 +50%
+                bonus_multiplier = min(bonus_multiplier, max_multiplier)
+
+                if bonus_multiplier > 1.0:
+                    final_value *= bonus_multiplier
                     self.logger.debug(
-                        f"[{trait_id}] {stat_name} 모든 스탯 배율 적용: x{effect.value} → {final_value}"
+                        f"[{trait_id}] {stat_name} 골드 보너스 적용: {gold_amount}골드 ({gold_units}×70) → x{bonus_multiplier:.3f} → {final_value}"
                     )
+            else:
+                # 조건을 만족한 일반 전체 스탯 효과
+                op = self._static_stat_op(effect, stat_name)
+                if op is not None:
+                    final_value = final_value * op[1] if op[0] == "mul" else final_value + op[1]
+            return final_value
+
+        # 조건을 만족한 일반 스탯 효과
+        op = self._static_stat_op(effect, stat_name)
+        if op is not None:
+            final_value = final_value * op[1] if op[0] == "mul" else final_value + op[1]
+        return final_value
+
+    def calculate_stat_bonus(
+        self,
+        character: Any,
+        stat_name: str,
+        base_value: float
+    ) -> float:
+        """
+        특성에 의한 스탯 보너스 계산
+
+        Args:
+            character: 캐릭터
+            stat_name: 스탯 이름
+            base_value: 기본 스탯 값
+
+        Returns:
+            보너스 적용된 최종 값
+        """
+        compiled = self.compile_traits(character)
+        ops = compiled.stat_ops.get(stat_name)
+        if ops is None:
+            ops = compiled.stat_ops[stat_name] = self._compile_stat_ops(compiled, stat_name)
+
+        final_value = base_value
+        for op in ops:
+            kind = op[0]
+            if kind == "mul":
+                final_value *= op[1]
+            elif kind == "add":
+                final_value += op[1]
+            else:
+                final_value = self._apply_dynamic_stat_effect(character, op[1], op[2], stat_name, final_value)
 
         return final_value
 
@@ -3623,42 +3736,75 @@ class TraitEffectManager:
         Returns:
             총 데미지 배율 (1.0 = 100%)
         """
-        total_multiplier = 1.0
-        all_traits = self._get_all_traits(character)
+        compiled = self.compile_traits(character)
+        cache_key = ("damage", damage_type)
+        cached = compiled.cache.get(cache_key)
+        if cached is None:
+            static_multiplier = 1.0
+            dynamic = []
+            for trait_id, effect in compiled.by_type.get(TraitEffectType.DAMAGE_MULTIPLIER, ()):
+                if effect.condition or effect.target_stat == "elemental":
+                    dynamic.append((trait_id, effect))
+                elif effect.target_stat in (None, "", damage_type, "all_attack", "next_attack"):
+                    static_multiplier *= effect.value
+            cached = compiled.cache[cache_key] = (static_multiplier, dynamic)
+
+        total_multiplier, dynamic = cached
+        for trait_id, effect in dynamic:
+            # 조건 확인
+            if effect.condition and not self._check_condition(character, effect.condition, context):
+                continue
+
+            # 타겟 확인
+            if effect.target_stat:
+                # 데미지 타입이 맞는지 확인
+                if effect.target_stat in (damage_type, "all_attack", "next_attack"):
+                    total_multiplier *= effect.value
+                elif effect.target_stat == "elemental" and context.get("is_elemental"):
+                    total_multiplier *= effect.value
+            else:
+                # 타겟이 없으면 모든 데미지에 적용
+                total_multiplier *= effect.value
 
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
+            self.logger.debug(
+                f"[{trait_id}] 데미지 배율 적용: x{effect.value} → 총 x{total_multiplier}"
+            )
 
-            for effect in effects:
-                if effect.effect_type != TraitEffectType.DAMAGE_MULTIPLIER:
-                    continue
+        return total_multiplier
 
-                # 조건 확인
-                if effect.condition and not self._check_condition(character, effect.condition, context):
-                    continue
+    def _combine_effects(
+        self,
+        character: Any,
+        effect_type: TraitEffectType,
+        multiply: bool = False,
+        context: Optional[Dict[str, Any]] = None,
+        check_conditions: bool = True
+    ) -> float:
+        """
+        같은 타입 효과 합산 (multiply=True면 곱)
 
-                # 타겟 확인
-                if effect.target_stat:
-                    # 데미지 타입이 맞는지 확인
-                    if effect.target_stat == damage_type:
-                        total_multiplier *= effect.value
-                    elif effect.target_stat == "all_attack":
-                        total_multiplier *= effect.value
-                    elif effect.target_stat == "elemental" and context.get("is_elemental"):
-                        total_multiplier *= effect.value
-                    elif effect.target_stat == "next_attack":
-                        # 다음 공격에만 적용
-                        total_multiplier *= effect.value
+        조건 없는 효과는 컴파일 시 한 번만 합산해 두고, 조건부 효과만 매번 확인합니다.
+        """
+        compiled = self.compile_traits(character)
+        cache_key = ("combine", effect_type, multiply, check_conditions)
+        cached = compiled.cache.get(cache_key)
+        if cached is None:
+            total = 1.0 if multiply else 0.0
+            dynamic = []
+            for trait_id, effect in compiled.by_type.get(effect_type, ()):
+                if check_conditions and effect.condition:
+                    dynamic.append(effect)
+                elif multiply:
+                    total *= effect.value
                 else:
-                    # 타겟이 없으면 모든 데미지에 적용
-                    total_multiplier *= effect.value
-
-                self.logger.debug(
-                    f"[{trait_id}] 데미지 배율 적용: x{effect.value} → 총 x{total_multiplier}"
-                )
+                    total += effect.value
+            cached = compiled.cache[cache_key] = (total, dynamic)
 
-        return total_multiplier
+        total, dynamic = cached
+        for effect in dynamic:
+            if self._check_condition(character, effect.condition, context or {}):
+                total = total * effect.value if multiply else total + effect.value
+        return total
 
     def calculate_mp_cost(self, character: Any, base_cost: int, **context) -> int:
         """
@@ -3672,23 +3818,9 @@ class TraitEffectManager:
         Returns:
             최종 MP 소모
         """
-        reduction_rate = 0.0
-        all_traits = self._get_all_traits(character)
-
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                if effect.effect_type != TraitEffectType.MP_COST_REDUCTION:
-                    continue
-
-                # 조건 확인
-                if effect.condition and not self._check_condition(character, effect.condition, context):
-                    continue
-
-                reduction_rate += effect.value
-                self.logger.debug(f"[{trait_id}] MP 감소: {effect.value * 100}%")
+        reduction_rate = self._combine_effects(
+            character, TraitEffectType.MP_COST_REDUCTION, context=context
+        )
 
         # 최대 75% 감소로 제한
         reduction_rate = min(0.75, reduction_rate)
@@ -3712,19 +3844,9 @@ class TraitEffectManager:
         Returns:
             크리티컬 확률 보너스 (0.15 = +15%)
         """
-        bonus = 0.0
-        all_traits = self._get_all_traits(character)
-
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.CRITICAL_BONUS:
-                    bonus += effect.value
-                    self.logger.debug(f"[{trait_id}] 크리티컬 보너스: +{effect.value * 100}%")
-
-        return bonus
+        return self._combine_effects(
+            character, TraitEffectType.CRITICAL_BONUS, check_conditions=False
+        )
 
     def calculate_break_bonus(self, character: Any) -> float:
         """
@@ -3736,155 +3858,139 @@ class TraitEffectManager:
         Returns:
             브레이크 보너스 배율 (1.5 = 150%)
         """
-        bonus = 0.0
-        all_traits = self._get_all_traits(character)
+        return self._combine_effects(
+            character, TraitEffectType.BREAK_BONUS, check_conditions=False
+        )
 
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
+    def calculate_hp_scaling_attack(self, character: Any) -> float:
+        """
+        특성에 의한 HP 비례 공격력 배율 (berserker_rage 등)
 
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.BREAK_BONUS:
-                    bonus += effect.value
-                    self.logger.debug(f"[{trait_id}] 브레이크 보너스: +{effect.value}")
+        Args:
+            character: 캐릭터
 
-        return bonus
+        Returns:
+            공격력 배율 (HP가 낮을수록 증가, 1.0 = 보너스 없음)
+        """
+        effects = self.compile_traits(character).by_type.get(TraitEffectType.HP_SCALING_ATTACK)
+        if not effects or not hasattr(character, 'current_hp') or not hasattr(character, 'max_hp'):
+            return 1.0
+
+        hp_percent = character.current_hp / character.max_hp if character.max_hp > 0 else 1.0
+        multiplier = 1.0
+        for trait_id, effect in effects:
+            max_bonus = effect.metadata.get("max_bonus", effect.value) if effect.metadata else effect.value
+            # HP 0%일 때 최대 보너스, HP 100%일 때 보너스 없음
+            multiplier *= 1.0 + (max_bonus * (1.0 - hp_percent))
+        return multiplier
 
     def calculate_damage_reduction(self, character: Any, is_defending: bool = False) -> float:
         """
         특성에 의한 피해 감소율 계산
-        
+
         Args:
             character: 캐릭터
             is_defending: 방어 중인지 여부
-        
+
         Returns:
             총 피해 감소율 (0.0 = 0%, 0.5 = 50%)
         """
-        total_reduction = 0.0
-        all_traits = self._get_all_traits(character)
-        
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-            
-            for effect in effects:
-                # DAMAGE_REDUCTION: 일반 피해 감소 (조건 확인)
-                if effect.effect_type == TraitEffectType.DAMAGE_REDUCTION:
-                    if self._check_condition(character, effect.condition or "", {}):
-                        total_reduction += effect.value
-                        self.logger.debug(f"[{trait_id}] 피해 감소: +{effect.value * 100:.0f}%")
-                
-                # DEFEND_BOOST: 방어 중일 때만 피해 감소
-                elif effect.effect_type == TraitEffectType.DEFEND_BOOST:
-                    if is_defending:
-                        condition_met = not effect.condition or self._check_condition(
-                            character, effect.condition, {}
-                        )
-                        if condition_met:
-                            total_reduction += effect.value
-                            self.logger.debug(f"[{trait_id}] 방어 보너스 피해 감소: +{effect.value * 100:.0f}%")
-        
+        # DAMAGE_REDUCTION: 일반 피해 감소 (조건 확인)
+        total_reduction = self._combine_effects(character, TraitEffectType.DAMAGE_REDUCTION)
+
+        # DEFEND_BOOST: 방어 중일 때만 피해 감소
+        if is_defending:
+            total_reduction += self._combine_effects(character, TraitEffectType.DEFEND_BOOST)
+
         # 최대 90%까지 감소 가능
         return min(total_reduction, 0.90)
 
     def check_fatal_damage_immunity(self, character: Any, incoming_damage: int) -> tuple[bool, int]:
         """
         치명적 피해 면역 확인 (last_stand 특성 등)
-        
+
         Args:
             character: 피해를 받는 캐릭터
             incoming_damage: 들어오는 피해량
-            
+
         Returns:
             (면역 발동 여부, 조정된 피해량)
         """
-        all_traits = self._get_all_traits(character)
-        
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-            
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.DAMAGE_IMMUNITY:
-                    # HP 15% 이하 체크
-                    current_hp = getattr(character, 'current_hp', 0)
-                    max_hp = getattr(character, 'max_hp', 1)
-                    hp_ratio = current_hp / max(1, max_hp)
-                    
-                    # 피해를 받으면 HP 15% 이하가 되는지 확인
-                    hp_after_damage = current_hp - incoming_damage
-                    hp_after_ratio = hp_after_damage / max(1, max_hp)
-                    
-                    # 조건: 1회 사용 가능 + HP 15% 이하로 떨어지는 치명적 피해
-                    once_per_combat = effect.metadata.get("once_per_combat", False)
-                    already_used = getattr(character, '_last_stand_used', False)
-                    
-                    if once_per_combat and already_used:
-                        continue
-                    
-                    # HP가 15% 이하로 떨어지거나 사망할 때 발동
-                    if hp_after_ratio <= 0.15 or hp_after_damage <= 0:
-                        # 면역 발동! HP를 1로 설정하고 피해 무효화
-                        character._last_stand_used = True
-                        
-                        # 광기 50 감소 (last_stand의 두 번째 효과)
-                        if hasattr(character, 'madness'):
-                            reduction = effect.metadata.get("madness_reduction", 50)
-                            old_madness = character.madness
-                            character.madness = max(0, character.madness - reduction)
-                            self.logger.info(f"[{trait_id}] 최후의 저항! 광기 {old_madness} → {character.madness}")
-                        
-                        # HP를 max_hp의 1%로 설정 (최소 1)
-                        survival_hp = max(1, int(max_hp * 0.01))
-                        adjusted_damage = max(0, current_hp - survival_hp)
-                        
-                        self.logger.info(f"[{trait_id}] 최후의 저항 발동! 치명적 피해 회피! (HP → {survival_hp})")
-                        return True, adjusted_damage
-        
+        effects = self.compile_traits(character).by_type.get(TraitEffectType.DAMAGE_IMMUNITY, ())
+
+        for trait_id, effect in effects:
+            # HP 15% 이하 체크
+            current_hp = getattr(character, 'current_hp', 0)
+            max_hp = getattr(character, 'max_hp', 1)
+
+            # 피해를 받으면 HP 15% 이하가 되는지 확인
+            hp_after_damage = current_hp - incoming_damage
+            hp_after_ratio = hp_after_damage / max(1, max_hp)
+
+            # 조건: 1회 사용 가능 + HP 15% 이하로 떨어지는 치명적 피해
+            once_per_combat = effect.metadata.get("once_per_combat", False)
+            already_used = getattr(character, '_last_stand_used', False)
+
+            if once_per_combat and already_used:
+                continue
+
+            # HP가 15% 이하로 떨어지거나 사망할 때 발동
+            if hp_after_ratio <= 0.15 or hp_after_damage <= 0:
+                # 면역 발동! HP를 1로 설정하고 피해 무효화
+                character._last_stand_used = True
+
+                # 광기 50 감소 (last_stand의 두 번째 효과)
+                if hasattr(character, 'madness'):
+                    reduction = effect.metadata.get("madness_reduction", 50)
+                    old_madness = character.madness
+                    character.madness = max(0, character.madness - reduction)
+                    self.logger.info(f"[{trait_id}] 최후의 저항! 광기 {old_madness} → {character.madness}")
+
+                # HP를 max_hp의 1%로 설정 (최소 1)
+                survival_hp = max(1, int(max_hp * 0.01))
+                adjusted_damage = max(0, current_hp - survival_hp)
+
+                self.logger.info(f"[{trait_id}] 최후의 저항 발동! 치명적 피해 회피! (HP → {survival_hp})")
+                return True, adjusted_damage
+
         return False, incoming_damage
 
     def check_extra_action(self, character: Any) -> tuple[bool, int]:
         """
         추가 행동 가능 여부 확인 (berserker_rush 특성 등)
-        
+
         Args:
             character: 캐릭터
-            
+
         Returns:
             (추가 행동 가능 여부, 소모할 리소스량)
         """
-        all_traits = self._get_all_traits(character)
-        
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-            
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.EXTRA_ACTION:
-                    # 조건 확인: 광기 50 이상
-                    madness = getattr(character, 'madness', 0)
-                    madness_cost = effect.metadata.get("madness_cost", 50)
-                    
-                    if madness < madness_cost:
-                        continue
-                    
-                    # 턴당 1회 제한
-                    once_per_turn = effect.metadata.get("once_per_turn", True)
-                    already_used_this_turn = getattr(character, '_berserker_rush_used_this_turn', False)
-                    
-                    if once_per_turn and already_used_this_turn:
-                        continue
-                    
-                    self.logger.info(f"[{trait_id}] 추가 행동 가능! (광기 {madness} → {madness - madness_cost})")
-                    return True, madness_cost
-        
+        effects = self.compile_traits(character).by_type.get(TraitEffectType.EXTRA_ACTION, ())
+
+        for trait_id, effect in effects:
+            # 조건 확인: 광기 50 이상
+            madness = getattr(character, 'madness', 0)
+            madness_cost = effect.metadata.get("madness_cost", 50)
+
+            if madness < madness_cost:
+                continue
+
+            # 턴당 1회 제한
+            once_per_turn = effect.metadata.get("once_per_turn", True)
+            already_used_this_turn = getattr(character, '_berserker_rush_used_this_turn', False)
+
+            if once_per_turn and already_used_this_turn:
+                continue
+
+            self.logger.info(f"[{trait_id}] 추가 행동 가능! (광기 {madness} → {madness - madness_cost})")
+            return True, madness_cost
+
         return False, 0
 
     def activate_extra_action(self, character: Any, cost: int):
         """
         추가 행동 발동 (리소스 소모)
-        
+
         Args:
             character: 캐릭터
             cost: 소모할 광기량
@@ -3898,7 +4004,7 @@ class TraitEffectManager:
     def reset_turn_flags(self, character: Any):
         """
         턴 시작 시 특성 관련 플래그 초기화
-        
+
         Args:
             character: 캐릭터
         """
@@ -3920,45 +4026,19 @@ class TraitEffectManager:
         Returns:
             생명력 흡수율 (0.10 = 10%)
         """
-        lifesteal_rate = 0.0
-        all_traits = self._get_all_traits(character)
-
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.LIFESTEAL:
-                    if self._check_condition(character, effect.condition or "", context):
-                        lifesteal_rate += effect.value
-                        self.logger.debug(f"[{trait_id}] 생명력 흡수: +{effect.value * 100:.0f}%")
-
-        return lifesteal_rate
+        return self._combine_effects(character, TraitEffectType.LIFESTEAL, context=context)
 
     def calculate_lifesteal_multiplier(self, character: Any) -> float:
         """
         특성에 의한 생명력 흡수 배율 계산
-        
+
         Args:
             character: 캐릭터
-            
+
         Returns:
             생명력 흡수 배율 (1.0 = 100%, 2.0 = 200%)
         """
-        multiplier = 1.0
-        all_traits = self._get_all_traits(character)
-        
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-            
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.LIFESTEAL_MULTIPLIER:
-                    if self._check_condition(character, effect.condition or "", {}):
-                        multiplier *= effect.value
-                        self.logger.debug(f"[{trait_id}] 생명력 흡수 배율: x{effect.value}")
-                        
-        return multiplier
+        return self._combine_effects(character, TraitEffectType.LIFESTEAL_MULTIPLIER, multiply=True)
 
     def calculate_mana_leech(self, character: Any) -> float:
         """
@@ -3970,20 +4050,7 @@ class TraitEffectManager:
         Returns:
             마력 흡수율 (0.05 = 5%)
         """
-        mana_leech_rate = 0.0
-        all_traits = self._get_all_traits(character)
-
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.MANA_LEECH:
-                    if self._check_condition(character, effect.condition or "", {}):
-                        mana_leech_rate += effect.value
-                        self.logger.debug(f"[{trait_id}] 마력 흡수: +{effect.value * 100:.0f}%")
-
-        return mana_leech_rate
+        return self._combine_effects(character, TraitEffectType.MANA_LEECH)
 
     def calculate_critical_damage(self, character: Any) -> float:
         """
@@ -3995,21 +4062,7 @@ class TraitEffectManager:
         Returns:
             크리티컬 데미지 배율 (1.0 = 100%, 1.5 = 150%)
         """
-        critical_damage_mult = 1.0
-        all_traits = self._get_all_traits(character)
-
-        for trait_data in all_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.CRITICAL_DAMAGE:
-                    if self._check_condition(character, effect.condition or "", {}):
-                        # 배율은 곱셈 (1.0 + (value - 1.0))
-                        critical_damage_mult *= effect.value
-                        self.logger.debug(f"[{trait_id}] 크리티컬 데미지 배율: {effect.value:.2f}x")
-
-        return critical_damage_mult
+        return self._combine_effects(character, TraitEffectType.CRITICAL_DAMAGE, multiply=True)
 
     def apply_turn_start_effects(self, character: Any):
         """
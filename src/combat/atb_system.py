@@ -8,7 +8,9 @@ ATB 증가량 = (해당 전투원의 SPD / 모든 전투원의 평균 SPD) * bas
 상태이상 효과 반영 (기절/마비/헤이스트/슬로우)
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+import math
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from src.core.config import get_config
 from src.core.logger import get_logger
 from src.core.event_bus import event_bus, Events
@@ -17,10 +19,14 @@ from src.core.event_bus import event_bus, Events
 class ATBGauge:
     """ATB 게이지 클래스"""
 
+    # current가 바뀔 때 호출 (ATBSystem.mark_dirty - 다음 행동 이벤트 재스케줄용)
+    on_change: Optional[Callable[[Any], None]] = None
+
     def __init__(self, owner: Any, max_gauge: int = 2000, threshold: int = 1000) -> None:
         self.owner = owner
         self.max_gauge = max_gauge
         self.threshold = threshold
+
         self.current = 0
 
         # 상태 이상 플래그
@@ -36,6 +42,17 @@ class ATBGauge:
         # 캐스팅 상태
         self.is_casting = False
 
+    @property
+    def current(self) -> float:
+        """현재 게이지"""
+        return self._current
+
+    @current.setter
+    def current(self, value: float) -> None:
+        self._current = value
+        if self.on_change is not None:
+            self.on_change(self.owner)
+
     @property
     def percentage(self) -> float:
         """게이지 퍼센트 (0.0 ~ 1.0)"""
@@ -160,6 +177,17 @@ class ATBSystem:
         # 평균 속도 캐시
         self._average_speed: float = 0.0
 
+        # 다음 행동 이벤트 스케줄 (advance_to_next_ready용)
+        # 힙 항목: (행동 가능 시각, 순번, 전투원) - 순번이 다르면 무효 항목(지연 삭제)
+        # 게이지/속도/상태이상/캐스팅 변경 훅이 _dirty에 표시한 전투원만 다시 스케줄합니다.
+        self.clock: int = 0
+        self._ready_queue: List[Tuple[float, int, Any]] = []
+        self._ready_keys: Dict[Any, Tuple[Tuple, int]] = {}
+        self._ready_seq: int = 0
+        self._dirty: Dict[Any, None] = {}  # 다시 스케줄할 전투원 (삽입 순서 유지)
+        self._ready_delta: Optional[float] = None  # 스케줄에 쓴 delta_time
+        self._hooked_casting: Any = None  # 변경 통지를 등록한 캐스팅 시스템
+
         # BREAK 이벤트 구독 (BREAK 시 ATB 초기화)
         event_bus.subscribe("brave.break", self._on_break)
 
@@ -171,8 +199,11 @@ class ATBSystem:
             combatant: 전투원 객체 (speed 속성 필요)
         """
         if combatant not in self.gauges:
-            self.gauges[combatant] = ATBGauge(combatant, self.max_gauge, self.threshold)
+            gauge = ATBGauge(combatant, self.max_gauge, self.threshold)
+            gauge.on_change = self.mark_dirty
+            self.gauges[combatant] = gauge
             self.combatants.append(combatant)
+            self.mark_dirty(combatant)
             self._update_average_speed()
 
             self.logger.debug(
@@ -185,8 +216,25 @@ class ATBSystem:
         if combatant in self.gauges:
             del self.gauges[combatant]
             self.combatants.remove(combatant)
+            self._ready_keys.pop(combatant, None)
+            self._dirty.pop(combatant, None)
             self._update_average_speed()
 
+    def mark_dirty(self, combatant: Any = None) -> None:
+        """
+        다음 행동 이벤트를 다시 계산할 전투원 표시
+
+        게이지 변경, ATB 상태이상, 캐스팅 시작/완료/중단은 자동으로 표시됩니다.
+        속도 스탯/버프나 생존 여부를 바꾼 쪽(CombatManager)은 직접 호출합니다.
+
+        Args:
+            combatant: 전투원 (None이면 전체)
+        """
+        if combatant is None:
+            self._dirty.update(dict.fromkeys(self.gauges))
+        elif combatant in self.gauges:
+            self._dirty[combatant] = None
+
     def _update_average_speed(self) -> None:
         """모든 전투원의 평균 속도 계산 (살아있는 전투원만)"""
         if not self.combatants:
@@ -252,13 +300,21 @@ class ATBSystem:
         # 캐스팅 시스템 가져오기
         from src.combat.casting_system import get_casting_system
         casting_system = get_casting_system()
+        active_casts = casting_system.active_casts
+        dirty = self._dirty
 
         for combatant, gauge in self.gauges.items():
             # 죽은 캐릭터는 ATB 업데이트 건너뛰기
             is_alive = getattr(combatant, 'is_alive', True)
             if not is_alive:
-                # 죽은 캐릭터의 ATB는 0으로 유지
+                # 이미 죽은 것으로 스케줄된 전투원은 다시 계산할 필요 없음
+                scheduled_dead = combatant not in dirty and self._ready_keys.get(combatant, ((True,),))[0] == (False,)
+                # 죽은 캐릭터의 ATB는 0으로 유지 (시전 중이면 진행 정지)
                 gauge.current = 0
+                if combatant in active_casts:
+                    casting_system.set_rate(combatant, None)
+                if scheduled_dead:
+                    dirty.pop(combatant, None)
                 continue
             
             # 상태이상 효과가 반영된 속도 사용
@@ -268,15 +324,16 @@ class ATBSystem:
             increase = (effective_speed * delta_time) / 10.0
 
             # 캐스팅 중인지 확인
-            is_casting = casting_system.is_casting(combatant)
+            is_casting = combatant in active_casts
             gauge.is_casting = is_casting
 
             if is_casting:
-                # 캐스팅 중이면 캐스팅 진행도 업데이트 (ATB는 증가하지 않음)
-                casting_system.update(combatant, int(increase))
+                # 캐스팅 중이면 틱당 캐스팅 진행량만 갱신 (ATB는 증가하지 않음)
+                casting_system.set_rate(combatant, int(increase))
             else:
                 # 캐스팅 중이 아니면 항상 ATB 증가 (기절/수면 상태에서도 ATB는 증가해야 함)
                 # 기절이 풀리면 바로 행동할 수 있도록 ATB를 미리 채워둠
+                # (게이지 변경 훅이 다시 스케줄하도록 표시 - 틱마다 더한 부동소수점 값 기준으로 계산)
                 gauge.increase(increase)
 
                 # 행동 가능 상태가 되면 이벤트 발행
@@ -286,6 +343,172 @@ class ATBSystem:
                         "atb_gauge": gauge.current
                     })
 
+        # 캐스팅 진행(정수 축적)은 스케줄과 같으므로 시계만 진행
+        self.clock += 1
+
+        # 캐스팅 진행 (완료 시점이 된 캐스팅만 처리)
+        casting_system.advance(1)
+
+    def _ready_signature(self, combatant: Any, gauge: ATBGauge, casting_system: Any,
+                         delta_time: float) -> Tuple:
+        """
+        행동 가능 시각 계산에 쓰이는 입력값 묶음 (생존, 실제 속도, 시전 중, delta_time)
+
+        값은 mark_dirty로 표시된 전투원을 다시 스케줄할 때만 계산합니다.
+        """
+        if not getattr(combatant, 'is_alive', True):
+            return (False,)
+        return (True, gauge.get_effective_speed(), casting_system.is_casting(combatant), delta_time)
+
+    def _ticks_to_ready(self, combatant: Any, gauge: ATBGauge, casting_system: Any, signature: Tuple) -> float:
+        """
+        다음 행동 이벤트(게이지 threshold 도달 또는 캐스팅 완료)까지 남은 틱 수
+
+        Returns:
+            틱 수 (도달하지 않으면 math.inf)
+        """
+        if not signature[0]:
+            return math.inf
+
+        _, effective_speed, is_casting, delta_time = signature
+        increase = (effective_speed * delta_time) / 10.0
+
+        if is_casting:
+            # 캐스팅은 틱마다 int(증가량)씩 축적
+            cast_info = casting_system.get_cast_info(combatant)
+            accumulated, required = cast_info.accumulated_atb, cast_info.required_atb
+            per_tick = int(increase)
+            if accumulated >= required:
+                return 0
+            if per_tick <= 0:
+                return math.inf
+            return math.ceil((required - accumulated) / per_tick)
+
+        if gauge.current >= self.threshold:
+            return 0
+        if increase <= 0:
+            return math.inf
+
+        ticks = math.ceil((self.threshold - gauge.current) / increase)
+        # 부동소수점 오차로 threshold에 못 미치는 경우 보정
+        if gauge.current + increase * ticks < self.threshold:
+            ticks += 1
+        return ticks
+
+    def _refresh_ready_queue(self, casting_system: Any, delta_time: float) -> None:
+        """변경 훅이 표시한 전투원만 다시 스케줄"""
+        if casting_system is not self._hooked_casting:
+            # 캐스팅 시작/완료/중단 통지 (캐스팅 시스템이 새로 만들어졌으면 전체 재계산)
+            casting_system.add_listener(self.mark_dirty)
+            self._hooked_casting = casting_system
+            self.mark_dirty()
+        if delta_time != self._ready_delta:
+            self._ready_delta = delta_time
+            self.mark_dirty()
+
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, {}
+        for combatant in dirty:
+            gauge = self.gauges.get(combatant)
+            if gauge is None:
+                continue
+            signature = self._ready_signature(combatant, gauge, casting_system, delta_time)
+            self._ready_seq += 1
+            self._ready_keys[combatant] = (signature, self._ready_seq)
+            eta = self.clock + self._ticks_to_ready(combatant, gauge, casting_system, signature)
+            if eta != math.inf:
+                heapq.heappush(self._ready_queue, (eta, self._ready_seq, combatant))
+
+    def ticks_until_next_ready(self, delta_time: float = 1.0) -> Optional[int]:
+        """
+        다음 행동 이벤트까지 남은 update() 틱 수
+
+        Args:
+            delta_time: 틱당 경과 시간
+
+        Returns:
+            틱 수 (0이면 이미 행동 가능한 전투원이 있음, None이면 아무도 도달하지 않음)
+        """
+        from src.combat.casting_system import get_casting_system
+        self._refresh_ready_queue(get_casting_system(), delta_time)
+
+        queue = self._ready_queue
+        while queue:
+            eta, seq, combatant = queue[0]
+            key = self._ready_keys.get(combatant)
+            if key is not None and key[1] == seq:
+                return max(0, int(eta - self.clock))
+            heapq.heappop(queue)
+        return None
+
+    def advance_to_next_ready(
+        self,
+        delta_time: float = 1.0,
+        max_ticks: Optional[int] = None,
+        is_player_turn: bool = False
+    ) -> int:
+        """
+        다음 행동 이벤트 시점까지 한 번에 진행
+
+        ATB 증가는 시간에 선형이므로 update()를 틱마다 반복하는 대신
+        누군가 threshold에 도달하는 틱(또는 캐스팅 완료 틱)으로 바로 건너뜁니다.
+        결과는 같은 횟수의 update(delta_time) 호출과 같습니다.
+
+        Args:
+            delta_time: 틱당 경과 시간
+            max_ticks: 최대 진행 틱 수 (None이면 제한 없음)
+            is_player_turn: 플레이어 턴 중인지 (True면 진행하지 않음)
+
+        Returns:
+            진행한 틱 수 (0이면 이미 행동 가능한 전투원이 있거나 진행 불가)
+        """
+        if not self.enabled or is_player_turn or not self.gauges:
+            return 0
+
+        ticks = self.ticks_until_next_ready(delta_time)
+        if ticks is None:
+            ticks = max_ticks or 0
+        elif max_ticks is not None:
+            ticks = min(ticks, max_ticks)
+        if ticks <= 0:
+            return 0
+
+        from src.combat.casting_system import get_casting_system
+        casting_system = get_casting_system()
+
+        for combatant, gauge in self.gauges.items():
+            signature = self._ready_keys[combatant][0]
+            if not signature[0]:
+                gauge.current = 0
+                casting_system.set_rate(combatant, None)
+                continue
+
+            increase = (signature[1] * delta_time) / 10.0
+            if signature[2]:
+                # 캐스팅 진행 (완료되면 캐스팅 시스템 통지로 다시 스케줄됨)
+                gauge.is_casting = True
+                casting_system.set_rate(combatant, int(increase))
+                continue
+
+            gauge.is_casting = False
+            if gauge.current < self.threshold:
+                gauge.increase(increase * ticks)
+
+        # 스케줄대로 진행한 게이지 변경이므로 다시 계산하지 않음
+        self._dirty.clear()
+        self.clock += ticks
+        casting_system.advance(ticks)
+
+        for combatant, gauge in self.gauges.items():
+            if gauge.current >= self.threshold and gauge.can_act:
+                event_bus.publish(Events.COMBAT_TURN_START, {
+                    "combatant": combatant,
+                    "atb_gauge": gauge.current
+                })
+
+        return ticks
+
     def get_action_order(self) -> List[Any]:
         """
         행동 순서 가져오기 (ATB 게이지 기준 정렬)
@@ -351,6 +574,7 @@ class ATBSystem:
         if not gauge:
             return
 
+        self.mark_dirty(combatant)
         if effect_type == "stun":
             gauge.is_stunned = True
             # 기절 시 ATB 즉시 0으로 리셋
@@ -387,6 +611,7 @@ class ATBSystem:
         if not gauge:
             return
 
+        self.mark_dirty(combatant)
         if effect_type == "stun":
             gauge.is_stunned = False
         elif effect_type == "paralyze":
@@ -453,12 +678,42 @@ class ATBSystem:
         self.gauges.clear()
         self.combatants.clear()
         self._average_speed = 0.0
+        self.clock = 0
+        self._ready_queue.clear()
+        self._ready_keys.clear()
+        self._dirty.clear()
 
 
 # 전역 인스턴스
 _atb_system: Optional[ATBSystem] = None
 
 
+def create_atb_system(backend: Optional[str] = None) -> ATBSystem:
+    """
+    ATB 시스템 생성
+
+    Args:
+        backend: "default" 또는 "vectorized" (None이면 combat.atb.backend 설정 사용)
+
+    Returns:
+        ATBSystem 인스턴스
+    """
+    if backend is None:
+        backend = get_config().get("combat.atb.backend", "default")
+
+    if backend == "vectorized":
+        from src.combat.atb_vectorized import VectorizedATBSystem
+        return VectorizedATBSystem()
+
+    return ATBSystem()
+
+
+def set_atb_system(system: Optional[ATBSystem]) -> None:
+    """전역 ATB 시스템 인스턴스 설정 (None이면 다음 호출 시 재생성)"""
+    global _atb_system
+    _atb_system = system
+
+
 def get_atb_system() -> ATBSystem:
     """전역 ATB 시스템 인스턴스"""
     global _atb_system
@@ -482,9 +737,9 @@ def get_atb_system() -> ATBSystem:
         logger = get_logger("atb")
         logger.debug(f"멀티플레이 모드 확인 실패: {e}, 일반 ATB 시스템 사용")
     
-    # 싱글플레이 모드: 일반 ATBSystem 사용
+    # 싱글플레이 모드: 설정된 백엔드의 ATBSystem 사용
     if _atb_system is None:
-        _atb_system = ATBSystem()
+        _atb_system = create_atb_system()
     else:
         # 이미 멀티플레이 시스템이 설정되어 있으면 그대로 사용 (전투 중일 수 있음)
         try:
@@ -0,0 +1,327 @@
+"""
+Vectorized ATB System - 구조체 배열(SoA) 기반 ATB 백엔드
+
+ATBSystem과 같은 규칙으로 동작하지만 게이지, 속도, 헤이스트/슬로우 배율,
+캐스팅 플래그를 NumPy 배열에 저장하고 모든 전투원을 한 번의 벡터 연산으로
+진행시킵니다. 행동 가능 후보는 인덱스 마스크로 반환됩니다.
+
+기존 호출부는 ATBGauge 인터페이스를 그대로 사용할 수 있도록
+ArrayATBGauge(배열 슬롯에 대한 얇은 뷰)를 받습니다.
+
+대규모 전투, 소환수(네크로맨서 언데드 군단 등), 헤드리스 시뮬레이터용입니다.
+"""
+
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from src.combat.atb_system import ATBSystem, ATBGauge
+from src.core.event_bus import event_bus, Events
+
+
+def get_buff_speed_modifier(owner: Any) -> float:
+    """speed_up/speed_down 버프에 의한 속도 배율 (ATBGauge.get_effective_speed와 동일 규칙)"""
+    modifier = 1.0
+    active_buffs = getattr(owner, 'active_buffs', None)
+    if active_buffs:
+        if 'speed_up' in active_buffs:
+            modifier *= (1.0 + active_buffs['speed_up'].get('value', 0.0))
+        if 'speed_down' in active_buffs:
+            modifier *= (1.0 - active_buffs['speed_down'].get('value', 0.0))
+    return modifier
+
+
+class ATBArrays:
+    """
+    ATB 상태 구조체 배열
+
+    슬롯 i는 ATBSystem.combatants[i]에 대응합니다.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.size = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """배열 할당 (기존 값 보존)"""
+        old = getattr(self, 'current', None)
+        fields = {
+            'current': (np.float64, 0.0),
+            'speed': (np.float64, 10.0),
+            'buff_modifier': (np.float64, 1.0),
+            'haste': (np.float64, 1.0),
+            'slow': (np.float64, 1.0),
+            'confused': (np.bool_, False),
+            'casting': (np.bool_, False),
+            'alive': (np.bool_, True),
+        }
+        for name, (dtype, default) in fields.items():
+            array = np.full(capacity, default, dtype=dtype)
+            if old is not None:
+                array[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def add(self) -> int:
+        """새 슬롯 할당 후 인덱스 반환"""
+        if self.size >= self.capacity:
+            self._allocate(self.capacity * 2)
+        index = self.size
+        self.size += 1
+        return index
+
+    def remove(self, index: int) -> None:
+        """슬롯 제거 (뒤쪽 슬롯을 한 칸씩 당겨 순서 유지)"""
+        for name in ('current', 'speed', 'buff_modifier', 'haste', 'slow',
+                     'confused', 'casting', 'alive'):
+            array = getattr(self, name)
+            array[index:self.size - 1] = array[index + 1:self.size]
+        self.size -= 1
+
+    def clear(self) -> None:
+        """모든 슬롯 제거"""
+        self.size = 0
+
+
+class ArrayATBGauge(ATBGauge):
+    """
+    ATBArrays 슬롯에 대한 게이지 뷰
+
+    current, 헤이스트/슬로우 배율, 혼란/캐스팅 플래그는 배열에 저장되고
+    기절/마비/수면 플래그와 can_act 판정은 ATBGauge 그대로 사용합니다.
+    """
+
+    def __init__(self, owner: Any, arrays: ATBArrays, index: int,
+                 max_gauge: int = 2000, threshold: int = 1000) -> None:
+        self._arrays = arrays
+        self.index = index
+        super().__init__(owner, max_gauge, threshold)
+
+    @property
+    def current(self) -> float:
+        return float(self._arrays.current[self.index])
+
+    @current.setter
+    def current(self, value: float) -> None:
+        self._arrays.current[self.index] = value
+        if self.on_change is not None:
+            self.on_change(self.owner)
+
+    @property
+    def haste_multiplier(self) -> float:
+        return float(self._arrays.haste[self.index])
+
+    @haste_multiplier.setter
+    def haste_multiplier(self, value: float) -> None:
+        self._arrays.haste[self.index] = value
+
+    @property
+    def slow_multiplier(self) -> float:
+        return float(self._arrays.slow[self.index])
+
+    @slow_multiplier.setter
+    def slow_multiplier(self, value: float) -> None:
+        self._arrays.slow[self.index] = value
+
+    @property
+    def is_confused(self) -> bool:
+        return bool(self._arrays.confused[self.index])
+
+    @is_confused.setter
+    def is_confused(self, value: bool) -> None:
+        self._arrays.confused[self.index] = value
+
+    @property
+    def is_casting(self) -> bool:
+        return bool(self._arrays.casting[self.index])
+
+    @is_casting.setter
+    def is_casting(self, value: bool) -> None:
+        self._arrays.casting[self.index] = value
+
+
+class VectorizedATBSystem(ATBSystem):
+    """
+    벡터화 ATB 시스템
+
+    ATBSystem과 같은 인터페이스를 제공하며, update()는 전투원 수와 무관하게
+    한 번의 배열 연산으로 게이지를 진행시킵니다. 전투원 객체에서 읽어야 하는
+    값(속도, 생존 여부, 속도 버프)은 speed_refresh_interval 틱마다 동기화됩니다.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.arrays = ATBArrays()
+
+        # 속도/생존/버프 동기화 주기 (1이면 매 틱, 기존 ATBSystem과 동일한 결과)
+        self.speed_refresh_interval = max(1, int(self.config.get("combat.atb.speed_refresh_interval", 1)))
+        self._ticks_since_refresh = self.speed_refresh_interval
+
+        # 마지막 update()에서 계산된 행동 가능 마스크
+        self.ready_mask = np.zeros(0, dtype=np.bool_)
+
+    def register_combatant(self, combatant: Any) -> None:
+        """전투원 등록 (배열 슬롯 할당)"""
+        if combatant in self.gauges:
+            return
+
+        index = self.arrays.add()
+        gauge = ArrayATBGauge(combatant, self.arrays, index, self.max_gauge, self.threshold)
+        gauge.on_change = self.mark_dirty
+        self.gauges[combatant] = gauge
+        self.combatants.append(combatant)
+        self.mark_dirty(combatant)
+        self._refresh_slot(index, combatant)
+        self._update_average_speed()
+
+        self.logger.debug(
+            f"전투원 등록: {getattr(combatant, 'name', 'Unknown')}",
+            {"speed": getattr(combatant, "speed", 0)}
+        )
+
+    def unregister_combatant(self, combatant: Any) -> None:
+        """전투원 제거 (뒤쪽 게이지 뷰의 인덱스 재배치)"""
+        gauge = self.gauges.pop(combatant, None)
+        if gauge is None:
+            return
+
+        self.arrays.remove(gauge.index)
+        self.combatants.remove(combatant)
+        self._ready_keys.pop(combatant, None)
+        self._dirty.pop(combatant, None)
+        for other in self.combatants[gauge.index:]:
+            self.gauges[other].index -= 1
+        self._update_average_speed()
+
+    def _refresh_slot(self, index: int, combatant: Any) -> None:
+        """전투원 한 명의 속도/생존/버프 값을 배열에 반영"""
+        arrays = self.arrays
+        arrays.speed[index] = getattr(combatant, "speed", 10)
+        arrays.alive[index] = getattr(combatant, 'is_alive', True)
+        arrays.buff_modifier[index] = get_buff_speed_modifier(combatant)
+
+    def refresh(self) -> None:
+        """모든 전투원의 속도/생존/버프 값을 배열에 반영"""
+        for index, combatant in enumerate(self.combatants):
+            self._refresh_slot(index, combatant)
+        self._ticks_since_refresh = 0
+
+    def advance(self, delta_time: float = 1.0) -> np.ndarray:
+        """
+        모든 게이지를 한 번에 진행
+
+        Args:
+            delta_time: 경과 시간
+
+        Returns:
+            행동 가능 후보 마스크 (combatants와 같은 순서, 상태이상 판정 전)
+        """
+        arrays = self.arrays
+        n = arrays.size
+
+        if self._ticks_since_refresh >= self.speed_refresh_interval:
+            self.refresh()
+        self._ticks_since_refresh += 1
+
+        # 캐스팅 플래그 동기화 (시전 중인 전투원만 순회)
+        from src.combat.casting_system import get_casting_system
+        casting_system = get_casting_system()
+        casting = arrays.casting[:n]
+        casting[:] = False
+        casting_indices = []
+        for caster in casting_system.active_casts:
+            gauge = self.gauges.get(caster)
+            if gauge is not None:
+                casting[gauge.index] = True
+                casting_indices.append(gauge.index)
+
+        current = arrays.current[:n]
+        alive = arrays.alive[:n]
+
+        # 실제 속도 = 기본 속도 × 헤이스트/슬로우 × 혼란(0.7) × 속도 버프
+        effective_speed = (
+            arrays.speed[:n] * arrays.haste[:n] / arrays.slow[:n]
+            * np.where(arrays.confused[:n], 0.7, 1.0)
+            * arrays.buff_modifier[:n]
+        )
+        increase = effective_speed * delta_time / 10.0
+
+        # 죽은 전투원의 ATB는 0으로 유지
+        current[~alive] = 0.0
+
+        # threshold 미만인 전투원만 증가, max_gauge/0으로 클램핑
+        active = alive & ~casting
+        growing = active & (current < self.threshold)
+        np.clip(current + increase, 0.0, self.max_gauge, out=current, where=growing)
+        np.minimum(current, self.max_gauge, out=current, where=active & ~growing)
+
+        # 캐스팅 중이면 캐스팅 진행 (ATB는 증가하지 않음, 죽은 시전자는 정지)
+        for index in casting_indices:
+            rate = int(increase[index]) if alive[index] else None
+            casting_system.set_rate(self.combatants[index], rate)
+        casting_system.advance(1)
+
+        # 배열을 직접 갱신했으므로 (게이지 변경 훅을 거치지 않음) 다음 행동 이벤트 스케줄은 다시 계산
+        self._ready_keys.clear()
+        self._ready_queue.clear()
+        self.mark_dirty()
+
+        self.ready_mask = active & (current >= self.threshold)
+        return self.ready_mask
+
+    def update(self, delta_time: float = 1.0, is_player_turn: bool = False) -> None:
+        """
+        모든 게이지 업데이트
+
+        Args:
+            delta_time: 경과 시간 (프레임 기반)
+            is_player_turn: 플레이어 턴 중인지 (True면 ATB 증가 정지)
+        """
+        if not self.enabled or is_player_turn:
+            return
+
+        ready_mask = self.advance(delta_time)
+
+        # 게이지가 찬 전투원만 상태이상(can_act) 확인 후 이벤트 발행
+        for index in np.flatnonzero(ready_mask):
+            combatant = self.combatants[index]
+            gauge = self.gauges[combatant]
+            if gauge.can_act:
+                event_bus.publish(Events.COMBAT_TURN_START, {
+                    "combatant": combatant,
+                    "atb_gauge": gauge.current
+                })
+
+    def get_ready_indices(self) -> np.ndarray:
+        """게이지가 threshold 이상인 살아있는 전투원 인덱스 (ATB 높은 순)"""
+        n = self.arrays.size
+        current = self.arrays.current[:n]
+        mask = self.arrays.alive[:n] & ~self.arrays.casting[:n] & (current >= self.threshold)
+        indices = np.flatnonzero(mask)
+        # 동률이면 등록 순서 유지 (ATBSystem.get_action_order와 동일)
+        return indices[np.argsort(-current[indices], kind='stable')]
+
+    def get_action_order(self) -> List[Any]:
+        """
+        행동 순서 가져오기 (ATB 게이지 기준 정렬)
+
+        Returns:
+            행동 가능한 전투원 리스트 (ATB 게이지 높은 순)
+        """
+        order = []
+        for index in self.get_ready_indices():
+            combatant = self.combatants[index]
+            if self.gauges[combatant].can_act:
+                order.append(combatant)
+        return order
+
+    def reset_all(self) -> None:
+        """모든 게이지 리셋"""
+        self.arrays.current[:self.arrays.size] = 0.0
+
+    def clear(self) -> None:
+        """시스템 초기화"""
+        super().clear()
+        self.arrays.clear()
+        self.ready_mask = np.zeros(0, dtype=np.bool_)
+        self._ticks_since_refresh = self.speed_refresh_interval
@@ -0,0 +1,380 @@
+"""
+Balance Sweep - 몬테카를로 밸런스 스윕
+
+직업/파티 구성 × 층 × 난이도 조합마다 시드 고정 전투를 대량으로 실행하고
+(CombatSimulator 사용) 승률, 처치 턴 수, 피해량 분포, BREAK 빈도를 집계합니다.
+전투는 ProcessPoolExecutor로 모든 코어에 분산되며, 결과는 열(column) 단위
+NumPy 배열로 저장됩니다.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.logger import get_logger
+
+
+logger = get_logger("balance_sweep")
+
+# 파티 구성 모드
+COMPOSITION_MONO = "mono"    # 같은 직업으로만 구성
+COMPOSITION_MIXED = "mixed"  # 대상 직업 + 무작위 동료
+
+# 전투 1회당 기록되는 열
+BATTLE_COLUMNS = (
+    "job", "party", "floor", "difficulty", "seed",
+    "victory", "timed_out", "turns", "ticks", "actions",
+    "ally_damage_total", "ally_hits", "ally_hit_max", "enemy_damage_total",
+    "ally_breaks", "enemy_breaks", "allies_alive", "elapsed", "error",
+)
+
+
+@dataclass(frozen=True)
+class BattleSpec:
+    """스윕에서 실행할 전투 1회 명세"""
+    job: str
+    party: Tuple[str, ...]
+    floor: int
+    difficulty: str
+    level: int
+    seed: int
+
+
+def get_all_job_ids() -> List[str]:
+    """밸런스 대상 직업 ID 목록 (character_loader 기준)"""
+    from src.character.character_loader import CLASS_FILE_MAP
+    return list(CLASS_FILE_MAP.values())
+
+
+def get_all_difficulties() -> List[str]:
+    """난이도 이름 목록 (DifficultyLevel 값)"""
+    from src.core.difficulty import DifficultyLevel
+    return [level.value for level in DifficultyLevel]
+
+
+def build_sweep(
+    jobs: Optional[Sequence[str]] = None,
+    floors: Sequence[int] = (1, 5, 10),
+    difficulties: Optional[Sequence[str]] = None,
+    battles_per_cell: int = 20,
+    party_size: int = 4,
+    composition: str = COMPOSITION_MONO,
+    level: Optional[int] = None,
+    base_seed: int = 0
+) -> List[BattleSpec]:
+    """
+    스윕 전투 명세 생성
+
+    Args:
+        jobs: 대상 직업 ID (None이면 전체)
+        floors: 층 번호 목록
+        difficulties: 난이도 목록 (None이면 전체)
+        battles_per_cell: (직업, 층, 난이도) 조합당 전투 수
+        party_size: 파티 인원
+        composition: 파티 구성 모드 ("mono" 또는 "mixed")
+        level: 아군 레벨 (None이면 층 번호와 동일)
+        base_seed: 시드 시작값 (전투마다 1씩 증가)
+
+    Returns:
+        전투 명세 리스트
+    """
+    if composition not in (COMPOSITION_MONO, COMPOSITION_MIXED):
+        raise ValueError(f"알 수 없는 파티 구성 모드: {composition}")
+
+    jobs = list(jobs) if jobs else get_all_job_ids()
+    difficulties = list(difficulties) if difficulties else get_all_difficulties()
+    all_jobs = get_all_job_ids()
+
+    specs = []
+    seed = base_seed
+    for job in jobs:
+        for floor in floors:
+            for difficulty in difficulties:
+                for _ in range(battles_per_cell):
+                    if composition == COMPOSITION_MONO:
+                        party = (job,) * party_size
+                    else:
+                        # 동료 구성도 시드로 고정
+                        partners = random.Random(seed).sample(all_jobs, party_size - 1)
+                        party = (job,) + tuple(partners)
+                    specs.append(BattleSpec(
+                        job=job,
+                        party=party,
+                        floor=floor,
+                        difficulty=difficulty,
+                        level=level if level is not None else max(1, floor),
+                        seed=seed
+                    ))
+                    seed += 1
+    return specs
+
+
+def _init_worker(disable_logging: bool = True) -> None:
+    """
+    워커 프로세스 초기화 (설정/스킬 등록)
+
+    Args:
+        disable_logging: WARNING 이하 로그 억제 여부 (전용 워커 프로세스에서만 사용)
+    """
+    import logging
+    if disable_logging:
+        logging.disable(logging.WARNING)
+
+    from src.core.config import get_config, initialize_config
+    try:
+        get_config()
+    except RuntimeError:
+        initialize_config()
+
+    from src.character.skills.skill_initializer import initialize_all_skills
+    from src.combat.combat_simulator import headless_mode
+    with headless_mode():
+        initialize_all_skills()
+
+
+def _set_difficulty(difficulty: str) -> None:
+    """현재 프로세스의 난이도 설정"""
+    from src.core.config import get_config
+    from src.core.difficulty import DifficultyLevel, get_difficulty_system
+
+    system = get_difficulty_system(get_config())
+    system.set_difficulty(DifficultyLevel(difficulty))
+
+
+def run_battle(spec: BattleSpec) -> Dict[str, Any]:
+    """
+    전투 1회 실행 후 한 행(row)의 결과 반환
+
+    Args:
+        spec: 전투 명세
+
+    Returns:
+        BATTLE_COLUMNS 키를 가진 딕셔너리
+    """
+    from src.character.character import Character
+    from src.combat.combat_simulator import CombatSimulator, headless_mode
+
+    _set_difficulty(spec.difficulty)
+    random.seed(spec.seed)
+
+    with headless_mode():
+        allies = [
+            Character(f"{job}_{i + 1}", job, level=spec.level)
+            for i, job in enumerate(spec.party)
+        ]
+
+    result = CombatSimulator().run_floor_battle(allies, spec.floor, seed=spec.seed)
+
+    return {
+        "job": spec.job,
+        "party": "+".join(spec.party),
+        "floor": spec.floor,
+        "difficulty": spec.difficulty,
+        "seed": spec.seed,
+        "victory": result.victory,
+        "timed_out": result.timed_out,
+        "turns": result.turns,
+        "ticks": result.ticks,
+        "actions": result.actions,
+        "ally_damage_total": sum(result.ally_damage),
+        "ally_hits": len(result.ally_damage),
+        "ally_hit_max": max(result.ally_damage, default=0),
+        "enemy_damage_total": sum(result.enemy_damage),
+        "ally_breaks": result.ally_breaks,
+        "enemy_breaks": result.enemy_breaks,
+        "allies_alive": result.allies_alive,
+        "elapsed": result.elapsed,
+        "error": "",
+    }
+
+
+def failed_battle_row(spec: BattleSpec, error: BaseException) -> Dict[str, Any]:
+    """
+    예외로 끝난 전투의 행 (집계에서는 제외되고 실패 수로만 보고됨)
+
+    Args:
+        spec: 전투 명세
+        error: 발생한 예외
+
+    Returns:
+        BATTLE_COLUMNS 키를 가진 딕셔너리 (error 열에 예외 요약)
+    """
+    row: Dict[str, Any] = {name: 0 for name in BATTLE_COLUMNS}
+    row.update({
+        "job": spec.job,
+        "party": "+".join(spec.party),
+        "floor": spec.floor,
+        "difficulty": spec.difficulty,
+        "seed": spec.seed,
+        "victory": False,
+        "timed_out": False,
+        "elapsed": 0.0,
+        "error": f"{type(error).__name__}: {error}",
+    })
+    return row
+
+
+def _run_chunk(specs: List[BattleSpec]) -> List[Dict[str, Any]]:
+    """명세 묶음 실행 (워커 프로세스 진입점)"""
+    rows = []
+    for spec in specs:
+        try:
+            rows.append(run_battle(spec))
+        except Exception as e:
+            logger.error(f"전투 실패 (seed={spec.seed}, party={spec.party}): {e}", exc_info=True)
+            rows.append(failed_battle_row(spec, e))
+    return rows
+
+
+class SweepResults:
+    """
+    스윕 결과 (열 단위 저장)
+
+    columns[name]은 전투 수 길이의 NumPy 배열입니다.
+    예외로 끝난 전투는 error 열에 예외 요약이 있고, 나머지 열은 0입니다.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.array([row[name] for row in rows]) for name in BATTLE_COLUMNS if name != "error"
+        }
+        self.columns["error"] = np.array([row.get("error") or "" for row in rows], dtype=str)
+
+    def __len__(self) -> int:
+        return len(self.columns["seed"])
+
+    @property
+    def failed(self) -> np.ndarray:
+        """예외로 끝난 전투 마스크"""
+        return self.columns["error"] != ""
+
+    @property
+    def failure_count(self) -> int:
+        """예외로 끝난 전투 수"""
+        return int(self.failed.sum())
+
+    def summarize(self) -> Dict[str, np.ndarray]:
+        """
+        (직업, 층, 난이도)별 집계
+
+        예외로 끝난 전투는 failures/failure_rate로만 보고하고 나머지 통계에서는 제외합니다.
+
+        Returns:
+            열 단위 집계 결과 (승률, 처치 턴, 피해량 분포, BREAK 빈도, 실패 수)
+        """
+        cols = self.columns
+        failed = self.failed
+        keys = list(zip(cols["job"].tolist(), cols["floor"].tolist(), cols["difficulty"].tolist()))
+        groups: Dict[Tuple[str, int, str], List[int]] = {}
+        for index, key in enumerate(keys):
+            groups.setdefault(key, []).append(index)
+
+        summary: Dict[str, list] = {name: [] for name in (
+            "job", "floor", "difficulty", "battles", "failures", "failure_rate", "win_rate", "timeout_rate",
+            "turns_mean", "turns_p90", "hit_mean", "hit_p10", "hit_p50", "hit_p90",
+            "hit_max", "damage_taken_mean", "ally_breaks_mean", "enemy_breaks_mean",
+        )}
+
+        for (job, floor, difficulty), indices in sorted(groups.items()):
+            group = np.array(indices)
+            idx = group[~failed[group]]
+            summary["job"].append(job)
+            summary["floor"].append(floor)
+            summary["difficulty"].append(difficulty)
+            summary["battles"].append(len(group))
+            summary["failures"].append(len(group) - len(idx))
+            summary["failure_rate"].append(float((len(group) - len(idx)) / len(group)))
+            if not len(idx):
+                # 전부 실패한 조합: 통계 없음
+                for name in summary:
+                    if len(summary[name]) < len(summary["job"]):
+                        summary[name].append(float("nan") if name != "hit_max" else 0)
+                continue
+
+            victory = cols["victory"][idx].astype(bool)
+            win_turns = cols["turns"][idx][victory]
+            hits = cols["ally_hits"][idx]
+            damage = cols["ally_damage_total"][idx]
+            hit_means = damage[hits > 0] / hits[hits > 0]
+
+            summary["win_rate"].append(float(victory.mean()))
+            summary["timeout_rate"].append(float(cols["timed_out"][idx].mean()))
+            summary["turns_mean"].append(float(win_turns.mean()) if len(win_turns) else float("nan"))
+            summary["turns_p90"].append(float(np.percentile(win_turns, 90)) if len(win_turns) else float("nan"))
+            summary["hit_mean"].append(float(damage.sum() / hits.sum()) if hits.sum() else 0.0)
+            for name, q in (("hit_p10", 10), ("hit_p50", 50), ("hit_p90", 90)):
+                summary[name].append(float(np.percentile(hit_means, q)) if len(hit_means) else 0.0)
+            summary["hit_max"].append(int(cols["ally_hit_max"][idx].max()))
+            summary["damage_taken_mean"].append(float(cols["enemy_damage_total"][idx].mean()))
+            summary["ally_breaks_mean"].append(float(cols["ally_breaks"][idx].mean()))
+            summary["enemy_breaks_mean"].append(float(cols["enemy_breaks"][idx].mean()))
+
+        return {name: np.array(values) for name, values in summary.items()}
+
+    def save(self, path: str) -> None:
+        """전투별 결과를 열 단위 .npz로 저장"""
+        np.savez_compressed(path, **self.columns)
+
+    def save_summary(self, path: str) -> None:
+        """집계 결과를 열 단위 .npz로 저장"""
+        np.savez_compressed(path, **self.summarize())
+
+    @classmethod
+    def load(cls, path: str) -> "SweepResults":
+        """저장된 .npz에서 복원"""
+        results = cls([])
+        with np.load(path) as data:
+            results.columns = {name: data[name] for name in BATTLE_COLUMNS if name in data}
+        if "error" not in results.columns:
+            # error 열이 없던 이전 스윕 결과
+            results.columns["error"] = np.full(len(results.columns["seed"]), "", dtype=str)
+        return results
+
+
+def run_sweep(
+    specs: List[BattleSpec],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> SweepResults:
+    """
+    전투 명세를 병렬 실행
+
+    Args:
+        specs: 전투 명세 리스트
+        workers: 워커 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 실행)
+        chunk_size: 워커에 한 번에 넘길 전투 수 (None이면 자동)
+
+    Returns:
+        스윕 결과
+    """
+    workers = workers or os.cpu_count() or 1
+    start_time = time.perf_counter()
+
+    if workers == 1:
+        _init_worker(disable_logging=False)
+        rows = _run_chunk(specs)
+    else:
+        # 워커당 여러 묶음을 배정하여 프로세스 간 부하를 고르게 분산
+        chunk_size = chunk_size or max(1, len(specs) // (workers * 8))
+        chunks = [specs[i:i + chunk_size] for i in range(0, len(specs), chunk_size)]
+        rows = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            for chunk_rows in executor.map(_run_chunk, chunks):
+                rows.extend(chunk_rows)
+
+    elapsed = time.perf_counter() - start_time
+    results = SweepResults(rows)
+    failed = results.failure_count
+    logger.info(
+        f"밸런스 스윕 완료: 전투 {len(rows)}회 (실패 {failed}회), "
+        f"워커 {workers}개, {elapsed:.1f}초"
+    )
+    if failed:
+        logger.warning(f"밸런스 스윕: 예외로 끝난 전투 {failed}회는 집계에서 제외됨 (error 열 참고)")
+    return results
+
@@ -0,0 +1,105 @@
+"""
+Battlefield Analysis - 전장 분석 공유 캐시
+
+같은 ATB 틱에 여러 적이 행동을 결정할 때 매번 플레이어 파티의 HP 비율,
+어그로 기초 가중치, BRV 상태를 처음부터 다시 계산하지 않도록
+진영별 분석 결과를 CombatManager가 한 번 계산해 모든 적 AI와 봇이 공유합니다.
+
+HP/BRV/상태이상 변화 이벤트나 행동 실행이 있으면 무효화됩니다.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+# 힐러/서포터 판정 키워드 (job_name 기준, 어그로 가중치용)
+SUPPORT_KEYWORDS = ('heal', '힐', 'support', '지원', 'white', '백')
+
+
+def is_support_job(character: Any) -> bool:
+    """힐러/서포터 직업 여부"""
+    job_name = getattr(character, 'job_name', '').lower()
+    return any(keyword in job_name for keyword in SUPPORT_KEYWORDS)
+
+
+def agro_hp_percent(character: Any) -> float:
+    """어그로 계산용 HP 비율 (max_hp가 0이면 1.0)"""
+    max_hp = getattr(character, 'max_hp', 1000)
+    return getattr(character, 'current_hp', 1000) / max_hp if max_hp > 0 else 1.0
+
+
+class SideAnalysis:
+    """한 진영에 대한 분석 결과 (계산 후 변경하지 않음)"""
+
+    __slots__ = (
+        "members", "alive", "alive_count", "hp_avg", "brv_avg",
+        "weakest", "strongest", "hp_percent", "is_support",
+    )
+
+    def __init__(self, members: List[Any], support_cache: Optional[Dict[int, bool]] = None):
+        self.members = members
+        self.alive = [m for m in members if getattr(m, 'is_alive', True)]
+        self.alive_count = len(self.alive)
+
+        count = len(members)
+        hp_total = sum(getattr(m, 'current_hp', 0) for m in self.alive)
+        brv_total = sum(getattr(m, 'current_brv', 0) for m in self.alive)
+        self.hp_avg = hp_total / count if count else 0
+        self.brv_avg = brv_total / count if count else 0
+
+        # 가장 약한/강한 대상 (HP 기준, 동점이면 앞쪽)
+        weakest, lowest_hp = None, float('inf')
+        strongest, highest_hp = None, 0
+        for member in self.alive:
+            hp = getattr(member, 'current_hp', 0)
+            if hp < lowest_hp:
+                lowest_hp, weakest = hp, member
+            if hp > highest_hp:
+                highest_hp, strongest = hp, member
+        self.weakest = weakest
+        self.strongest = strongest
+
+        # 대상별 어그로 기초 정보 (id 기준)
+        self.hp_percent: Dict[int, float] = {id(m): agro_hp_percent(m) for m in self.alive}
+        if support_cache is None:
+            support_cache = {}
+        self.is_support: Dict[int, bool] = {}
+        for member in self.alive:
+            key = id(member)
+            if key not in support_cache:
+                support_cache[key] = is_support_job(member)
+            self.is_support[key] = support_cache[key]
+
+    def describes(self, members: List[Any]) -> bool:
+        """이 분석이 주어진 진영 목록에 대한 것인지"""
+        return members is self.members
+
+
+class BattlefieldAnalysis:
+    """
+    양 진영 분석 결과
+
+    CombatManager.get_battlefield_analysis()로 얻으며, 적 AI와 봇이 공유합니다.
+    """
+
+    __slots__ = ("allies", "enemies", "version")
+
+    def __init__(self, allies: List[Any], enemies: List[Any], version: int = 0,
+                 support_cache: Optional[Dict[int, bool]] = None):
+        """
+        Args:
+            allies: 플레이어 파티 (CombatManager.allies)
+            enemies: 적 진영 (CombatManager.enemies)
+            version: 계산 시점의 무효화 버전
+            support_cache: 직업 기반 고정 정보 캐시 (전투 동안 유지)
+        """
+        self.allies = SideAnalysis(allies, support_cache)
+        self.enemies = SideAnalysis(enemies, support_cache)
+        self.version = version
+
+    def side(self, members: List[Any]) -> Optional[SideAnalysis]:
+        """진영 목록에 해당하는 분석 (없으면 None)"""
+        if self.allies.describes(members):
+            return self.allies
+        if self.enemies.describes(members):
+            return self.enemies
+        return None
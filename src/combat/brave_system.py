@@ -15,6 +15,7 @@ from typing import Dict, Any, Optional
 from src.core.config import get_config
 from src.core.logger import get_logger
 from src.core.event_bus import event_bus, Events
+from src.combat.combat_log import CombatLogFlag, CombatLogKind, get_combat_log
 from src.combat.damage_calculator import get_damage_calculator
 
 
@@ -27,6 +28,7 @@ class BraveSystem:
 
     def __init__(self) -> None:
         self.logger = get_logger("brave")
+        self.combat_log = get_combat_log()
         self.config = get_config()
 
         # 설정 로드
@@ -242,7 +244,7 @@ class BraveSystem:
         # BRV가 0인 상태에서 추가로 BRV 공격을 받았을 때 BREAK
         if was_broken and actual_damage > 0 and not already_broken:
             is_break = True
-            self.logger.info(f"[BREAK] {attacker.name} -> {defender.name} (BRV 0 상태에서 추가 공격, BRV 획득: {brv_gain})")
+            self.combat_log.record(CombatLogKind.BREAK, attacker, defender, amount=brv_gain)
 
             # BREAK 상태 플래그 설정
             defender.is_broken = True
@@ -258,7 +260,7 @@ class BraveSystem:
             })
         elif was_broken and actual_damage > 0 and already_broken:
             # 이미 BREAK 상태라면 추가 BREAK 면역 (로그만 출력)
-            self.logger.debug(f"{defender.name}은(는) 이미 BREAK 상태여서 추가 BREAK 면역")
+            self.combat_log.record(CombatLogKind.BREAK_IMMUNE, target=defender)
 
         # 이벤트 발행
         event_bus.publish(Events.CHARACTER_BRV_CHANGE, {
@@ -360,7 +362,10 @@ class BraveSystem:
                             defender.current_brv = min(defender.current_brv + brv_recovered, defender.max_brv)
                             actual_brv_regen = defender.current_brv - old_brv
                             if actual_brv_regen > 0:
-                                self.logger.info(f"[{trait_id}] {defender.name} BRV 회복: +{actual_brv_regen} ({brv_regen * 100:.0f}%)")
+                                self.combat_log.record(
+                                    CombatLogKind.TRAIT_BRV_REGEN, target=defender, note=trait_id,
+                                    amount=actual_brv_regen, extra=round(brv_regen * 100)
+                                )
         
         # 보호 효과를 위해 원본 공격 정보 저장
         defender._last_attacker = attacker
@@ -409,7 +414,10 @@ class BraveSystem:
                 wound_damage = max(0, max_wound - defender.wound)
 
             defender.wound += wound_damage
-            self.logger.info(f"상처 축적: {defender.name} +{wound_damage} (총 {defender.wound}/{max_wound})")
+            self.combat_log.record(
+                CombatLogKind.WOUND, target=defender,
+                amount=wound_damage, extra=defender.wound, total=max_wound
+            )
         
         # 플래그 해제
         if hasattr(defender, "_wound_applied_this_turn"):
@@ -425,7 +433,9 @@ class BraveSystem:
             if hasattr(attacker, 'heal'):
                 actual_heal = attacker.heal(heal_amount)
                 if actual_heal > 0:
-                    self.logger.info(f"[생명력 흡수] {attacker.name} HP 회복: +{actual_heal} ({lifesteal_rate * 100:.0f}%)")
+                    self.combat_log.record(
+                        CombatLogKind.LIFESTEAL, attacker, amount=actual_heal, extra=round(lifesteal_rate * 100)
+                    )
         
         mana_leech_rate = trait_manager.calculate_mana_leech(attacker)
         if mana_leech_rate > 0 and hp_damage > 0:
@@ -433,9 +443,10 @@ class BraveSystem:
             if hasattr(attacker, 'restore_mp'):
                 actual_mp = attacker.restore_mp(mp_amount)
                 if actual_mp > 0:
-                    self.logger.info(f"[마력 흡수] {attacker.name} MP 회복: +{actual_mp} ({mana_leech_rate * 100:.0f}%)")
+                    self.combat_log.record(
+                        CombatLogKind.MANA_LEECH, attacker, amount=actual_mp, extra=round(mana_leech_rate * 100)
+                    )
         brv_consumed = attacker.current_brv
-        self.logger.debug(f"[HP 공격] {attacker.name} BRV 소비: {brv_consumed}")
         attacker.current_brv = 0
 
         event_bus.publish(Events.CHARACTER_BRV_CHANGE, {
@@ -445,19 +456,14 @@ class BraveSystem:
             "max": attacker.max_brv
         })
 
-        self.logger.info(
-            f"HP 공격: {attacker.name} → {defender.name}",
-            {
-                "brv_consumed": brv_consumed,
-                "hp_damage": hp_damage,
-                "wound_damage": wound_damage,
-                "total_wound": defender.wound if hasattr(defender, "wound") else 0,
-                "damage_type": damage_type,
-                "stat_modifier": damage_result.variance,
-                "is_critical": damage_result.is_critical,
-                "is_break_bonus": is_defender_broken,
-                "attacker_brv_after": attacker.current_brv
-            }
+        flags = CombatLogFlag.NONE
+        if damage_result.is_critical:
+            flags |= CombatLogFlag.CRITICAL
+        if is_defender_broken:
+            flags |= CombatLogFlag.BREAK
+        self.combat_log.record(
+            CombatLogKind.HP_ATTACK_DETAIL, attacker, defender,
+            amount=hp_damage, extra=brv_consumed, total=wound_damage, flags=flags
         )
 
         return {
@@ -573,7 +579,7 @@ class BraveSystem:
                 character.break_turn_count = 0
                 character.current_brv = init_brv_value
 
-                self.logger.info(f"{character.name} BREAK 해제 및 BRV 회복: {init_brv_value}")
+                self.combat_log.record(CombatLogKind.BREAK_RECOVER, character, amount=init_brv_value)
 
                 event_bus.publish(Events.CHARACTER_BRV_CHANGE, {
                     "character": character,
@@ -585,7 +591,7 @@ class BraveSystem:
                 return init_brv_value
             else:
                 # 아직 BREAK 상태 유지
-                self.logger.debug(f"{character.name} BREAK 상태 유지")
+                self.combat_log.record(CombatLogKind.BREAK_HOLD, character)
                 return 0
 
         # 일반적인 경우: BRV가 0일 때만 회복 (init_brv 사용)
@@ -4,10 +4,18 @@
 일부 강력한 스킬은 캐스팅 시간이 필요
 ATB 기반 캐스팅: cast_time은 ATB 비율 (0.0~1.0)
 예: 0.3 = ATB 30%, 0.5 = ATB 50%, 1.0 = ATB 100%
+
+완료 처리는 완료 예정 틱 기준 최소 힙으로 관리합니다.
+ATB 시스템이 시전자의 틱당 축적량을 set_rate()로 알려주면 advance()는
+완료 시점이 된 캐스팅만 힙에서 꺼내고, 시전 중이 아닌 전투원은 건드리지 않습니다.
+축적량은 조회할 때 계산하며(지연 동기화), 중단/취소된 힙 항목은 꺼낼 때 버립니다.
 """
 
+import heapq
+import math
+import weakref
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from enum import Enum
 
 from src.core.logger import get_logger, Loggers
@@ -37,6 +45,8 @@ class CastingInfo:
     interruptible: bool = True  # 중단 가능 여부
     parry_success: bool = False  # 패링 성공 여부
     snapshot_context: Optional[Dict[str, Any]] = None  # 캐스팅 시작 시점의 기믹 값 스냅샷
+    atb_per_tick: Optional[int] = None  # 틱당 축적량 (None이면 진행 정지, CastingSystem.set_rate로 설정)
+    synced_tick: int = 0  # accumulated_atb가 반영된 캐스팅 시계 값
 
     @property
     def progress(self) -> float:
@@ -58,6 +68,36 @@ class CastingSystem:
         self.active_casts: Dict[Any, CastingInfo] = {}  # caster -> CastingInfo
         self.cast_queue: list = []  # 완료 대기 큐
 
+        # 완료 스케줄: (완료 틱, 순번, 시전자) 최소 힙
+        # 시전자별 유효 순번과 다른 항목은 중단/재스케줄된 것이므로 꺼낼 때 무시
+        self.clock = 0
+        self._completion_heap: List[Tuple[int, int, Any]] = []
+        self._schedule_seq: Dict[Any, int] = {}
+        self._seq = 0
+
+        # 시전 시작/완료/중단 통지 대상 (ATBSystem.mark_dirty 등, 약한 참조)
+        self._listeners: List[weakref.WeakMethod] = []
+
+    def add_listener(self, callback: Callable[[Any], None]) -> None:
+        """
+        시전 상태 변경 통지 등록
+
+        Args:
+            callback: 시전자를 받는 바운드 메서드 (소유 객체가 사라지면 자동 해제)
+        """
+        self._listeners.append(weakref.WeakMethod(callback))
+
+    def _notify(self, caster: Any) -> None:
+        """시전 상태가 바뀐 시전자 통지"""
+        alive = []
+        for ref in self._listeners:
+            callback = ref()
+            if callback is not None:
+                callback(caster)
+                alive.append(ref)
+        if len(alive) != len(self._listeners):
+            self._listeners = alive
+
     def start_cast(
         self,
         caster: Any,
@@ -132,10 +172,13 @@ class CastingSystem:
             cast_time_ratio=cast_time_ratio,
             required_atb=required_atb,
             interruptible=interruptible,
-            snapshot_context=snapshot if snapshot else None
+            snapshot_context=snapshot if snapshot else None,
+            synced_tick=self.clock
         )
 
         self.active_casts[caster] = cast_info
+        self._schedule(cast_info)
+        self._notify(caster)
 
         caster_name = getattr(caster, 'name', str(caster))
         skill_name = getattr(skill, 'name', str(skill))
@@ -143,10 +186,103 @@ class CastingSystem:
 
         return cast_info
 
+    def _sync(self, cast_info: CastingInfo) -> None:
+        """축적량을 현재 캐스팅 시계까지 반영"""
+        elapsed = self.clock - cast_info.synced_tick
+        if elapsed > 0 and cast_info.atb_per_tick:
+            cast_info.accumulated_atb += cast_info.atb_per_tick * elapsed
+        cast_info.synced_tick = self.clock
+
+    def _schedule(self, cast_info: CastingInfo) -> None:
+        """완료 예정 틱 계산 후 힙에 추가 (이전 항목은 지연 삭제)"""
+        caster = cast_info.caster
+        self._seq += 1
+        self._schedule_seq[caster] = self._seq
+
+        rate = cast_info.atb_per_tick
+        if rate is None:
+            return
+        remaining = cast_info.required_atb - cast_info.accumulated_atb
+        if remaining <= 0:
+            # 이미 충족 (다음 틱에 완료)
+            eta = self.clock
+        elif rate > 0:
+            eta = self.clock + math.ceil(remaining / rate)
+        else:
+            return
+        heapq.heappush(self._completion_heap, (eta, self._seq, caster))
+
+        # 무효 항목이 쌓이면 정리
+        if len(self._completion_heap) > 4 * len(self._schedule_seq) + 32:
+            self._completion_heap = [
+                entry for entry in self._completion_heap
+                if self._schedule_seq.get(entry[2]) == entry[1]
+            ]
+            heapq.heapify(self._completion_heap)
+
+    def _complete(self, cast_info: CastingInfo) -> None:
+        """캐스팅 완료 처리 (완료 큐로 이동)"""
+        caster = cast_info.caster
+        cast_info.state = CastingState.CAST_COMPLETE
+        self.cast_queue.append(cast_info)
+
+        caster_name = getattr(caster, 'name', str(caster))
+        skill_name = getattr(cast_info.skill, 'name', str(cast_info.skill))
+        logger.info(f"{caster_name}의 {skill_name} 시전 완료!")
+
+        # 완료된 캐스팅 제거
+        del self.active_casts[caster]
+        self._schedule_seq.pop(caster, None)
+        self._notify(caster)
+
+    def set_rate(self, caster: Any, atb_per_tick: Optional[int]) -> None:
+        """
+        시전자의 틱당 축적량 설정 (값이 바뀐 경우에만 다시 스케줄)
+
+        Args:
+            caster: 시전자
+            atb_per_tick: 틱당 축적 ATB 포인트 (None이면 진행 정지 - 전투 불능 등)
+        """
+        cast_info = self.active_casts.get(caster)
+        if cast_info is None or cast_info.atb_per_tick == atb_per_tick:
+            return
+        if cast_info.state != CastingState.CASTING:
+            return
+
+        self._sync(cast_info)
+        cast_info.atb_per_tick = atb_per_tick
+        self._schedule(cast_info)
+
+    def advance(self, ticks: int = 1) -> int:
+        """
+        캐스팅 시계를 진행하고 완료 시점이 된 캐스팅을 완료 큐로 이동
+
+        Args:
+            ticks: 진행할 틱 수
+
+        Returns:
+            이번에 완료된 캐스팅 수
+        """
+        self.clock += ticks
+        heap = self._completion_heap
+        completed = 0
+        while heap and heap[0][0] <= self.clock:
+            _, seq, caster = heapq.heappop(heap)
+            if self._schedule_seq.get(caster) != seq:
+                continue
+            cast_info = self.active_casts[caster]
+            self._sync(cast_info)
+            self._complete(cast_info)
+            completed += 1
+        return completed
+
     def update(self, caster: Any, atb_increase: int):
         """
         특정 시전자의 캐스팅 업데이트 (ATB 기반)
 
+        틱 단위 진행은 set_rate()/advance()를 사용하고,
+        이 메서드는 축적량을 직접 더할 때 사용합니다.
+
         Args:
             caster: 시전자
             atb_increase: 증가한 ATB 포인트
@@ -159,19 +295,15 @@ class CastingSystem:
             return
 
         # ATB 축적
+        self._sync(cast_info)
         cast_info.accumulated_atb += atb_increase
+        self._notify(caster)
 
         # 완료 체크
         if cast_info.is_complete:
-            cast_info.state = CastingState.CAST_COMPLETE
-            self.cast_queue.append(cast_info)
-
-            caster_name = getattr(caster, 'name', str(caster))
-            skill_name = getattr(cast_info.skill, 'name', str(cast_info.skill))
-            logger.info(f"{caster_name}의 {skill_name} 시전 완료!")
-
-            # 완료된 캐스팅 제거
-            del self.active_casts[caster]
+            self._complete(cast_info)
+        elif atb_increase and cast_info.atb_per_tick is not None:
+            self._schedule(cast_info)
 
     def cancel_cast(self, caster: Any, reason: str = "중단됨"):
         """
@@ -196,6 +328,9 @@ class CastingSystem:
 
         cast_info.state = CastingState.INTERRUPTED
         del self.active_casts[caster]
+        # 힙 항목은 지연 삭제 (순번이 없으므로 꺼낼 때 무시됨)
+        self._schedule_seq.pop(caster, None)
+        self._notify(caster)
 
     def interrupt_on_damage(self, caster: Any, damage: int):
         """
@@ -222,8 +357,15 @@ class CastingSystem:
         return caster in self.active_casts
 
     def get_cast_info(self, caster: Any) -> Optional[CastingInfo]:
-        """캐스팅 정보 가져오기"""
-        return self.active_casts.get(caster)
+        """캐스팅 정보 가져오기 (축적량은 현재 시계 기준)"""
+        cast_info = self.active_casts.get(caster)
+        if cast_info is not None:
+            self._sync(cast_info)
+        return cast_info
+
+    def has_completed_casts(self) -> bool:
+        """완료 대기 중인 캐스팅이 있는지 확인"""
+        return bool(self.cast_queue)
 
     def get_completed_casts(self) -> list:
         """완료된 캐스팅 가져오기 (큐에서 제거)"""
@@ -231,10 +373,30 @@ class CastingSystem:
         self.cast_queue.clear()
         return completed
 
+    def sync_all(self) -> None:
+        """모든 캐스팅의 축적량을 현재 시계까지 반영 (상태 복사 전 호출)"""
+        for cast_info in self.active_casts.values():
+            self._sync(cast_info)
+
+    def reschedule_all(self) -> None:
+        """active_casts를 외부에서 바꾼 뒤 완료 스케줄 재구성"""
+        self._completion_heap.clear()
+        self._schedule_seq.clear()
+        for cast_info in self.active_casts.values():
+            cast_info.synced_tick = self.clock
+            self._schedule(cast_info)
+            self._notify(cast_info.caster)
+
     def clear(self):
         """모든 캐스팅 초기화"""
+        casters = list(self.active_casts)
         self.active_casts.clear()
         self.cast_queue.clear()
+        self._completion_heap.clear()
+        self._schedule_seq.clear()
+        self.clock = 0
+        for caster in casters:
+            self._notify(caster)
 
 
 # 전역 인스턴스
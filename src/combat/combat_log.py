@@ -0,0 +1,499 @@
+"""
+Combat Log - 구조화된 전투 로그
+
+전투 중 발생하는 사건을 한국어 문자열 대신 타입이 있는 레코드
+(행동자/대상 번호, 종류, 수치, 플래그)로 고정 크기 링 버퍼에 기록합니다.
+표시용 문자열은 전투 로그 창이 그릴 때나 로그 싱크가 요청할 때만 만들어지므로
+헤드리스 시뮬레이션처럼 아무도 읽지 않는 경우 문자열 생성 비용이 들지 않습니다.
+
+긴 실행의 사후 분석을 위해 간결한 바이너리 덤프(dumps/loads)를 지원합니다.
+"""
+
+import logging
+import struct
+from contextlib import contextmanager
+from enum import IntEnum, IntFlag
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from src.core.config import get_config
+from src.core.logger import get_logger
+
+
+class CombatLogKind(IntEnum):
+    """전투 로그 레코드 종류"""
+    MESSAGE = 0          # 미리 만들어진 텍스트
+    TURN_START = 1
+    BRV_ATTACK = 2
+    HP_ATTACK = 3
+    MISS = 4
+    DEFEND = 5
+    FLEE_SUCCESS = 6
+    FLEE_FAILED = 7
+    BREAK = 8
+    BREAK_IMMUNE = 9
+    BREAK_RECOVER = 10
+    BREAK_HOLD = 11
+    WOUND = 12
+    TRAIT_BRV_REGEN = 13
+    LIFESTEAL = 14
+    MANA_LEECH = 15
+    HP_ATTACK_DETAIL = 16
+    ACTION_FAILED = 17
+    HP_REGEN_PERCENT = 18
+    HP_REGEN = 19
+    MP_REGEN = 20
+    CANNOT_ACT = 21
+    EXTRA_ACTION = 22
+    FIRST_STRIKE = 23
+    REVENGE = 24
+    STATUS_PROC = 25
+    LIFESTEAL_HIT = 26
+    HIT_RECOVER = 27
+    AREA_DAMAGE = 28
+    CAST_CANCELLED = 29
+    CAST_TRIGGER = 30
+    FIELD_DAMAGE = 31
+    FIELD_HEAL = 32
+    FIELD_MP = 33
+    MP_COST = 34
+    COMBAT_END = 35
+
+
+class CombatLogFlag(IntFlag):
+    """전투 로그 레코드 플래그"""
+    NONE = 0
+    CRITICAL = 1
+    BREAK = 2
+    KO = 4
+    ACTOR_ALLY = 8
+    TARGET_ALLY = 16
+    TEXT = 32  # MESSAGE 레코드 (텍스트/색상을 함께 저장)
+
+
+class _KindSpec(NamedTuple):
+    """레코드 종류별 표시 규칙"""
+    template: str
+    color: Tuple[int, int, int] = (255, 255, 255)
+    level: int = logging.INFO
+    channel: str = "combat"
+    suffixes: Tuple[Tuple[int, str], ...] = ()
+    critical_color: Optional[Tuple[int, int, int]] = None
+
+
+# 종류별 템플릿 (사용 가능한 필드: actor, target, note, amount, extra, total, actor_side, target_side)
+_KIND_SPECS: Dict[int, _KindSpec] = {
+    CombatLogKind.MESSAGE: _KindSpec(""),
+    CombatLogKind.TURN_START: _KindSpec("{actor}의 턴!", (100, 255, 255)),
+    CombatLogKind.BRV_ATTACK: _KindSpec(
+        "BRV 공격! {amount} 데미지", (200, 200, 200),
+        suffixes=((CombatLogFlag.CRITICAL, " [크리티컬!]"), (CombatLogFlag.BREAK, " [BREAK!]")),
+        critical_color=(255, 255, 100),
+    ),
+    CombatLogKind.HP_ATTACK: _KindSpec(
+        "HP 공격! {amount} HP 데미지", (255, 100, 100),
+        suffixes=((CombatLogFlag.KO, " [격파!]"),),
+    ),
+    CombatLogKind.MISS: _KindSpec(
+        "[빗나감] {actor_side} {actor}의 공격이 {target_side} {target}에게 빗나갔다!", (150, 150, 150)
+    ),
+    CombatLogKind.DEFEND: _KindSpec("방어 자세!", (100, 200, 255)),
+    CombatLogKind.FLEE_SUCCESS: _KindSpec("도망쳤다!", (255, 255, 100)),
+    CombatLogKind.FLEE_FAILED: _KindSpec("도망칠 수 없다!", (255, 100, 100)),
+    CombatLogKind.BREAK: _KindSpec(
+        "[BREAK] {actor} -> {target} (BRV 0 상태에서 추가 공격, BRV 획득: {amount})", channel="brave"
+    ),
+    CombatLogKind.BREAK_IMMUNE: _KindSpec(
+        "{target}은(는) 이미 BREAK 상태여서 추가 BREAK 면역", level=logging.DEBUG, channel="brave"
+    ),
+    CombatLogKind.BREAK_RECOVER: _KindSpec("{actor} BREAK 해제 및 BRV 회복: {amount}", channel="brave"),
+    CombatLogKind.BREAK_HOLD: _KindSpec("{actor} BREAK 상태 유지", level=logging.DEBUG, channel="brave"),
+    CombatLogKind.WOUND: _KindSpec("상처 축적: {target} +{amount} (총 {extra}/{total})", channel="brave"),
+    CombatLogKind.TRAIT_BRV_REGEN: _KindSpec(
+        "[{note}] {target} BRV 회복: +{amount} ({extra}%)", channel="brave"
+    ),
+    CombatLogKind.LIFESTEAL: _KindSpec("[생명력 흡수] {actor} HP 회복: +{amount} ({extra}%)", channel="brave"),
+    CombatLogKind.MANA_LEECH: _KindSpec("[마력 흡수] {actor} MP 회복: +{amount} ({extra}%)", channel="brave"),
+    CombatLogKind.HP_ATTACK_DETAIL: _KindSpec(
+        "HP 공격: {actor} → {target} (BRV 소비: {extra}, HP 데미지: {amount}, 상처: {total})",
+        channel="brave",
+        suffixes=((CombatLogFlag.CRITICAL, " [크리티컬]"), (CombatLogFlag.BREAK, " [BREAK 보너스]")),
+    ),
+    CombatLogKind.ACTION_FAILED: _KindSpec("{actor}의 행동 실패 - ATB 소비 안 함, 재생 효과 없음"),
+    CombatLogKind.HP_REGEN_PERCENT: _KindSpec("{actor} HP 재생: +{amount} ({extra}% 스탯 기반, 버프)"),
+    CombatLogKind.HP_REGEN: _KindSpec("{actor} HP 재생: +{amount} (버프, 스탯 기반)"),
+    CombatLogKind.MP_REGEN: _KindSpec("{actor} MP 재생: +{amount} (버프)"),
+    CombatLogKind.CANNOT_ACT: _KindSpec("{actor}은(는) 행동 불가능 상태!"),
+    CombatLogKind.EXTRA_ACTION: _KindSpec("[추가 행동] {actor}이(가) 추가 행동을 획득했습니다!"),
+    CombatLogKind.FIRST_STRIKE: _KindSpec("[선제 공격] {actor} 첫 턴 공격! 데미지 +{extra}%"),
+    CombatLogKind.REVENGE: _KindSpec("[복수] {actor} 복수 공격! 데미지 +{extra}%"),
+    CombatLogKind.STATUS_PROC: _KindSpec("[{note}] {target} {note}! ({extra}% 확률)"),
+    CombatLogKind.LIFESTEAL_HIT: _KindSpec("[흡혈] {actor} HP 회복: {amount} (피해의 {extra}%)"),
+    CombatLogKind.HIT_RECOVER: _KindSpec("[타격 회복] {actor} {note} +{amount}"),
+    CombatLogKind.AREA_DAMAGE: _KindSpec("[{note}] {target}에게 {amount} 피해! (본 피해의 {extra}%)"),
+    CombatLogKind.CAST_CANCELLED: _KindSpec("{actor} 전투 불능으로 시전 취소"),
+    CombatLogKind.CAST_TRIGGER: _KindSpec("{actor}의 {note} 발동!"),
+    CombatLogKind.FIELD_DAMAGE: _KindSpec("{actor} {note} 피해: {amount}"),
+    CombatLogKind.FIELD_HEAL: _KindSpec("{actor} {note} 회복: {amount}"),
+    CombatLogKind.FIELD_MP: _KindSpec("{actor} {note} MP 회복: {amount}"),
+    CombatLogKind.MP_COST: _KindSpec("{actor} MP 소모: -{amount} (잔여: {extra})"),
+    CombatLogKind.COMBAT_END: _KindSpec("전투 종료: {note}"),
+}
+
+
+# 이름 테이블에 없는 경우 (행동자/대상/비고 없음)
+NO_NAME = 0xFFFF
+
+# 바이너리 덤프 형식
+_MAGIC = b"CLOG"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHII")          # magic, version, capacity, record 수
+_RECORD = struct.Struct("<IBHHHHiii")      # seq, kind, flags, actor, target, note, amount, extra, total
+_TEXT_HEADER = struct.Struct("<H3B")       # 텍스트 길이, 색상 RGB
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I32_MIN, _I32_MAX = -(2 ** 31), 2 ** 31 - 1
+
+
+class CombatLogRecord:
+    """전투 로그 레코드 (표시 텍스트는 format() 호출 시 생성)"""
+
+    __slots__ = ("seq", "kind", "flags", "actor", "target", "note",
+                 "amount", "extra", "total", "text", "color")
+
+    def __init__(self, seq: int, kind: int, flags: int, actor: int, target: int, note: int,
+                 amount: int, extra: int, total: int,
+                 text: Optional[str] = None, color: Optional[Tuple[int, int, int]] = None):
+        self.seq = seq
+        self.kind = kind
+        self.flags = flags
+        self.actor = actor
+        self.target = target
+        self.note = note
+        self.amount = amount
+        self.extra = extra
+        self.total = total
+        self.text = text
+        self.color = color
+
+
+# 로그 싱크: (log, record) -> None
+CombatLogSink = Callable[["CombatLog", CombatLogRecord], None]
+
+
+class CombatLoggerSink:
+    """
+    레코드를 게임 로거로 전달하는 싱크
+
+    해당 로거가 레코드 레벨을 기록하지 않는 경우(헤드리스 모드 등) 포맷하지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._loggers: Dict[str, Any] = {}
+
+    def __call__(self, log: "CombatLog", record: CombatLogRecord) -> None:
+        spec = _KIND_SPECS[record.kind]
+        logger = self._loggers.get(spec.channel)
+        if logger is None:
+            logger = self._loggers[spec.channel] = get_logger(spec.channel)
+        if not logger.is_enabled_for(spec.level):
+            return
+        if spec.level >= logging.INFO:
+            logger.info(log.format(record))
+        else:
+            logger.debug(log.format(record))
+
+
+class CombatLog:
+    """
+    전투 로그 링 버퍼
+
+    capacity를 넘으면 가장 오래된 레코드부터 덮어씁니다.
+    행동자/대상 이름과 비고 문자열은 이름 테이블에 한 번만 저장하고 번호로 참조합니다.
+    """
+
+    def __init__(self, capacity: int = 2048) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다")
+        self.capacity = capacity
+        self._records: List[Optional[CombatLogRecord]] = [None] * capacity
+        self._next = 0
+        self._count = 0
+        self._seq = 0
+        self._names: List[str] = []
+        self._name_index: Dict[str, int] = {}
+        self._sinks: List[CombatLogSink] = []
+        self._suppress_depth = 0
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        kind: CombatLogKind,
+        actor: Any = None,
+        target: Any = None,
+        amount: int = 0,
+        extra: int = 0,
+        total: int = 0,
+        flags: int = 0,
+        note: Optional[str] = None,
+    ) -> CombatLogRecord:
+        """
+        타입이 있는 레코드 기록
+
+        Args:
+            kind: 레코드 종류
+            actor: 행동자 (캐릭터 또는 이름)
+            target: 대상 (캐릭터 또는 이름)
+            amount: 주 수치 (데미지, 회복량 등)
+            extra: 보조 수치 (확률/비율 %, 잔여량 등)
+            total: 추가 수치 (최대치 등)
+            flags: CombatLogFlag 조합
+            note: 비고 (스킬/상태/특성 이름 등)
+
+        Returns:
+            기록된 레코드
+        """
+        rec = CombatLogRecord(
+            self._seq, int(kind), int(flags),
+            self._intern(actor), self._intern(target), self._intern(note),
+            amount, extra, total,
+        )
+        self._append(rec)
+        return rec
+
+    def message(self, text: str, color: Optional[Tuple[int, int, int]] = None) -> CombatLogRecord:
+        """미리 만들어진 텍스트 레코드 기록"""
+        rec = CombatLogRecord(
+            self._seq, CombatLogKind.MESSAGE, CombatLogFlag.TEXT,
+            NO_NAME, NO_NAME, NO_NAME, 0, 0, 0,
+            text, color or (255, 255, 255),
+        )
+        self._append(rec)
+        return rec
+
+    def _append(self, rec: CombatLogRecord) -> None:
+        if self._suppress_depth:
+            return
+        self._records[self._next] = rec
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        self._seq += 1
+        for sink in self._sinks:
+            sink(self, rec)
+
+    @contextmanager
+    def suppressed(self) -> Iterator[None]:
+        """
+        기록 차단 블록
+
+        블록 안의 레코드는 버퍼에 남지 않고 싱크에도 전달되지 않습니다 (중첩 가능).
+        시험 실행(lookahead) 중의 가상 행동이 로그에 섞이지 않도록 사용합니다.
+        """
+        self._suppress_depth += 1
+        try:
+            yield
+        finally:
+            self._suppress_depth -= 1
+
+    def _intern(self, value: Any) -> int:
+        """이름 테이블 번호 (None이면 NO_NAME)"""
+        if value is None:
+            return NO_NAME
+        name = value if isinstance(value, str) else getattr(value, 'name', 'Unknown')
+        index = self._name_index.get(name)
+        if index is None:
+            if len(self._names) >= NO_NAME:
+                # 이름 테이블이 가득 차면 더 이상 추가하지 않음
+                return NO_NAME
+            index = len(self._names)
+            self._names.append(name)
+            self._name_index[name] = index
+        return index
+
+    # ------------------------------------------------------------------
+    # 조회/포맷
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[CombatLogRecord]:
+        return iter(self.records())
+
+    def records(self, start: int = 0, end: Optional[int] = None) -> List[CombatLogRecord]:
+        """오래된 것부터 정렬된 레코드 구간 [start, end)"""
+        if end is None or end > self._count:
+            end = self._count
+        start = max(0, start)
+        if start >= end:
+            return []
+        oldest = (self._next - self._count) % self.capacity
+        records = self._records
+        capacity = self.capacity
+        return [records[(oldest + i) % capacity] for i in range(start, end)]
+
+    def name(self, index: int) -> str:
+        """이름 테이블 조회"""
+        if 0 <= index < len(self._names):
+            return self._names[index]
+        return ""
+
+    def format(self, record: CombatLogRecord) -> str:
+        """레코드의 표시 텍스트 (처음 요청될 때 생성)"""
+        text = record.text
+        if text is None:
+            spec = _KIND_SPECS[record.kind]
+            text = spec.template.format(
+                actor=self.name(record.actor),
+                target=self.name(record.target),
+                note=self.name(record.note),
+                amount=record.amount,
+                extra=record.extra,
+                total=record.total,
+                actor_side="아군" if record.flags & CombatLogFlag.ACTOR_ALLY else "적",
+                target_side="아군" if record.flags & CombatLogFlag.TARGET_ALLY else "적",
+            )
+            for flag, suffix in spec.suffixes:
+                if record.flags & flag:
+                    text += suffix
+            record.text = text
+        return text
+
+    def color_of(self, record: CombatLogRecord) -> Tuple[int, int, int]:
+        """레코드 표시 색상"""
+        if record.color is not None:
+            return record.color
+        spec = _KIND_SPECS[record.kind]
+        if spec.critical_color and record.flags & CombatLogFlag.CRITICAL:
+            return spec.critical_color
+        return spec.color
+
+    def format_lines(self, count: Optional[int] = None) -> List[str]:
+        """최근 레코드 count개의 표시 텍스트 (None이면 전체)"""
+        start = 0 if count is None else self._count - count
+        return [self.format(rec) for rec in self.records(start)]
+
+    # ------------------------------------------------------------------
+    # 싱크
+    # ------------------------------------------------------------------
+
+    def add_sink(self, sink: CombatLogSink) -> None:
+        """레코드가 기록될 때마다 호출될 싱크 추가"""
+        if sink not in self._sinks:
+            self._sinks.append(sink)
+
+    def remove_sink(self, sink: CombatLogSink) -> None:
+        """싱크 제거"""
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+
+    def clear(self) -> None:
+        """레코드와 이름 테이블 초기화 (싱크는 유지)"""
+        self._records = [None] * self.capacity
+        self._next = 0
+        self._count = 0
+        self._names.clear()
+        self._name_index.clear()
+
+    # ------------------------------------------------------------------
+    # 바이너리 덤프
+    # ------------------------------------------------------------------
+
+    def dumps(self) -> bytes:
+        """
+        바이너리 덤프
+
+        헤더, 이름 테이블, 고정 크기 레코드 순서로 기록합니다.
+        MESSAGE 레코드는 레코드 뒤에 텍스트와 색상이 이어집니다.
+        """
+        parts = [_HEADER.pack(_MAGIC, _VERSION, self.capacity, self._count)]
+
+        parts.append(_U32.pack(len(self._names)))
+        for name in self._names:
+            encoded = name.encode("utf-8")[:0xFFFF]
+            parts.append(_U16.pack(len(encoded)))
+            parts.append(encoded)
+
+        for rec in self.records():
+            parts.append(_RECORD.pack(
+                rec.seq & 0xFFFFFFFF, rec.kind, rec.flags,
+                rec.actor, rec.target, rec.note,
+                _clamp_i32(rec.amount), _clamp_i32(rec.extra), _clamp_i32(rec.total),
+            ))
+            if rec.flags & CombatLogFlag.TEXT:
+                encoded = (rec.text or "").encode("utf-8")[:0xFFFF]
+                color = rec.color or (255, 255, 255)
+                parts.append(_TEXT_HEADER.pack(len(encoded), *color))
+                parts.append(encoded)
+        return b"".join(parts)
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """바이너리 덤프를 파일로 저장"""
+        Path(path).write_bytes(self.dumps())
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CombatLog":
+        """바이너리 덤프에서 로그 복원 (싱크 없음)"""
+        magic, version, capacity, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("전투 로그 덤프 형식이 아닙니다")
+        offset = _HEADER.size
+
+        log = cls(capacity)
+        (name_count,) = _U32.unpack_from(data, offset)
+        offset += _U32.size
+        for _ in range(name_count):
+            (length,) = _U16.unpack_from(data, offset)
+            offset += _U16.size
+            name = data[offset:offset + length].decode("utf-8", errors="replace")
+            offset += length
+            log._name_index.setdefault(name, len(log._names))
+            log._names.append(name)
+
+        seq = 0
+        for _ in range(count):
+            seq, kind, flags, actor, target, note, amount, extra, total = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            text, color = None, None
+            if flags & CombatLogFlag.TEXT:
+                length, r, g, b = _TEXT_HEADER.unpack_from(data, offset)
+                offset += _TEXT_HEADER.size
+                text = data[offset:offset + length].decode("utf-8", errors="replace")
+                color = (r, g, b)
+                offset += length
+            log._records[log._next] = CombatLogRecord(
+                seq, kind, flags, actor, target, note, amount, extra, total, text, color
+            )
+            log._next = (log._next + 1) % capacity
+            log._count += 1
+        log._seq = seq + 1 if count else 0
+        return log
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CombatLog":
+        """파일에서 바이너리 덤프 복원"""
+        return cls.loads(Path(path).read_bytes())
+
+
+def _clamp_i32(value: Any) -> int:
+    """바이너리 덤프용 32비트 정수 범위 제한"""
+    value = int(value)
+    return _I32_MIN if value < _I32_MIN else _I32_MAX if value > _I32_MAX else value
+
+
+# 전역 인스턴스
+_combat_log: Optional[CombatLog] = None
+
+
+def get_combat_log() -> CombatLog:
+    """전역 전투 로그 (게임 로거로 전달하는 싱크 포함)"""
+    global _combat_log
+    if _combat_log is None:
+        capacity = get_config().get("combat.log_capacity", 2048)
+        _combat_log = CombatLog(capacity)
+        _combat_log.add_sink(CombatLoggerSink())
+    return _combat_log
@@ -10,14 +10,32 @@ from enum import Enum
 from src.core.config import get_config
 from src.core.logger import get_logger
 from src.core.event_bus import event_bus, Events
+from src.core.rng import RngStreams, get_rng
 from src.combat.atb_system import get_atb_system, ATBSystem
+from src.combat.battlefield_analysis import BattlefieldAnalysis
 from src.combat.brave_system import get_brave_system, BraveSystem
+from src.combat.combat_log import CombatLogFlag, CombatLogKind, get_combat_log
+from src.combat.combat_recorder import CombatRecorder
 from src.combat.damage_calculator import get_damage_calculator, DamageCalculator
+from src.combat.party_combatants import get_party_combatant_pool
 from src.combat.status_effects import StatusManager, StatusEffect, StatusType
 from src.audio import play_sfx
 from src.character.gimmick_updater import GimmickUpdater
 
 
+# 공유 전장 분석을 무효화하는 이벤트 (HP/BRV/상태이상 변화)
+_BATTLEFIELD_EVENTS = (
+    Events.CHARACTER_HP_CHANGE,
+    Events.CHARACTER_BRV_CHANGE,
+    Events.CHARACTER_DEATH,
+    Events.CHARACTER_REVIVE,
+    Events.COMBAT_DAMAGE_TAKEN,
+    Events.STATUS_APPLIED,
+    Events.STATUS_REMOVED,
+    Events.STATUS_DOT_DAMAGE,
+)
+
+
 class CombatState(Enum):
     """전투 상태"""
     NOT_STARTED = "not_started"
@@ -49,6 +67,7 @@ class CombatManager:
 
     def __init__(self) -> None:
         self.logger = get_logger("combat")
+        self.combat_log = get_combat_log()
         self.config = get_config()
 
         # 서브시스템
@@ -56,6 +75,9 @@ class CombatManager:
         self.brave: BraveSystem = get_brave_system()
         self.damage_calc: DamageCalculator = get_damage_calculator()
 
+        # 행동 단위 이벤트 일괄 전달 여부
+        self.defer_events = self.config.get("combat.defer_events", False)
+
         # 전투 상태
         self.state: CombatState = CombatState.NOT_STARTED
         self.turn_count = 0
@@ -81,9 +103,22 @@ class CombatManager:
         self.on_turn_start: Optional[Callable[[Any], None]] = None
         self.on_action_complete: Optional[Callable[[Any, Dict], None]] = None
 
+        # 공유 전장 분석 (적 AI/봇이 재사용, HP/BRV/상태 변화 시 무효화)
+        self._battlefield: Optional[BattlefieldAnalysis] = None
+        self._battlefield_version = 0
+        self._support_cache: Dict[int, bool] = {}  # 직업 기반 힐러 여부 (전투 동안 고정)
+        self._enemy_ais: Dict[int, Any] = {}  # 적별 AI (전투 동안 유지, 전투 후 last_stats 조회용)
+        self._prefetching = False  # prefetch를 시작한 전투면 행동이 끝날 때마다 새 상태로 다시 탐색
+        self._sides: Dict[int, Tuple[Any, bool]] = {}  # id → (전투원, 아군 여부), start_combat에서 구성
+
+        # 전투 입력 기록기 (None이면 기록 안 함, combat.record_inputs로 자동 생성)
+        self.recorder: Optional[CombatRecorder] = None
+
         # 사망 이벤트 구독
         event_bus.subscribe(Events.CHARACTER_DEATH, self._on_character_death)
         event_bus.subscribe(Events.COMBAT_DAMAGE_TAKEN, self._on_damage_taken)
+        for event_name in _BATTLEFIELD_EVENTS:
+            event_bus.subscribe(event_name, self._on_battlefield_change)
 
     def start_combat(self, allies: List[Any], enemies: List[Any], dungeon: Optional[Any] = None, combat_position: Optional[Tuple[int, int]] = None) -> None:
         """
@@ -97,6 +132,17 @@ class CombatManager:
         """
         self.logger.info("전투 시작!")
 
+        # 입력 기록: 전투 시드로 난수를 고정해야 재생 시 같은 결과가 나옴
+        if self.recorder is None and self.config.get("combat.record_inputs", False):
+            self.recorder = CombatRecorder()
+        if self.recorder is not None:
+            self.recorder.begin()
+
+        self._support_cache = {}
+        self._enemy_ais = {}
+        self._prefetching = False
+        self.invalidate_battlefield_analysis()
+
         # 전투원 설정 (PartyMember 변환은 아래에서 처리)
         self.enemies = enemies
         self.turn_count = 0
@@ -119,63 +165,31 @@ class CombatManager:
             self.cooking_cooldown_turn = None
             self.cooking_cooldown_duration = 0
 
-        # PartyMember를 Character로 변환 (unhashable 타입 문제 해결)
-        from src.ui.party_setup import PartyMember
-        from src.character.character import Character
-        converted_allies = []
-        for ally in allies:
-            if isinstance(ally, PartyMember):
-                # PartyMember를 Character로 변환
-                char = Character(
-                    name=ally.character_name,
-                    character_class=ally.job_id,
-                    level=getattr(ally, 'level', 1)
-                )
-                # PartyMember의 속성을 Character에 복사
-                if hasattr(ally, 'player_id'):
-                    char.player_id = ally.player_id
-                if hasattr(ally, 'selected_traits') and ally.selected_traits:
-                    for trait_id in ally.selected_traits:
-                        char.activate_trait(trait_id)
-                # 스탯 복사 (stats가 StatManager인 경우)
-                if hasattr(ally, 'stats') and ally.stats:
-                    from src.character.stats import Stats
-                    # stats가 딕셔너리인 경우 StatManager에 적용
-                    if isinstance(ally.stats, dict):
-                        for stat_name, value in ally.stats.items():
-                            try:
-                                # Stats는 클래스이므로 getattr 사용
-                                stat_enum = getattr(Stats, stat_name.upper(), None)
-                                if stat_enum:
-                                    char.stat_manager.set_value(stat_enum, value)
-                            except (KeyError, AttributeError):
-                                pass
-                    elif hasattr(ally.stats, 'get_value'):
-                        # StatManager 객체인 경우 복사
-                        for stat in Stats:
-                            try:
-                                value = ally.stats.get_value(stat)
-                                char.stat_manager.set_value(stat, value)
-                            except:
-                                pass
-                converted_allies.append(char)
-            else:
-                converted_allies.append(ally)
-        
-        self.allies = converted_allies
+        # PartyMember를 전투용 Character로 변환 (unhashable 타입 문제 해결)
+        # 멤버별 Character는 풀에 유지되고 바뀐 필드만 동기화됨
+        self.allies = get_party_combatant_pool().convert(allies)
+        self._sides = {id(c): (c, True) for c in self.allies}
+        self._sides.update((id(c), (c, False)) for c in self.enemies)
+
+        if self.recorder is not None:
+            self.recorder.bind(
+                self.allies, self.enemies,
+                has_dungeon=dungeon is not None,
+                position=list(combat_position) if combat_position else None,
+            )
         
         # 보호 관계 초기화 (이전 전투의 오래된 참조 제거)
         self._clear_protection_relationships(self.allies)
         
         # ATB 시스템에 전투원 등록
-        import random
+        atb_rng = get_rng(RngStreams.ATB)
         for ally in self.allies:
             self.atb.register_combatant(ally)
             self.brave.initialize_brv(ally)
             # ATB 게이지를 0~50% 랜덤하게 채우기
             gauge = self.atb.get_gauge(ally)
             if gauge:
-                random_percentage = random.uniform(0.0, 0.5)
+                random_percentage = atb_rng.uniform(0.0, 0.5)
                 gauge.current = int(gauge.max_gauge * random_percentage)
 
         for enemy in enemies:
@@ -184,7 +198,7 @@ class CombatManager:
             # ATB 게이지를 0~50% 랜덤하게 채우기
             gauge = self.atb.get_gauge(enemy)
             if gauge:
-                random_percentage = random.uniform(0.0, 0.5)
+                random_percentage = atb_rng.uniform(0.0, 0.5)
                 gauge.current = int(gauge.max_gauge * random_percentage)
 
         # 캐스팅 시스템 초기화
@@ -242,6 +256,9 @@ class CombatManager:
         Args:
             delta_time: 경과 시간
         """
+        if self.recorder is not None:
+            self.recorder.record_tick(delta_time, self.state == CombatState.PLAYER_TURN)
+
         if self.state not in [CombatState.IN_PROGRESS, CombatState.PLAYER_TURN, CombatState.ENEMY_TURN]:
             return
 
@@ -255,6 +272,29 @@ class CombatManager:
         # 승리/패배 판정
         self._check_battle_end()
 
+    def skip_idle_ticks(self, limit: int, delta_time: float = 1.0) -> int:
+        """
+        아무도 행동할 수 없는 틱을 다음 행동 시점 직전까지 한 번에 진행
+
+        마지막 한 틱은 update()로 처리해야 캐스팅 완료/승패 판정이
+        틱 단위 진행과 같은 순서로 일어납니다. 건너뛴 틱 수는 입력 기록 대상입니다.
+
+        Args:
+            limit: 최대 진행 틱 수
+            delta_time: 틱당 경과 시간
+
+        Returns:
+            진행한 틱 수
+        """
+        idle_ticks = self.atb.ticks_until_next_ready()
+        skip = limit if idle_ticks is None else min(idle_ticks - 1, limit)
+        if skip <= 0:
+            return 0
+        advanced = self.atb.advance_to_next_ready(delta_time=delta_time, max_ticks=skip)
+        if self.recorder is not None and advanced > 0:
+            self.recorder.record_idle(delta_time, advanced)
+        return advanced
+
     def execute_action(
         self,
         actor: Any,
@@ -266,6 +306,56 @@ class CombatManager:
         """
         행동 실행
 
+        combat.defer_events가 켜져 있으면 행동 중 발행된 이벤트를 모아
+        행동이 끝난 뒤 한 번에 전달합니다.
+
+        Args:
+            actor: 행동자
+            action_type: 행동 타입
+            target: 대상
+            skill: 스킬 (있는 경우)
+            **kwargs: 추가 옵션
+
+        Returns:
+            행동 결과
+        """
+        if self.recorder is not None:
+            self.recorder.record_action(actor, action_type.value, target, skill, kwargs)
+        try:
+            if self.defer_events:
+                with event_bus.deferred():
+                    return self._execute_action(actor, action_type, target, skill, **kwargs)
+            return self._execute_action(actor, action_type, target, skill, **kwargs)
+        finally:
+            # 행동 중 직접 바뀐 HP/BRV도 반영되도록 분석 무효화
+            self.invalidate_battlefield_analysis()
+            self._mark_atb_dirty(actor, action_type, target)
+            self._refresh_prefetch()
+
+    def _mark_atb_dirty(self, actor: Any, action_type: ActionType, target: Any) -> None:
+        """
+        행동으로 속도/버프/생존 여부가 바뀌었을 수 있는 전투원의 ATB 스케줄 무효화
+
+        공격은 행동자와 대상만, 스킬/아이템(전체 대상·버프 가능)은 전체를 표시합니다.
+        """
+        if action_type in (ActionType.SKILL, ActionType.ITEM) or target is None:
+            self.atb.mark_dirty()
+            return
+        self.atb.mark_dirty(actor)
+        for combatant in target if isinstance(target, (list, tuple)) else (target,):
+            self.atb.mark_dirty(combatant)
+
+    def _execute_action(
+        self,
+        actor: Any,
+        action_type: ActionType,
+        target: Optional[Any] = None,
+        skill: Optional[Any] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        행동 실행 (이벤트 지연 여부와 무관한 본체)
+
         Args:
             actor: 행동자
             action_type: 행동 타입
@@ -346,7 +436,7 @@ class CombatManager:
         
         # 행동이 실패하면 턴 시작 처리(재생 효과 포함)를 하지 않음
         if action_failed:
-            self.logger.info(f"{actor.name}의 행동 실패 - ATB 소비 안 함, 재생 효과 없음")
+            self.combat_log.record(CombatLogKind.ACTION_FAILED, actor)
             return result
 
         # 턴 시작 처리 (행동 성공 시에만)
@@ -445,7 +535,10 @@ class CombatManager:
                         actor.current_hp = min(actor.max_hp, actor.current_hp + hp_amount)
                         actual_heal = actor.current_hp - old_hp
                     if actual_heal > 0:
-                        self.logger.info(f"{actor.name} HP 재생: +{actual_heal} ({int(regen_percent*100)}% 스탯 기반, 버프)")
+                        self.combat_log.record(
+                            CombatLogKind.HP_REGEN_PERCENT, actor,
+                            amount=actual_heal, extra=int(regen_percent * 100)
+                        )
             
             # HP_REGEN 처리 (시전자 스탯 기반 HP 재생, 약 8%)
             if 'hp_regen' in actor.active_buffs:
@@ -466,7 +559,7 @@ class CombatManager:
                         actor.current_hp = min(actor.max_hp, actor.current_hp + hp_amount)
                         actual_heal = actor.current_hp - old_hp
                     if actual_heal > 0:
-                        self.logger.info(f"{actor.name} HP 재생: +{actual_heal} (버프, 스탯 기반)")
+                        self.combat_log.record(CombatLogKind.HP_REGEN, actor, amount=actual_heal)
             
             # MP 재생 처리 (고정값 기반)
             if 'mp_regen' in actor.active_buffs:
@@ -481,7 +574,7 @@ class CombatManager:
                         actor.current_mp = min(actor.max_mp, actor.current_mp + mp_amount)
                         actual_restore = actor.current_mp - old_mp
                     if actual_restore > 0:
-                        self.logger.info(f"{actor.name} MP 재생: +{actual_restore} (버프)")
+                        self.combat_log.record(CombatLogKind.MP_REGEN, actor, amount=actual_restore)
         # 기믹 업데이트에 context 전달 (언데드 자동 공격 등)
         context = {
             'enemies': self.enemies,
@@ -543,7 +636,7 @@ class CombatManager:
         if hasattr(actor, 'status_manager'):
             can_act = actor.status_manager.can_act()
             if not can_act:
-                self.logger.info(f"{actor.name}은(는) 행동 불가능 상태!")
+                self.combat_log.record(CombatLogKind.CANNOT_ACT, actor)
                 result["success"] = False
                 result["error"] = "행동 불가능 상태"
                 # ATB는 소비하지만 행동하지 못함
@@ -564,7 +657,7 @@ class CombatManager:
             trait_manager.activate_extra_action(actor, extra_action_cost)
             actor._is_extra_action = True  # 다음 행동은 추가 행동임을 표시
             result["extra_action_granted"] = True
-            self.logger.info(f"[추가 행동] {actor.name}이(가) 추가 행동을 획득했습니다!")
+            self.combat_log.record(CombatLogKind.EXTRA_ACTION, actor)
             
             # 콜백 호출
             if self.on_action_complete:
@@ -682,7 +775,7 @@ class CombatManager:
         if self.turn_count == 0 and skill and hasattr(skill, 'metadata') and skill.metadata.get('first_strike_bonus'):
             first_strike_bonus = skill.metadata['first_strike_bonus']
             skill_multiplier *= (1.0 + first_strike_bonus)
-            self.logger.info(f"[선제 공격] {attacker.name} 첫 턴 공격! 데미지 +{first_strike_bonus*100:.0f}%")
+            self.combat_log.record(CombatLogKind.FIRST_STRIKE, attacker, extra=round(first_strike_bonus * 100))
 
         # revenge_bonus (복수 보너스 - 피격 후 공격) - 데미지 계산 전에 적용
         revenge_bonus = 0
@@ -690,7 +783,7 @@ class CombatManager:
             if skill and hasattr(skill, 'metadata') and skill.metadata.get('revenge_bonus'):
                 revenge_bonus = skill.metadata['revenge_bonus']
                 skill_multiplier *= (1.0 + revenge_bonus)
-                self.logger.info(f"[복수] {attacker.name} 복수 공격! 데미지 +{revenge_bonus*100:.0f}%")
+                self.combat_log.record(CombatLogKind.REVENGE, attacker, extra=round(revenge_bonus * 100))
             attacker._recently_damaged = False  # 복수 후 초기화
 
         # 데미지 계산
@@ -702,9 +795,10 @@ class CombatManager:
         is_miss = damage_result.details.get("miss", False)
         if is_miss:
             # 공격 빗나감 로그
-            attacker_type = "아군" if attacker in self.allies else "적"
-            defender_type = "아군" if defender in self.allies else "적"
-            self.logger.info(f"[빗나감] {attacker_type} {attacker.name}의 공격이 {defender_type} {defender.name}에게 빗나갔다!")
+            self.combat_log.record(
+                CombatLogKind.MISS, attacker, defender,
+                flags=self._side_flags(attacker, defender)
+            )
             # SFX 재생 (회피 사운드)
             play_sfx("combat", "miss")
 
@@ -751,7 +845,9 @@ class CombatManager:
                     stun = StatusEffect("기절", StatusType.STUN, duration=1, intensity=1.0)
                     if hasattr(defender, 'status_manager'):
                         defender.status_manager.add_status(stun)
-                        self.logger.info(f"[기절] {defender.name} 기절! ({stun_chance*100:.0f}% 확률)")
+                        self.combat_log.record(
+                            CombatLogKind.STATUS_PROC, target=defender, note="기절", extra=round(stun_chance * 100)
+                        )
 
             # freeze_chance (빙결 확률)
             if skill.metadata.get('freeze_chance'):
@@ -763,7 +859,9 @@ class CombatManager:
                     freeze = StatusEffect("빙결", StatusType.FREEZE, duration=min(freeze_duration, 2), intensity=1.0)
                     if hasattr(defender, 'status_manager'):
                         defender.status_manager.add_status(freeze)
-                        self.logger.info(f"[빙결] {defender.name} 빙결! ({freeze_chance*100:.0f}% 확률)")
+                        self.combat_log.record(
+                            CombatLogKind.STATUS_PROC, target=defender, note="빙결", extra=round(freeze_chance * 100)
+                        )
 
             # blind_chance (실명 확률)
             if skill.metadata.get('blind_chance'):
@@ -775,7 +873,9 @@ class CombatManager:
                     blind = StatusEffect("실명", StatusType.BLIND, duration=blind_duration, intensity=1.0)
                     if hasattr(defender, 'status_manager'):
                         defender.status_manager.add_status(blind)
-                        self.logger.info(f"[실명] {defender.name} 실명! ({blind_chance*100:.0f}% 확률)")
+                        self.combat_log.record(
+                            CombatLogKind.STATUS_PROC, target=defender, note="실명", extra=round(blind_chance * 100)
+                        )
 
             # silence_chance (침묵 확률)
             if skill.metadata.get('silence_chance'):
@@ -787,7 +887,9 @@ class CombatManager:
                     silence = StatusEffect("침묵", StatusType.SILENCE, duration=min(silence_duration, 2), intensity=1.0)
                     if hasattr(defender, 'status_manager'):
                         defender.status_manager.add_status(silence)
-                        self.logger.info(f"[침묵] {defender.name} 침묵! ({silence_chance*100:.0f}% 확률)")
+                        self.combat_log.record(
+                            CombatLogKind.STATUS_PROC, target=defender, note="침묵", extra=round(silence_chance * 100)
+                        )
 
         return {
             "action": "brv_attack",
@@ -972,7 +1074,9 @@ class CombatManager:
                     actual_heal = heal_amount
 
                 if actual_heal > 0:
-                    self.logger.info(f"[흡혈] {attacker.name} HP 회복: {actual_heal} (피해의 {lifesteal_ratio*100:.0f}%)")
+                    self.combat_log.record(
+                        CombatLogKind.LIFESTEAL_HIT, attacker, amount=actual_heal, extra=round(lifesteal_ratio * 100)
+                    )
 
                 # blood_empowerment: 흡혈 성공 시 30% 확률로 버프
                 if actual_heal > 0:
@@ -1002,7 +1106,7 @@ class CombatManager:
                 attacker.current_hp += actual_heal
             else:
                 actual_heal = heal_amount
-            self.logger.info(f"[타격 회복] {attacker.name} HP +{actual_heal}")
+            self.combat_log.record(CombatLogKind.HIT_RECOVER, attacker, note="HP", amount=actual_heal)
 
         # mp_on_hit (타격 시 MP 회복)
         if skill and hasattr(skill, 'metadata') and skill.metadata.get('mp_on_hit'):
@@ -1014,7 +1118,7 @@ class CombatManager:
                 attacker.current_mp += actual_mp
             else:
                 actual_mp = mp_amount
-            self.logger.info(f"[타격 회복] {attacker.name} MP +{actual_mp}")
+            self.combat_log.record(CombatLogKind.HIT_RECOVER, attacker, note="MP", amount=actual_mp)
 
         # brv_on_hit (타격 시 BRV 회복)
         if skill and hasattr(skill, 'metadata') and skill.metadata.get('brv_on_hit'):
@@ -1022,7 +1126,7 @@ class CombatManager:
             if hasattr(attacker, 'current_brv') and hasattr(attacker, 'max_brv'):
                 actual_brv = min(brv_amount, attacker.max_brv - attacker.current_brv)
                 attacker.current_brv += actual_brv
-                self.logger.info(f"[타격 회복] {attacker.name} BRV +{actual_brv}")
+                self.combat_log.record(CombatLogKind.HIT_RECOVER, attacker, note="BRV", amount=actual_brv)
 
         # splash_damage (범위 피해) - 주변 적들에게 추가 피해
         if skill and hasattr(skill, 'metadata') and skill.metadata.get('splash_damage'):
@@ -1042,7 +1146,10 @@ class CombatManager:
                         splash_target.current_hp = max(0, splash_target.current_hp - actual_damage)
                     else:
                         actual_damage = splash_damage
-                    self.logger.info(f"[범위 피해] {splash_target.name}에게 {actual_damage} 피해! (본 피해의 {splash_ratio*100:.0f}%)")
+                    self.combat_log.record(
+                        CombatLogKind.AREA_DAMAGE, target=splash_target, note="범위 피해",
+                        amount=actual_damage, extra=round(splash_ratio * 100)
+                    )
 
         # cleave (광역 베기) - 전방 적들에게 피해
         if skill and hasattr(skill, 'metadata') and skill.metadata.get('cleave'):
@@ -1062,7 +1169,10 @@ class CombatManager:
                         cleave_target.current_hp = max(0, cleave_target.current_hp - actual_damage)
                     else:
                         actual_damage = cleave_damage
-                    self.logger.info(f"[광역 베기] {cleave_target.name}에게 {actual_damage} 피해! (본 피해의 {cleave_ratio*100:.0f}%)")
+                    self.combat_log.record(
+                        CombatLogKind.AREA_DAMAGE, target=cleave_target, note="광역 베기",
+                        amount=actual_damage, extra=round(cleave_ratio * 100)
+                    )
 
         # chain_lightning (연쇄 공격) - 다음 대상으로 전파
         if skill and hasattr(skill, 'metadata') and skill.metadata.get('chain_lightning'):
@@ -1169,7 +1279,9 @@ class CombatManager:
                 freeze = StatusEffect("빙결", StatusType.FREEZE, duration=min(freeze_duration, 2), intensity=1.0)
                 if hasattr(defender, 'status_manager'):
                     defender.status_manager.add_status(freeze)
-                    self.logger.info(f"[빙결] {defender.name} 빙결! ({freeze_chance*100:.0f}% 확률)")
+                    self.combat_log.record(
+                        CombatLogKind.STATUS_PROC, target=defender, note="빙결", extra=round(freeze_chance * 100)
+                    )
 
         # blind_chance (실명 확률)
         if skill and hasattr(skill, 'metadata') and skill.metadata.get('blind_chance'):
@@ -1181,7 +1293,9 @@ class CombatManager:
                 blind = StatusEffect("실명", StatusType.BLIND, duration=blind_duration, intensity=1.0)
                 if hasattr(defender, 'status_manager'):
                     defender.status_manager.add_status(blind)
-                    self.logger.info(f"[실명] {defender.name} 실명! ({blind_chance*100:.0f}% 확률)")
+                    self.combat_log.record(
+                        CombatLogKind.STATUS_PROC, target=defender, note="실명", extra=round(blind_chance * 100)
+                    )
 
         # silence_chance (침묵 확률)
         if skill and hasattr(skill, 'metadata') and skill.metadata.get('silence_chance'):
@@ -1193,7 +1307,9 @@ class CombatManager:
                 silence = StatusEffect("침묵", StatusType.SILENCE, duration=min(silence_duration, 2), intensity=1.0)
                 if hasattr(defender, 'status_manager'):
                     defender.status_manager.add_status(silence)
-                    self.logger.info(f"[침묵] {defender.name} 침묵! ({silence_chance*100:.0f}% 확률)")
+                    self.combat_log.record(
+                        CombatLogKind.STATUS_PROC, target=defender, note="침묵", extra=round(silence_chance * 100)
+                    )
 
         # slow_percent / slow_duration (둔화)
         if skill and hasattr(skill, 'metadata') and skill.metadata.get('slow_percent'):
@@ -1218,7 +1334,6 @@ class CombatManager:
                 # 적 처치 확인
                 from src.character.trait_effects import get_trait_effect_manager
                 trait_manager = get_trait_effect_manager()
-                print(f"DEBUG: trait_manager attributes: {dir(trait_manager)}")
                 
                 # 모든 아군에게 처치 효과 적용
                 for ally in self.allies:
@@ -1237,7 +1352,6 @@ class CombatManager:
 
                         # 암흑기사: 적 처치 시 충전 획득
                         if (hasattr(ally, 'gimmick_type') and ally.gimmick_type == "charge_system"):
-                            from src.character.gimmick_updater import GimmickUpdater
                             GimmickUpdater.on_kill_charge(ally)
 
                         # 처치 보너스 (bloodthirst) - 스택 누적
@@ -1665,6 +1779,41 @@ class CombatManager:
             result["error"] = "대상이 없습니다"
             return result
         
+        # 공격자 측 데미지 값은 대상과 무관하므로 한 번만 계산
+        if skill.damage > 0 and skill.skill_id != "heartless_angel":
+            # 계수 조정 (실행 시점에서 통일):
+            # - BRV 공격만 있는 경우: 2배로 조정
+            # - HP 공격만 있는 경우: 0.75배로 조정
+            # - 복합 스킬(BRV+HP): BRV는 2배, HP는 0.75배로 조정
+            effective_multiplier = skill.damage_multiplier
+            brv_multiplier = skill.damage_multiplier
+            hp_multiplier = skill.damage_multiplier
+
+            if skill.brv_damage > 0 and not skill.hp_attack:
+                # BRV 공격만 있는 경우: 2배로 조정
+                brv_multiplier = skill.damage_multiplier * 2.0
+                effective_multiplier = brv_multiplier
+            elif skill.hp_attack and not skill.brv_damage:
+                # HP 공격만 있는 경우: 0.75배로 조정
+                effective_multiplier = skill.damage_multiplier * 0.75
+                hp_multiplier = effective_multiplier
+            elif skill.hp_attack and skill.brv_damage:
+                # 복합 스킬: BRV는 2배, HP는 0.75배로
+                brv_multiplier = skill.damage_multiplier * 2.0
+                hp_multiplier = skill.damage_multiplier * 0.75
+                effective_multiplier = brv_multiplier  # BRV 데미지 계산용
+
+            if skill.is_magical:
+                attack_stat = actor.magic_attack
+                defense_attr = 'magic_defense'
+            else:
+                attack_stat = actor.physical_attack
+                defense_attr = 'physical_defense'
+
+            base_damage = int(skill.damage + attack_stat * effective_multiplier)
+            brv_base_damage = int(skill.damage + attack_stat * brv_multiplier)
+            hp_base_damage = int(skill.damage + attack_stat * hp_multiplier)
+
         # 각 대상에게 스킬 효과 적용
         for tgt in targets:
             target_result = {"target": getattr(tgt, 'name', 'Unknown')}
@@ -1679,51 +1828,14 @@ class CombatManager:
                         target_result["hp_damage"] = damage
                         target_result["special"] = "hp_to_1"
                 else:
-                    # 일반 데미지 계산
-                    # 계수 조정 (실행 시점에서 통일):
-                    # - BRV 공격만 있는 경우: 2배로 조정
-                    # - HP 공격만 있는 경우: 0.75배로 조정
-                    # - 복합 스킬(BRV+HP): BRV는 2배, HP는 0.75배로 조정
-                    effective_multiplier = skill.damage_multiplier
-                    brv_multiplier = skill.damage_multiplier
-                    hp_multiplier = skill.damage_multiplier
-                    
-                    if skill.brv_damage > 0 and not skill.hp_attack:
-                        # BRV 공격만 있는 경우: 2배로 조정
-                        brv_multiplier = skill.damage_multiplier * 2.0
-                        effective_multiplier = brv_multiplier
-                    elif skill.hp_attack and not skill.brv_damage:
-                        # HP 공격만 있는 경우: 0.75배로 조정
-                        effective_multiplier = skill.damage_multiplier * 0.75
-                        hp_multiplier = effective_multiplier
-                    elif skill.hp_attack and skill.brv_damage:
-                        # 복합 스킬: BRV는 2배, HP는 0.75배로
-                        brv_multiplier = skill.damage_multiplier * 2.0
-                        hp_multiplier = skill.damage_multiplier * 0.75
-                        effective_multiplier = brv_multiplier  # BRV 데미지 계산용
-                    
-                    if skill.is_magical:
-                        base_damage = int(skill.damage + actor.magic_attack * effective_multiplier)
-                        defense = getattr(tgt, 'magic_defense', 0)
-                    else:
-                        base_damage = int(skill.damage + actor.physical_attack * effective_multiplier)
-                        defense = getattr(tgt, 'physical_defense', 0)
-
                     # 방어력 적용
+                    defense = getattr(tgt, defense_attr, 0)
                     final_damage = max(1, base_damage - defense // 2)
 
                     # BRV 데미지 계산 (복합 스킬의 경우 BRV 계수는 2배 적용)
                     if skill.brv_damage > 0:
-                        # BRV 데미지를 계수에 맞게 계산
-                        if skill.is_magical:
-                            brv_base_damage = int(skill.damage + actor.magic_attack * brv_multiplier)
-                            brv_defense = getattr(tgt, 'magic_defense', 0)
-                        else:
-                            brv_base_damage = int(skill.damage + actor.physical_attack * brv_multiplier)
-                            brv_defense = getattr(tgt, 'physical_defense', 0)
-                        
                         # 방어력 적용 (BRV 데미지)
-                        brv_final_damage = max(1, brv_base_damage - brv_defense // 2)
+                        brv_final_damage = max(1, brv_base_damage - defense // 2)
                         
                         if hasattr(tgt, 'current_brv'):
                             brv_dmg = min(brv_final_damage, tgt.current_brv)
@@ -1734,14 +1846,7 @@ class CombatManager:
                     if skill.hp_attack or not skill.brv_damage:
                         # 둘 다 있는 경우: HP 데미지는 별도 계산
                         if skill.hp_attack and skill.brv_damage:
-                            if skill.is_magical:
-                                hp_base_damage = int(skill.damage + actor.magic_attack * hp_multiplier)
-                                hp_defense = getattr(tgt, 'magic_defense', 0)
-                            else:
-                                hp_base_damage = int(skill.damage + actor.physical_attack * hp_multiplier)
-                                hp_defense = getattr(tgt, 'physical_defense', 0)
-                            hp_final_damage = max(1, hp_base_damage - hp_defense // 2)
-                            final_damage = hp_final_damage
+                            final_damage = max(1, hp_base_damage - defense // 2)
                         if hasattr(tgt, 'take_damage'):
                             actual_damage = tgt.take_damage(final_damage)
                         elif hasattr(tgt, 'current_hp'):
@@ -2079,6 +2184,7 @@ class CombatManager:
                                 enemy.active_buffs['defense_down'] = {'value': debuff_value, 'duration': duration}
                             elif effect_type == "debuff_speed":
                                 enemy.active_buffs['speed_down'] = {'value': debuff_value, 'duration': duration}
+                                self.atb.mark_dirty(enemy)
                             elif effect_type == "smoke_bomb":
                                 enemy.active_buffs['accuracy_down'] = {'value': debuff_value, 'duration': duration}
                         targets_debuffed += 1
@@ -2106,6 +2212,7 @@ class CombatManager:
                         tgt.active_buffs['damage_reduction'] = {'value': effect_value, 'duration': duration}
                     elif effect_type == "haste_crystal":
                         tgt.active_buffs['speed_up'] = {'value': effect_value, 'duration': duration}
+                        self.atb.mark_dirty(tgt)
                     elif effect_type == "power_tonic":
                         tgt.active_buffs['attack_up'] = {'value': effect_value, 'duration': duration}
                         tgt.active_buffs['magic_up'] = {'value': effect_value, 'duration': duration}
@@ -2339,6 +2446,7 @@ class CombatManager:
         character = data.get("character")
         if not character:
             return
+        self.atb.mark_dirty(character)
         
         # 전투가 이미 종료된 상태라면 처리하지 않음 (무한 루프 방지)
         if self.state in [CombatState.VICTORY, CombatState.DEFEAT, CombatState.FLED]:
@@ -2728,6 +2836,11 @@ class CombatManager:
                 # 만료된 버프 제거
                 for buff_type in expired_buffs:
                     del combatant.active_buffs[buff_type]
+                if 'speed_up' in expired_buffs or 'speed_down' in expired_buffs:
+                    self.atb.mark_dirty(combatant)
+
+        # 턴 종료 효과(상태이상/기믹)로 행동자의 속도/생존 여부가 바뀔 수 있음
+        self.atb.mark_dirty(actor)
 
         # 기믹 업데이트 (턴 종료)
         GimmickUpdater.on_turn_end(actor)
@@ -2756,9 +2869,12 @@ class CombatManager:
         """완료된 캐스팅 처리"""
         from src.combat.casting_system import get_casting_system
         casting_system = get_casting_system()
+        if not casting_system.has_completed_casts():
+            return
 
         # 완료된 캐스팅 가져오기
         completed_casts = casting_system.get_completed_casts()
+        self.invalidate_battlefield_analysis()
 
         for cast_info in completed_casts:
             caster = cast_info.caster
@@ -2767,12 +2883,12 @@ class CombatManager:
 
             # 시전자가 여전히 살아있고 행동 가능한지 확인
             if self._is_defeated(caster):
-                self.logger.info(f"{getattr(caster, 'name', 'Unknown')} 전투 불능으로 시전 취소")
+                self.combat_log.record(CombatLogKind.CAST_CANCELLED, caster)
                 continue
 
             # 패링 성공 시 스킬 효과는 발동 (패링은 즉시 카운터, 캐스팅 완료 시 스킬 효과 발동)
             # 패링 성공 플래그가 있어도 스킬 효과는 정상적으로 발동
-            self.logger.info(f"{getattr(caster, 'name', 'Unknown')}의 {skill.name} 발동!")
+            self.combat_log.record(CombatLogKind.CAST_TRIGGER, caster, note=skill.name)
 
             # 스킬 실행 (SFX 포함)
             from src.character.skills.skill_manager import get_skill_manager
@@ -3033,8 +3149,10 @@ class CombatManager:
             state: 종료 상태
         """
         self.state = state
+        if self.recorder is not None and self.recorder.recording is not None:
+            self.recorder.recording.meta["outcome"] = state.value
 
-        self.logger.info(f"전투 종료: {state.value}")
+        self.combat_log.record(CombatLogKind.COMBAT_END, note=state.value)
 
         # 이벤트 발행
         event_bus.publish(Events.COMBAT_END, {
@@ -3057,6 +3175,110 @@ class CombatManager:
         casting_system = get_casting_system()
         casting_system.clear()
 
+        # 입력 기록 저장 (combat.record_inputs)
+        if self.recorder is not None and self.recorder.recording is not None:
+            if self.config.get("combat.record_inputs", False):
+                self._save_recording()
+
+    def _save_recording(self) -> None:
+        """전투 입력 기록을 user_data/replays에 저장"""
+        from datetime import datetime
+        from pathlib import Path
+
+        recording = self.recorder.recording
+        replay_dir = Path(__file__).parent.parent.parent / "user_data" / "replays"
+        path = replay_dir / f"combat_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{recording.seed}.json"
+        try:
+            recording.save(path)
+            self.logger.info(f"전투 기록 저장: {path.name} (행동 {recording.action_count}회)")
+        except OSError as e:
+            self.logger.warning(f"전투 기록 저장 실패: {e}")
+
+    def skip_turn(self, actor: Any) -> None:
+        """
+        행동 불가 상태(기절/수면 등) 턴 스킵
+
+        상태이상 지속시간을 줄이고 ATB를 임계값 아래로 내린 뒤 턴을 종료합니다.
+        CombatUI와 헤드리스 시뮬레이터가 같은 처리를 사용하며, 입력 기록 대상입니다.
+
+        Args:
+            actor: ATB가 찼지만 행동할 수 없는 전투원
+        """
+        if self.recorder is not None:
+            self.recorder.record_skip(actor)
+
+        # 상태이상 지속시간 감소
+        if hasattr(actor, 'status_manager'):
+            expired = actor.status_manager.update_duration()
+            if expired:
+                self.logger.debug(f"{getattr(actor, 'name', 'Unknown')}: {len(expired)}개 상태 효과 만료 (행동 불가 중)")
+
+        # 기절 상태일 때는 ATB를 완전히 소비하여 무한 루프 방지
+        gauge = self.atb.get_gauge(actor)
+        if gauge:
+            # ATB를 threshold 아래로 강제로 내림
+            gauge.current = max(0, gauge.current - gauge.threshold)
+            if gauge.current >= gauge.threshold:
+                gauge.current = gauge.threshold - 1
+
+        self.atb.consume_atb(actor)
+        self._on_turn_end(actor)
+        self._refresh_prefetch()
+
+    def cleanup(self) -> None:
+        """
+        이벤트 구독 해제
+
+        전투 매니저를 반복 생성하는 경우(헤드리스 시뮬레이션 등) 이전 매니저의
+        핸들러가 이벤트 버스에 남아 계속 호출되지 않도록 정리합니다.
+        """
+        event_bus.unsubscribe(Events.CHARACTER_DEATH, self._on_character_death)
+        event_bus.unsubscribe(Events.COMBAT_DAMAGE_TAKEN, self._on_damage_taken)
+        for event_name in _BATTLEFIELD_EVENTS:
+            event_bus.unsubscribe(event_name, self._on_battlefield_change)
+
+        # 행동 후 다시 시작한 적 탐색이 전투 뒤에 남지 않도록 중단
+        if self._prefetching:
+            from src.ai.mcts_ai import get_search_worker
+            worker = get_search_worker()
+            for enemy in self.enemies:
+                worker.cancel(enemy)
+            self._prefetching = False
+
+    def _side_flags(self, actor: Any, target: Any) -> CombatLogFlag:
+        """전투 로그용 진영 플래그 (아군 여부)"""
+        flags = CombatLogFlag.NONE
+        if actor in self.allies:
+            flags |= CombatLogFlag.ACTOR_ALLY
+        if target in self.allies:
+            flags |= CombatLogFlag.TARGET_ALLY
+        return flags
+
+    def get_battlefield_analysis(self) -> BattlefieldAnalysis:
+        """
+        공유 전장 분석 (무효화 전까지 같은 결과를 재사용)
+
+        같은 틱에 행동하는 적 AI와 봇이 파티 HP 비율, 어그로 기초 정보,
+        BRV 상태를 다시 계산하지 않도록 한 번만 계산합니다.
+
+        Returns:
+            양 진영 분석 결과
+        """
+        if self._battlefield is None:
+            self._battlefield = BattlefieldAnalysis(
+                self.allies, self.enemies, self._battlefield_version, self._support_cache
+            )
+        return self._battlefield
+
+    def invalidate_battlefield_analysis(self) -> None:
+        """공유 전장 분석 무효화"""
+        self._battlefield = None
+        self._battlefield_version += 1
+
+    def _on_battlefield_change(self, data: Dict[str, Any]) -> None:
+        """HP/BRV/상태이상 변화 이벤트 처리"""
+        self.invalidate_battlefield_analysis()
+
     def get_action_order(self) -> List[Any]:
         """
         현재 행동 순서 가져오기
@@ -3081,6 +3303,30 @@ class CombatManager:
         """Party 객체 설정"""
         self._party = value
 
+    def is_ally(self, combatant: Any) -> Optional[bool]:
+        """
+        전투원 진영 조회 (start_combat에서 만든 진영 맵 사용)
+
+        전투 중 합류한 전투원처럼 맵에 없으면 리스트를 한 번 검색해 기록합니다.
+
+        Args:
+            combatant: 전투원
+
+        Returns:
+            아군이면 True, 적이면 False, 어느 쪽에도 없으면 None
+        """
+        entry = self._sides.get(id(combatant))
+        if entry is not None and entry[0] is combatant:
+            return entry[1]
+        if combatant in self.allies:
+            side = True
+        elif combatant in self.enemies:
+            side = False
+        else:
+            return None
+        self._sides[id(combatant)] = (combatant, side)
+        return side
+
     def is_player_turn(self, character: Any) -> bool:
         """플레이어 턴 여부"""
         return character in self.allies
@@ -3109,6 +3355,61 @@ class CombatManager:
             else:
                 return self.enemies
 
+    def get_enemy_ai(self, enemy: Any, game_difficulty: Optional[str] = None) -> Any:
+        """
+        적 AI (전투마다 적별로 한 번만 생성)
+
+        MCTSBossAI의 last_stats 같은 AI 상태가 턴마다 사라지지 않도록
+        start_combat 전까지 같은 인스턴스를 재사용합니다.
+
+        Args:
+            enemy: 적 캐릭터
+            game_difficulty: 게임 난이도 (처음 생성할 때만 사용)
+
+        Returns:
+            적 AI 인스턴스
+        """
+        ai = self._enemy_ais.get(id(enemy))
+        if ai is None or ai.enemy is not enemy:
+            from src.ai.enemy_ai import create_ai_for_enemy
+            ai = create_ai_for_enemy(enemy, game_difficulty)
+            self._enemy_ais[id(enemy)] = ai
+        return ai
+
+    def prefetch_enemy_decisions(self) -> int:
+        """
+        플레이어가 행동을 고르는 동안 적 행동을 미리 탐색
+
+        start_search를 지원하는 AI(MCTSBossAI)만 백그라운드 탐색을 시작합니다.
+
+        Returns:
+            탐색을 시작한 적 수
+        """
+        started = 0
+        for enemy in self.enemies:
+            if not getattr(enemy, 'is_alive', True):
+                continue
+            ai = self.get_enemy_ai(enemy)
+            start_search = getattr(ai, 'start_search', None)
+            if start_search is not None and start_search(self.enemies, self.allies):
+                started += 1
+        if started:
+            self._prefetching = True
+        return started
+
+    def _refresh_prefetch(self) -> None:
+        """
+        행동이 끝난 상태로 적 탐색 다시 시작
+
+        prefetch 결과는 탐색 시점 상태(HP/BRV/상태이상 등)와 같을 때만 쓰이므로,
+        플레이어 메뉴가 열릴 때 시작한 탐색은 그 행동이 끝나면 맞지 않게 됩니다.
+        prefetch를 쓰는 전투(UI)에서만 동작하고 헤드리스 시뮬레이터는 영향받지 않습니다.
+        """
+        if self._prefetching and self.state in (
+            CombatState.IN_PROGRESS, CombatState.PLAYER_TURN, CombatState.ENEMY_TURN
+        ):
+            self.prefetch_enemy_decisions()
+
     def execute_enemy_turn(self, enemy: Any) -> Optional[Dict[str, Any]]:
         """
         적 턴 실행 (AI 사용)
@@ -3142,16 +3443,14 @@ class CombatManager:
                         "message": f"{enemy.name}은(는) 행동 불가능 상태!"
                     }
 
-            from src.ai.enemy_ai import create_ai_for_enemy
-
-            # 적 AI 생성
-            ai = create_ai_for_enemy(enemy)
+            # 적 AI (전투 동안 재사용)
+            ai = self.get_enemy_ai(enemy)
 
             # AI가 행동 결정
             allies = self.enemies  # 적 입장에서 아군
             enemies = self.allies  # 적 입장에서 적군
 
-            action_decision = ai.decide_action(allies, enemies)
+            action_decision = ai.decide_action(allies, enemies, self.get_battlefield_analysis())
 
             if not action_decision:
                 # 결정 실패 시 기본 공격
@@ -3332,7 +3631,7 @@ class CombatManager:
                     actor.take_damage(damage)
                 else:
                     actor.current_hp = max(1, actor.current_hp - damage)
-                self.logger.info(f"{actor.name} 독 늪 피해: {damage}")
+                self.combat_log.record(CombatLogKind.FIELD_DAMAGE, actor, note="독 늪", amount=damage)
             
             elif effect.effect_type == EnvironmentalEffectType.RADIATION_ZONE:
                 damage = int(12 * effect.intensity)
@@ -3340,7 +3639,7 @@ class CombatManager:
                     actor.take_damage(damage)
                 else:
                     actor.current_hp = max(1, actor.current_hp - damage)
-                self.logger.info(f"{actor.name} 방사능 피해: {damage}")
+                self.combat_log.record(CombatLogKind.FIELD_DAMAGE, actor, note="방사능", amount=damage)
             
             elif effect.effect_type == EnvironmentalEffectType.CURSED_ZONE:
                 damage = int(actor.max_hp * 0.015 * effect.intensity)
@@ -3348,7 +3647,7 @@ class CombatManager:
                     actor.take_damage(damage)
                 else:
                     actor.current_hp = max(1, actor.current_hp - damage)
-                self.logger.info(f"{actor.name} 저주 구역 피해: {damage}")
+                self.combat_log.record(CombatLogKind.FIELD_DAMAGE, actor, note="저주 구역", amount=damage)
             
             elif effect.effect_type == EnvironmentalEffectType.BLOOD_MOON:
                 damage = int(actor.max_hp * 0.025 * effect.intensity)
@@ -3356,7 +3655,7 @@ class CombatManager:
                     actor.take_damage(damage)
                 else:
                     actor.current_hp = max(1, actor.current_hp - damage)
-                self.logger.info(f"{actor.name} 피의 달 저주 피해: {damage}")
+                self.combat_log.record(CombatLogKind.FIELD_DAMAGE, actor, note="피의 달 저주", amount=damage)
             
             # === 이동 시 데미지 효과 (전투 중에는 턴 시작 시에도 적용) ===
             elif effect.effect_type == EnvironmentalEffectType.BURNING_FLOOR:
@@ -3365,7 +3664,7 @@ class CombatManager:
                     actor.take_damage(damage)
                 else:
                     actor.current_hp = max(1, actor.current_hp - damage)
-                self.logger.info(f"{actor.name} 불타는 바닥 피해: {damage}")
+                self.combat_log.record(CombatLogKind.FIELD_DAMAGE, actor, note="불타는 바닥", amount=damage)
             
             elif effect.effect_type == EnvironmentalEffectType.ELECTRIC_FIELD:
                 damage = int(10 * effect.intensity)
@@ -3373,7 +3672,7 @@ class CombatManager:
                     actor.take_damage(damage)
                 else:
                     actor.current_hp = max(1, actor.current_hp - damage)
-                self.logger.info(f"{actor.name} 전기장 피해: {damage}")
+                self.combat_log.record(CombatLogKind.FIELD_DAMAGE, actor, note="전기장", amount=damage)
             
             # === 턴당 지속 회복 효과 ===
             elif effect.effect_type == EnvironmentalEffectType.HOLY_GROUND:
@@ -3382,7 +3681,7 @@ class CombatManager:
                     actor.heal(heal)
                 else:
                     actor.current_hp = min(actor.max_hp, actor.current_hp + heal)
-                self.logger.info(f"{actor.name} 신성한 땅 회복: {heal}")
+                self.combat_log.record(CombatLogKind.FIELD_HEAL, actor, note="신성한 땅", amount=heal)
             
             elif effect.effect_type == EnvironmentalEffectType.BLESSED_SANCTUARY:
                 heal = int(actor.max_hp * 0.04 * effect.intensity)
@@ -3390,7 +3689,7 @@ class CombatManager:
                     actor.heal(heal)
                 else:
                     actor.current_hp = min(actor.max_hp, actor.current_hp + heal)
-                self.logger.info(f"{actor.name} 축복받은 성역 회복: {heal}")
+                self.combat_log.record(CombatLogKind.FIELD_HEAL, actor, note="축복받은 성역", amount=heal)
             
             elif effect.effect_type == EnvironmentalEffectType.HALLOWED_LIGHT:
                 heal = int(actor.max_hp * 0.025 * effect.intensity)
@@ -3398,7 +3697,7 @@ class CombatManager:
                     actor.heal(heal)
                 else:
                     actor.current_hp = min(actor.max_hp, actor.current_hp + heal)
-                self.logger.info(f"{actor.name} 신성한 빛 회복: {heal}")
+                self.combat_log.record(CombatLogKind.FIELD_HEAL, actor, note="신성한 빛", amount=heal)
             
             elif effect.effect_type == EnvironmentalEffectType.MANA_VORTEX:
                 if hasattr(actor, 'current_mp') and hasattr(actor, 'max_mp'):
@@ -3407,7 +3706,7 @@ class CombatManager:
                         actor.restore_mp(mp_restore)
                     else:
                         actor.current_mp = min(actor.max_mp, actor.current_mp + mp_restore)
-                    self.logger.info(f"{actor.name} 마나 소용돌이 MP 회복: {mp_restore}")
+                    self.combat_log.record(CombatLogKind.FIELD_MP, actor, note="마나 소용돌이", amount=mp_restore)
             
             # 스탯 수정 효과는 별도로 처리 (현재 턴에는 데미지/회복만)
             # 스탯 수정은 get_stat_modifiers로 별도 계산되어 데미지 계산에 반영되어야 함
@@ -3545,7 +3844,7 @@ class CombatManager:
                 return False
 
             actor.current_mp -= mp_cost
-            self.logger.info(f"{actor.name} MP 소모: -{mp_cost} (잔여: {actor.current_mp})")
+            self.combat_log.record(CombatLogKind.MP_COST, actor, amount=mp_cost, extra=actor.current_mp)
 
             # 팀워크 스킬 SFX 재생 (체인 2단계 이상, pitch/volume 증가)
             from src.audio import play_teamwork_sfx
@@ -0,0 +1,346 @@
+"""
+Combat Recorder - 전투 입력 기록과 재생
+
+CombatManager에 들어오는 외부 입력(update 틱, 행동, 행동 불가 턴 스킵)을
+전투 시드와 함께 순서대로 기록합니다. 같은 시드로 다시 시드한 뒤
+같은 초기 전투원에게 같은 입력을 주면 렌더링/대기 없이 전투가 그대로 재현되므로
+반복 가능한 성능 벤치마크와 느린/동기화가 어긋난 전투의 재현에 사용합니다.
+
+입력마다 직전 전투 상태 체크섬을 함께 저장하여 재생 중 어긋나는 지점을 찾습니다.
+"""
+
+import json
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from src.core.logger import get_logger
+from src.core.rng import get_rng_manager, seed_combat
+
+
+logger = get_logger("combat")
+
+# 기록 형식 버전
+RECORDING_VERSION = 1
+
+# 행동 옵션 중 그대로 기록하는 값 타입 (JSON 직렬화 가능)
+_PLAIN_TYPES = (bool, int, float, str, type(None))
+
+
+def combat_checksum(combatants: List[Any]) -> int:
+    """전투원 HP/BRV/MP 상태 체크섬 (입력 직전 상태 비교용)"""
+    values = []
+    for combatant in combatants:
+        values.append(getattr(combatant, 'current_hp', 0))
+        values.append(getattr(combatant, 'current_brv', 0))
+        values.append(getattr(combatant, 'current_mp', 0))
+    return zlib.crc32(repr(values).encode("utf-8"))
+
+
+@dataclass
+class CombatRecording:
+    """
+    기록된 전투
+
+    entries 형식:
+        ["tick", delta_time, player_turn, count]  - 같은 update 호출 count회
+        ["idle", delta_time, ticks]  - skip_idle_ticks로 건너뛴 ATB 틱 수
+        ["action", actor, action, target, skill_id, options, checksum]
+        ["skip", actor, checksum]
+    actor/target은 combatants 목록의 인덱스 (target은 인덱스 리스트일 수 있음)
+    """
+    seed: int
+    combatants: List[str] = field(default_factory=list)
+    entries: List[List[Any]] = field(default_factory=list)
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def action_count(self) -> int:
+        """기록된 행동 수"""
+        return sum(1 for entry in self.entries if entry[0] == "action")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화"""
+        return {
+            "version": RECORDING_VERSION,
+            "seed": self.seed,
+            "combatants": self.combatants,
+            "entries": self.entries,
+            "meta": self.meta,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CombatRecording":
+        """역직렬화"""
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"지원하지 않는 전투 기록 버전: {data.get('version')}")
+        return cls(
+            seed=data["seed"],
+            combatants=list(data.get("combatants", [])),
+            entries=[list(entry) for entry in data.get("entries", [])],
+            meta=dict(data.get("meta", {})),
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """JSON 파일로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CombatRecording":
+        """JSON 파일에서 불러오기"""
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+class CombatRecorder:
+    """
+    전투 입력 기록기
+
+    CombatManager.recorder에 설정하면 start_combat에서 전투 시드로 난수를 고정하고
+    이후 update/execute_action/skip_turn 호출을 기록합니다.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            seed: 전투 시드 (None이면 현재 층 시드에서 파생)
+        """
+        self.seed = seed
+        self.recording: Optional[CombatRecording] = None
+        self._index: Dict[int, int] = {}
+        self._combatants: List[Any] = []
+
+    def begin(self) -> None:
+        """전투 시작: 전투 시드로 전역 random과 전투 스트림 고정 (탐험 스트림은 유지)"""
+        seed = self.seed
+        if seed is None:
+            seed = get_rng_manager().next_combat_seed()
+        seed_combat(seed)
+        self.recording = CombatRecording(seed=seed)
+        self._index = {}
+        self._combatants = []
+
+    def bind(self, allies: List[Any], enemies: List[Any], **meta: Any) -> None:
+        """전투원 목록 확정 (아군 → 적 순서로 인덱스 부여)"""
+        self._combatants = list(allies) + list(enemies)
+        self._index = {id(c): i for i, c in enumerate(self._combatants)}
+        self.recording.combatants = [getattr(c, 'name', '?') for c in self._combatants]
+        self.recording.meta.update(meta)
+
+    def _ref(self, combatant: Any) -> Optional[int]:
+        return self._index.get(id(combatant))
+
+    def _encode_target(self, target: Any) -> Any:
+        if target is None:
+            return None
+        if isinstance(target, (list, tuple)):
+            return [self._ref(t) for t in target]
+        return self._ref(target)
+
+    def record_tick(self, delta_time: float, player_turn: bool) -> None:
+        """update 호출 기록 (연속된 같은 호출은 횟수로 묶음)"""
+        if self.recording is None:
+            return
+        entries = self.recording.entries
+        if entries:
+            last = entries[-1]
+            if last[0] == "tick" and last[1] == delta_time and last[2] == player_turn:
+                last[3] += 1
+                return
+        entries.append(["tick", delta_time, player_turn, 1])
+
+    def record_idle(self, delta_time: float, ticks: int) -> None:
+        """skip_idle_ticks로 한 번에 진행한 틱 기록"""
+        if self.recording is None:
+            return
+        self.recording.entries.append(["idle", delta_time, ticks])
+
+    def record_action(self, actor: Any, action: str, target: Any, skill: Any, options: Dict[str, Any]) -> None:
+        """execute_action 호출 기록"""
+        if self.recording is None:
+            return
+        encoded_options = {}
+        for key, value in options.items():
+            if key == "item" and value is not None:
+                from src.persistence.save_system import serialize_item
+                encoded_options["item"] = serialize_item(value)
+            elif isinstance(value, _PLAIN_TYPES):
+                encoded_options[key] = value
+        skill_id = getattr(skill, 'skill_id', None) if skill is not None else None
+        self.recording.entries.append([
+            "action", self._ref(actor), action, self._encode_target(target),
+            skill_id, encoded_options, combat_checksum(self._combatants),
+        ])
+
+    def record_skip(self, actor: Any) -> None:
+        """행동 불가 턴 스킵 기록"""
+        if self.recording is None:
+            return
+        self.recording.entries.append(["skip", self._ref(actor), combat_checksum(self._combatants)])
+
+
+@dataclass
+class ReplayResult:
+    """재생 결과"""
+    outcome: Any
+    entries_played: int = 0
+    actions: int = 0
+    ticks: int = 0
+    elapsed: float = 0.0
+    # 체크섬/진행 틱이 처음 어긋난 기록 위치, 최종 승패가 다르면 len(entries) (None이면 끝까지 일치)
+    desync_at: Optional[int] = None
+
+    @property
+    def in_sync(self) -> bool:
+        """기록과 끝까지 일치했는지"""
+        return self.desync_at is None
+
+
+class CombatReplayer:
+    """
+    기록된 전투를 헤드리스로 재생
+
+    렌더링/입력 대기 없이 최대 속도로 진행합니다.
+    전투원은 기록 시점과 같은 초기 상태로 새로 만들어 전달해야 합니다.
+    """
+
+    def __init__(
+        self,
+        recording: CombatRecording,
+        stop_at: Optional[int] = None,
+        on_stop: Optional[Callable[[Any], None]] = None,
+        quiet: bool = True
+    ) -> None:
+        """
+        Args:
+            recording: 재생할 기록
+            stop_at: 이 행동 번호(0부터) 직전까지만 빠르게 진행 (None이면 끝까지)
+            on_stop: 재생이 끝난 직후 CombatManager를 넘겨 받는 콜백 (상태 조사용)
+            quiet: 로그 출력 억제 여부
+        """
+        self.recording = recording
+        self.stop_at = stop_at
+        self.on_stop = on_stop
+        self.quiet = quiet
+
+    def run(
+        self,
+        allies: List[Any],
+        enemies: List[Any],
+        dungeon: Optional[Any] = None,
+        combat_position: Optional[Tuple[int, int]] = None
+    ) -> ReplayResult:
+        """
+        재생 실행
+
+        Args:
+            allies: 아군 리스트 (기록 시점과 같은 초기 상태)
+            enemies: 적군 리스트
+            dungeon: 던전 맵 (환경 효과가 있던 전투라면 같은 맵)
+            combat_position: 전투 위치
+
+        Returns:
+            재생 결과
+        """
+        from src.combat.casting_system import get_casting_system
+        from src.combat.combat_manager import CombatManager
+        from src.combat.combat_simulator import headless_mode
+
+        seed_combat(self.recording.seed)
+        start_time = time.perf_counter()
+
+        with headless_mode(self.quiet):
+            manager = CombatManager()
+            try:
+                manager.start_combat(allies, enemies, dungeon, combat_position)
+                try:
+                    result = self._play(manager)
+                    if self.on_stop is not None:
+                        self.on_stop(manager)
+                finally:
+                    # 중간에 멈춘 재생도 전역 ATB/캐스팅에 전투원이 남아 다음 전투에 끼지 않도록 정리
+                    manager.atb.clear()
+                    get_casting_system().clear()
+            finally:
+                manager.cleanup()
+
+        result.elapsed = time.perf_counter() - start_time
+        return result
+
+    def _play(self, manager: Any) -> ReplayResult:
+        """기록된 입력을 순서대로 CombatManager에 전달"""
+        from src.combat.combat_manager import ActionType, CombatState
+
+        combatants = list(manager.allies) + list(manager.enemies)
+        result = ReplayResult(outcome=manager.state)
+
+        if [getattr(c, 'name', '?') for c in combatants] != self.recording.combatants:
+            logger.warning("재생 전투원 구성이 기록과 다릅니다")
+            result.desync_at = 0
+
+        def resolve(index: Any) -> Any:
+            if isinstance(index, list):
+                return [combatants[i] for i in index if i is not None]
+            return combatants[index] if index is not None else None
+
+        for position, entry in enumerate(self.recording.entries):
+            kind = entry[0]
+            if kind == "tick":
+                _, delta_time, player_turn, count = entry
+                for _ in range(count):
+                    if manager.state in (CombatState.IN_PROGRESS, CombatState.PLAYER_TURN):
+                        manager.state = CombatState.PLAYER_TURN if player_turn else CombatState.IN_PROGRESS
+                    manager.update(delta_time)
+                result.ticks += count
+            elif kind == "idle":
+                _, delta_time, ticks = entry
+                advanced = manager.atb.advance_to_next_ready(delta_time, max_ticks=ticks)
+                if result.desync_at is None and advanced != ticks:
+                    result.desync_at = position
+                result.ticks += advanced
+            else:
+                if kind == "action" and self.stop_at is not None and result.actions >= self.stop_at:
+                    break
+                checksum = entry[-1]
+                if result.desync_at is None and combat_checksum(combatants) != checksum:
+                    result.desync_at = position
+                if kind == "skip":
+                    manager.skip_turn(resolve(entry[1]))
+                else:
+                    _, actor, action, target, skill_id, options, _ = entry
+                    actor = resolve(actor)
+                    options = dict(options)
+                    if "item" in options:
+                        from src.persistence.save_system import deserialize_item
+                        options["item"] = deserialize_item(options["item"])
+                    manager.execute_action(
+                        actor, ActionType(action), target=resolve(target),
+                        skill=self._resolve_skill(actor, skill_id), **options
+                    )
+                    result.actions += 1
+            # 기록 시에는 UI/시뮬레이터가 행동 후 승패를 판정하므로 재생도 입력마다 판정
+            manager._check_battle_end()
+            result.entries_played = position + 1
+
+        result.outcome = manager.state
+        recorded_outcome = self.recording.meta.get("outcome")
+        finished = result.entries_played == len(self.recording.entries)
+        if finished and recorded_outcome is not None and result.outcome.value != recorded_outcome:
+            logger.warning(f"재생 결과가 기록과 다릅니다: {result.outcome.value} (기록: {recorded_outcome})")
+            if result.desync_at is None:
+                result.desync_at = len(self.recording.entries)
+        return result
+
+    @staticmethod
+    def _resolve_skill(actor: Any, skill_id: Optional[str]) -> Any:
+        """기록된 skill_id를 스킬 객체로 (전투원 자신의 스킬 우선)"""
+        if skill_id is None:
+            return None
+        for skill in getattr(actor, 'skills', None) or []:
+            if getattr(skill, 'skill_id', None) == skill_id:
+                return skill
+        from src.character.skills.skill_manager import get_skill_manager
+        return get_skill_manager().get_skill(skill_id)
@@ -0,0 +1,432 @@
+"""
+Combat Simulator - 헤드리스 전투 시뮬레이터
+
+CombatUI(run_combat) 없이 CombatManager를 직접 구동하여 전투를 끝까지 진행합니다.
+렌더링, 프레임 대기(sleep), 오디오/진동 부작용이 없으므로 밸런스 분석,
+성능 회귀 테스트, AI 탐색의 기반으로 사용할 수 있습니다.
+"""
+
+import logging
+import random
+import sys
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+
+from src.core.event_bus import event_bus
+from src.core.logger import get_logger
+from src.combat.combat_manager import CombatManager, CombatState, ActionType
+from src.core.rng import seed_all
+
+
+logger = get_logger("combat_simulator")
+
+# 전투 진행 중 상태
+_RUNNING_STATES = (CombatState.IN_PROGRESS, CombatState.PLAYER_TURN, CombatState.ENEMY_TURN)
+
+
+@contextmanager
+def headless_mode(quiet: bool = True) -> Iterator[None]:
+    """
+    헤드리스 실행 컨텍스트
+
+    오디오 재생과 게임패드 진동을 막고, quiet이면 ERROR 미만 로그를 차단합니다.
+    컨텍스트 종료 시 이전 상태로 복원합니다.
+
+    Args:
+        quiet: 로그 출력 억제 여부
+    """
+    from src.audio import set_audio_muted, is_audio_muted
+
+    was_muted = is_audio_muted()
+    set_audio_muted(True)
+
+    # 진동 시스템은 이미 로드된 경우에만 비활성화 (새로 임포트하지 않음)
+    vibration_module = sys.modules.get("src.core.vibration_system")
+    vibration_manager = getattr(vibration_module, "vibration_manager", None)
+    vibration_enabled = getattr(vibration_manager, "enabled", None)
+    if vibration_manager is not None:
+        vibration_manager.enabled = False
+
+    previous_disable = logging.root.manager.disable
+    if quiet:
+        logging.disable(logging.WARNING)
+
+    try:
+        yield
+    finally:
+        if quiet:
+            logging.disable(previous_disable)
+        if vibration_manager is not None:
+            vibration_manager.enabled = vibration_enabled
+        set_audio_muted(was_muted)
+
+
+def _get_sides(manager: CombatManager, actor: Any) -> Tuple[List[Any], List[Any]]:
+    """행동자 기준 (아군, 적군) 리스트"""
+    if actor in manager.enemies:
+        return manager.enemies, manager.allies
+    return manager.allies, manager.enemies
+
+
+def _alive(characters: List[Any]) -> List[Any]:
+    """살아있는 캐릭터만 반환"""
+    return [c for c in characters if getattr(c, 'is_alive', True)]
+
+
+class CombatPolicy(ABC):
+    """
+    전투 행동 정책
+
+    decide()는 EnemyAI/봇과 같은 형식의 행동 딕셔너리를 반환합니다.
+    {"type": "attack" | "hp_attack" | "skill" | "defend", "target": ..., "skill": ...}
+    """
+
+    @abstractmethod
+    def decide(self, manager: CombatManager, actor: Any) -> Optional[Dict[str, Any]]:
+        """
+        행동 결정
+
+        Args:
+            manager: 전투 관리자
+            actor: 행동할 전투원
+
+        Returns:
+            행동 딕셔너리 (None이면 기본 BRV 공격)
+        """
+        pass
+
+
+class BasicAllyPolicy(CombatPolicy):
+    """
+    기본 아군 봇 정책
+
+    BRV를 충분히 모으면 HP 공격, 아니면 BRV 공격을 하며
+    skill_chance 확률로 사용 가능한 스킬을 시도합니다.
+    """
+
+    # 정책이 대상을 결정할 수 있는 스킬 타겟 타입
+    _SKILL_TARGET_TYPES = ("single_enemy", "all_enemies", "self", "ally", "party", "all_allies")
+
+    def __init__(self, skill_chance: float = 0.3, hp_attack_ratio: float = 0.4) -> None:
+        """
+        Args:
+            skill_chance: 스킬 사용 시도 확률
+            hp_attack_ratio: HP 공격으로 전환하는 BRV 비율 (최대 BRV 대비)
+        """
+        self.skill_chance = skill_chance
+        self.hp_attack_ratio = hp_attack_ratio
+
+    def decide(self, manager: CombatManager, actor: Any) -> Optional[Dict[str, Any]]:
+        own_side, other_side = _get_sides(manager, actor)
+        side = manager.get_battlefield_analysis().side(other_side)
+        targets = side.alive if side is not None else _alive(other_side)
+        if not targets:
+            return None
+
+        # 가장 HP가 낮은 적을 집중 공격
+        target = side.weakest if side is not None else min(targets, key=lambda t: getattr(t, 'current_hp', 0))
+
+        if self.skill_chance > 0 and random.random() < self.skill_chance:
+            decision = self._decide_skill(actor, own_side, target)
+            if decision:
+                return decision
+
+        current_brv = getattr(actor, 'current_brv', 0)
+        max_brv = max(1, getattr(actor, 'max_brv', 1))
+        if current_brv > 0 and (
+            current_brv >= max_brv * self.hp_attack_ratio
+            or current_brv >= getattr(target, 'current_hp', 0)
+        ):
+            return {"type": "hp_attack", "target": target}
+
+        return {"type": "attack", "target": target}
+
+    def _decide_skill(self, actor: Any, own_side: List[Any], target: Any) -> Optional[Dict[str, Any]]:
+        """사용 가능한 스킬 중 하나를 무작위로 선택"""
+        from src.character.skills.teamwork_skill import TeamworkSkill
+
+        candidates = []
+        for skill in getattr(actor, 'skills', None) or []:
+            if isinstance(skill, TeamworkSkill):
+                continue
+            if getattr(skill, 'target_type', None) not in self._SKILL_TARGET_TYPES:
+                continue
+            can_use, _ = skill.can_use(actor)
+            if can_use:
+                candidates.append(skill)
+
+        if not candidates:
+            return None
+
+        skill = random.choice(candidates)
+        if skill.target_type in ("single_enemy", "all_enemies"):
+            skill_target = target
+        elif skill.target_type == "ally":
+            allies = _alive(own_side) or [actor]
+            skill_target = min(
+                allies,
+                key=lambda a: getattr(a, 'current_hp', 0) / max(1, getattr(a, 'max_hp', 1))
+            )
+        else:
+            skill_target = actor
+
+        return {"type": "skill", "skill": skill, "target": skill_target}
+
+
+class EnemyAIPolicy(CombatPolicy):
+    """EnemyAI(CombatManager.get_enemy_ai, 전투 동안 적별로 재사용)를 사용하는 적 정책"""
+
+    def __init__(self, game_difficulty: Optional[str] = None) -> None:
+        self.game_difficulty = game_difficulty
+
+    def decide(self, manager: CombatManager, actor: Any) -> Optional[Dict[str, Any]]:
+        own_side, other_side = _get_sides(manager, actor)
+        ai = manager.get_enemy_ai(actor, self.game_difficulty)
+        return ai.decide_action(own_side, other_side, manager.get_battlefield_analysis())
+
+
+@dataclass
+class SimulationResult:
+    """시뮬레이션 결과"""
+    outcome: CombatState
+    ticks: int = 0
+    actions: int = 0
+    turns: int = 0
+    elapsed: float = 0.0
+    # 행동별 HP 피해량 (아군 → 적 / 적 → 아군)
+    ally_damage: List[int] = field(default_factory=list)
+    enemy_damage: List[int] = field(default_factory=list)
+    # BREAK 횟수 (공격자 진영 기준)
+    ally_breaks: int = 0
+    enemy_breaks: int = 0
+    allies_alive: int = 0
+    enemies_alive: int = 0
+
+    @property
+    def victory(self) -> bool:
+        """아군 승리 여부"""
+        return self.outcome == CombatState.VICTORY
+
+    @property
+    def timed_out(self) -> bool:
+        """틱 제한 초과로 결판이 나지 않았는지 여부"""
+        return self.outcome in _RUNNING_STATES
+
+
+class CombatSimulator:
+    """
+    헤드리스 전투 시뮬레이터
+
+    CombatManager.update/execute_action을 UI 없이 최대 속도로 구동합니다.
+    """
+
+    def __init__(
+        self,
+        ally_policy: Optional[CombatPolicy] = None,
+        enemy_policy: Optional[CombatPolicy] = None,
+        max_ticks: int = 100000,
+        quiet: bool = True,
+        event_driven: bool = True
+    ) -> None:
+        """
+        Args:
+            ally_policy: 아군 행동 정책 (기본: BasicAllyPolicy)
+            enemy_policy: 적 행동 정책 (기본: EnemyAIPolicy)
+            max_ticks: 최대 ATB 틱 수 (무한 전투 방지)
+            quiet: 로그 출력 억제 여부
+            event_driven: 아무도 행동할 수 없는 틱을 건너뛰고 다음 행동 시점으로 바로 진행
+        """
+        self.ally_policy = ally_policy or BasicAllyPolicy()
+        self.enemy_policy = enemy_policy or EnemyAIPolicy()
+        self.max_ticks = max_ticks
+        self.quiet = quiet
+        self.event_driven = event_driven
+
+    def run(
+        self,
+        allies: List[Any],
+        enemies: List[Any],
+        seed: Optional[int] = None
+    ) -> SimulationResult:
+        """
+        전투를 끝까지 실행
+
+        Args:
+            allies: 아군 리스트
+            enemies: 적군 리스트
+            seed: 난수 시드 (None이면 시드 고정 안 함)
+
+        Returns:
+            시뮬레이션 결과
+        """
+        if seed is not None:
+            seed_all(seed)
+
+        with headless_mode(self.quiet):
+            manager = CombatManager()
+            try:
+                return self._run_battle(manager, allies, enemies)
+            finally:
+                manager.cleanup()
+
+    def run_floor_battle(
+        self,
+        allies: List[Any],
+        floor_number: int,
+        num_enemies: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> SimulationResult:
+        """
+        EnemyGenerator로 층에 맞는 적을 생성하여 전투 실행
+
+        Args:
+            allies: 아군 리스트
+            floor_number: 층 번호
+            num_enemies: 적 수 (None이면 설정값 범위에서 랜덤)
+            seed: 난수 시드 (적 생성과 전투 모두에 적용)
+
+        Returns:
+            시뮬레이션 결과
+        """
+        from src.world.enemy_generator import EnemyGenerator
+
+        if seed is not None:
+            seed_all(seed)
+
+        with headless_mode(self.quiet):
+            enemies = EnemyGenerator.generate_enemies(floor_number, num_enemies)
+        return self.run(allies, enemies)
+
+    def _run_battle(self, manager: CombatManager, allies: List[Any], enemies: List[Any]) -> SimulationResult:
+        """전투 루프 (렌더링/대기 없음)"""
+        breaks = {"allies": 0, "enemies": 0}
+
+        def on_break(data: Dict[str, Any]) -> None:
+            attacker = data.get("attacker") if data else None
+            side = "enemies" if attacker in manager.enemies else "allies"
+            breaks[side] += 1
+
+        event_bus.subscribe("brave.break", on_break)
+        start_time = time.perf_counter()
+        result = SimulationResult(outcome=CombatState.NOT_STARTED)
+
+        try:
+            manager.start_combat(allies, enemies)
+
+            while manager.state in _RUNNING_STATES and result.ticks < self.max_ticks:
+                if self.event_driven:
+                    result.ticks += manager.skip_idle_ticks(self.max_ticks - result.ticks - 1)
+                manager.update(delta_time=1.0)
+                result.ticks += 1
+                self._process_ready(manager, result)
+        finally:
+            event_bus.unsubscribe("brave.break", on_break)
+
+        result.outcome = manager.state
+        result.turns = manager.turn_count
+        result.elapsed = time.perf_counter() - start_time
+        result.ally_breaks = breaks["allies"]
+        result.enemy_breaks = breaks["enemies"]
+        result.allies_alive = len(_alive(manager.allies))
+        result.enemies_alive = len(_alive(manager.enemies))
+
+        # 틱 제한으로 끝난 전투도 ATB/캐스팅 상태는 정리
+        if result.timed_out:
+            manager.atb.clear()
+
+        return result
+
+    def _process_ready(self, manager: CombatManager, result: SimulationResult) -> None:
+        """이번 틱에 행동 가능한 전투원을 모두 처리"""
+        # 추가 행동(berserker_rush 등)으로 인한 무한 반복 방지
+        max_actions = (len(manager.allies) + len(manager.enemies)) * 4
+
+        for _ in range(max_actions):
+            if manager.state not in _RUNNING_STATES:
+                return
+
+            blocked = self._find_blocked_actor(manager)
+            if blocked is not None:
+                self._skip_turn(manager, blocked)
+                continue
+
+            ready = manager.atb.get_action_order()
+            if not ready:
+                return
+
+            self._take_turn(manager, ready[0], result)
+            manager._check_battle_end()
+
+    def _find_blocked_actor(self, manager: CombatManager) -> Optional[Any]:
+        """ATB가 찼지만 상태이상으로 행동할 수 없는 전투원 (ATB 높은 순)"""
+        blocked = None
+        blocked_gauge = -1.0
+        for combatant, gauge in manager.atb.gauges.items():
+            if gauge.current < gauge.threshold or not getattr(combatant, 'is_alive', True):
+                continue
+            status_manager = getattr(combatant, 'status_manager', None)
+            if status_manager is not None and not status_manager.can_act():
+                if gauge.current > blocked_gauge:
+                    blocked = combatant
+                    blocked_gauge = gauge.current
+        return blocked
+
+    def _skip_turn(self, manager: CombatManager, actor: Any) -> None:
+        """행동 불가 턴 스킵 (CombatUI와 동일한 처리)"""
+        manager.skip_turn(actor)
+
+    def _take_turn(self, manager: CombatManager, actor: Any, result: SimulationResult) -> None:
+        """정책에 따라 한 번 행동하고 HP 피해량을 기록"""
+        is_enemy = actor in manager.enemies
+        policy = self.enemy_policy if is_enemy else self.ally_policy
+        opponents = manager.allies if is_enemy else manager.enemies
+        hp_before = sum(getattr(c, 'current_hp', 0) for c in opponents)
+
+        decision = policy.decide(manager, actor)
+        action_result = self.execute_decision(manager, actor, decision)
+
+        # 스킬 실패 시 ATB가 소비되지 않으므로 기본 공격으로 대체 (무한 대기 방지)
+        if action_result.get("action") == "skill" and not action_result.get("success", False):
+            targets = _alive(opponents)
+            if targets:
+                self.execute_decision(manager, actor, {"type": "attack", "target": targets[0]})
+
+        result.actions += 1
+        damage = hp_before - sum(getattr(c, 'current_hp', 0) for c in opponents)
+        if damage > 0:
+            (result.enemy_damage if is_enemy else result.ally_damage).append(int(damage))
+
+    @staticmethod
+    def execute_decision(manager: CombatManager, actor: Any, decision: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        정책 결정(행동 딕셔너리)을 CombatManager 행동으로 실행
+
+        Args:
+            manager: 전투 관리자
+            actor: 행동자
+            decision: {"type", "target", "skill"} 딕셔너리 (None이면 기본 BRV 공격)
+
+        Returns:
+            execute_action 결과
+        """
+        if not decision:
+            _, other_side = _get_sides(manager, actor)
+            targets = _alive(other_side)
+            if not targets:
+                return {}
+            decision = {"type": "attack", "target": targets[0]}
+
+        action_type = decision.get("type", "attack")
+        target = decision.get("target")
+        skill = decision.get("skill")
+
+        if action_type == "skill" and skill:
+            return manager.execute_action(actor, ActionType.SKILL, target=target, skill=skill)
+        if action_type == "hp_attack":
+            return manager.execute_action(actor, ActionType.HP_ATTACK, target=target)
+        if action_type == "defend":
+            return manager.execute_action(actor, ActionType.DEFEND)
+        return manager.execute_action(actor, ActionType.BRV_ATTACK, target=target)
@@ -0,0 +1,297 @@
+"""
+Combat Snapshot - 전투 상태 스냅샷/복원
+
+AI 탐색(1~2수 앞보기, MCTS 등)이 실제 전투에 행동을 시험 적용한 뒤
+되돌릴 수 있도록 전투에 영향을 주는 상태만 캡처합니다.
+
+캡처 대상:
+- 전투원 속성: HP/MP/BRV, 상처, BREAK, 기믹 카운터 등 (Character를 deepcopy하지 않음)
+- 상태이상 (StatusManager), 스탯 보너스 (StatManager.version이 바뀐 경우만 복원)
+- ATB 게이지, 캐스팅 대기열, CombatManager 진행 상태, 전역 난수 상태
+
+컨테이너 속성(list/dict/set)은 원래 객체를 유지한 채 내용만 되돌리므로
+status_effects 같은 별칭 참조도 그대로 유효합니다.
+"""
+
+import copy
+import random
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.core.event_bus import event_bus
+from src.core.rng import get_rng_manager
+
+
+# 스냅샷에서 제외하는 속성 (전투 중 바뀌지 않거나 별도로 처리하는 값)
+_SKIP_ATTRS = frozenset({
+    "logger", "config", "class_data", "gimmick_data", "stat_manager", "status_manager",
+    "equipment", "available_traits", "active_traits", "skill_ids", "_cached_skills",
+    "skills", "name", "character_class", "job_id", "job_name", "job_description",
+    "job_slogan",
+})
+
+# CombatManager에서 제외하는 속성 (하위 시스템은 따로 캡처)
+_MANAGER_SKIP_ATTRS = frozenset({
+    "logger", "config", "atb", "brave", "damage_calc", "combat_log", "recorder",
+    "on_combat_end", "on_turn_start", "on_action_complete",
+})
+
+# ATB 게이지에서 캡처하는 필드
+_GAUGE_FIELDS = (
+    "current", "is_stunned", "is_paralyzed", "is_sleeping", "is_confused",
+    "haste_multiplier", "slow_multiplier", "is_casting",
+)
+
+
+def _copy_container(value: Any) -> Any:
+    """컨테이너 2단계 복사 (버프 딕셔너리 등 한 단계 중첩된 값까지)"""
+    if isinstance(value, dict):
+        return {k: _copy_item(v) for k, v in value.items()}
+    if isinstance(value, set):
+        return set(value)
+    return [_copy_item(v) for v in value]
+
+
+def _copy_item(value: Any) -> Any:
+    """컨테이너 원소 복사 (dict/list만 얕은 복사, 객체는 참조 유지)"""
+    if type(value) is dict:
+        return dict(value)
+    if type(value) is list:
+        return list(value)
+    return value
+
+
+class _AttributeState:
+    """객체 속성 스냅샷 (스칼라/객체는 참조, 컨테이너는 내용 복사)"""
+
+    __slots__ = ("obj", "skip", "values", "containers")
+
+    def __init__(self, obj: Any, skip: frozenset) -> None:
+        self.obj = obj
+        self.skip = skip
+        self.values: Dict[str, Any] = {}
+        # 속성 이름 -> (원래 컨테이너 객체, 내용 복사본)
+        self.containers: Dict[str, Tuple[Any, Any]] = {}
+
+        for name, value in vars(obj).items():
+            if name in skip:
+                continue
+            if isinstance(value, (list, dict, set)):
+                self.containers[name] = (value, _copy_container(value))
+            else:
+                self.values[name] = value
+
+    def restore(self) -> None:
+        """속성 복원 (시험 실행 중 새로 생긴 속성은 제거)"""
+        attrs = vars(self.obj)
+        added = [
+            name for name in attrs
+            if name not in self.values and name not in self.containers and name not in self.skip
+        ]
+        for name in added:
+            del attrs[name]
+
+        attrs.update(self.values)
+        for name, (container, saved) in self.containers.items():
+            contents = _copy_container(saved)
+            if isinstance(container, list):
+                container[:] = contents
+            else:
+                container.clear()
+                container.update(contents)
+            attrs[name] = container
+
+
+class CombatantSnapshot:
+    """전투원 한 명의 스냅샷"""
+
+    __slots__ = ("combatant", "attributes", "status_effects", "stat_version", "stats", "gauge", "gauge_state")
+
+    def __init__(self, combatant: Any, gauge: Optional[Any]) -> None:
+        self.combatant = combatant
+
+        status_manager = getattr(combatant, "status_manager", None)
+        skip = _SKIP_ATTRS
+        self.status_effects: Optional[List[Any]] = None
+        if status_manager is not None:
+            # status_effects는 StatusManager 리스트의 별칭이므로 여기서 함께 처리
+            skip = _SKIP_ATTRS | {"status_effects"}
+            self.status_effects = [self._copy_effect(e) for e in status_manager.status_effects]
+        self.attributes = _AttributeState(combatant, skip)
+
+        stat_manager = getattr(combatant, "stat_manager", None)
+        self.stat_version: Optional[int] = None
+        self.stats: Dict[str, Tuple[float, Dict[str, float]]] = {}
+        if stat_manager is not None:
+            self.stat_version = stat_manager.version
+            self.stats = {
+                name: (stat._base_value, dict(stat._bonuses))
+                for name, stat in stat_manager.stats.items()
+            }
+
+        self.gauge = gauge
+        self.gauge_state = tuple(getattr(gauge, f) for f in _GAUGE_FIELDS) if gauge else None
+
+    @staticmethod
+    def _copy_effect(effect: Any) -> Any:
+        """상태 효과 복사 (지속 시간/스택은 시험 실행 중 바뀜)"""
+        clone = copy.copy(effect)
+        if isinstance(getattr(clone, "metadata", None), dict):
+            clone.metadata = dict(clone.metadata)
+        return clone
+
+    def restore(self) -> None:
+        """전투원 상태 복원"""
+        combatant = self.combatant
+        self.attributes.restore()
+
+        if self.status_effects is not None:
+            combatant.status_manager.status_effects[:] = [
+                self._copy_effect(e) for e in self.status_effects
+            ]
+
+        # 스탯 보너스는 시험 실행 중 바뀐 경우에만 복원
+        stat_manager = getattr(combatant, "stat_manager", None)
+        if stat_manager is not None and stat_manager.version != self.stat_version:
+            for name, (base_value, bonuses) in self.stats.items():
+                stat = stat_manager.stats.get(name)
+                if stat is not None:
+                    stat._base_value = base_value
+                    stat._bonuses = dict(bonuses)
+                    stat._invalidate()
+            self.stat_version = stat_manager.version
+
+        if self.gauge is not None:
+            for field_name, value in zip(_GAUGE_FIELDS, self.gauge_state):
+                if getattr(self.gauge, field_name) != value:
+                    setattr(self.gauge, field_name, value)
+
+
+class CombatSnapshot:
+    """
+    전투 상태 스냅샷
+
+    capture()로 만들고 restore()로 몇 번이든 같은 상태로 되돌릴 수 있습니다.
+    """
+
+    def __init__(self, manager: Any) -> None:
+        from src.combat.casting_system import get_casting_system
+
+        self.manager = manager
+        self.manager_state = _AttributeState(manager, _MANAGER_SKIP_ATTRS)
+
+        atb = manager.atb
+        self.atb = atb
+        self.atb_clock = atb.clock
+        self.atb_gauges = dict(atb.gauges)
+        self.atb_combatants = list(atb.combatants)
+        self.atb_average_speed = atb._average_speed
+        arrays = getattr(atb, "arrays", None)
+        self.atb_array_size = arrays.size if arrays is not None else None
+
+        combatants = list(manager.allies) + list(manager.enemies)
+        self.combatants = [CombatantSnapshot(c, atb.gauges.get(c)) for c in combatants]
+
+        casting_system = get_casting_system()
+        casting_system.sync_all()
+        self.casting_system = casting_system
+        self.active_casts = {c: copy.copy(info) for c, info in casting_system.active_casts.items()}
+        self.cast_queue = [copy.copy(info) for info in casting_system.cast_queue]
+
+        self.rng_state = random.getstate()
+        self.rng_streams = get_rng_manager().get_state()
+
+    @classmethod
+    def capture(cls, manager: Any) -> "CombatSnapshot":
+        """현재 전투 상태 캡처"""
+        return cls(manager)
+
+    def restore(self) -> None:
+        """캡처 시점의 전투 상태로 복원"""
+        self.manager_state.restore()
+
+        # 시험 실행 중 전투가 끝나면 ATB가 초기화되므로 게이지 목록도 복원
+        atb = self.atb
+        if atb.gauges != self.atb_gauges:
+            atb.gauges.clear()
+            atb.gauges.update(self.atb_gauges)
+            atb.combatants[:] = self.atb_combatants
+        if self.atb_array_size is not None:
+            atb.arrays.size = self.atb_array_size
+        atb.clock = self.atb_clock
+        atb._average_speed = self.atb_average_speed
+        atb._ready_keys.clear()
+        atb._ready_queue.clear()
+        atb.mark_dirty()
+
+        for combatant_snapshot in self.combatants:
+            combatant_snapshot.restore()
+
+        casting_system = self.casting_system
+        casting_system.active_casts.clear()
+        casting_system.active_casts.update(
+            {c: copy.copy(info) for c, info in self.active_casts.items()}
+        )
+        casting_system.cast_queue[:] = [copy.copy(info) for info in self.cast_queue]
+        casting_system.reschedule_all()
+
+        random.setstate(self.rng_state)
+        get_rng_manager().set_state(self.rng_streams)
+
+
+@contextmanager
+def lookahead(manager: Any, quiet: bool = True) -> Iterator[CombatSnapshot]:
+    """
+    시험 실행 블록
+
+    블록 안에서 전투를 진행해도 블록이 끝나면 캡처 시점으로 되돌아갑니다.
+    이벤트 발행, 전투 종료 콜백, 입력 기록, 전투 로그, 오디오/진동, (quiet이면) 로그는 차단됩니다.
+
+    Args:
+        manager: 전투 관리자
+        quiet: 로그 출력 억제 여부
+
+    Yields:
+        CombatSnapshot (블록 안에서 restore()로 여러 번 되돌릴 수 있음)
+    """
+    from src.combat.combat_simulator import headless_mode
+
+    snapshot = CombatSnapshot.capture(manager)
+    on_combat_end = manager.on_combat_end
+    recorder = manager.recorder
+    manager.on_combat_end = None
+    manager.recorder = None
+    try:
+        with event_bus.suppressed(), manager.combat_log.suppressed(), headless_mode(quiet):
+            yield snapshot
+    finally:
+        manager.on_combat_end = on_combat_end
+        manager.recorder = recorder
+        snapshot.restore()
+
+
+def simulate_action(
+    manager: Any,
+    actor: Any,
+    decision: Optional[Dict[str, Any]],
+    evaluate: Optional[Callable[[Any], Any]] = None
+) -> Any:
+    """
+    행동 하나를 시험 실행하고 결과를 평가한 뒤 되돌림
+
+    Args:
+        manager: 전투 관리자
+        actor: 행동자
+        decision: 행동 딕셔너리 ({"type", "target", "skill"}, EnemyAI 결정과 같은 형식)
+        evaluate: 시험 실행 후 상태 평가 함수 (None이면 execute_action 결과 반환)
+
+    Returns:
+        evaluate(manager) 결과 또는 execute_action 결과
+    """
+    from src.combat.combat_simulator import CombatSimulator
+
+    with lookahead(manager):
+        result = CombatSimulator.execute_decision(manager, actor, decision)
+        if evaluate is not None:
+            return evaluate(manager)
+        return result
@@ -5,12 +5,13 @@ BRV 데미지, HP 데미지, 상처 데미지 계산
 밸런스 조정된 데미지 공식 적용
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, List, Sequence, Union
 from dataclasses import dataclass
-import random
+import math
 
 from src.core.config import get_config
 from src.core.logger import get_logger
+from src.core.rng import RngStreams, get_rng
 
 
 @dataclass
@@ -24,16 +25,41 @@ class DamageResult:
     details: Dict[str, Any]
 
 
+@dataclass
+class AttackerProfile:
+    """
+    공격자 측 보정값 (여러 대상에게 공격할 때 한 번만 계산)
+
+    Attributes:
+        attacker: 공격자
+        attack_stat: 공격 스탯 (물리: 공격력, 마법: 마법력, 버프 반영)
+        accuracy: 명중률 스탯
+        critical_chance: 크리티컬 확률 (상한 적용)
+        hp_scaling: HP 비례 공격력 배율 (특성)
+        critical_damage: 크리티컬 데미지 추가 배율 (특성)
+        player_damage_multiplier: 난이도 데미지 배율 (플레이어가 아니면 None)
+    """
+    attacker: Any
+    attack_stat: int
+    accuracy: int
+    critical_chance: float
+    hp_scaling: float
+    critical_damage: float
+    player_damage_multiplier: Optional[float]
+
+
 class DamageCalculator:
     """
     데미지 계산기
 
     BRV 데미지 및 HP 데미지 계산
+    광역 공격은 *_batch 메서드로 공격자 보정을 한 번만 계산합니다.
     """
 
     def __init__(self) -> None:
         self.logger = get_logger("damage")
         self.config = get_config()
+        self.rng = get_rng(RngStreams.DAMAGE)
 
         # 밸런스 설정
         self.brv_damage_multiplier = self.config.get("combat.damage.brv_multiplier", 1.5)
@@ -65,9 +91,49 @@ class DamageCalculator:
         Returns:
             DamageResult
         """
+        return self.calculate_brv_damage_batch(attacker, [defender], skill_multiplier, **kwargs)[0]
+
+    def calculate_brv_damage_batch(
+        self,
+        attacker: Any,
+        defenders: Sequence[Any],
+        skill_multiplier: float = 1.0,
+        **kwargs
+    ) -> List[DamageResult]:
+        """
+        여러 대상에 대한 BRV 데미지 일괄 계산
+
+        공격자 스탯/특성/난이도 보정은 한 번만 계산하고, 대상별로
+        명중 → 변동 → 크리티컬 순서로 판정합니다 (개별 호출과 같은 난수 순서).
+
+        Args:
+            attacker: 공격자
+            defenders: 방어자 리스트
+            skill_multiplier: 스킬 배율
+            **kwargs: 추가 옵션 (calculate_brv_damage와 동일)
+
+        Returns:
+            defenders와 같은 순서의 DamageResult 리스트
+        """
+        profile = self._resolve_attacker(attacker)
+        return [
+            self._brv_damage_for(profile, defender, skill_multiplier, kwargs)
+            for defender in defenders
+        ]
+
+    def _brv_damage_for(
+        self,
+        profile: AttackerProfile,
+        defender: Any,
+        skill_multiplier: float,
+        kwargs: Dict[str, Any]
+    ) -> DamageResult:
+        """대상 한 명에 대한 BRV 데미지 (공격자 보정은 profile 사용)"""
+        attacker = profile.attacker
+
         # 명중 판정 (회피 무시가 아닌 경우)
         ignore_evasion = kwargs.get("ignore_evasion", False)
-        if not ignore_evasion and not self.check_hit(attacker, defender):
+        if not ignore_evasion and not self._roll_hit(profile.accuracy, attacker, defender):
             # 회피 성공 - 데미지 0
             return DamageResult(
                 base_damage=0,
@@ -79,7 +145,7 @@ class DamageCalculator:
             )
 
         # 스탯 추출
-        attacker_atk = self._get_attack_stat(attacker)
+        attacker_atk = profile.attack_stat
         defender_def = self._get_defense_stat(defender)
 
         # pierce: 방어 무시 (%) - 방어력을 %만큼 무시
@@ -100,46 +166,24 @@ class DamageCalculator:
         base_damage = max(1, int(stat_modifier * skill_multiplier * self.brv_damage_multiplier))
 
         # 특성 효과: HP 비례 공격력 (berserker_rage 등)
-        from src.character.trait_effects import get_trait_effect_manager
-        trait_manager = get_trait_effect_manager()
-        hp_scaling_mult = 1.0
-        if hasattr(attacker, 'active_traits'):
-            for trait_data in attacker.active_traits:
-                trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-                effects = trait_manager.get_trait_effects(trait_id)
-                for effect in effects:
-                    if effect.effect_type.value == "hp_scaling_attack":
-                        # HP가 낮을수록 공격력 증가
-                        if hasattr(attacker, 'current_hp') and hasattr(attacker, 'max_hp'):
-                            hp_percent = attacker.current_hp / attacker.max_hp if attacker.max_hp > 0 else 1.0
-                            max_bonus = effect.metadata.get("max_bonus", effect.value) if effect.metadata else effect.value
-                            # HP 0%일 때 최대 보너스, HP 100%일 때 보너스 없음
-                            bonus_mult = 1.0 + (max_bonus * (1.0 - hp_percent))
-                            hp_scaling_mult *= bonus_mult
-        
-        base_damage = int(base_damage * hp_scaling_mult)
+        base_damage = int(base_damage * profile.hp_scaling)
 
         # 랜덤 변수 (90% ~ 110%)
-        variance = random.uniform(0.9, 1.1)
+        variance = self.rng.uniform(0.9, 1.1)
         damage = base_damage * variance
 
         # 크리티컬 판정
-        is_critical = self._check_critical(attacker)
-        critical_dmg_mult = 1.0
+        is_critical = self.rng.random() < profile.critical_chance
         if is_critical:
             # 크리티컬 데미지 배율 (critical_master 등)
-            critical_dmg_mult = trait_manager.calculate_critical_damage(attacker)
-            damage *= (self.critical_multiplier * critical_dmg_mult)
-            self.logger.debug(f"크리티컬 히트! {attacker.name} (배율: {self.critical_multiplier * critical_dmg_mult:.2f}x)")
+            damage *= (self.critical_multiplier * profile.critical_damage)
+            self.logger.debug(f"크리티컬 히트! {attacker.name} (배율: {self.critical_multiplier * profile.critical_damage:.2f}x)")
 
         final_damage = max(1, int(damage))
 
         # 난이도 보정 (플레이어가 공격자인 경우)
-        from src.core.difficulty import get_difficulty_system
-        difficulty_system = get_difficulty_system()
-        if difficulty_system and self._is_player(attacker):
-            player_dmg_mult = difficulty_system.get_player_damage_multiplier()
-            final_damage = int(final_damage * player_dmg_mult)
+        if profile.player_damage_multiplier is not None:
+            final_damage = int(final_damage * profile.player_damage_multiplier)
 
         self.logger.debug(
             f"BRV 데미지 계산: {attacker.name} → {defender.name}",
@@ -191,12 +235,82 @@ class DamageCalculator:
         Returns:
             (DamageResult, wound_damage)
         """
+        results = self.calculate_hp_damage_batch(
+            attacker, [defender], brv_points, hp_multiplier, is_break, damage_type, **kwargs
+        )
+        return results[0]
+
+    def calculate_hp_damage_batch(
+        self,
+        attacker: Any,
+        defenders: Sequence[Any],
+        brv_points: int,
+        hp_multiplier: float = 1.0,
+        is_break: Union[bool, Sequence[bool]] = False,
+        damage_type: str = "physical",
+        **kwargs
+    ) -> List[Tuple[DamageResult, int]]:
+        """
+        여러 대상에 대한 HP 데미지 일괄 계산
+
+        공격자 스탯/특성/난이도 보정과 BREAK 보너스는 한 번만 계산합니다.
+
+        Args:
+            attacker: 공격자
+            defenders: 방어자 리스트
+            brv_points: 축적된 BRV (모든 대상에게 동일)
+            hp_multiplier: HP 배율
+            is_break: BREAK 상태 여부 (bool 하나 또는 대상별 리스트)
+            damage_type: 데미지 타입 ("physical" 또는 "magical")
+            **kwargs: 추가 옵션 (calculate_hp_damage와 동일)
+
+        Returns:
+            defenders와 같은 순서의 (DamageResult, wound_damage) 리스트
+        """
+        profile = self._resolve_attacker(attacker, damage_type)
+        if isinstance(is_break, bool):
+            break_flags = [is_break] * len(defenders)
+        else:
+            break_flags = list(is_break)
+
+        break_mult = None
+        if any(break_flags):
+            # 브레이크 보너스 계산 (break_master 등)
+            from src.character.trait_effects import get_trait_effect_manager
+            break_bonus = get_trait_effect_manager().calculate_break_bonus(attacker)
+            if break_bonus > 0:
+                # break_bonus는 추가 배율 (1.5 = 150%)
+                break_mult = 1.0 + (break_bonus - 1.0)
+            else:
+                break_mult = self.break_damage_bonus
+
+        return [
+            self._hp_damage_for(
+                profile, defender, brv_points, hp_multiplier,
+                break_mult if defender_break else None, damage_type, kwargs
+            )
+            for defender, defender_break in zip(defenders, break_flags)
+        ]
+
+    def _hp_damage_for(
+        self,
+        profile: AttackerProfile,
+        defender: Any,
+        brv_points: int,
+        hp_multiplier: float,
+        break_mult: Optional[float],
+        damage_type: str,
+        kwargs: Dict[str, Any]
+    ) -> Tuple[DamageResult, int]:
+        """대상 한 명에 대한 HP 데미지 (break_mult가 None이면 BREAK 아님)"""
+        attacker = profile.attacker
+        is_break = break_mult is not None
+
         # 스탯 기반 보정 (공격자 스탯 vs 방어자 스탯)
+        attacker_stat = profile.attack_stat
         if damage_type == "magical":
-            attacker_stat = self._get_magic_stat(attacker)
             defender_stat = self._get_spirit_stat(defender)
         else:  # physical
-            attacker_stat = self._get_attack_stat(attacker)
             defender_stat = self._get_defense_stat(defender)
 
         # pierce: 방어 무시 (%) - 방어력을 %만큼 무시
@@ -227,24 +341,7 @@ class DamageCalculator:
         damage = base_damage
 
         # 특성 효과: HP 비례 공격력 (berserker_rage 등)
-        from src.character.trait_effects import get_trait_effect_manager
-        trait_manager = get_trait_effect_manager()
-        hp_scaling_mult = 1.0
-        if hasattr(attacker, 'active_traits'):
-            for trait_data in attacker.active_traits:
-                trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-                effects = trait_manager.get_trait_effects(trait_id)
-                for effect in effects:
-                    if effect.effect_type.value == "hp_scaling_attack":
-                        # HP가 낮을수록 공격력 증가
-                        if hasattr(attacker, 'current_hp') and hasattr(attacker, 'max_hp'):
-                            hp_percent = attacker.current_hp / attacker.max_hp if attacker.max_hp > 0 else 1.0
-                            max_bonus = effect.metadata.get("max_bonus", effect.value) if effect.metadata else effect.value
-                            # HP 0%일 때 최대 보너스, HP 100%일 때 보너스 없음
-                            bonus_mult = 1.0 + (max_bonus * (1.0 - hp_percent))
-                            hp_scaling_mult *= bonus_mult
-        
-        damage = int(damage * hp_scaling_mult)
+        damage = int(damage * profile.hp_scaling)
 
         # 언데드 추가 피해 (undead_bonus)
         if kwargs.get('undead_bonus'):
@@ -255,40 +352,29 @@ class DamageCalculator:
                 self.logger.info(f"[언데드 추가 피해] {attacker.name} → {defender.name} (언데드): 데미지 +{kwargs['undead_bonus']*100:.0f}%")
 
         # 크리티컬 판정
-        is_critical = self._check_critical(attacker)
-        critical_dmg_mult = 1.0
+        is_critical = self.rng.random() < profile.critical_chance
         if is_critical:
             # 크리티컬 데미지 배율 (critical_master 등)
-            critical_dmg_mult = trait_manager.calculate_critical_damage(attacker)
-            damage = int(damage * self.critical_multiplier * critical_dmg_mult)
-            self.logger.info(f"[CRITICAL] HP 공격! {attacker.name} (배율: {self.critical_multiplier * critical_dmg_mult:.2f}x)")
+            damage = int(damage * self.critical_multiplier * profile.critical_damage)
+            self.logger.info(f"[CRITICAL] HP 공격! {attacker.name} (배율: {self.critical_multiplier * profile.critical_damage:.2f}x)")
 
         # BREAK 보너스
         if is_break:
-            # 브레이크 보너스 계산 (break_master 등)
-            break_bonus = trait_manager.calculate_break_bonus(attacker)
-            if break_bonus > 0:
-                # break_bonus는 추가 배율 (1.5 = 150%)
-                break_mult = 1.0 + (break_bonus - 1.0)
-            else:
-                break_mult = self.break_damage_bonus
             damage = int(damage * break_mult)
             self.logger.info(f"[BREAK BONUS] 데미지! {damage} ({break_mult:.2f}x)")
 
         final_damage = max(5, damage)
         
         # 피해 감소 적용 (damage_reduction, brave_soul 등)
-        damage_reduction = trait_manager.calculate_damage_reduction(defender, is_defending=kwargs.get("is_defending", False))
+        from src.character.trait_effects import get_trait_effect_manager
+        damage_reduction = get_trait_effect_manager().calculate_damage_reduction(defender, is_defending=kwargs.get("is_defending", False))
         if damage_reduction > 0:
             final_damage = int(final_damage * (1.0 - damage_reduction))
             self.logger.debug(f"[{defender.name}] 피해 감소 적용: {damage_reduction * 100:.1f}% → 최종 피해: {final_damage}")
 
         # 난이도 보정 (플레이어가 공격자인 경우)
-        from src.core.difficulty import get_difficulty_system
-        difficulty_system = get_difficulty_system()
-        if difficulty_system and self._is_player(attacker):
-            player_dmg_mult = difficulty_system.get_player_damage_multiplier()
-            final_damage = int(final_damage * player_dmg_mult)
+        if profile.player_damage_multiplier is not None:
+            final_damage = int(final_damage * profile.player_damage_multiplier)
 
         # 상처 데미지 (HP 데미지의 25%)
         wound_damage = int(final_damage * self.wound_damage_rate)
@@ -353,9 +439,49 @@ class DamageCalculator:
         Returns:
             DamageResult
         """
+        return self.calculate_magic_damage_batch(
+            attacker, [defender], skill_multiplier, element, **kwargs
+        )[0]
+
+    def calculate_magic_damage_batch(
+        self,
+        attacker: Any,
+        defenders: Sequence[Any],
+        skill_multiplier: float = 1.0,
+        element: Optional[str] = None,
+        **kwargs
+    ) -> List[DamageResult]:
+        """
+        여러 대상에 대한 마법 데미지 일괄 계산
+
+        Args:
+            attacker: 공격자
+            defenders: 방어자 리스트
+            skill_multiplier: 스킬 배율
+            element: 속성 (fire, ice, lightning 등)
+            **kwargs: 추가 옵션 (calculate_magic_damage와 동일)
+
+        Returns:
+            defenders와 같은 순서의 DamageResult 리스트
+        """
+        profile = self._resolve_attacker(attacker, "magical", with_traits=False)
+        return [
+            self._magic_damage_for(profile, defender, skill_multiplier, element, kwargs)
+            for defender in defenders
+        ]
+
+    def _magic_damage_for(
+        self,
+        profile: AttackerProfile,
+        defender: Any,
+        skill_multiplier: float,
+        element: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> DamageResult:
+        """대상 한 명에 대한 마법 데미지"""
         # 명중 판정 (회피 무시가 아닌 경우)
         ignore_evasion = kwargs.get("ignore_evasion", False)
-        if not ignore_evasion and not self.check_hit(attacker, defender):
+        if not ignore_evasion and not self._roll_hit(profile.accuracy, profile.attacker, defender):
             # 회피 성공 - 데미지 0
             return DamageResult(
                 base_damage=0,
@@ -367,7 +493,7 @@ class DamageCalculator:
             )
 
         # 마법 스탯 추출
-        attacker_mag = self._get_magic_stat(attacker)
+        attacker_mag = profile.attack_stat
         defender_spr = self._get_spirit_stat(defender)
 
         # 기본 데미지 계산: 마법력 / 정신력 비율
@@ -382,11 +508,11 @@ class DamageCalculator:
         base_damage = max(1, int(stat_modifier * skill_multiplier * self.brv_damage_multiplier * element_bonus))
 
         # 랜덤 변수
-        variance = random.uniform(0.9, 1.1)
+        variance = self.rng.uniform(0.9, 1.1)
         damage = base_damage * variance
 
         # 크리티컬 판정
-        is_critical = self._check_critical(attacker)
+        is_critical = self.rng.random() < profile.critical_chance
         if is_critical:
             damage *= self.critical_multiplier
 
@@ -406,6 +532,53 @@ class DamageCalculator:
             }
         )
 
+    def _resolve_attacker(
+        self,
+        attacker: Any,
+        damage_type: str = "physical",
+        with_traits: bool = True
+    ) -> AttackerProfile:
+        """
+        공격자 측 보정값 계산
+
+        Args:
+            attacker: 공격자
+            damage_type: "physical" 또는 "magical" (공격 스탯 선택)
+            with_traits: False면 특성 배율을 1.0으로 둠 (마법 BRV 데미지)
+
+        Returns:
+            AttackerProfile
+        """
+        if damage_type == "magical":
+            attack_stat = self._get_magic_stat(attacker)
+        else:
+            attack_stat = self._get_attack_stat(attacker)
+
+        hp_scaling = 1.0
+        critical_damage = 1.0
+        player_damage_multiplier = None
+        if with_traits:
+            from src.character.trait_effects import get_trait_effect_manager
+            trait_manager = get_trait_effect_manager()
+            hp_scaling = trait_manager.calculate_hp_scaling_attack(attacker)
+            critical_damage = trait_manager.calculate_critical_damage(attacker)
+
+            # 난이도 보정 (플레이어가 공격자인 경우)
+            from src.core.difficulty import get_difficulty_system
+            difficulty_system = get_difficulty_system()
+            if difficulty_system and self._is_player(attacker):
+                player_damage_multiplier = difficulty_system.get_player_damage_multiplier()
+
+        return AttackerProfile(
+            attacker=attacker,
+            attack_stat=attack_stat,
+            accuracy=self._get_accuracy_stat(attacker),
+            critical_chance=self._get_critical_chance(attacker),
+            hp_scaling=hp_scaling,
+            critical_damage=critical_damage,
+            player_damage_multiplier=player_damage_multiplier
+        )
+
     def _get_attack_stat(self, character: Any) -> int:
         """공격력 스탯 추출 (버프 반영)"""
         # 여러 속성명 시도
@@ -528,9 +701,10 @@ class DamageCalculator:
         Returns:
             명중 여부
         """
-        import math
+        return self._roll_hit(self._get_accuracy_stat(attacker), attacker, defender)
 
-        accuracy = self._get_accuracy_stat(attacker)
+    def _roll_hit(self, accuracy: int, attacker: Any, defender: Any) -> bool:
+        """명중 판정 (명중률 스탯을 미리 계산한 경우)"""
         evasion = self._get_evasion_stat(defender)
 
         # 회피가 0이면 최소값 1로 설정 (0으로 나누기 방지)
@@ -549,7 +723,7 @@ class DamageCalculator:
         # 확률 변환 (0.0 ~ 1.0)
         hit_chance_pct = final_hit_rate / 100.0
 
-        is_hit = random.random() < hit_chance_pct
+        is_hit = self.rng.random() < hit_chance_pct
 
         if not is_hit:
             self.logger.debug(
@@ -574,6 +748,10 @@ class DamageCalculator:
         Returns:
             크리티컬 여부
         """
+        return self.rng.random() < self._get_critical_chance(attacker)
+
+    def _get_critical_chance(self, attacker: Any) -> float:
+        """크리티컬 확률 (행운 반영, 상한 95%)"""
         # 행운 스탯 추출
         luck = getattr(attacker, "luck", 5)
 
@@ -581,9 +759,7 @@ class DamageCalculator:
         critical_chance = self.critical_base_chance + (luck / 100.0)
 
         # 크리티컬 확률 상한선 (95%)
-        critical_chance = min(0.95, critical_chance)
-
-        return random.random() < critical_chance
+        return min(0.95, critical_chance)
 
     def _get_element_bonus(self, defender: Any, element: str) -> float:
         """
@@ -0,0 +1,156 @@
+"""
+Party Combatants - 파티 멤버별 전투용 Character 유지
+
+전투마다 PartyMember를 Character로 새로 만들면 YAML 스탯 설정, 특성별 activate_trait,
+CHARACTER_CREATED 이벤트 발행이 매번 반복됩니다.
+멤버마다 Character를 한 번만 만들어 두고, 전투 진입 시에는 마지막 동기화 이후
+바뀐 필드(이름, 플레이어 ID, 선택 특성)만 반영합니다.
+
+직업이나 기초 스탯이 바뀐 멤버만 Character를 다시 만듭니다.
+HP/MP/상처 등 전투 결과는 같은 Character에 남아 다음 전투로 이어집니다.
+"""
+
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.logger import get_logger
+
+
+logger = get_logger("combat")
+
+
+class _PartyEntry:
+    """멤버 하나의 전투용 Character와 마지막으로 동기화한 필드 값"""
+
+    __slots__ = ("member_ref", "character", "job_id", "stats", "name", "player_id", "traits")
+
+    def __init__(self, member_ref: "weakref.ref", character: Any) -> None:
+        self.member_ref = member_ref
+        self.character = character
+        self.job_id: Optional[str] = None
+        self.stats: Dict[str, Any] = {}
+        self.name: Optional[str] = None
+        self.player_id: Optional[str] = None
+        self.traits: Tuple[str, ...] = ()
+
+
+class PartyCombatantPool:
+    """
+    PartyMember → 전투용 Character 풀
+
+    PartyMember는 dataclass(eq=True)라 해시할 수 없으므로 id()로 찾고,
+    약한 참조로 같은 객체인지 확인합니다 (멤버가 사라지면 항목도 제거).
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, _PartyEntry] = {}
+        self.created = 0   # Character 생성 횟수
+        self.synced = 0    # 생성 없이 동기화만 한 횟수
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_character(self, member: Any) -> Any:
+        """
+        멤버의 전투용 Character (없거나 직업/기초 스탯이 바뀌었으면 새로 생성)
+
+        Args:
+            member: PartyMember
+
+        Returns:
+            동기화된 Character
+        """
+        key = id(member)
+        entry = self._entries.get(key)
+        if entry is not None and entry.member_ref() is not member:
+            entry = None
+
+        if entry is None or entry.job_id != member.job_id or entry.stats != (member.stats or {}):
+            entry = self._create(member, key)
+        else:
+            self.synced += 1
+
+        self._sync(entry, member)
+        return entry.character
+
+    def convert(self, allies: List[Any]) -> List[Any]:
+        """PartyMember만 전투용 Character로 바꾼 아군 리스트"""
+        from src.ui.party_setup import PartyMember
+
+        return [
+            self.get_character(ally) if isinstance(ally, PartyMember) else ally
+            for ally in allies
+        ]
+
+    def discard(self, member: Any) -> None:
+        """멤버의 Character 버리기 (다음 전투에서 새로 생성)"""
+        entry = self._entries.get(id(member))
+        if entry is not None and entry.member_ref() is member:
+            del self._entries[id(member)]
+
+    def clear(self) -> None:
+        """모든 항목 제거 (새 게임 시작 등)"""
+        self._entries.clear()
+
+    def _create(self, member: Any, key: int) -> _PartyEntry:
+        from src.character.character import Character
+
+        character = Character(
+            name=member.character_name,
+            character_class=member.job_id,
+            level=getattr(member, 'level', 1)
+        )
+
+        def _forget(ref: "weakref.ref", key: int = key) -> None:
+            entry = self._entries.get(key)
+            if entry is not None and entry.member_ref is ref:
+                del self._entries[key]
+
+        entry = _PartyEntry(weakref.ref(member, _forget), character)
+        # 기초 스탯은 Character가 같은 직업 YAML에서 이미 불러왔으므로 비교용으로만 보관
+        entry.job_id = member.job_id
+        entry.stats = dict(member.stats or {})
+        entry.name = member.character_name
+        entry.player_id = getattr(member, 'player_id', None)
+        character.player_id = entry.player_id
+        self._entries[key] = entry
+        self.created += 1
+        logger.debug(f"전투용 캐릭터 생성: {member.character_name} ({member.job_id})")
+        return entry
+
+    def _sync(self, entry: _PartyEntry, member: Any) -> None:
+        """마지막 동기화 이후 바뀐 필드만 Character에 반영"""
+        character = entry.character
+
+        name = member.character_name
+        if name != entry.name:
+            character.name = name
+            character.status_manager.owner_name = name
+            entry.name = name
+
+        player_id = getattr(member, 'player_id', None)
+        if player_id != entry.player_id:
+            character.player_id = player_id
+            entry.player_id = player_id
+
+        traits = tuple(getattr(member, 'selected_traits', None) or ())
+        if traits != entry.traits:
+            for trait_id in entry.traits:
+                if trait_id not in traits:
+                    character.deactivate_trait(trait_id)
+            for trait_id in traits:
+                if trait_id not in entry.traits:
+                    character.activate_trait(trait_id)
+            entry.traits = traits
+
+
+# 전역 인스턴스
+_party_combatant_pool: Optional[PartyCombatantPool] = None
+
+
+def get_party_combatant_pool() -> PartyCombatantPool:
+    """전역 파티 전투원 풀"""
+    global _party_combatant_pool
+    if _party_combatant_pool is None:
+        _party_combatant_pool = PartyCombatantPool()
+    return _party_combatant_pool
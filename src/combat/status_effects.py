@@ -203,11 +203,93 @@ class StatusEffect:
                 f"intensity={self.intensity}, stacks={self.stack_count}/{self.max_stacks})")
 
 
+# 상태 타입별 비트 (활성 상태 비트마스크용)
+STATUS_BITS: Dict[StatusType, int] = {
+    status_type: 1 << index for index, status_type in enumerate(StatusType)
+}
+
+
+def _status_mask(*status_types: StatusType) -> int:
+    """상태 타입 목록을 비트마스크로 변환"""
+    mask = 0
+    for status_type in status_types:
+        mask |= STATUS_BITS[status_type]
+    return mask
+
+
+# 행동 불가 상태
+BLOCKING_MASK = _status_mask(
+    StatusType.STUN,
+    StatusType.SLEEP,
+    StatusType.FREEZE,
+    StatusType.PETRIFY,
+    StatusType.PARALYZE,
+    StatusType.TIME_STOP
+)
+
+# 스킬 사용 불가 상태
+SILENCING_MASK = _status_mask(
+    StatusType.SILENCE,
+    StatusType.MADNESS
+)
+
+# 제어 불가 상태 (매혹, 지배, 혼란)
+CONTROL_MASK = _status_mask(
+    StatusType.CHARM,
+    StatusType.DOMINATE,
+    StatusType.CONFUSION
+)
+
+INVINCIBLE_MASK = _status_mask(
+    StatusType.INVINCIBLE,
+    StatusType.TEMPORARY_INVINCIBLE
+)
+
+
+class _StatusList(list):
+    """
+    변경 시 StatusManager 인덱스를 무효화하는 상태 효과 리스트
+
+    Character.status_effects 등 외부에서 리스트를 직접 수정해도
+    타입 인덱스/비트마스크/스탯 배율 캐시가 어긋나지 않도록 합니다.
+    """
+
+    _manager: Optional["StatusManager"] = None
+
+    def __init__(self, iterable=(), manager: Optional["StatusManager"] = None) -> None:
+        super().__init__(iterable)
+        self._manager = manager
+
+    def _changed(self) -> None:
+        if self._manager is not None:
+            self._manager._invalidate()
+
+
+def _tracked(name: str) -> Callable:
+    """list 변경 메서드를 무효화 통지로 감싸기"""
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "sort",
+              "reverse", "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(_StatusList, _name, _tracked(_name))
+
+
 class StatusManager:
     """
     상태 효과 관리자
 
     캐릭터의 모든 상태 효과를 관리합니다.
+    상태 타입별 인덱스와 활성 타입 비트마스크, 스탯 배율은 캐시되며
+    효과 추가/제거/턴 경과 시 무효화됩니다.
     """
 
     def __init__(self, owner_name: str = "Unknown", owner: Any = None) -> None:
@@ -218,8 +300,55 @@ class StatusManager:
         """
         self.owner_name = owner_name
         self.owner = owner  # 캐릭터 객체 참조
-        self.status_effects: List[StatusEffect] = []
-        self.effects = self.status_effects  # 호환성을 위한 별칭
+
+        # 타입별 인덱스 캐시 (_dirty면 다음 조회 시 재구성)
+        self._index: Dict[StatusType, StatusEffect] = {}
+        self._mask = 0
+        self._modifiers: Optional[Dict[str, float]] = None
+        self._dirty = True
+
+        self.status_effects = []
+
+    @property
+    def status_effects(self) -> List[StatusEffect]:
+        """상태 효과 리스트"""
+        return self._effects
+
+    @status_effects.setter
+    def status_effects(self, effects: List[StatusEffect]) -> None:
+        if not isinstance(effects, _StatusList) or effects._manager is not self:
+            effects = _StatusList(effects, manager=self)
+        self._effects = effects
+        self._invalidate()
+
+    # 호환성을 위한 별칭
+    effects = status_effects
+
+    def _invalidate(self) -> None:
+        """인덱스/스탯 배율 캐시 무효화"""
+        self._dirty = True
+        self._modifiers = None
+
+    def _rebuild_index(self) -> None:
+        """상태 타입별 인덱스와 비트마스크 재구성"""
+        index: Dict[StatusType, StatusEffect] = {}
+        mask = 0
+        for effect in self._effects:
+            status_type = getattr(effect, 'status_type', None)
+            if status_type is None or status_type in index:
+                continue
+            index[status_type] = effect
+            mask |= STATUS_BITS.get(status_type, 0)
+        self._index = index
+        self._mask = mask
+        self._dirty = False
+
+    @property
+    def active_mask(self) -> int:
+        """활성 상태 타입 비트마스크 (STATUS_BITS 기준)"""
+        if self._dirty:
+            self._rebuild_index()
+        return self._mask
 
     def add_status(
         self,
@@ -255,6 +384,7 @@ class StatusManager:
                     f"{self.owner_name}: {status_effect.name} 지속시간 갱신 "
                     f"({existing.duration}턴)"
                 )
+            self._modifiers = None
 
             # 기절 상태이상 갱신 시에도 ATB 리셋 (기절이 새로 적용되는 경우)
             if status_effect.status_type == StatusType.STUN and self.owner:
@@ -279,7 +409,6 @@ class StatusManager:
         else:
             # 새로운 효과 추가
             self.status_effects.append(status_effect)
-            self.effects = self.status_effects
 
             logger.info(
                 f"{self.owner_name}: {status_effect.name} 추가 "
@@ -335,7 +464,6 @@ class StatusManager:
         effect = self.get_status(status_type)
         if effect:
             self.status_effects.remove(effect)
-            self.effects = self.status_effects
 
             logger.info(f"{self.owner_name}: {effect.name} 제거")
 
@@ -381,10 +509,9 @@ class StatusManager:
         Returns:
             해당하는 StatusEffect 또는 None
         """
-        for effect in self.status_effects:
-            if effect.status_type == status_type:
-                return effect
-        return None
+        if self._dirty:
+            self._rebuild_index()
+        return self._index.get(status_type)
 
     def has_status(self, status_type: StatusType) -> bool:
         """
@@ -396,7 +523,7 @@ class StatusManager:
         Returns:
             보유 여부
         """
-        return self.get_status(status_type) is not None
+        return self.active_mask & STATUS_BITS.get(status_type, 0) != 0
 
     def update_duration(self) -> List[StatusEffect]:
         """
@@ -446,7 +573,8 @@ class StatusManager:
                     "expired": True
                 })
 
-        self.effects = self.status_effects
+        # 지속시간 변화만 있어도 스탯 배율은 다시 계산
+        self._modifiers = None
         return expired
 
     def process_dot_effects(self, target: Any) -> Dict[str, Any]:
@@ -560,7 +688,6 @@ class StatusManager:
         """모든 상태 효과 제거"""
         cleared = self.status_effects.copy()
         self.status_effects.clear()
-        self.effects = self.status_effects
 
         logger.info(f"{self.owner_name}: 모든 상태 효과 제거 ({len(cleared)}개)")
 
@@ -578,19 +705,7 @@ class StatusManager:
         Returns:
             행동 가능하면 True, 불가능하면 False
         """
-        blocking_states = [
-            StatusType.STUN,
-            StatusType.SLEEP,
-            StatusType.FREEZE,
-            StatusType.PETRIFY,
-            StatusType.PARALYZE,
-            StatusType.TIME_STOP
-        ]
-
-        return not any(
-            effect.status_type in blocking_states
-            for effect in self.status_effects
-        )
+        return not self.active_mask & BLOCKING_MASK
 
     def can_use_skills(self) -> bool:
         """
@@ -599,15 +714,7 @@ class StatusManager:
         Returns:
             스킬 사용 가능하면 True, 불가능하면 False
         """
-        silencing_states = [
-            StatusType.SILENCE,
-            StatusType.MADNESS
-        ]
-
-        return not any(
-            effect.status_type in silencing_states
-            for effect in self.status_effects
-        )
+        return not self.active_mask & SILENCING_MASK
 
     def is_controlled(self) -> bool:
         """
@@ -616,16 +723,7 @@ class StatusManager:
         Returns:
             제어 불가 상태면 True
         """
-        control_states = [
-            StatusType.CHARM,
-            StatusType.DOMINATE,
-            StatusType.CONFUSION
-        ]
-
-        return any(
-            effect.status_type in control_states
-            for effect in self.status_effects
-        )
+        return bool(self.active_mask & CONTROL_MASK)
 
     def has_stealth(self) -> bool:
         """은신 상태 확인"""
@@ -633,16 +731,21 @@ class StatusManager:
 
     def has_invincibility(self) -> bool:
         """무적 상태 확인"""
-        return (self.has_status(StatusType.INVINCIBLE) or
-                self.has_status(StatusType.TEMPORARY_INVINCIBLE))
+        return bool(self.active_mask & INVINCIBLE_MASK)
 
     def get_stat_modifiers(self) -> Dict[str, float]:
         """
-        스탯 수정치 반환 (곱셈용 배율)
+        스탯 수정치 반환 (곱셈용 배율, 효과가 바뀔 때까지 캐시)
 
         Returns:
             스탯별 배율 딕셔너리
         """
+        if self._modifiers is None:
+            self._modifiers = self._compute_stat_modifiers()
+        return dict(self._modifiers)
+
+    def _compute_stat_modifiers(self) -> Dict[str, float]:
+        """상태 효과로부터 스탯 배율 계산"""
         modifiers: Dict[str, float] = {
             'physical_attack': 1.0,
             'magic_attack': 1.0,
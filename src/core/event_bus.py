@@ -4,8 +4,30 @@ Event Bus - 이벤트 기반 통신 시스템
 모든 시스템 간 통신은 이벤트를 통해 이루어집니다.
 """
 
-from typing import Callable, Dict, List, Any
-from collections import defaultdict
+from typing import Callable, Dict, List, Any, Deque, Iterator, Optional, Tuple
+from collections import defaultdict, deque
+from contextlib import contextmanager
+import atexit
+import time
+
+
+def _callback_name(callback: Callable) -> str:
+    """콜백 표시 이름 (모듈.한정이름)"""
+    name = getattr(callback, '__qualname__', None) or repr(callback)
+    module = getattr(callback, '__module__', None)
+    return f"{module}.{name}" if module else name
+
+
+class SubscriberStats:
+    """구독자 한 명의 누적 실행 통계"""
+
+    __slots__ = ("calls", "total_time", "max_time", "errors")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.errors = 0
 
 
 class EventBus:
@@ -13,23 +35,63 @@ class EventBus:
     이벤트 버스 - Pub/Sub 패턴 구현
 
     시스템 간 느슨한 결합을 위한 중앙 이벤트 관리자
+
+    구독자는 우선순위가 높은 순서(같으면 구독 순서)로 호출됩니다.
+    deferred() 블록 안에서 발행된 이벤트는 큐에 쌓였다가 블록이 끝날 때
+    발행 순서대로 한 번에 전달됩니다.
+    suppressed() 블록 안에서 발행된 이벤트는 기록/전달 없이 버려집니다.
+    enable_profiling()을 켜면 이벤트별 발행 횟수와 구독자별 누적/최대
+    실행 시간을 기록합니다.
     """
 
     def __init__(self) -> None:
+        # 이벤트별 구독자 (우선순위 순으로 정렬된 리스트)
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
-        self._event_history: List[tuple] = []
+        # 이벤트별 {콜백: 우선순위} (중복 확인용)
+        self._priorities: Dict[str, Dict[Callable, int]] = defaultdict(dict)
+        # 이벤트별 전달 스냅샷 (구독 변경 시에만 다시 만듦)
+        self._dispatch: Dict[str, Tuple[Callable, ...]] = {}
+
         self._max_history = 100
+        self._event_history: Deque[tuple] = deque(maxlen=self._max_history)
+
+        # 지연 전달 모드
+        self._defer_depth = 0
+        self._pending: Deque[tuple] = deque()
+
+        # 발행 차단 모드 (AI 탐색 등 되돌릴 시험 실행용)
+        self._suppress_depth = 0
+
+        # 콜백 실패 횟수 (이벤트 이름별, 항상 기록)
+        self.error_counts: Dict[str, int] = defaultdict(int)
 
-    def subscribe(self, event_name: str, callback: Callable[[Any], None]) -> None:
+        # 프로파일링 (선택)
+        self._profiling = False
+        self._publish_counts: Dict[str, int] = defaultdict(int)
+        self._subscriber_stats: Dict[Tuple[str, str], SubscriberStats] = {}
+        self._exit_report_registered = False
+
+    def subscribe(self, event_name: str, callback: Callable[[Any], None], priority: int = 0) -> None:
         """
         이벤트 구독
 
         Args:
             event_name: 이벤트 이름 (예: "combat.start")
             callback: 이벤트 발생 시 호출될 콜백 함수
+            priority: 우선순위 (높을수록 먼저 호출, 기본 0)
         """
-        if callback not in self._subscribers[event_name]:
-            self._subscribers[event_name].append(callback)
+        priorities = self._priorities[event_name]
+        if callback in priorities:
+            return
+        priorities[callback] = priority
+
+        # 같은 우선순위끼리는 구독 순서 유지
+        subscribers = self._subscribers[event_name]
+        index = len(subscribers)
+        while index > 0 and priorities.get(subscribers[index - 1], 0) < priority:
+            index -= 1
+        subscribers.insert(index, callback)
+        self._dispatch.pop(event_name, None)
 
     def unsubscribe(self, event_name: str, callback: Callable[[Any], None]) -> None:
         """
@@ -39,8 +101,10 @@ class EventBus:
             event_name: 이벤트 이름
             callback: 제거할 콜백 함수
         """
-        if callback in self._subscribers[event_name]:
+        priorities = self._priorities.get(event_name)
+        if priorities and priorities.pop(callback, None) is not None:
             self._subscribers[event_name].remove(callback)
+            self._dispatch.pop(event_name, None)
 
     def publish(self, event_name: str, data: Any = None) -> None:
         """
@@ -50,18 +114,196 @@ class EventBus:
             event_name: 이벤트 이름
             data: 이벤트 데이터
         """
+        if self._suppress_depth:
+            return
+
         # 이벤트 히스토리 기록
         self._event_history.append((event_name, data))
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
 
-        # 구독자들에게 이벤트 전달
-        for callback in self._subscribers[event_name]:
+        if self._profiling:
+            self._publish_counts[event_name] += 1
+
+        if self._defer_depth:
+            self._pending.append((event_name, data))
+            return
+
+        self._deliver(event_name, data)
+
+    def _deliver(self, event_name: str, data: Any) -> None:
+        """구독자들에게 이벤트 전달"""
+        callbacks = self._dispatch.get(event_name)
+        if callbacks is None:
+            subscribers = self._subscribers.get(event_name)
+            if not subscribers:
+                return
+            # 콜백 안에서 구독/해제해도 이번 전달 대상은 바뀌지 않도록 스냅샷 사용
+            callbacks = self._dispatch[event_name] = tuple(subscribers)
+
+        if self._profiling:
+            self._deliver_profiled(event_name, data, callbacks)
+            return
+
+        for callback in callbacks:
             try:
                 callback(data)
             except Exception as e:
-                # 콜백 실행 실패 시 로그 (Logger 순환 참조 방지를 위해 print 사용)
-                print(f"[EventBus] 이벤트 콜백 실행 실패: {event_name} - {str(e)}")
+                self._on_callback_error(event_name, e)
+
+    def _deliver_profiled(self, event_name: str, data: Any, callbacks: Tuple[Callable, ...]) -> None:
+        """구독자별 실행 시간을 측정하며 이벤트 전달"""
+        perf_counter = time.perf_counter
+        for callback in callbacks:
+            key = (event_name, _callback_name(callback))
+            stats = self._subscriber_stats.get(key)
+            if stats is None:
+                stats = self._subscriber_stats[key] = SubscriberStats()
+
+            start = perf_counter()
+            try:
+                callback(data)
+            except Exception as e:
+                stats.errors += 1
+                self._on_callback_error(event_name, e)
+            elapsed = perf_counter() - start
+
+            stats.calls += 1
+            stats.total_time += elapsed
+            if elapsed > stats.max_time:
+                stats.max_time = elapsed
+
+    def _on_callback_error(self, event_name: str, error: Exception) -> None:
+        """콜백 실행 실패 기록"""
+        self.error_counts[event_name] += 1
+        # 콜백 실행 실패 시 로그 (Logger 순환 참조 방지를 위해 print 사용)
+        print(f"[EventBus] 이벤트 콜백 실행 실패: {event_name} - {str(error)}")
+
+    def enable_profiling(self, report_on_exit: bool = False) -> None:
+        """
+        프로파일링 모드 켜기
+
+        Args:
+            report_on_exit: True면 프로세스 종료 시 보고서 출력
+        """
+        self._profiling = True
+        if report_on_exit and not self._exit_report_registered:
+            atexit.register(self._print_exit_report)
+            self._exit_report_registered = True
+
+    def disable_profiling(self) -> None:
+        """프로파일링 모드 끄기 (기록된 통계는 유지)"""
+        self._profiling = False
+
+    def reset_profile(self) -> None:
+        """프로파일링 통계 초기화"""
+        self._publish_counts.clear()
+        self._subscriber_stats.clear()
+        self.error_counts.clear()
+
+    def get_profile_stats(self) -> Dict[str, Any]:
+        """
+        프로파일링 통계 조회
+
+        Returns:
+            {"publish_counts": {이벤트: 횟수},
+             "subscribers": [{event, callback, calls, total_time, max_time, errors}, ...]
+                (누적 시간 내림차순),
+             "errors": {이벤트: 실패 횟수}}
+        """
+        subscribers = [
+            {
+                "event": event_name,
+                "callback": callback_name,
+                "calls": stats.calls,
+                "total_time": stats.total_time,
+                "max_time": stats.max_time,
+                "errors": stats.errors,
+            }
+            for (event_name, callback_name), stats in self._subscriber_stats.items()
+        ]
+        subscribers.sort(key=lambda entry: entry["total_time"], reverse=True)
+        return {
+            "publish_counts": dict(self._publish_counts),
+            "subscribers": subscribers,
+            "errors": dict(self.error_counts),
+        }
+
+    def get_profile_report(self, limit: Optional[int] = None) -> str:
+        """
+        프로파일링 보고서 문자열 (구독자 누적 시간 내림차순)
+
+        Args:
+            limit: 표시할 최대 구독자 수 (None이면 전체)
+
+        Returns:
+            보고서 문자열
+        """
+        stats = self.get_profile_stats()
+        lines = ["[EventBus] 이벤트 프로파일", "", "발행 횟수:"]
+        for event_name, count in sorted(stats["publish_counts"].items(), key=lambda item: -item[1]):
+            lines.append(f"  {count:8d}  {event_name}")
+
+        lines.append("")
+        lines.append(f"  {'누적(ms)':>10s} {'최대(ms)':>10s} {'평균(ms)':>10s} {'호출':>8s} {'실패':>6s}  이벤트 / 구독자")
+        subscribers = stats["subscribers"]
+        if limit is not None:
+            subscribers = subscribers[:limit]
+        for entry in subscribers:
+            average = entry["total_time"] / entry["calls"] if entry["calls"] else 0.0
+            lines.append(
+                f"  {entry['total_time'] * 1000:10.3f} {entry['max_time'] * 1000:10.3f} "
+                f"{average * 1000:10.4f} {entry['calls']:8d} {entry['errors']:6d}  "
+                f"{entry['event']} / {entry['callback']}"
+            )
+
+        if stats["errors"]:
+            lines.append("")
+            lines.append("콜백 실패:")
+            for event_name, count in sorted(stats["errors"].items(), key=lambda item: -item[1]):
+                lines.append(f"  {count:8d}  {event_name}")
+
+        return "\n".join(lines)
+
+    def _print_exit_report(self) -> None:
+        """종료 시 보고서 출력"""
+        if self._publish_counts or self._subscriber_stats:
+            print(self.get_profile_report())
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """
+        지연 전달 블록
+
+        블록 안에서 발행된 이벤트를 모아 두었다가 가장 바깥 블록이 끝날 때
+        발행 순서대로 전달합니다 (중첩 가능).
+        """
+        self._defer_depth += 1
+        try:
+            yield
+        finally:
+            self._defer_depth -= 1
+            if not self._defer_depth:
+                self.flush()
+
+    @contextmanager
+    def suppressed(self) -> Iterator[None]:
+        """
+        발행 차단 블록
+
+        블록 안에서 발행된 이벤트는 히스토리에도 남지 않고 구독자에게 전달되지
+        않습니다 (중첩 가능). 바깥 deferred() 블록에 쌓인 이벤트는 영향 없음.
+        """
+        self._suppress_depth += 1
+        try:
+            yield
+        finally:
+            self._suppress_depth -= 1
+
+    def flush(self) -> None:
+        """대기 중인 이벤트 전달 (전달 중 발행된 이벤트도 이어서 처리)"""
+        pending = self._pending
+        while pending:
+            event_name, data = pending.popleft()
+            self._deliver(event_name, data)
 
     def clear_subscribers(self, event_name: str = None) -> None:
         """
@@ -72,8 +314,12 @@ class EventBus:
         """
         if event_name:
             self._subscribers[event_name].clear()
+            self._priorities[event_name].clear()
+            self._dispatch.pop(event_name, None)
         else:
             self._subscribers.clear()
+            self._priorities.clear()
+            self._dispatch.clear()
 
     def get_event_history(self, event_name: str = None) -> List[tuple]:
         """
@@ -87,7 +333,7 @@ class EventBus:
         """
         if event_name:
             return [(name, data) for name, data in self._event_history if name == event_name]
-        return self._event_history.copy()
+        return list(self._event_history)
 
 
 # 전역 이벤트 버스 인스턴스
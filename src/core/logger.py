@@ -73,6 +73,10 @@ class Logger:
         file_handler.setFormatter(file_format)
         self.logger.addHandler(file_handler)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """해당 레벨 로그가 기록되는지 (logging.disable 반영)"""
+        return self.logger.isEnabledFor(level)
+
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """디버그 로그"""
         if extra:
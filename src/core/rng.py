@@ -0,0 +1,150 @@
+"""
+RNG - 서브시스템별 결정적 난수 스트림
+
+데미지 계산, 초기 ATB, 적 AI, 탐험 중 적 이동이 전역 random 모듈을 공유하면
+한 곳의 호출 횟수 변화가 다른 모든 결과를 바꿔 벤치마크가 흔들리고
+느린/어긋난 전투를 재현할 수 없습니다.
+
+세션/층 시드에서 이름별로 파생한 random.Random 스트림을 제공합니다.
+스트림 객체는 재시드해도 그대로 유지되므로 각 시스템은 한 번 받아 두고 계속 사용합니다.
+"""
+
+import hashlib
+import random
+from typing import Any, Dict, Optional, Tuple
+
+
+class RngStreams:
+    """난수 스트림 이름"""
+    DAMAGE = "damage"            # 데미지 분산, 크리티컬, 명중
+    ATB = "atb"                  # 전투 시작 시 초기 ATB
+    ENEMY_AI = "enemy_ai"        # 적 AI 스킬/대상 선택
+    EXPLORATION = "exploration"  # 탐험 중 적 이동
+    COMBAT = "combat"            # 전투 시드 파생 (기록/재생)
+
+
+# 전투 중에 소비하는 스트림 (전투 기록/재생 시 전투 시드로 고정)
+COMBAT_STREAMS = (RngStreams.DAMAGE, RngStreams.ATB, RngStreams.ENEMY_AI)
+
+
+def derive_seed(base_seed: int, name: str) -> int:
+    """
+    기준 시드와 이름으로 스트림 시드 파생
+
+    hash()는 문자열 해시가 프로세스마다 달라지므로 blake2b를 사용합니다.
+    """
+    digest = hashlib.blake2b(f"{base_seed}:{name}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class RngManager:
+    """
+    이름별 난수 스트림 관리자
+
+    seed가 None이면 각 스트림은 OS 엔트로피로 초기화됩니다 (기존 전역 random과 같은 성질).
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.seed: Optional[int] = seed
+        self._streams: Dict[str, random.Random] = {}
+        self._combat_counter = 0
+
+    def stream(self, name: str) -> random.Random:
+        """이름별 스트림 (처음 요청 시 생성)"""
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = random.Random(self._stream_seed(name))
+            self._streams[name] = rng
+        return rng
+
+    def _stream_seed(self, name: str) -> Optional[int]:
+        return None if self.seed is None else derive_seed(self.seed, name)
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """
+        기준 시드 변경 (기존 스트림 객체는 유지한 채 다시 시드)
+
+        Args:
+            seed: 세션/층 시드 (None이면 엔트로피)
+        """
+        self.seed = seed
+        self._combat_counter = 0
+        for name, rng in self._streams.items():
+            rng.seed(self._stream_seed(name))
+
+    def seed_streams(self, seed: Optional[int], names: Tuple[str, ...]) -> None:
+        """
+        지정한 스트림만 다시 시드 (기준 시드, 전투 카운터, 나머지 스트림은 유지)
+
+        Args:
+            seed: 스트림 시드를 파생할 기준값 (None이면 엔트로피)
+            names: 다시 시드할 스트림 이름들
+        """
+        for name in names:
+            self.stream(name).seed(None if seed is None else derive_seed(seed, name))
+
+    def next_combat_seed(self) -> int:
+        """
+        전투 시드 파생 (같은 층 시드에서 전투 순서대로 같은 값)
+
+        Returns:
+            전투 기록/재생에 쓰는 시드
+        """
+        self._combat_counter += 1
+        if self.seed is None:
+            return random.getrandbits(63)
+        return derive_seed(self.seed, f"{RngStreams.COMBAT}:{self._combat_counter}")
+
+    def get_state(self) -> Dict[str, Any]:
+        """모든 스트림 상태 (스냅샷용)"""
+        return {name: rng.getstate() for name, rng in self._streams.items()}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """get_state()로 저장한 상태 복원 (이후 생성된 스트림은 그대로)"""
+        for name, rng_state in state.items():
+            self.stream(name).setstate(rng_state)
+
+
+# 전역 인스턴스
+_rng_manager: Optional[RngManager] = None
+
+
+def get_rng_manager() -> RngManager:
+    """전역 난수 스트림 관리자"""
+    global _rng_manager
+    if _rng_manager is None:
+        _rng_manager = RngManager()
+    return _rng_manager
+
+
+def get_rng(name: str) -> random.Random:
+    """
+    이름별 난수 스트림
+
+    Args:
+        name: 스트림 이름 (RngStreams 상수)
+    """
+    return get_rng_manager().stream(name)
+
+
+def seed_all(seed: Optional[int]) -> None:
+    """
+    전역 random과 모든 스트림을 같은 시드로 고정
+
+    스트림으로 옮겨지지 않은 나머지 시스템(스킬 효과, 적 생성 등)까지
+    재현하려면 전역 random도 함께 시드해야 합니다.
+    """
+    random.seed(seed)
+    get_rng_manager().reseed(seed)
+
+
+def seed_combat(seed: Optional[int]) -> None:
+    """
+    전투 시드로 전역 random과 전투 스트림(COMBAT_STREAMS)만 고정
+
+    탐험 스트림과 층 시드/전투 카운터는 건드리지 않으므로 전투를 기록해도
+    이후 탐험 난수나 다음 전투 시드가 바뀌지 않습니다. 전역 random은 아직
+    스트림으로 옮겨지지 않은 전투 코드(스킬 효과 등) 재현에 필요합니다.
+    """
+    random.seed(seed)
+    get_rng_manager().seed_streams(seed, COMBAT_STREAMS)
@@ -13,6 +13,7 @@ from src.multiplayer.network import NetworkManager
 from src.multiplayer.protocol import MessageType, MessageBuilder, NetworkMessage
 from src.multiplayer.session import MultiplayerSession
 from src.core.logger import get_logger
+from src.combat.battlefield_analysis import BattlefieldAnalysis
 
 
 class BotBehavior(Enum):
@@ -63,6 +64,9 @@ class AIBot:
         self.explored_positions = set()
         self.target_position: Optional[tuple] = None
         self.last_direction = (0, 0)
+
+        # 공유 전장 분석 (전투 중 행동 결정 직전에 CombatUI가 설정, 적 AI와 같은 결과 재사용)
+        self.battlefield: Optional[BattlefieldAnalysis] = None
         
         # 메시지 핸들러 등록
         self._register_handlers()
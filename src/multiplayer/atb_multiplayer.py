@@ -61,6 +61,8 @@ class MultiplayerATBSystem(ATBSystem):
                 self.players_selecting_action.discard(player_id)
                 # 액션 확인 시간 기록 (전역 시간 - 모든 플레이어와 적에게 적용)
                 self.last_action_confirmed_time = time.time()
+                # 대기 중에는 모든 증가량(캐스팅 진행 포함)이 0이므로 다음 행동 시점 다시 계산
+                self.mark_dirty()
                 self.logger.debug(f"플레이어 {player_id} 행동 선택 완료 (모든 ATB 1.5초 정지)")
         except Exception as e:
             self.logger.error(f"플레이어 선택 상태 설정 실패: {e}", exc_info=True)
@@ -179,12 +181,15 @@ class MultiplayerATBSystem(ATBSystem):
         # 캐스팅 시스템 가져오기
         from src.combat.casting_system import get_casting_system
         casting_system = get_casting_system()
+        active_casts = casting_system.active_casts
         
         for combatant, gauge in self.gauges.items():
-            # 죽은 캐릭터는 ATB 업데이트 건너뛰기
+            # 죽은 캐릭터는 ATB 업데이트 건너뛰기 (시전 중이면 진행 정지)
             is_alive = getattr(combatant, 'is_alive', True)
             if not is_alive:
                 gauge.current = 0
+                if combatant in active_casts:
+                    casting_system.set_rate(combatant, None)
                 continue
             
             # ATB 증가량 계산 (멀티플레이 규칙 적용)
@@ -192,12 +197,12 @@ class MultiplayerATBSystem(ATBSystem):
             increase = self.calculate_atb_increase(combatant, delta_time, is_player_turn=False)
             
             # 캐스팅 중인지 확인
-            is_casting = casting_system.is_casting(combatant)
+            is_casting = combatant in active_casts
             gauge.is_casting = is_casting
             
             if is_casting:
-                # 캐스팅 중이면 캐스팅 진행도 업데이트
-                casting_system.update(combatant, int(increase))
+                # 캐스팅 중이면 틱당 캐스팅 진행량만 갱신
+                casting_system.set_rate(combatant, int(increase))
             else:
                 # 캐스팅 중이 아니면 항상 ATB 증가 (기절/수면 상태에서도 ATB는 증가해야 함)
                 # 기절이 풀리면 바로 행동할 수 있도록 ATB를 미리 채워둠
@@ -210,6 +215,44 @@ class MultiplayerATBSystem(ATBSystem):
                         "combatant": combatant,
                         "atb_gauge": gauge.current
                     })
+
+        # 캐스팅 진행 (완료 시점이 된 캐스팅만 처리)
+        casting_system.advance(1)
+    
+    def advance_to_next_ready(
+        self,
+        delta_time: float = 1.0,
+        max_ticks: Optional[int] = None,
+        is_player_turn: bool = False
+    ) -> int:
+        """
+        다음 행동 이벤트 시점까지 한 번에 진행 (멀티플레이 규칙 적용)
+        
+        액션 대기 시간(1.5초) 중에는 진행하지 않으며, 불릿타임에서는
+        게이지 업데이트 1회가 update() 호출 bullet_time_update_interval회에 해당합니다.
+        
+        Args:
+            delta_time: 틱당 경과 시간
+            max_ticks: 최대 진행 update() 호출 수 (None이면 제한 없음)
+            is_player_turn: 멀티플레이에서는 무시됨
+            
+        Returns:
+            건너뛴 update() 호출 수
+        """
+        if not self.enabled:
+            return 0
+        
+        self.cleanup_old_waits()
+        if self.is_in_action_wait():
+            return 0
+        
+        interval = self.bullet_time_update_interval if self._is_bullet_time_active() else 1
+        max_updates = None if max_ticks is None else max_ticks // interval
+        if max_updates == 0:
+            return 0
+        
+        updates = super().advance_to_next_ready(delta_time, max_updates, is_player_turn=False)
+        return updates * interval
     
     def clear_action_wait(self):
         """
@@ -217,6 +260,7 @@ class MultiplayerATBSystem(ATBSystem):
         """
         if self.last_action_confirmed_time is not None:
             self.last_action_confirmed_time = None
+            self.mark_dirty()
             self.logger.debug("액션 대기 시간 종료 (모든 ATB 재개)")
     
     def cleanup_old_waits(self):
@@ -1395,9 +1395,9 @@ class MultiplayerExplorationSystem(ExplorationSystem):
                 continue
             
             # 30% 확률로 이동 (적보다 덜 자주 이동)
-            if random.random() < 0.3:
+            if self.rng.random() < 0.3:
                 directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-                random.shuffle(directions)  # 랜덤 순서
+                self.rng.shuffle(directions)  # 랜덤 순서
                 
                 for dx, dy in directions:
                     new_x = x + dx
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from src.core.logger import get_logger, Loggers
 
 
@@ -611,28 +613,35 @@ def serialize_dungeon(dungeon: Any, enemies: List[Any] = None) -> Dict[str, Any]
     # 타일 데이터 압축 (변경된 타일만 저장)
     tiles_data = []
 
-    for y in range(dungeon.height):
-        for x in range(dungeon.width):
-            tile = dungeon.get_tile(x, y)
+    grid = getattr(dungeon, 'grid', None)
+    if grid is not None:
+        # 기본 VOID 타일은 저장 안 함 (배열에서 한 번에 걸러냄, 행 우선 순서 유지)
+        ys, xs = np.nonzero(~grid.type_mask(TileType.VOID) | grid.explored)
+        positions = zip(xs.tolist(), ys.tolist())
+    else:
+        positions = ((x, y) for y in range(dungeon.height) for x in range(dungeon.width))
 
-            # 기본 VOID 타일은 저장 안 함
-            if tile.tile_type == TileType.VOID and not tile.explored:
-                continue
+    for x, y in positions:
+        tile = dungeon.get_tile(x, y)
 
-            tiles_data.append({
-                "x": x,
-                "y": y,
-                "type": tile.tile_type.value,
-                "explored": tile.explored,
-                "visible": tile.visible,
-                "locked": tile.locked,
-                "key_id": tile.key_id,
-                "trap_damage": tile.trap_damage,
-                "teleport_target": tile.teleport_target,
-                "loot_id": tile.loot_id,
-                "ingredient_id": tile.ingredient_id,
-                "harvested": tile.harvested
-            })
+        # 기본 VOID 타일은 저장 안 함
+        if tile.tile_type == TileType.VOID and not tile.explored:
+            continue
+
+        tiles_data.append({
+            "x": x,
+            "y": y,
+            "type": tile.tile_type.value,
+            "explored": tile.explored,
+            "visible": tile.visible,
+            "locked": tile.locked,
+            "key_id": tile.key_id,
+            "trap_damage": tile.trap_damage,
+            "teleport_target": tile.teleport_target,
+            "loot_id": tile.loot_id,
+            "ingredient_id": tile.ingredient_id,
+            "harvested": tile.harvested
+        })
 
     # 채집 오브젝트 직렬화
     harvestables_data = []
@@ -6,8 +6,8 @@
 """
 
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
 from enum import Enum
+import re
 import tcod
 import random
 import pygame
@@ -19,11 +19,14 @@ from src.ui.tcod_display import render_space_background
 from src.ui.teamwork_gauge_display import TeamworkGaugeDisplay
 from src.combat.combat_manager import CombatManager, CombatState, ActionType
 from src.combat.casting_system import get_casting_system, CastingSystem
+from src.combat.combat_log import CombatLog, CombatLogFlag, CombatLogKind
 from src.core.logger import get_logger, Loggers
 from src.audio import play_sfx, play_bgm
 
 
 logger = get_logger(Loggers.UI)
+
+
 gauge_renderer = GaugeRenderer()
 casting_system = get_casting_system()
 
@@ -40,12 +43,11 @@ class CombatUIState(Enum):
     BATTLE_END = "battle_end"  # 전투 종료
 
 
-@dataclass
-class CombatMessage:
-    """전투 메시지"""
-    text: str
-    color: Tuple[int, int, int] = (255, 255, 255)
-    frames_remaining: int = 180  # 3초 (60 FPS 기준)
+# 전투 로그 창에 보관할 최대 메시지 수 (오래된 것부터 덮어씀)
+MESSAGE_LOG_CAPACITY = 1000
+
+# 기믹 수치 변화 패턴: "이름의 필드명: 숫자 -> 숫자"
+_GIMMICK_MESSAGE_PATTERN = re.compile(r'.+의\s+\w+:\s*\d+\s*->\s*\d+')
 
 
 class CombatUI:
@@ -81,8 +83,8 @@ class CombatUI:
         self.selected_item: Optional[Any] = None  # 선택된 아이템
         self.selected_item_index: Optional[int] = None  # 선택된 아이템 인덱스
 
-        # 메시지 로그 (스크롤 형식, 제한 없이 저장)
-        self.messages: List[CombatMessage] = []
+        # 메시지 로그 (스크롤 형식, 표시 텍스트는 그릴 때 생성)
+        self.message_log = CombatLog(MESSAGE_LOG_CAPACITY)
         self.log_scroll_offset = 0  # 스크롤 오프셋 (0이면 최신 메시지)
         self.log_visible_lines = 12  # 화면에 표시할 메시지 라인 수 (8 -> 12로 증가)
 
@@ -474,7 +476,7 @@ class CombatUI:
             # 위로 스크롤 (오래된 메시지 보기)
             self.log_scroll_offset = min(
                 self.log_scroll_offset + 3,
-                max(0, len(self.messages) - self.log_visible_lines)
+                max(0, len(self.message_log) - self.log_visible_lines)
             )
             return False
         elif action == GameAction.PAGE_DOWN:
@@ -996,7 +998,7 @@ class CombatUI:
                         # 플레이어 턴: 일반 UI 표시
                         self.action_menu = self._create_action_menu(self.current_actor)
                         self.state = CombatUIState.ACTION_MENU
-                        self.add_message(f"{next_ally.name}의 턴!", (100, 255, 255))
+                        self.add_record(CombatLogKind.TURN_START, actor=next_ally)
                         play_sfx("ui", "cursor_select")
                     
                     # 불릿타임 활성화
@@ -1041,52 +1043,39 @@ class CombatUI:
                 attacker = self.current_actor
                 target = self.selected_target
                 if attacker and target:
-                    attacker_name = getattr(attacker, 'name', '알 수 없음')
-                    target_name = getattr(target, 'name', '알 수 없음')
-
                     # 아군/적 구분
-                    is_attacker_ally = attacker in self.combat_manager.allies
-                    is_target_ally = target in self.combat_manager.allies
-
-                    attacker_type = "아군" if is_attacker_ally else "적"
-                    target_type = "아군" if is_target_ally else "적"
-
-                    msg = f"[빗나감] {attacker_type} {attacker_name}의 공격이 {target_type} {target_name}에게 빗나갔다!"
-                    color = (150, 150, 150)
+                    flags = CombatLogFlag.NONE
+                    if attacker in self.combat_manager.allies:
+                        flags |= CombatLogFlag.ACTOR_ALLY
+                    if target in self.combat_manager.allies:
+                        flags |= CombatLogFlag.TARGET_ALLY
+                    self.add_record(CombatLogKind.MISS, actor=attacker, target=target, flags=flags)
                 else:
-                    msg = "[빗나감] 공격이 빗나갔다!"
-                    color = (150, 150, 150)
+                    self.add_message("[빗나감] 공격이 빗나갔다!", (150, 150, 150))
             else:
-                msg = f"BRV 공격! {damage} 데미지"
+                flags = CombatLogFlag.NONE
                 if is_crit:
-                    msg += " [크리티컬!]"
+                    flags |= CombatLogFlag.CRITICAL
                 if is_break:
-                    msg += " [BREAK!]"
-
-                color = (255, 255, 100) if is_crit else (200, 200, 200)
-
-            self.add_message(msg, color)
+                    flags |= CombatLogFlag.BREAK
+                self.add_record(CombatLogKind.BRV_ATTACK, amount=damage, flags=flags)
 
         elif action == "hp_attack":
             damage = result.get("hp_damage", 0)
             is_ko = result.get("is_ko", False)
 
-            msg = f"HP 공격! {damage} HP 데미지"
-            if is_ko:
-                msg += " [격파!]"
-
-            color = (255, 100, 100)
-            self.add_message(msg, color)
+            flags = CombatLogFlag.KO if is_ko else CombatLogFlag.NONE
+            self.add_record(CombatLogKind.HP_ATTACK, amount=damage, flags=flags)
 
         elif action == "defend":
-            self.add_message("방어 자세!", (100, 200, 255))
+            self.add_record(CombatLogKind.DEFEND)
 
         elif action == "flee":
             success = result.get("success", False)
             if success:
-                self.add_message("도망쳤다!", (255, 255, 100))
+                self.add_record(CombatLogKind.FLEE_SUCCESS)
             else:
-                self.add_message("도망칠 수 없다!", (255, 100, 100))
+                self.add_record(CombatLogKind.FLEE_FAILED)
 
         elif action == "skill":
             skill_name = result.get("skill_name", "스킬")
@@ -1095,15 +1084,13 @@ class CombatUI:
             if success:
                 message = result.get("message", f"{skill_name} 사용!")
                 # 여러 줄 메시지에서 기믹 관련 줄 필터링
-                import re
                 lines = message.split("\n")
                 filtered_lines = []
                 for line in lines:
                     # "  → "로 시작하는 효과 메시지 체크
                     if line.strip().startswith("→"):
                         # 기믹 수치 변화 패턴 체크
-                        gimmick_pattern = r'.+의\s+\w+:\s*\d+\s*->\s*\d+'
-                        if re.search(gimmick_pattern, line):
+                        if _GIMMICK_MESSAGE_PATTERN.search(line):
                             # 기믹 관련 메시지는 제외
                             continue
                     filtered_lines.append(line)
@@ -1300,24 +1287,9 @@ class CombatUI:
                 status_name = blocking_status or "행동 불가 상태"
                 self.add_message(f"{actor.name}(은)는 {status_name}로 인해 행동할 수 없습니다...", (200, 100, 100))
                 logger.info(f"{actor.name} 턴 자동 스킵: {status_name}")
-                
-                # 상태이상 지속시간 감소
-                expired = actor.status_manager.update_duration()
-                if expired:
-                    logger.debug(f"{actor.name}: {len(expired)}개 상태 효과 만료 (행동 불가 중)")
             
-            # ATB 소비 및 턴 스킵
-            # 기절 상태일 때는 ATB를 완전히 소비하여 무한 루프 방지
-            gauge = self.combat_manager.atb.get_gauge(actor)
-            if gauge:
-                # ATB를 threshold 아래로 강제로 내림 (무한 루프 방지)
-                gauge.current = max(0, gauge.current - gauge.threshold)
-                # threshold보다 높으면 threshold만큼만 남기고 나머지 소비
-                if gauge.current >= gauge.threshold:
-                    gauge.current = gauge.threshold - 1
-            
-            self.combat_manager.atb.consume_atb(actor)
-            self.combat_manager._on_turn_end(actor)
+            # 상태이상 지속시간 감소, ATB 소비 및 턴 스킵
+            self.combat_manager.skip_turn(actor)
             
             # 상태를 WAITING_ATB로 명확히 설정 (무한 대기 방지)
             self.state = CombatUIState.WAITING_ATB
@@ -1360,23 +1332,8 @@ class CombatUI:
                         self.add_message(f"{actor.name}(은)는 {status_name}로 인해 행동할 수 없습니다...", (200, 100, 100))
                         logger.info(f"{actor.name} 턴 자동 스킵: {status_name}")
                         
-                        # 상태이상 지속시간 감소
-                        expired = actor.status_manager.update_duration()
-                        if expired:
-                            logger.debug(f"{actor.name}: {len(expired)}개 상태 효과 만료 (행동 불가 중)")
-                        
-                        # ATB 소비 및 턴 스킵
-                        # 기절 상태일 때는 ATB를 완전히 소비하여 무한 루프 방지
-                        gauge = self.combat_manager.atb.get_gauge(actor)
-                        if gauge:
-                            # ATB를 threshold 아래로 강제로 내림 (무한 루프 방지)
-                            gauge.current = max(0, gauge.current - gauge.threshold)
-                            # threshold보다 높으면 threshold만큼만 남기고 나머지 소비
-                            if gauge.current >= gauge.threshold:
-                                gauge.current = gauge.threshold - 1
-                        
-                        self.combat_manager.atb.consume_atb(actor)
-                        self.combat_manager._on_turn_end(actor)
+                        # 상태이상 지속시간 감소, ATB 소비 및 턴 스킵
+                        self.combat_manager.skip_turn(actor)
                         
                         # 상태는 WAITING_ATB로 명확히 설정 (무한 대기 방지)
                         self.state = CombatUIState.WAITING_ATB
@@ -1388,9 +1345,12 @@ class CombatUI:
                         self.current_actor = actor
                         self.action_menu = self._create_action_menu(actor)
                         self.state = CombatUIState.ACTION_MENU
-                        self.add_message(f"{actor.name}의 턴!", (100, 255, 255))
+                        self.add_record(CombatLogKind.TURN_START, actor=actor)
                         play_sfx("ui", "cursor_select")
 
+                        # 행동 선택 중에 보스 AI 탐색 (ATB가 차면 바로 결정)
+                        self.combat_manager.prefetch_enemy_decisions()
+
         # 전투 종료 체크
         if self.combat_manager.state in [CombatState.VICTORY, CombatState.DEFEAT, CombatState.FLED]:
             if not self.battle_ended:
@@ -1398,11 +1358,6 @@ class CombatUI:
                 self.battle_ended = True
                 self.battle_result = self.combat_manager.state
                 self.state = CombatUIState.BATTLE_END
-    
-        # 메시지 타이머 감소 (표시용이지만, 메시지는 사라지지 않고 계속 저장됨)
-        for msg in self.messages:
-            msg.frames_remaining -= 1
-        # 메시지는 제거하지 않음 (스크롤로 항상 볼 수 있도록)
 
         # 불릿타임 해제 체크: 행동 선택이 완료되면 불릿타임 해제
         if is_multiplayer and hasattr(self.combat_manager.atb, 'set_player_selecting'):
@@ -1476,7 +1431,8 @@ class CombatUI:
             return
         
         try:
-            # 봇 AI로 행동 결정
+            # 봇 AI로 행동 결정 (공유 전장 분석은 결정 전에 봇에 설정)
+            bot.battlefield = self.combat_manager.get_battlefield_analysis()
             action = bot.decide_action(
                 character=actor,
                 allies=self.combat_manager.allies,
@@ -1547,8 +1503,8 @@ class CombatUI:
         Args:
             actor: 행동자
         """
-        # 살아있는 적 찾기
-        alive_enemies = [e for e in self.combat_manager.enemies if getattr(e, 'is_alive', True)]
+        # 살아있는 적 찾기 (공유 전장 분석)
+        alive_enemies = self.combat_manager.get_battlefield_analysis().enemies.alive
         
         if not alive_enemies:
             return
@@ -1677,6 +1633,8 @@ class CombatUI:
                     
                     try:
                         # 봇 행동 결정 메서드 호출 (decide_action 우선, 없으면 auto_combat_action)
+                        # 공유 전장 분석은 결정 전에 봇에 설정
+                        bot.battlefield = self.combat_manager.get_battlefield_analysis()
                         if hasattr(bot, 'decide_action'):
                             action_data = bot.decide_action(
                                 character=combatant,
@@ -1755,7 +1713,7 @@ class CombatUI:
                     self.current_actor = combatant
                     self.action_menu = self._create_action_menu(self.current_actor)  # actor 전달
                     self.state = CombatUIState.ACTION_MENU
-                    self.add_message(f"{combatant.name}의 턴!", (100, 255, 255))
+                    self.add_record(CombatLogKind.TURN_START, actor=combatant)
                     
                     # 멀티플레이: 행동 선택 시작 알림 (불릿타임 모드 진입)
                     # 현재 액터가 어떤 플레이어의 캐릭터든 불릿타임 활성화
@@ -1817,24 +1775,31 @@ class CombatUI:
                     self.state = CombatUIState.BATTLE_END
 
     def add_message(self, text: str, color: Tuple[int, int, int] = (255, 255, 255)):
-        """메시지 추가 (스크롤 형식 - 제한 없이 계속 저장)"""
+        """메시지 추가 (스크롤 형식 - 최근 MESSAGE_LOG_CAPACITY개 저장)"""
         # 기믹 관련 수치 증감 메시지 필터링 (예: "이름의 필드: 값 -> 값" 형식)
-        import re
-        # 기믹 수치 변화 패턴 체크: "이름의 필드명: 숫자 -> 숫자" 또는 "이름의 필드명: 숫자 -> 숫자"
-        gimmick_pattern = r'.+의\s+\w+:\s*\d+\s*->\s*\d+'
-        if re.match(gimmick_pattern, text):
+        if _GIMMICK_MESSAGE_PATTERN.match(text):
             # 기믹 관련 메시지는 로그에 추가하지 않음
             logger.debug(f"기믹 메시지 필터링됨: {text}")
             return
         
-        msg = CombatMessage(text=text, color=color)
-        self.messages.append(msg)
+        self.message_log.message(text, color)
 
         # 새로운 메시지가 추가되면 스크롤을 최신으로 리셋 (위에 있는 로그부터 사라지도록)
         self.log_scroll_offset = 0
         
         logger.debug(f"전투 메시지: {text}")
 
+    def add_record(self, kind: CombatLogKind, **fields: Any):
+        """
+        타입이 있는 메시지 추가 (표시 텍스트는 _render_messages에서 생성)
+
+        Args:
+            kind: 레코드 종류
+            **fields: CombatLog.record 인자 (actor, target, amount, flags 등)
+        """
+        self.message_log.record(kind, **fields)
+        self.log_scroll_offset = 0
+
     def render(self, console: tcod.console.Console):
         """렌더링"""
         # 필드 효과에 따른 배경 색상 변경
@@ -2173,7 +2138,7 @@ class CombatUI:
         console.print(msg_x, msg_y - 1, "[전투 로그]" + separator, fg=(150, 150, 150))
         
         # 메시지 목록 (오래된 것부터 정렬)
-        total_messages = len(self.messages)
+        total_messages = len(self.message_log)
         
         # 스크롤 가능한 범위 계산
         max_scroll = max(0, total_messages - self.log_visible_lines)
@@ -2189,15 +2154,16 @@ class CombatUI:
         start_idx = max(0, total_messages - self.log_visible_lines - self.log_scroll_offset)
         end_idx = total_messages - self.log_scroll_offset
         
-        # 메시지 표시 (오래된 것부터 위로)
-        display_messages = self.messages[start_idx:end_idx]
-        for i, msg in enumerate(display_messages):
+        # 메시지 표시 (오래된 것부터 위로, 표시되는 레코드만 텍스트로 변환)
+        display_records = self.message_log.records(start_idx, end_idx)
+        for i, record in enumerate(display_records):
             if i >= self.log_visible_lines:
                 break
             
             # 텍스트가 너무 길면 잘라내기
-            display_text = msg.text[:msg_width] if len(msg.text) > msg_width else msg.text
-            console.print(msg_x, msg_y + i, display_text, fg=msg.color)
+            text = self.message_log.format(record)
+            display_text = text[:msg_width] if len(text) > msg_width else text
+            console.print(msg_x, msg_y + i, display_text, fg=self.message_log.color_of(record))
         
         # 스크롤 가능 여부 표시
         if total_messages > self.log_visible_lines:
@@ -10,7 +10,9 @@ from collections import deque
 import random
 
 from src.world.tile import Tile, TileType
+from src.world.tile_grid import TileGrid, TileRows
 from src.core.logger import get_logger, Loggers
+from src.core.rng import get_rng_manager
 
 
 logger = get_logger(Loggers.WORLD)
@@ -70,7 +72,8 @@ class DungeonMap:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.tiles: List[List[Tile]] = []
+        self.grid = TileGrid(width, height)
+        self._tiles = TileRows(self.grid)
         self.rooms: List[Rect] = []
         self.corridors: List[Tuple[int, int]] = []
 
@@ -94,31 +97,28 @@ class DungeonMap:
         # 생성 시드 (재생성용)
         self.generation_seed: Optional[int] = None
 
-        # 타일 초기화
-        self._initialize_tiles()
-
-    def _initialize_tiles(self):
-        """타일 초기화 (모두 VOID로)"""
-        self.tiles = [
-            [Tile(TileType.VOID, x, y) for x in range(self.width)]
-            for y in range(self.height)
-        ]
+    @property
+    def tiles(self) -> TileRows:
+        """tiles[y][x] 하위 호환 뷰 (새 코드는 get_tile/grid 사용)"""
+        return self._tiles
 
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
-        """타일 가져오기"""
+        """타일 가져오기 (일반 타일은 배열을 읽고 쓰는 TileView)"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x]
+            return self.grid.get(x, y)
         return None
 
     def set_tile(self, x: int, y: int, tile_type: TileType, **kwargs):
         """타일 설정"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.tiles[y][x] = Tile(tile_type, x, y, **kwargs)
+            self.grid.set(x, y, tile_type, **kwargs)
 
     def is_walkable(self, x: int, y: int) -> bool:
         """이동 가능 여부"""
-        tile = self.get_tile(x, y)
-        return tile is not None and tile.walkable and not tile.locked
+        if 0 <= x < self.width and 0 <= y < self.height:
+            grid = self.grid
+            return bool(grid.walkable[y, x]) and not grid.locked[y, x]
+        return False
 
 
 class DungeonGenerator:
@@ -154,6 +154,8 @@ class DungeonGenerator:
             # 층별로 다른 시드를 사용하도록 보정 (같은 시드로 다른 층 생성)
             floor_seed = seed + floor_number * 1000
             random.seed(floor_seed)
+            # 데미지/ATB/적 AI/적 이동 스트림도 층 시드에서 파생
+            get_rng_manager().reseed(floor_seed)
             logger.info(f"던전 생성 시작: {self.width}x{self.height}, 층 {floor_number}, 시드 {floor_seed}")
         else:
             logger.info(f"던전 생성 시작: {self.width}x{self.height}, 층 {floor_number} (랜덤 시드)")
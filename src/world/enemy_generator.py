@@ -638,9 +638,25 @@ class SimpleEnemy:
 
         return actual_damage
 
-    def heal(self, amount: int) -> int:
-        """회복"""
-        actual_heal = min(amount, self.max_hp - self.current_hp)
+    def heal(self, amount: int, can_revive: bool = False, source_character=None, is_self_skill: bool = False) -> int:
+        """
+        회복 (Character.heal과 같은 시그니처 - HealEffect가 키워드 인자를 넘김)
+
+        Args:
+            amount: 회복량
+            can_revive: 죽은 적도 회복 가능한지 여부
+            source_character: 회복을 제공한 캐릭터 (적은 사용하지 않음)
+            is_self_skill: 본인 스킬로 인한 회복인지 여부 (적은 사용하지 않음)
+
+        Returns:
+            실제로 회복한 양
+        """
+        if not self.is_alive:
+            if not (can_revive and amount > 0):
+                return 0
+            self.is_alive = True
+            self.current_hp = 0
+        actual_heal = max(0, min(amount, self.max_hp - self.current_hp))
         self.current_hp += actual_heal
         return actual_heal
 
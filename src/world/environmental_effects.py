@@ -1,8 +1,10 @@
 from enum import Enum
 from dataclasses import dataclass
-from typing import Set, Dict, Any, Optional
+from typing import Set, Dict, Any, Optional, Tuple
 import random
 
+import numpy as np
+
 from src.core.logger import get_logger
 
 logger = get_logger("environmental_effects")
@@ -113,6 +115,9 @@ class EnvironmentalEffectManager:
     
     def __init__(self):
         self.active_effects: Dict[EnvironmentalEffectType, EnvironmentalEffect] = {}
+        # 렌더링용 타일별 오버레이 색상 레이어 캐시 (효과 구성이 바뀌면 다시 계산)
+        self._color_layer_key = None
+        self._color_layer: Optional[Tuple[np.ndarray, np.ndarray]] = None
     
     def add_effect(self, effect: EnvironmentalEffect):
         """효과 추가"""
@@ -144,6 +149,36 @@ class EnvironmentalEffectManager:
                 effects.append(effect)
         return effects
     
+    def color_layer(self, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        맵 전체 [y, x] 오버레이 색상 레이어
+
+        get_effects_at_tile()의 첫 번째 효과 색상과 같도록, 타일마다 먼저 추가된 효과가 우선합니다.
+        효과 목록이나 affected_tiles가 바뀌었을 때만 다시 계산합니다.
+
+        Returns:
+            (오버레이 여부 마스크 [h, w] bool, 오버레이 색상 [h, w, 3] uint8)
+        """
+        key = (width, height, tuple(
+            (effect_type, id(effect.affected_tiles), len(effect.affected_tiles or ()))
+            for effect_type, effect in self.active_effects.items()
+        ))
+        if key != self._color_layer_key:
+            mask = np.zeros((height, width), dtype=bool)
+            colors = np.zeros((height, width, 3), dtype=np.uint8)
+            # 나중 효과부터 칠해서 먼저 추가된 효과가 덮어쓰도록
+            for effect in reversed(list(self.active_effects.values())):
+                if not effect.affected_tiles:
+                    continue
+                xs, ys = np.array(list(effect.affected_tiles), dtype=np.intp).reshape(-1, 2).T
+                inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+                ys, xs = ys[inside], xs[inside]
+                mask[ys, xs] = True
+                colors[ys, xs] = effect.color_overlay
+            self._color_layer_key = key
+            self._color_layer = (mask, colors)
+        return self._color_layer
+
     def apply_tile_effects(self, player: Any, x: int, y: int, is_movement: bool = False) -> list:
         """
         타일의 모든 효과 적용
@@ -13,7 +13,9 @@ import time
 from src.world.dungeon_generator import DungeonMap
 from src.world.tile import Tile, TileType
 from src.world.fov import FOVSystem
+from src.world.flow_field import FlowField
 from src.core.logger import get_logger, Loggers
+from src.core.rng import RngStreams, get_rng
 from src.audio import play_sfx
 
 # ExplorationEvent를 먼저 정의하여 import 순서 문제 방지
@@ -113,6 +115,11 @@ class ExplorationSystem:
 
     def __init__(self, dungeon: DungeonMap, party: List[Any], floor_number: int = 1, inventory=None, game_stats=None):
         self.dungeon = dungeon
+        # 적/NPC 이동 전용 난수 스트림 (층 시드에서 파생)
+        self.rng = get_rng(RngStreams.EXPLORATION)
+        # 적 이동 틱 동안 모든 추적 적이 공유하는 플레이어 방향 거리 맵 (틱마다 한 번 계산)
+        self._chase_field: Optional[FlowField] = None
+        self._share_chase_field = False
 
         # 플레이어 스폰 위치 결정 (계단이 아닌 첫 번째 방의 안전한 위치)
         spawn_x, spawn_y = 5, 5  # 기본값
@@ -205,21 +212,21 @@ class ExplorationSystem:
         # 마을에서는 모든 타일을 보이게 함
         if hasattr(self, 'is_town') and self.is_town:
             # 모든 타일을 visible과 explored로 설정
-            for y in range(self.dungeon.height):
-                for x in range(self.dungeon.width):
-                    tile = self.dungeon.get_tile(x, y)
-                    if tile:
-                        tile.visible = True
-                        tile.explored = True
-            # explored_tiles에도 추가
-            for y in range(self.dungeon.height):
-                for x in range(self.dungeon.width):
-                    self.explored_tiles.add((x, y))
+            grid = self.dungeon.grid
+            if not (grid.visible.all() and grid.explored.all()):
+                grid.visible[:] = True
+                grid.explored[:] = True
+                grid.mark_all_dirty()
+            self.fov_system.reset()
+            # explored_tiles에도 추가 (이미 전부 있으면 생략)
+            if len(self.explored_tiles) < self.dungeon.width * self.dungeon.height:
+                for y in range(self.dungeon.height):
+                    for x in range(self.dungeon.width):
+                        self.explored_tiles.add((x, y))
             logger.debug("[update_fov] 마을: 모든 타일을 보이게 설정")
             return
-        
-        # 이전 visible 초기화
-        self.fov_system.clear_visibility(self.dungeon)
+
+        # 이전 visible은 compute_fov가 달라진 셀만 갱신 (맵 전체 초기화 없음)
 
         # 기본 시야 반지름 (3)
         base_radius = 3
@@ -1324,8 +1331,27 @@ class ExplorationSystem:
             logger.debug("[적 이동] 이동할 적이 없습니다")
             return
         logger.debug(f"[적 이동] {len(self.enemies)}마리 적 이동 시작")
-        for enemy in self.enemies:
-            self._move_enemy(enemy)
+        # 이번 틱의 추적 거리 맵은 처음 필요할 때 한 번만 계산해 모든 적이 공유
+        self._chase_field = None
+        self._share_chase_field = True
+        try:
+            for enemy in self.enemies:
+                self._move_enemy(enemy)
+        finally:
+            self._share_chase_field = False
+            self._chase_field = None
+
+    def _get_chase_field(self) -> FlowField:
+        """모든 플레이어(봇 포함)까지의 거리 맵 (적 이동 틱 안에서는 공유)"""
+        if self._chase_field is not None:
+            return self._chase_field
+        field = FlowField.toward(
+            self.dungeon,
+            [(t.x, t.y) for t in self._chase_targets() if hasattr(t, 'x') and hasattr(t, 'y')]
+        )
+        if self._share_chase_field:
+            self._chase_field = field
+        return field
 
     def _move_enemy(self, enemy: Enemy):
         """단일 적 움직임"""
@@ -1359,7 +1385,7 @@ class ExplorationSystem:
 
             # 추적 중이면 플레이어 방향으로 이동
             if enemy.is_chasing:
-                self._move_enemy_towards(enemy, self.player.x, self.player.y)
+                self._chase_nearest_target(enemy)
 
         # 추적하지 않을 때
         if not enemy.is_chasing:
@@ -1367,15 +1393,22 @@ class ExplorationSystem:
             if enemy.x != enemy.spawn_x or enemy.y != enemy.spawn_y:
                 self._move_enemy_towards(enemy, enemy.spawn_x, enemy.spawn_y)
 
+    def _chase_nearest_target(self, enemy: Enemy):
+        """가장 가까운 플레이어(봇 포함)를 향해 한 칸 추적"""
+        # 플레이어까지의 공유 거리 맵을 따라 벽을 돌아서 이동
+        steps = self._get_chase_field().steps(enemy.x, enemy.y, self.rng)
+        if steps:
+            for new_x, new_y in steps:
+                if self._try_move_enemy(enemy, new_x, new_y):
+                    return
+            return
+
+        # 어떤 플레이어에게도 닿을 수 없으면 가장 가까운 플레이어 방향으로 한 칸 (기존 방식)
+        target = self._find_nearest_target(enemy) or self.player
+        self._move_enemy_towards(enemy, target.x, target.y)
+
     def _move_enemy_towards(self, enemy: Enemy, target_x: int, target_y: int):
-        """적을 목표 위치로 한 칸 이동 (가장 가까운 플레이어 추적)"""
-        # 목표 재설정: 가장 가까운 플레이어(봇 포함) 찾기
-        target = self._find_nearest_target(enemy)
-        if target:
-            target_x, target_y = target.x, target.y
-            
-        old_x, old_y = enemy.x, enemy.y
-        
+        """적을 목표 위치로 한 칸 이동 (맨하탄 방향, 스폰 복귀 등)"""
         # 이동 방향 결정 (맨하탄 거리 기반)
         dx = 0
         dy = 0
@@ -1392,7 +1425,7 @@ class ExplorationSystem:
 
         # 대각선 이동 or 직선 이동 선택
         # 50% 확률로 X축 우선, 50% 확률로 Y축 우선
-        if random.random() < 0.5 and dx != 0:
+        if self.rng.random() < 0.5 and dx != 0:
             new_x, new_y = enemy.x + dx, enemy.y
         elif dy != 0:
             new_x, new_y = enemy.x, enemy.y + dy
@@ -1401,6 +1434,12 @@ class ExplorationSystem:
         else:
             return  # 이미 목표 위치에 도착
 
+        self._try_move_enemy(enemy, new_x, new_y)
+
+    def _try_move_enemy(self, enemy: Enemy, new_x: int, new_y: int) -> bool:
+        """적을 (new_x, new_y)로 이동 시도 (이동했으면 True)"""
+        old_x, old_y = enemy.x, enemy.y
+
         # 이동 가능 여부 확인
         if self.dungeon.is_walkable(new_x, new_y):
             # 플레이어 위치로 이동하려고 하면 전투 트리거
@@ -1411,22 +1450,23 @@ class ExplorationSystem:
                 enemy.x = new_x
                 enemy.y = new_y
                 logger.info(f"[적 이동] {enemy.name}이(가) 플레이어 위치로 이동 - 전투 트리거 예정")
-                return  # 전투는 move_player에서 처리됨
-            
+                return True  # 전투는 move_player에서 처리됨
+
             # 다른 적과 겹치지 않는지 확인
             enemy_at_target = self.get_enemy_at(new_x, new_y)
-            
+
             if not enemy_at_target:
                 enemy.x = new_x
                 enemy.y = new_y
                 logger.debug(f"[적 이동] {enemy.name} 이동: ({old_x}, {old_y}) -> ({new_x}, {new_y})")
-            else:
-                logger.debug(f"[적 이동] {enemy.name} 이동 실패: 목표 타일이 차있음 ({new_x}, {new_y})")
+                return True
+            logger.debug(f"[적 이동] {enemy.name} 이동 실패: 목표 타일이 차있음 ({new_x}, {new_y})")
         else:
             logger.debug(f"[적 이동] {enemy.name} 이동 실패: 목표 타일이 이동 불가능 ({new_x}, {new_y})")
+        return False
 
-    def _find_nearest_target(self, enemy: Enemy) -> Any:
-        """적에게 가장 가까운 대상(플레이어 또는 봇) 찾기"""
+    def _chase_targets(self) -> List[Any]:
+        """적이 추적하는 대상들 (로컬 플레이어 + 멀티플레이 세션 플레이어/봇)"""
         targets = []
         
         # 1. 로컬 플레이어
@@ -1438,12 +1478,15 @@ class ExplorationSystem:
                 # 로컬 플레이어는 이미 추가했으므로 제외 (PID 비교가 안전하지만 객체 비교도 가능)
                 if pid != getattr(self.player, 'player_id', None):
                     targets.append(p)
-                    
+        return targets
+
+    def _find_nearest_target(self, enemy: Enemy) -> Any:
+        """적에게 가장 가까운 대상(플레이어 또는 봇) 찾기"""
         # 가장 가까운 타겟 찾기
         nearest = None
         min_dist = float('inf')
-        
-        for t in targets:
+
+        for t in self._chase_targets():
             if hasattr(t, 'x') and hasattr(t, 'y'):
                 dist = abs(enemy.x - t.x) + abs(enemy.y - t.y)
                 if dist < min_dist:
@@ -2197,9 +2240,9 @@ class ExplorationSystem:
                 continue
             
             # 30% 확률로 이동 (적보다 덜 자주 이동)
-            if random.random() < 0.3:
+            if self.rng.random() < 0.3:
                 directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-                random.shuffle(directions)  # 랜덤 순서
+                self.rng.shuffle(directions)  # 랜덤 순서
                 
                 for dx, dy in directions:
                     new_x = x + dx
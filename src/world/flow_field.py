@@ -0,0 +1,82 @@
+"""
+플로우 필드 (Dijkstra 거리 맵)
+
+모든 목표(살아 있는 플레이어) 위치에서 동시에 퍼져 나간 이동 거리를 맵 전체 [y, x] 배열로 계산합니다.
+적 이동 틱마다 한 번만 만들어 추적 중인 모든 적이 공유하므로
+비용은 적 수 × 플레이어 수가 아니라 맵 크기에 비례하고, 벽을 돌아가는 경로도 찾습니다.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+import tcod.path
+
+from src.world.dungeon_generator import DungeonMap
+
+
+# 적은 상하좌우로만 이동
+CARDINAL_DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# 어떤 목표에도 닿지 않는 셀의 거리
+UNREACHABLE = np.iinfo(np.int32).max
+
+
+class FlowField:
+    """목표 지점들까지의 거리 맵"""
+
+    __slots__ = ("distance",)
+
+    def __init__(self, distance: np.ndarray) -> None:
+        self.distance = distance
+
+    @classmethod
+    def toward(cls, dungeon: DungeonMap, goals: Iterable[Tuple[int, int]]) -> "FlowField":
+        """
+        목표 지점들까지의 거리 맵 계산
+
+        Args:
+            dungeon: 던전 맵 (이동 가능: walkable이고 잠기지 않은 셀)
+            goals: 목표 (x, y) 좌표들 (맵 밖 좌표는 무시)
+        """
+        grid = dungeon.grid
+        distance = np.full((dungeon.height, dungeon.width), UNREACHABLE, dtype=np.int32)
+        for x, y in goals:
+            if 0 <= x < dungeon.width and 0 <= y < dungeon.height:
+                distance[y, x] = 0
+        cost = grid.passable().astype(np.int32)
+        tcod.path.dijkstra2d(distance, cost, cardinal=1, out=distance)
+        return cls(distance)
+
+    def distance_at(self, x: int, y: int) -> Optional[int]:
+        """(x, y)에서 가장 가까운 목표까지 이동 거리 (닿을 수 없으면 None)"""
+        height, width = self.distance.shape
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        value = int(self.distance[y, x])
+        return None if value == UNREACHABLE else value
+
+    def steps(self, x: int, y: int, rng=None) -> List[Tuple[int, int]]:
+        """
+        목표에 가까워지는 이웃 칸들 (가까운 순)
+
+        Args:
+            x, y: 현재 위치
+            rng: 거리가 같은 이웃의 순서를 섞을 난수 생성기 (None이면 고정 순서)
+
+        Returns:
+            이동할 (x, y) 좌표 리스트 (닿을 수 없거나 이미 목표면 빈 리스트)
+        """
+        current = self.distance_at(x, y)
+        if current is None:
+            return []
+        directions = list(CARDINAL_DIRECTIONS)
+        if rng is not None:
+            rng.shuffle(directions)
+
+        candidates = []
+        for dx, dy in directions:
+            nearer = self.distance_at(x + dx, y + dy)
+            if nearer is not None and nearer < current:
+                candidates.append((nearer, x + dx, y + dy))
+        candidates.sort(key=lambda c: c[0])
+        return [(nx, ny) for _, nx, ny in candidates]
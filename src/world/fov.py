@@ -1,14 +1,48 @@
 """
 FOV (Field of View) 시스템
 
-플레이어 주변 시야 계산 (레이캐스팅)
+플레이어 주변 시야 계산 (tcod 그림자 투사)
+
+시야 반지름 안쪽 창(window)의 투명도 배열만 tcod.map.compute_fov에 넘기고,
+이전 시야와 비교해 새로 보이게 된 셀/더 이상 보이지 않는 셀만 타일 배열에 반영하므로
+이동 한 번의 비용은 맵 크기가 아니라 반지름² 에 비례합니다.
 """
 
-from typing import Set, Tuple
-import math
+from typing import Optional, Set, Tuple
+
+import numpy as np
+import tcod.map
+from tcod import libtcodpy
 
 from src.world.dungeon_generator import DungeonMap
-from src.world.tile import TileType
+
+
+# 기존 파이썬 재귀 그림자 투사와 가장 가까운 tcod 알고리즘
+FOV_ALGORITHM = libtcodpy.FOV_SHADOW
+
+
+class FOVWindow:
+    """맵의 [y0:y1, x0:x1] 영역과 그 영역의 가시 마스크"""
+
+    __slots__ = ("x0", "y0", "x1", "y1", "mask")
+
+    def __init__(self, x0: int, y0: int, x1: int, y1: int, mask: np.ndarray) -> None:
+        self.x0 = x0
+        self.y0 = y0
+        self.x1 = x1
+        self.y1 = y1
+        self.mask = mask
+
+    def positions(self) -> Set[Tuple[int, int]]:
+        """보이는 (x, y) 좌표 set"""
+        ys, xs = np.nonzero(self.mask)
+        return set(zip((xs + self.x0).tolist(), (ys + self.y0).tolist()))
+
+    def to_map(self, width: int, height: int) -> np.ndarray:
+        """맵 전체 크기 [y, x] 불리언 마스크"""
+        full = np.zeros((height, width), dtype=bool)
+        full[self.y0:self.y1, self.x0:self.x1] = self.mask
+        return full
 
 
 class FOVSystem:
@@ -22,15 +56,23 @@ class FOVSystem:
         self.default_radius = default_radius
         self.visible_tiles: Set[Tuple[int, int]] = set()
 
-    def compute_fov(
+        # 마지막으로 타일 배열에 반영한 시야 (같은 그리드일 때만 차이 갱신)
+        self._grid = None
+        self._window: Optional[FOVWindow] = None
+
+        # 마지막 갱신에서 바뀐 셀 수 (디버그/성능 확인용)
+        self.last_gained = 0
+        self.last_lost = 0
+
+    def compute_window(
         self,
         dungeon: DungeonMap,
         origin_x: int,
         origin_y: int,
         radius: int = None
-    ) -> Set[Tuple[int, int]]:
+    ) -> FOVWindow:
         """
-        FOV 계산 (Shadowcasting 알고리즘)
+        시야 계산만 수행 (타일은 바꾸지 않음)
 
         Args:
             dungeon: 던전 맵
@@ -39,152 +81,124 @@ class FOVSystem:
             radius: 시야 반지름 (None이면 default 사용)
 
         Returns:
-            보이는 타일 좌표 set
+            반지름 창 영역과 가시 마스크
         """
         if radius is None:
             radius = self.default_radius
 
-        self.visible_tiles.clear()
-
-        # 플레이어 위치는 항상 보임
-        self.visible_tiles.add((origin_x, origin_y))
-
-        # 8방향 스캔
-        for octant in range(8):
-            self._cast_light(
-                dungeon,
-                origin_x,
-                origin_y,
-                radius,
-                1,  # start row
-                1.0,  # start slope
-                0.0,  # end slope
-                octant
-            )
-
-        # 탐험 마크 업데이트
-        for x, y in self.visible_tiles:
-            tile = dungeon.get_tile(x, y)
-            if tile:
-                tile.explored = True
-                tile.visible = True
-
-        return self.visible_tiles
+        x0 = max(0, origin_x - radius)
+        y0 = max(0, origin_y - radius)
+        x1 = min(dungeon.width, origin_x + radius + 1)
+        y1 = min(dungeon.height, origin_y + radius + 1)
+
+        transparency = dungeon.grid.transparent[y0:y1, x0:x1]
+        mask = tcod.map.compute_fov(
+            transparency,
+            (origin_y - y0, origin_x - x0),
+            radius=radius,
+            light_walls=True,
+            algorithm=FOV_ALGORITHM,
+        )
+        return FOVWindow(x0, y0, x1, y1, mask)
+
+    def compute_fov_mask(
+        self,
+        dungeon: DungeonMap,
+        origin_x: int,
+        origin_y: int,
+        radius: int = None
+    ) -> np.ndarray:
+        """맵 전체 크기 [y, x] 가시 마스크 (타일은 바꾸지 않음)"""
+        window = self.compute_window(dungeon, origin_x, origin_y, radius)
+        return window.to_map(dungeon.width, dungeon.height)
 
-    def _cast_light(
+    def compute_fov(
         self,
         dungeon: DungeonMap,
-        cx: int,
-        cy: int,
-        radius: int,
-        row: int,
-        start_slope: float,
-        end_slope: float,
-        octant: int
-    ):
+        origin_x: int,
+        origin_y: int,
+        radius: int = None
+    ) -> Set[Tuple[int, int]]:
         """
-        Shadowcasting 재귀 함수
+        FOV 계산 후 타일의 visible/explored 갱신
+
+        이전 시야와 달라진 셀만 visible을 바꾸고, 보이는 셀은 explored로 표시합니다.
 
         Args:
-            cx, cy: 중심 좌표
-            radius: 반지름
-            row: 현재 행
-            start_slope: 시작 기울기
-            end_slope: 끝 기울기
-            octant: 팔분면 (0-7)
+            dungeon: 던전 맵
+            origin_x: 플레이어 X 위치
+            origin_y: 플레이어 Y 위치
+            radius: 시야 반지름 (None이면 default 사용)
+
+        Returns:
+            보이는 타일 좌표 set
         """
-        if start_slope < end_slope:
-            return
-
-        radius_squared = radius * radius
-
-        for j in range(row, radius + 1):
-            dx = -j - 1
-            dy = -j
-            blocked = False
-            new_start = 0.0
-
-            while dx <= 0:
-                dx += 1
-
-                # 좌표 변환 (octant에 따라)
-                mx, my = self._transform_octant(cx, cy, dx, dy, octant)
-
-                # 범위 체크
-                if not (0 <= mx < dungeon.width and 0 <= my < dungeon.height):
-                    continue
-
-                # 거리 체크
-                distance = dx * dx + dy * dy
-                if distance > radius_squared:
-                    continue
-
-                l_slope = (dx - 0.5) / (dy + 0.5)
-                r_slope = (dx + 0.5) / (dy - 0.5)
-
-                if start_slope < r_slope:
-                    continue
-                elif end_slope > l_slope:
-                    break
-
-                # 타일 보이게
-                self.visible_tiles.add((mx, my))
-
-                # 블록 체크
-                tile = dungeon.get_tile(mx, my)
-                if tile and not tile.transparent:
-                    if blocked:
-                        new_start = r_slope
-                    else:
-                        blocked = True
-                        self._cast_light(
-                            dungeon, cx, cy, radius,
-                            j + 1, start_slope, l_slope, octant
-                        )
-                        new_start = r_slope
-                else:
-                    if blocked:
-                        blocked = False
-                        start_slope = new_start
-
-            if blocked:
-                break
-
-    def _transform_octant(
-        self,
-        cx: int,
-        cy: int,
-        dx: int,
-        dy: int,
-        octant: int
-    ) -> Tuple[int, int]:
-        """팔분면에 따른 좌표 변환"""
-        if octant == 0:
-            return (cx + dx, cy - dy)
-        elif octant == 1:
-            return (cx + dy, cy - dx)
-        elif octant == 2:
-            return (cx - dy, cy - dx)
-        elif octant == 3:
-            return (cx - dx, cy - dy)
-        elif octant == 4:
-            return (cx - dx, cy + dy)
-        elif octant == 5:
-            return (cx - dy, cy + dx)
-        elif octant == 6:
-            return (cx + dy, cy + dx)
-        elif octant == 7:
-            return (cx + dx, cy + dy)
-
-        return (cx, cy)
+        if not (0 <= origin_x < dungeon.width and 0 <= origin_y < dungeon.height):
+            self.visible_tiles = {(origin_x, origin_y)}
+            return self.visible_tiles
+
+        window = self.compute_window(dungeon, origin_x, origin_y, radius)
+        self._apply(dungeon, window)
+        self.visible_tiles = window.positions()
+        return self.visible_tiles
+
+    def _apply(self, dungeon: DungeonMap, window: FOVWindow) -> None:
+        """이전 시야와의 차이만 타일 배열에 반영"""
+        grid = dungeon.grid
+        previous = self._window
+        if grid is not self._grid or previous is None:
+            # 새 맵(또는 외부에서 가시성이 바뀐 뒤) 첫 계산: 한 번만 전체 초기화
+            grid.visible[:] = False
+            grid.mark_all_dirty()
+            previous = None
+
+        # 이전/현재 창을 모두 덮는 영역 (반지름² 크기)
+        x0, y0, x1, y1 = window.x0, window.y0, window.x1, window.y1
+        if previous is not None:
+            x0, y0 = min(x0, previous.x0), min(y0, previous.y0)
+            x1, y1 = max(x1, previous.x1), max(y1, previous.y1)
+        shape = (y1 - y0, x1 - x0)
+
+        now = np.zeros(shape, dtype=bool)
+        now[window.y0 - y0:window.y1 - y0, window.x0 - x0:window.x1 - x0] = window.mask
+        before = np.zeros(shape, dtype=bool)
+        if previous is not None:
+            before[previous.y0 - y0:previous.y1 - y0, previous.x0 - x0:previous.x1 - x0] = previous.mask
+
+        gained = now & ~before
+        lost = before & ~now
+        visible = grid.visible[y0:y1, x0:x1]
+        visible[lost] = False
+        visible[gained] = True
+        grid.explored[y0:y1, x0:x1] |= now
+        if previous is not None and (gained.any() or lost.any()):
+            grid.mark_dirty(x0, y0, x1, y1)
+
+        self.last_gained = int(gained.sum())
+        self.last_lost = int(lost.sum())
+        self._grid = grid
+        self._window = window
 
     def clear_visibility(self, dungeon: DungeonMap):
         """현재 프레임 가시성 초기화"""
-        for y in range(dungeon.height):
-            for x in range(dungeon.width):
-                tile = dungeon.get_tile(x, y)
-                if tile:
-                    tile.visible = False
+        grid = dungeon.grid
+        window = self._window
+        if grid is self._grid and window is not None:
+            grid.visible[window.y0:window.y1, window.x0:window.x1][window.mask] = False
+            grid.mark_dirty(window.x0, window.y0, window.x1, window.y1)
+            # 빈 시야를 추적해 두면 다음 계산도 차이만 갱신
+            self._window = FOVWindow(window.x0, window.y0, window.x1, window.y1, np.zeros_like(window.mask))
+            self.visible_tiles = set()
+        else:
+            grid.visible[:] = False
+            grid.mark_all_dirty()
+            self.reset()
+
+    def reset(self) -> None:
+        """추적 중인 시야 잊기 (다음 계산에서 전체 초기화)"""
+        self._grid = None
+        self._window = None
+        self.visible_tiles = set()
 
     def get_visible_radius_with_modifiers(self, base_radius: int, modifiers: dict) -> int:
         """
@@ -2,12 +2,71 @@
 맵 렌더러
 
 던전 맵을 화면에 표시
+
+카메라 창의 글리프/전경색/배경색을 NumPy 배열로 한 번에 만들고
+(타입별 표시 테이블 → 드문 타일 덮어쓰기 → 시야 밖 어둡게 → 환경 효과 오버레이)
+console.rgb 슬라이스에 한 번에 대입합니다.
+
+맵 전체의 정적 레이어는 오프스크린 콘솔에 캐시해 두고, 타일 그리드가 기록한
+더티 영역(문 열림, 퍼즐 해결, 채집, FOV 변화 등)만 다시 계산합니다.
+매 프레임에는 캐시된 레이어의 카메라 창만 복사하고, 액터는 호출자가 그 위에 그립니다.
 """
 
+from typing import Optional, Tuple
+
+import numpy as np
 import tcod
 
 from src.world.dungeon_generator import DungeonMap
-from src.world.tile import TileType
+from src.world.tile import Tile, TileType
+from src.world.tile_grid import TILE_TYPES
+
+
+# 마을에서 배경 없이 표시하는 건물 심볼
+TOWN_BUILDING_SYMBOLS = frozenset(['K', 'B', 'A', 'S', 'Q', '$', 'I', 'G', 'F'])
+
+# 작동하기 전까지 일반 바닥처럼 숨기는 함정
+HIDDEN_TRAP_TYPES = frozenset([TileType.TRAP, TileType.SPIKE_TRAP, TileType.FIRE_TRAP, TileType.POISON_GAS])
+
+# 숨긴 함정/해결된 퍼즐의 바닥 표시
+PLAIN_FLOOR_GRAPHIC = (".", (100, 100, 100), (0, 0, 0))
+
+
+def tile_graphic(tile, is_town: bool) -> Tuple[str, tuple, tuple]:
+    """
+    타일 하나의 표시 (문자, 전경색, 배경색) - 시야/환경 효과 적용 전
+
+    Args:
+        tile: 타일 (Tile 또는 TileView)
+        is_town: 마을 맵 여부
+    """
+    # 마을 건물 표시 (우선순위 높음)
+    # building_symbol이 있으면 사용, 없으면 타일의 char와 fg_color를 사용 (이미 건물 심볼로 설정됨)
+    if getattr(tile, 'building_symbol', None):
+        return tile.building_symbol, getattr(tile, 'building_color', tile.fg_color), (0, 0, 0)
+    # 타일의 char가 건물 심볼인 경우 (K, B, A, S, Q, $, I, G, F)
+    if is_town and tile.char in TOWN_BUILDING_SYMBOLS:
+        return tile.char, tile.fg_color, (0, 0, 0)
+    # 함정은 작동하기 전까지 숨김 (일반 바닥처럼 표시)
+    if tile.tile_type in HIDDEN_TRAP_TYPES:
+        return PLAIN_FLOOR_GRAPHIC
+    # 퍼즐은 해결되면 일반 바닥처럼 표시
+    if tile.tile_type == TileType.PUZZLE and getattr(tile, 'puzzle_solved', False):
+        return PLAIN_FLOOR_GRAPHIC
+    return tile.char, tile.fg_color, tile.bg_color
+
+
+def _graphic_table(is_town: bool) -> np.ndarray:
+    """타입 코드 → 기본 타일 표시 (tcod rgb_graphic 룩업 테이블)"""
+    table = np.zeros(len(TILE_TYPES), dtype=tcod.console.rgb_graphic)
+    for code, tile_type in enumerate(TILE_TYPES):
+        char, fg, bg = tile_graphic(Tile(tile_type, 0, 0), is_town)
+        table[code] = (ord(char), fg, bg)
+    return table
+
+
+# 코드별 기본 표시 (던전 / 마을)
+GRAPHIC_TABLES = {False: _graphic_table(False), True: _graphic_table(True)}
 
 
 class MapRenderer:
@@ -22,6 +81,18 @@ class MapRenderer:
         self.map_x = map_x
         self.map_y = map_y
 
+        # 정적 맵 레이어 캐시 (맵 전체 크기 오프스크린 콘솔)
+        self._layer: Optional[tcod.console.Console] = None
+        self._layer_key = None
+
+        # 마지막 render에서 다시 계산한 셀 수 (디버그/성능 확인용)
+        self.last_rebuilt = 0
+
+    def invalidate(self) -> None:
+        """정적 레이어 캐시 버리기 (다음 render에서 전체 다시 계산)"""
+        self._layer = None
+        self._layer_key = None
+
     def render(
         self,
         console: tcod.console.Console,
@@ -35,91 +106,99 @@ class MapRenderer:
         맵 렌더링
 
         Args:
-            console: TCOD 콘솔
+            console: TCOD 콘솔 (기본 order="C", rgb가 [y, x]인 콘솔)
             dungeon: 던전 맵
             camera_x: 카메라 X 위치 (맵 좌표)
             camera_y: 카메라 Y 위치 (맵 좌표)
             view_width: 표시 너비
             view_height: 표시 높이
         """
-        # 표시 범위 계산
-        start_x = max(0, camera_x)
-        start_y = max(0, camera_y)
-        end_x = min(dungeon.width, camera_x + view_width)
-        end_y = min(dungeon.height, camera_y + view_height)
-
-        # 타일 렌더링
-        for map_y in range(start_y, end_y):
-            for map_x in range(start_x, end_x):
-                tile = dungeon.get_tile(map_x, map_y)
+        # 표시 범위 계산 (맵 범위와 콘솔 범위 모두로 자름)
+        offset_x = self.map_x - camera_x
+        offset_y = self.map_y - camera_y
+        start_x = max(0, camera_x, -offset_x)
+        start_y = max(0, camera_y, -offset_y)
+        end_x = min(dungeon.width, camera_x + view_width, console.width - offset_x)
+        end_y = min(dungeon.height, camera_y + view_height, console.height - offset_y)
+        if start_x >= end_x or start_y >= end_y:
+            return
 
-                # 화면 좌표 계산
-                screen_x = self.map_x + (map_x - camera_x)
-                screen_y = self.map_y + (map_y - camera_y)
-
-                # 범위 체크
-                if not (0 <= screen_x < console.width and 0 <= screen_y < console.height):
-                    continue
-
-                # 탐험되지 않은 타일은 표시 안 함
-                if not tile.explored:
-                    continue
-
-                # 마을 건물 표시 (우선순위 높음)
-                # building_symbol이 있으면 사용, 없으면 타일의 char와 fg_color를 사용 (이미 건물 심볼로 설정됨)
-                if hasattr(tile, 'building_symbol') and tile.building_symbol:
-                    char = tile.building_symbol
-                    fg = getattr(tile, 'building_color', tile.fg_color)
-                    bg = (0, 0, 0)
-                # 타일의 char가 건물 심볼인 경우 (K, B, A, S, Q, $, I, G, F)
-                elif tile.char in ['K', 'B', 'A', 'S', 'Q', '$', 'I', 'G', 'F'] and hasattr(dungeon, 'is_town') and dungeon.is_town:
-                    char = tile.char
-                    fg = tile.fg_color
-                    bg = (0, 0, 0)
-                # 마을 장식 제거 (더 이상 사용하지 않음)
-                # elif hasattr(tile, 'decoration_char') and tile.decoration_char: 제거됨
-                # 함정은 작동하기 전까지 숨김 (일반 바닥처럼 표시)
-                elif tile.tile_type in [TileType.TRAP, TileType.SPIKE_TRAP, TileType.FIRE_TRAP, TileType.POISON_GAS]:
-                    # 함정은 일반 바닥처럼 표시
-                    char = "."
-                    fg = (100, 100, 100)
-                    bg = (0, 0, 0)
-                # 퍼즐은 해결되면 일반 바닥처럼 표시
-                elif tile.tile_type == TileType.PUZZLE and getattr(tile, 'puzzle_solved', False):
-                    char = "."
-                    fg = (100, 100, 100)
-                    bg = (0, 0, 0)
-                else:
-                    # 타일 표시
-                    char = tile.char
-                    fg = tile.fg_color
-                    bg = tile.bg_color
-
-                # 탐험됐지만 현재 보이지 않는 경우 어둡게
-                if not tile.visible:
-                    fg = tuple(c // 4 for c in fg)
-                    bg = tuple(c // 4 for c in bg)
-
-                # 환경 효과 색상 오버레이 적용 (마을이 아닌 경우만)
-                if hasattr(dungeon, 'environment_effect_manager') and not (hasattr(dungeon, 'is_town') and dungeon.is_town):
-                    effects = dungeon.environment_effect_manager.get_effects_at_tile(map_x, map_y)
-                    if effects:
-                        # 가장 강한 효과의 색상 사용 (첫 번째 효과)
-                        effect = effects[0]
-                        overlay_color = effect.color_overlay
-                        
-                        # 색상 블렌딩 (50% 오버레이)
-                        fg = tuple(
-                            int(fg[i] * 0.5 + overlay_color[i] * 0.5)
-                            for i in range(3)
-                        )
-                        # 배경색도 약간 블렌딩
-                        bg = tuple(
-                            int(bg[i] * 0.7 + overlay_color[i] * 0.3)
-                            for i in range(3)
-                        )
-
-                console.print(screen_x, screen_y, char, fg=fg, bg=bg)
+        layer = self._update_layer(dungeon)
+
+        # 탐험되지 않은 타일은 표시 안 함 (기존 콘솔 내용 유지)
+        explored = dungeon.grid.explored[start_y:end_y, start_x:end_x]
+        screen = console.rgb[start_y + offset_y:end_y + offset_y, start_x + offset_x:end_x + offset_x]
+        screen[explored] = layer.rgb[start_y:end_y, start_x:end_x][explored]
+
+    def _update_layer(self, dungeon: DungeonMap) -> tcod.console.Console:
+        """정적 레이어를 최신 상태로 (바뀐 영역만 다시 계산)"""
+        grid = dungeon.grid
+        is_town = bool(getattr(dungeon, 'is_town', False))
+        overlay = None
+        if hasattr(dungeon, 'environment_effect_manager') and not is_town:
+            overlay = dungeon.environment_effect_manager.color_layer(dungeon.width, dungeon.height)
+
+        regions = grid.take_dirty_regions()
+        key = self._layer_key
+        if self._layer is None or key[0] is not grid or key[1] != is_town or key[2] is not overlay:
+            # 새 맵/마을 전환/환경 효과 변경: 전체 다시 계산
+            self._layer = tcod.console.Console(dungeon.width, dungeon.height, order="C")
+            self._layer_key = (grid, is_town, overlay)
+            regions = [(0, 0, dungeon.width, dungeon.height)]
+
+        rebuilt = 0
+        rgb = self._layer.rgb
+        for x0, y0, x1, y1 in regions:
+            x0, y0 = max(0, x0), max(0, y0)
+            x1, y1 = min(dungeon.width, x1), min(dungeon.height, y1)
+            if x0 < x1 and y0 < y1:
+                rgb[y0:y1, x0:x1] = self.build_cells(dungeon, x0, y0, x1, y1)
+                rebuilt += (x1 - x0) * (y1 - y0)
+        self.last_rebuilt = rebuilt
+        return self._layer
+
+    def build_cells(
+        self,
+        dungeon: DungeonMap,
+        start_x: int,
+        start_y: int,
+        end_x: int,
+        end_y: int
+    ) -> np.ndarray:
+        """
+        맵 [start_y:end_y, start_x:end_x] 영역의 표시 배열 (rgb_graphic, [y, x])
+
+        탐험 여부와 관계없이 모든 셀을 채웁니다.
+        """
+        grid = dungeon.grid
+        is_town = bool(getattr(dungeon, 'is_town', False))
+
+        # 타입별 기본 표시
+        cells = GRAPHIC_TABLES[is_town][grid.tile_type[start_y:end_y, start_x:end_x]]
+
+        # 개별 데이터가 있는 드문 타일은 타일 값으로 덮어쓰기
+        for tile in grid.rare_tiles_in(start_x, start_y, end_x, end_y):
+            char, fg, bg = tile_graphic(tile, is_town)
+            cells[tile.y - start_y, tile.x - start_x] = (ord(char), fg, bg)
+
+        # 탐험됐지만 현재 보이지 않는 경우 어둡게
+        hidden = ~grid.visible[start_y:end_y, start_x:end_x]
+        cells["fg"][hidden] //= 4
+        cells["bg"][hidden] //= 4
+
+        # 환경 효과 색상 오버레이 적용 (마을이 아닌 경우만)
+        if hasattr(dungeon, 'environment_effect_manager') and not is_town:
+            mask, colors = dungeon.environment_effect_manager.color_layer(dungeon.width, dungeon.height)
+            mask = mask[start_y:end_y, start_x:end_x]
+            if mask.any():
+                overlay = colors[start_y:end_y, start_x:end_x][mask].astype(np.float64)
+                # 색상 블렌딩 (전경 50%, 배경 30% 오버레이)
+                fg = cells["fg"][mask] * 0.5 + overlay * 0.5
+                bg = cells["bg"][mask] * 0.7 + overlay * 0.3
+                cells["fg"][mask] = fg.astype(np.uint8)
+                cells["bg"][mask] = bg.astype(np.uint8)
+
+        return cells
 
     def render_minimap(
         self,
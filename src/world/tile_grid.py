@@ -0,0 +1,425 @@
+"""
+타일 그리드 - NumPy 배열 기반 던전 타일 저장소
+
+셀마다 30여 개 필드를 가진 Tile 객체를 만드는 대신,
+자주 쓰는 필드(tile_type, walkable, transparent, explored, visible, locked)는
+[y, x] 배열에 저장하고 상자/NPC/퍼즐/드롭 아이템처럼 개별 데이터가 있는
+드문 타일만 좌표 키의 희소 딕셔너리에 실제 Tile 객체로 보관합니다.
+
+get()은 드문 타일이면 그 Tile 객체를, 일반 타일이면 배열을 읽고 쓰는
+가벼운 TileView를 반환하므로 기존 Tile 속성 접근 코드는 그대로 동작합니다.
+
+표시가 바뀔 수 있는 변경(셀 교체, 필드 쓰기, FOV 갱신)은 더티 영역으로 기록되어
+렌더러가 캐시해 둔 정적 맵 레이어 중 바뀐 부분만 다시 그릴 수 있습니다.
+"""
+
+from dataclasses import fields
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.world.tile import Tile, TileType
+
+
+# 배열에 저장하는 필드
+ARRAY_FIELDS = ("tile_type", "walkable", "transparent", "explored", "visible", "locked")
+
+# 타일 타입 ↔ 배열 코드
+TILE_TYPES: Tuple[TileType, ...] = tuple(TileType)
+TILE_CODES: Dict[TileType, int] = {tile_type: code for code, tile_type in enumerate(TILE_TYPES)}
+VOID_CODE = TILE_CODES[TileType.VOID]
+
+# 이보다 많은 더티 영역이 쌓이면 맵 전체 하나로 합침
+MAX_DIRTY_REGIONS = 64
+
+_FIELD_NAMES = tuple(f.name for f in fields(Tile) if f.name not in ("x", "y"))
+_EXTRA_FIELD_NAMES = tuple(name for name in _FIELD_NAMES if name not in ARRAY_FIELDS)
+_SKIP_STATE = frozenset(ARRAY_FIELDS) | {"x", "y", "_grid"}
+
+
+def _build_type_defaults() -> List[Dict[str, Any]]:
+    """타입별 새 Tile의 필드 값 (__post_init__ 적용 후)"""
+    defaults = []
+    for tile_type in TILE_TYPES:
+        tile = Tile(tile_type, 0, 0)
+        defaults.append({name: getattr(tile, name) for name in _FIELD_NAMES})
+    return defaults
+
+
+# 코드별 기본 필드 값
+TYPE_DEFAULTS: List[Dict[str, Any]] = _build_type_defaults()
+
+# 코드별 배열 기본값 (walkable, transparent, locked)
+TYPE_WALKABLE = np.array([d["walkable"] for d in TYPE_DEFAULTS], dtype=bool)
+TYPE_TRANSPARENT = np.array([d["transparent"] for d in TYPE_DEFAULTS], dtype=bool)
+TYPE_LOCKED = np.array([d["locked"] for d in TYPE_DEFAULTS], dtype=bool)
+
+
+def _array_field(name: str) -> property:
+    """그리드에 붙어 있으면 배열을, 분리되었으면 자기 값을 읽고 쓰는 필드"""
+
+    def getter(tile: "_GridTile") -> Any:
+        grid = tile.__dict__["_grid"]
+        if grid is None:
+            return tile.__dict__[name]
+        return grid._load(tile.x, tile.y, name)
+
+    def setter(tile: "_GridTile", value: Any) -> None:
+        grid = tile.__dict__["_grid"]
+        if grid is None:
+            tile.__dict__[name] = value
+        else:
+            grid._store(tile.x, tile.y, name, value)
+
+    return property(getter, setter)
+
+
+class _GridTile(Tile):
+    """
+    희소 딕셔너리에 보관되는 Tile
+
+    배열 필드는 그리드 배열을 직접 읽고 쓰므로 FOV 등이 배열을 일괄 갱신해도 어긋나지 않습니다.
+    set()으로 셀이 교체되면 그 시점 값을 복사해 그리드와 분리되고, 기존 Tile 객체처럼 값만 남습니다.
+    """
+
+    tile_type = _array_field("tile_type")
+    walkable = _array_field("walkable")
+    transparent = _array_field("transparent")
+    explored = _array_field("explored")
+    visible = _array_field("visible")
+    locked = _array_field("locked")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        grid = self.__dict__.get("_grid")
+        if grid is not None:
+            grid.mark_dirty(self.x, self.y)
+
+
+class TileView:
+    """
+    일반 타일 프록시
+
+    배열 필드는 그리드 배열을, 나머지 필드는 타입 기본값을 읽습니다.
+    기본값과 다른 값을 쓰면 셀을 드문 타일(실제 Tile 객체)로 승격한 뒤 씁니다.
+    """
+
+    __slots__ = ("_grid", "x", "y")
+
+    def __init__(self, grid: "TileGrid", x: int, y: int) -> None:
+        object.__setattr__(self, "_grid", grid)
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    @property
+    def tile_type(self) -> TileType:
+        return TILE_TYPES[self._grid.tile_type[self.y, self.x]]
+
+    @property
+    def walkable(self) -> bool:
+        return bool(self._grid.walkable[self.y, self.x])
+
+    @property
+    def transparent(self) -> bool:
+        return bool(self._grid.transparent[self.y, self.x])
+
+    @property
+    def explored(self) -> bool:
+        return bool(self._grid.explored[self.y, self.x])
+
+    @property
+    def visible(self) -> bool:
+        return bool(self._grid.visible[self.y, self.x])
+
+    @property
+    def locked(self) -> bool:
+        return bool(self._grid.locked[self.y, self.x])
+
+    def __getattr__(self, name: str) -> Any:
+        # 슬롯/프로퍼티에 없는 이름만 여기로 옴
+        grid = self._grid
+        rare = grid._rare.get((self.x, self.y))
+        if rare is not None:
+            return getattr(rare, name)
+        defaults = TYPE_DEFAULTS[grid.tile_type[self.y, self.x]]
+        if name in defaults:
+            return defaults[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        grid = self._grid
+        x, y = self.x, self.y
+        rare = grid._rare.get((x, y))
+        if rare is not None:
+            setattr(rare, name, value)
+            return
+
+        if name in ARRAY_FIELDS:
+            # 타입만 바꿔도 문자/색 등 나머지 필드는 그대로 유지되어야 함
+            if name == "tile_type" and grid._extras_differ(grid.tile_type[y, x], TILE_CODES[value]):
+                setattr(grid.promote(x, y), name, value)
+            else:
+                grid._store(x, y, name, value)
+            return
+
+        defaults = TYPE_DEFAULTS[grid.tile_type[y, x]]
+        if name in defaults and defaults[name] == value:
+            return
+        setattr(grid.promote(x, y), name, value)
+
+    # 기존 Tile 메서드
+    unlock = Tile.unlock
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, TileView):
+            return other._grid is self._grid and other.x == self.x and other.y == self.y
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"TileView({self.tile_type}, {self.x}, {self.y})"
+
+
+class TileGrid:
+    """
+    배열 기반 타일 저장소
+
+    모든 배열은 [y, x] 인덱스 (tiles[y][x]와 같은 순서)입니다.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        shape = (height, width)
+        self.tile_type = np.full(shape, VOID_CODE, dtype=np.uint8)
+        self.walkable = np.full(shape, TYPE_WALKABLE[VOID_CODE], dtype=bool)
+        self.transparent = np.full(shape, TYPE_TRANSPARENT[VOID_CODE], dtype=bool)
+        self.explored = np.zeros(shape, dtype=bool)
+        self.visible = np.zeros(shape, dtype=bool)
+        self.locked = np.full(shape, TYPE_LOCKED[VOID_CODE], dtype=bool)
+        # 개별 데이터가 있는 드문 타일: (x, y) -> Tile
+        self._rare: Dict[Tuple[int, int], _GridTile] = {}
+        # 마지막 take_dirty_regions() 이후 표시가 바뀌었을 수 있는 영역 (x0, y0, x1, y1)
+        self._dirty_regions: List[Tuple[int, int, int, int]] = []
+
+    # ------------------------------------------------------------------
+    # 셀 접근
+    # ------------------------------------------------------------------
+
+    def get(self, x: int, y: int) -> Any:
+        """셀의 Tile (드문 타일) 또는 TileView (범위 검사는 호출자 몫)"""
+        rare = self._rare.get((x, y))
+        if rare is not None:
+            return rare
+        return TileView(self, x, y)
+
+    def set(self, x: int, y: int, tile_type: TileType, **kwargs: Any) -> None:
+        """
+        셀을 새 타일로 교체 (Tile(tile_type, x, y, **kwargs)와 같은 결과)
+
+        kwargs가 없으면 Tile 객체를 만들지 않고 배열만 갱신합니다.
+        """
+        if kwargs:
+            self.put(x, y, Tile(tile_type, x, y, **kwargs))
+            return
+        self._detach(x, y)
+        self.mark_dirty(x, y)
+        code = TILE_CODES[tile_type]
+        self.tile_type[y, x] = code
+        self.walkable[y, x] = TYPE_WALKABLE[code]
+        self.transparent[y, x] = TYPE_TRANSPARENT[code]
+        self.locked[y, x] = TYPE_LOCKED[code]
+        self.explored[y, x] = False
+        self.visible[y, x] = False
+
+    def put(self, x: int, y: int, tile: Tile) -> None:
+        """Tile 객체를 셀에 저장 (타입 기본값과 다른 필드가 있을 때만 객체 보관)"""
+        self._detach(x, y)
+        self.mark_dirty(x, y)
+        code = TILE_CODES[tile.tile_type]
+        self.tile_type[y, x] = code
+        self.walkable[y, x] = tile.walkable
+        self.transparent[y, x] = tile.transparent
+        self.locked[y, x] = tile.locked
+        self.explored[y, x] = tile.explored
+        self.visible[y, x] = tile.visible
+
+        # 데이터클래스 필드 외에 붙인 속성(건물 등)도 함께 보관
+        state = {k: v for k, v in tile.__dict__.items() if k not in _SKIP_STATE}
+        for name in _EXTRA_FIELD_NAMES:
+            state[name] = getattr(tile, name)
+        defaults = TYPE_DEFAULTS[code]
+        if len(state) == len(_EXTRA_FIELD_NAMES) and all(
+            state[name] == defaults[name] for name in _EXTRA_FIELD_NAMES
+        ):
+            return
+        self._attach(x, y, state)
+
+    def promote(self, x: int, y: int) -> Tile:
+        """일반 셀을 드문 타일로 승격 (현재 값 그대로)"""
+        rare = self._rare.get((x, y))
+        if rare is not None:
+            return rare
+        state = dict(TYPE_DEFAULTS[self.tile_type[y, x]])
+        state["tile_type"] = TILE_TYPES[self.tile_type[y, x]]
+        state["walkable"] = bool(self.walkable[y, x])
+        state["transparent"] = bool(self.transparent[y, x])
+        state["locked"] = bool(self.locked[y, x])
+        state["explored"] = bool(self.explored[y, x])
+        state["visible"] = bool(self.visible[y, x])
+        state["x"] = x
+        state["y"] = y
+        return self._attach(x, y, state)
+
+    def _attach(self, x: int, y: int, state: Dict[str, Any]) -> _GridTile:
+        """배열 필드는 이미 배열에 쓰여 있어야 함"""
+        rare = _GridTile.__new__(_GridTile)
+        rare.__dict__.update({k: v for k, v in state.items() if k not in ARRAY_FIELDS})
+        rare.__dict__["x"] = x
+        rare.__dict__["y"] = y
+        rare.__dict__["_grid"] = self
+        self._rare[(x, y)] = rare
+        return rare
+
+    def _detach(self, x: int, y: int) -> None:
+        rare = self._rare.pop((x, y), None)
+        if rare is not None:
+            for name in ARRAY_FIELDS:
+                rare.__dict__[name] = self._load(x, y, name)
+            rare.__dict__["_grid"] = None
+
+    def _load(self, x: int, y: int, name: str) -> Any:
+        """배열 필드 읽기"""
+        value = getattr(self, name)[y, x]
+        if name == "tile_type":
+            return TILE_TYPES[value]
+        return bool(value)
+
+    def _store(self, x: int, y: int, name: str, value: Any) -> None:
+        """배열 필드 쓰기"""
+        if name == "tile_type":
+            value = TILE_CODES[value]
+        getattr(self, name)[y, x] = value
+        self.mark_dirty(x, y)
+
+    @staticmethod
+    def _extras_differ(old_code: int, new_code: int) -> bool:
+        if old_code == new_code:
+            return False
+        old, new = TYPE_DEFAULTS[old_code], TYPE_DEFAULTS[new_code]
+        return any(old[name] != new[name] for name in _EXTRA_FIELD_NAMES)
+
+    # ------------------------------------------------------------------
+    # 일괄 접근
+    # ------------------------------------------------------------------
+
+    def rare_tiles(self) -> Iterator[Tile]:
+        """개별 데이터가 있는 타일들"""
+        return iter(list(self._rare.values()))
+
+    def rare_tiles_in(self, x0: int, y0: int, x1: int, y1: int) -> List[Tile]:
+        """[y0:y1, x0:x1] 영역 안의 드문 타일들 (영역과 드문 타일 수 중 작은 쪽을 순회)"""
+        rare = self._rare
+        if (x1 - x0) * (y1 - y0) < len(rare):
+            return [rare[(x, y)] for y in range(y0, y1) for x in range(x0, x1) if (x, y) in rare]
+        return [tile for (x, y), tile in rare.items() if x0 <= x < x1 and y0 <= y < y1]
+
+    # ------------------------------------------------------------------
+    # 더티 영역
+    # ------------------------------------------------------------------
+
+    def mark_dirty(self, x0: int, y0: int, x1: int = None, y1: int = None) -> None:
+        """
+        표시가 바뀌었을 수 있는 영역 기록
+
+        x1/y1을 생략하면 (x0, y0) 한 칸. 배열을 직접 일괄 갱신한 코드는 직접 호출해야 합니다.
+        """
+        if x1 is None:
+            x1, y1 = x0 + 1, y0 + 1
+        regions = self._dirty_regions
+        if regions and regions[-1] == (x0, y0, x1, y1):
+            return
+        if len(regions) >= MAX_DIRTY_REGIONS:
+            regions[:] = [(0, 0, self.width, self.height)]
+            return
+        regions.append((x0, y0, x1, y1))
+
+    def mark_all_dirty(self) -> None:
+        """맵 전체를 더티로 기록"""
+        self._dirty_regions[:] = [(0, 0, self.width, self.height)]
+
+    def take_dirty_regions(self) -> List[Tuple[int, int, int, int]]:
+        """기록된 더티 영역을 꺼내고 비움"""
+        regions = self._dirty_regions
+        self._dirty_regions = []
+        return regions
+
+    def type_mask(self, *tile_types: TileType) -> np.ndarray:
+        """지정한 타입인 셀의 [y, x] 불리언 마스크"""
+        return np.isin(self.tile_type, [TILE_CODES[t] for t in tile_types])
+
+    def passable(self) -> np.ndarray:
+        """이동 가능 마스크 (잠긴 셀 제외)"""
+        return self.walkable & ~self.locked
+
+    @property
+    def nbytes(self) -> int:
+        """배열 메모리 (바이트, 드문 타일 객체 제외)"""
+        return sum(getattr(self, name).nbytes for name in ARRAY_FIELDS)
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+
+class TileRows:
+    """tiles[y][x] 하위 호환 뷰"""
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: TileGrid) -> None:
+        self._grid = grid
+
+    def __len__(self) -> int:
+        return self._grid.height
+
+    def __getitem__(self, y: int) -> "TileRow":
+        if y < 0:
+            y += self._grid.height
+        if not 0 <= y < self._grid.height:
+            raise IndexError("tile row index out of range")
+        return TileRow(self._grid, y)
+
+    def __iter__(self) -> Iterator["TileRow"]:
+        for y in range(self._grid.height):
+            yield TileRow(self._grid, y)
+
+
+class TileRow:
+    """tiles[y] 한 행"""
+
+    __slots__ = ("_grid", "_y")
+
+    def __init__(self, grid: TileGrid, y: int) -> None:
+        self._grid = grid
+        self._y = y
+
+    def _index(self, x: int) -> int:
+        if x < 0:
+            x += self._grid.width
+        if not 0 <= x < self._grid.width:
+            raise IndexError("tile index out of range")
+        return x
+
+    def __len__(self) -> int:
+        return self._grid.width
+
+    def __getitem__(self, x: int) -> Any:
+        return self._grid.get(self._index(x), self._y)
+
+    def __setitem__(self, x: int, tile: Tile) -> None:
+        self._grid.put(self._index(x), self._y, tile)
+
+    def __iter__(self) -> Iterator[Any]:
+        for x in range(self._grid.width):
+            yield self._grid.get(x, self._y)
@@ -330,5 +330,68 @@ class TestTraitEffectTypes:
             print(f"✓ 전사 특성 {trait_id}: {len(effects)}개 효과")
 
 
+class TestCompiledTraits:
+    """컴파일된 특성 효과 테이블 테스트"""
+
+    def test_compiled_table_is_reused(self):
+        """특성 목록이 그대로면 테이블을 재사용하는지 확인"""
+        trait_manager = get_trait_effect_manager()
+        char = Character("테스트 전사", "warrior", level=1)
+        char.activate_trait("physical_power")
+
+        first = trait_manager.compile_traits(char)
+        trait_manager.calculate_damage_multiplier(char, "physical")
+        second = trait_manager.compile_traits(char)
+
+        assert first is second
+        assert ("damage", "physical") in second.cache
+
+    def test_compiled_table_rebuilt_on_trait_change(self):
+        """특성 활성화/비활성화 시 테이블이 다시 만들어지는지 확인"""
+        trait_manager = get_trait_effect_manager()
+        char = Character("테스트 전사", "warrior", level=1)
+
+        before = trait_manager.calculate_damage_multiplier(char, "physical")
+        char.activate_trait("physical_power")
+        boosted = trait_manager.calculate_damage_multiplier(char, "physical")
+        char.deactivate_trait("physical_power")
+        after = trait_manager.calculate_damage_multiplier(char, "physical")
+
+        assert boosted > before
+        assert after == before
+
+    def test_compiled_table_detects_list_replacement(self):
+        """특성 목록을 직접 교체해도 변경을 감지하는지 확인"""
+        trait_manager = get_trait_effect_manager()
+        char = Character("테스트 전사", "warrior", level=1)
+        trait_manager.calculate_stat_bonus(char, "hp", 100)
+
+        char.active_traits = ["hp_boost"]
+        bonus = trait_manager.calculate_stat_bonus(char, "hp", 100)
+
+        assert bonus == pytest.approx(115)
+
+    def test_compiled_table_detects_in_place_replacement(self):
+        """같은 길이로 특성을 제자리 교체해도 변경을 감지하는지 확인"""
+        trait_manager = get_trait_effect_manager()
+        char = Character("테스트 전사", "warrior", level=1)
+        char.active_traits = ["magic_power"]
+        assert trait_manager.calculate_damage_multiplier(char, "physical") == pytest.approx(1.0)
+
+        char.active_traits[0] = "physical_power"
+        assert trait_manager.calculate_damage_multiplier(char, "physical") == pytest.approx(1.2)
+
+    def test_combined_sum_and_product_are_cached_separately(self):
+        """같은 효과 타입의 합계와 곱이 서로의 캐시를 쓰지 않는지 확인"""
+        trait_manager = get_trait_effect_manager()
+        char = Character("테스트 전사", "warrior", level=1)
+        char.active_traits = ["physical_power", "magic_power"]
+
+        total = trait_manager._combine_effects(char, TraitEffectType.DAMAGE_MULTIPLIER)
+        product = trait_manager._combine_effects(char, TraitEffectType.DAMAGE_MULTIPLIER, multiply=True)
+        assert total == pytest.approx(2.4)
+        assert product == pytest.approx(1.44)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,195 @@
+"""
+MCTS 보스 AI 테스트
+"""
+
+from src.ai.mcts_ai import MCTSBossAI, MCTSSearch, SearchState, get_search_worker
+from src.combat.combat_manager import ActionType, CombatManager
+from src.combat.combat_simulator import headless_mode
+from src.combat.enemy_skills import EnemySkill, SkillTargetType
+from src.core.config import get_config
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str, hp: int = 3000, attack: int = 40):
+        self.name = name
+        self.speed = 10
+        self.level = 1
+
+        self.physical_attack = attack
+        self.physical_defense = 10
+        self.magic_attack = 15
+        self.magic_defense = 8
+
+        self.current_hp = hp
+        self.max_hp = hp
+        self.current_mp = 50
+        self.max_mp = 50
+
+        self.current_brv = 200
+        self.int_brv = 100
+        self.max_brv = 3000
+        self.is_broken = False
+
+        self.is_enemy = False
+        self.is_alive = True
+        self.active_buffs = {}
+
+    def take_damage(self, damage: int) -> int:
+        actual_damage = min(damage, self.current_hp)
+        self.current_hp -= actual_damage
+        if self.current_hp <= 0:
+            self.current_hp = 0
+            self.is_alive = False
+        return actual_damage
+
+
+def _start_battle():
+    heroes = [MockCharacter(f"Hero{i}") for i in range(3)]
+    boss = MockCharacter("Boss", hp=12000, attack=60)
+    boss.is_enemy = True
+    boss.skills = [
+        EnemySkill(skill_id="quake", name="Quake", description="",
+                   target_type=SkillTargetType.ALL_ENEMIES, damage=30, cooldown=3),
+        EnemySkill(skill_id="smash", name="Smash", description="",
+                   brv_damage=1, hp_attack=True, damage_multiplier=1.5, cooldown=2),
+    ]
+
+    manager = CombatManager()
+    manager.start_combat(heroes, [boss])
+    return manager, heroes, boss
+
+
+def test_search_respects_budget_and_counts():
+    """탐색이 예산 안에서 끝나고 롤아웃/노드 카운터가 기록되는지 테스트"""
+    with headless_mode():
+        manager, heroes, boss = _start_battle()
+        state = SearchState.from_combat(boss, manager.enemies, manager.allies, manager.atb)
+
+        result = MCTSSearch(state, budget_ms=15).run()
+
+        stats = result.stats
+        assert stats.rollouts > 0 and stats.nodes > 0
+        assert stats.simulated_actions >= stats.rollouts
+        assert stats.elapsed_ms < 15 + 50
+        assert sum(visits for _, visits, _ in result.actions) == stats.rollouts
+        manager.cleanup()
+
+
+def test_search_finds_lethal_hp_attack():
+    """BRV가 충분하면 HP가 낮은 대상을 HP 공격으로 처치하는 수를 고르는지 테스트"""
+    with headless_mode():
+        manager, heroes, boss = _start_battle()
+        heroes[1].current_hp = 50
+        boss.current_brv = 2000
+        for skill in boss.skills:
+            skill.current_cooldown = 5
+        manager.atb.get_gauge(boss).current = 1000
+        state = SearchState.from_combat(boss, manager.enemies, manager.allies, manager.atb)
+
+        result = MCTSSearch(state, budget_ms=0, seed=3, max_rollouts=400).run()
+
+        assert result.actions[0][0] == ("hp_attack", -1, 1)
+        manager.cleanup()
+
+
+def test_decide_action_maps_to_live_targets():
+    """결정이 살아있는 실제 전투원을 대상으로 하고 전투 상태는 바꾸지 않는지 테스트"""
+    with headless_mode():
+        manager, heroes, boss = _start_battle()
+        heroes[0].current_hp = 0
+        heroes[0].is_alive = False
+        hp_before = [h.current_hp for h in heroes]
+
+        ai = MCTSBossAI(boss, "보통")
+        decision = ai.decide_action(manager.enemies, manager.allies)
+
+        assert decision["type"] in ("attack", "hp_attack", "skill")
+        targets = decision["target"] if isinstance(decision["target"], list) else [decision["target"]]
+        assert all(t in manager.allies for t in targets)
+        assert heroes[0] not in targets or decision["type"] == "skill"
+        assert [h.current_hp for h in heroes] == hp_before
+        assert ai.last_stats.rollouts > 0
+        manager.cleanup()
+
+
+def test_prefetched_search_is_consumed():
+    """미리 시작한 탐색 결과를 결정 시 사용하는지 테스트"""
+    with headless_mode():
+        manager, heroes, boss = _start_battle()
+        worker = get_search_worker()
+
+        ai = MCTSBossAI(boss, "평온")
+        assert ai.start_search(manager.enemies, manager.allies)
+        assert worker.is_pending(boss)
+
+        ai.decide_action(manager.enemies, manager.allies)
+
+        assert ai.last_stats.prefetched
+        assert not worker.is_pending(boss)
+        manager.cleanup()
+
+
+def test_prefetched_search_is_discarded_when_state_changes():
+    """prefetch 이후 HP/BRV/BREAK가 바뀌면 결과를 버리고 다시 탐색하는지 테스트"""
+    with headless_mode():
+        manager, heroes, boss = _start_battle()
+        worker = get_search_worker()
+        ai = MCTSBossAI(boss, "평온")
+
+        for change in (
+            lambda: setattr(heroes[1], "current_hp", 40),
+            lambda: setattr(heroes[2], "current_brv", 0),
+            lambda: setattr(boss, "is_broken", True),
+        ):
+            assert ai.start_search(manager.enemies, manager.allies)
+            change()
+            ai.decide_action(manager.enemies, manager.allies)
+            assert not ai.last_stats.prefetched
+            assert not worker.is_pending(boss)
+        manager.cleanup()
+
+
+def test_combat_manager_keeps_one_ai_per_enemy():
+    """prefetch와 적 턴이 같은 AI를 써서 전투 후에도 탐색 통계를 읽을 수 있는지 테스트"""
+    config = get_config()
+    enabled = config.get("ai.mcts.enabled", False)
+    config.set("ai.mcts.enabled", True)
+    try:
+        with headless_mode():
+            manager, heroes, boss = _start_battle()
+            ai = manager.get_enemy_ai(boss)
+            assert isinstance(ai, MCTSBossAI)
+
+            assert manager.prefetch_enemy_decisions() == 1
+            manager.execute_enemy_turn(boss)
+
+            assert manager.get_enemy_ai(boss) is ai
+            assert ai.last_stats is not None and ai.last_stats.prefetched
+            manager.cleanup()
+    finally:
+        config.set("ai.mcts.enabled", enabled)
+
+
+def test_prefetch_restarts_after_player_action():
+    """플레이어 행동으로 상태가 바뀌어도 행동 후 다시 시작한 탐색 결과를 보스 턴에 쓰는지 테스트"""
+    config = get_config()
+    enabled = config.get("ai.mcts.enabled", False)
+    config.set("ai.mcts.enabled", True)
+    try:
+        with headless_mode():
+            manager, heroes, boss = _start_battle()
+            ai = manager.get_enemy_ai(boss)
+
+            # 플레이어 메뉴가 열릴 때 prefetch → 플레이어 BRV 공격으로 HP/BRV 변화
+            assert manager.prefetch_enemy_decisions() == 1
+            brv_before = boss.current_brv
+            manager.execute_action(heroes[0], ActionType.BRV_ATTACK, target=boss)
+            assert boss.current_brv != brv_before
+            assert get_search_worker().is_pending(boss)
+
+            manager.execute_enemy_turn(boss)
+            assert ai.last_stats.prefetched
+            manager.cleanup()
+    finally:
+        config.set("ai.mcts.enabled", enabled)
@@ -0,0 +1,65 @@
+"""
+GimmickUpdater 핸들러 레지스트리 테스트
+"""
+
+import pytest
+from src.character.gimmick_updater import GimmickUpdater
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str, gimmick_type: str = None):
+        self.name = name
+        self.gimmick_type = gimmick_type
+        self.active_traits = []
+
+
+@pytest.fixture
+def registry_snapshot():
+    """테스트 중 등록한 핸들러를 원래대로 복원"""
+    saved = (
+        dict(GimmickUpdater.TURN_END_HANDLERS),
+        dict(GimmickUpdater.TURN_START_HANDLERS),
+        dict(GimmickUpdater.SKILL_USE_HANDLERS),
+    )
+    yield
+    GimmickUpdater.TURN_END_HANDLERS = saved[0]
+    GimmickUpdater.TURN_START_HANDLERS = saved[1]
+    GimmickUpdater.SKILL_USE_HANDLERS = saved[2]
+
+
+def test_registered_handlers_are_dispatched(registry_snapshot):
+    """등록한 턴 시작/종료/스킬 사용 핸들러가 호출되는지 테스트"""
+    calls = []
+    GimmickUpdater.register_gimmick(
+        "test_gimmick",
+        turn_end=lambda c: calls.append(("end", c.name)),
+        turn_start=lambda c, ctx: calls.append(("start", ctx)),
+        skill_use=lambda c, skill: calls.append(("skill", skill)),
+    )
+    char = MockCharacter("Tester", "test_gimmick")
+
+    GimmickUpdater.on_turn_start(char, {"turn": 1})
+    GimmickUpdater.on_skill_use(char, "slash")
+    GimmickUpdater.on_turn_end(char)
+
+    assert calls == [("start", {"turn": 1}), ("skill", "slash"), ("end", "Tester")]
+
+
+def test_builtin_turn_start_handler():
+    """기본 등록된 기믹 핸들러가 동작하는지 테스트"""
+    char = MockCharacter("Gladiator", "crowd_cheer")
+    char.cheer = 10
+
+    GimmickUpdater.on_turn_start(char)
+
+    assert char.cheer == 15
+
+
+def test_unhandled_gimmicks_reported():
+    """핸들러가 없는 기믹 타입만 보고되는지 테스트"""
+    unhandled = GimmickUpdater.get_unhandled_gimmicks(
+        ["stance_system", "magazine_system", "unknown_gimmick"]
+    )
+
+    assert unhandled == ["unknown_gimmick"]
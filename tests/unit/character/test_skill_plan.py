@@ -0,0 +1,121 @@
+"""
+스킬 실행 계획 테스트
+"""
+
+from src.character.skills.costs.stack_cost import StackCost
+from src.character.skills.effects.gimmick_effect import GimmickEffect, GimmickOperation
+from src.character.skills.skill import Skill
+from src.character.skills.skill_manager import SkillManager
+from src.character.skills.skill_plan import get_character_facts
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str, character_class: str = "warrior"):
+        self.name = name
+        self.character_class = character_class
+        self.job_id = character_class
+        self.gimmick_type = None
+        self.is_alive = True
+
+
+class RecordingEffect:
+    """실행 순서와 대상을 기록하는 효과"""
+    def __init__(self, log: list, label: str):
+        self.log = log
+        self.label = label
+
+    def execute(self, user, target, context):
+        self.log.append((self.label, target))
+
+
+class MockCombatManager:
+    """테스트용 전투 관리자"""
+    def __init__(self, allies, enemies):
+        self.allies = allies
+        self.enemies = enemies
+
+
+def test_plan_compiled_at_registration_and_recompiled_on_change():
+    """등록 시 계획을 컴파일하고 effects가 바뀌면 다시 컴파일하는지 테스트"""
+    skill = Skill("test_stack", "Stack Strike")
+    skill.costs = [StackCost("charge_gauge", 10)]
+    skill.sfx = ("combat", "attack_physical")
+
+    SkillManager().register_skill(skill)
+    plan = skill.plan
+
+    assert skill.plan is plan
+    assert plan.cost_list(False) == tuple(skill.costs)
+    assert plan.cost_list(True) == ()
+    assert plan.sfx == ("combat", "attack_physical")
+
+    skill.effects.append(RecordingEffect([], "late"))
+    assert skill.plan is not plan
+    assert len(skill.plan.effects) == 1
+
+
+def test_charge_user_defers_gimmick_consume_and_resolves_allies():
+    """암흑기사는 CONSUME 효과를 마지막에 실행하고 아군 전체 대상이 해석되는지 테스트"""
+    log = []
+    skill = Skill("test_order", "Dark Order")
+    skill.target_type = "all_allies"
+    consume = GimmickEffect(GimmickOperation.CONSUME, "charge_gauge", 0)
+    consume.execute = lambda user, target, context: log.append(("consume", target))
+    skill.effects = [consume, RecordingEffect(log, "hit")]
+
+    knight, mage = MockCharacter("Knight", "dark_knight"), MockCharacter("Mage", "archmage")
+    foe = MockCharacter("Foe")
+    manager = MockCombatManager([knight, mage], [foe])
+
+    assert get_character_facts(knight).is_charge_user
+    assert not get_character_facts(mage).is_charge_user
+
+    skill.execute(knight, foe, {"combat_manager": manager})
+    assert [label for label, _ in log] == ["hit", "consume"]
+    assert log[0][1] == [knight, mage]
+
+    log.clear()
+    skill.execute(mage, foe, {"combat_manager": manager})
+    assert [label for label, _ in log] == ["consume", "hit"]
+
+
+def test_target_resolvers_use_combat_manager_side_map():
+    """전체 대상 해석이 CombatManager의 진영 맵으로 사용자 진영을 판정하는지 테스트"""
+    from src.combat.combat_manager import CombatManager
+
+    log = []
+    skill = Skill("test_side", "Side Check")
+    skill.target_type = "all_enemies"
+    skill.effects = [RecordingEffect(log, "hit")]
+
+    hero, foe, other = MockCharacter("Hero"), MockCharacter("Foe"), MockCharacter("Other")
+    manager = CombatManager()
+    manager.allies, manager.enemies = [hero], [foe]
+    manager._sides = {id(hero): (hero, True), id(foe): (foe, False)}
+
+    skill.execute(foe, hero, {"combat_manager": manager})
+    skill.execute(hero, foe, {"combat_manager": manager})
+    assert [target for _, target in log] == [[hero], [foe]]
+
+    # 맵에 없는 전투원(전투 중 합류)은 리스트에서 찾아 기록
+    manager.allies.append(other)
+    assert manager.is_ally(other) is True
+    assert manager._sides[id(other)] == (other, True)
+    assert manager.is_ally(MockCharacter("Stranger")) is None
+
+
+def test_character_facts_follow_job_and_gimmick_changes():
+    """직업/기믹이 바뀌면 캐시된 캐릭터 정보를 다시 계산하는지 테스트"""
+    char = MockCharacter("Shifter", "archmage")
+    facts = get_character_facts(char)
+    assert not facts.is_charge_user
+    assert get_character_facts(char) is facts
+
+    char.gimmick_type = "charge_system"
+    assert get_character_facts(char).is_charge_user
+    assert get_character_facts(char).gimmick_type == "charge_system"
+
+    char.gimmick_type = None
+    char.character_class = char.job_id = "dark_knight"
+    assert get_character_facts(char).is_charge_user
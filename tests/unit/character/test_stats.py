@@ -0,0 +1,75 @@
+"""
+Stat / StatManager 캐시 테스트
+"""
+
+import pytest
+from src.character.stats import Stat, StatManager
+
+
+def _make_manager() -> StatManager:
+    return StatManager({
+        "hp": {"base_value": 100, "max_value": 500},
+        "strength": {"base_value": 10},
+    })
+
+
+def test_total_value_is_cached_until_change():
+    """보너스/기본값이 바뀔 때만 총 값이 다시 계산되는지 테스트"""
+    stat = Stat("strength", 10)
+    stat.add_bonus("equipment", 5)
+    assert stat.total_value == 15
+    version = stat.version
+
+    assert stat.total_value == 15
+    assert stat.version == version
+
+    stat.add_bonus("equipment", 5)
+    assert stat.version == version
+
+    stat.add_bonus("buff", 3)
+    stat.base_value = 20
+    assert stat.total_value == 28
+
+    stat.remove_bonus("equipment")
+    assert stat.total_value == 23
+
+
+def test_clamp_bounds_invalidate_cache():
+    """최소/최대 값 변경도 캐시를 무효화하는지 테스트"""
+    stat = Stat("hp", 100, max_value=150)
+    stat.add_bonus("equipment", 100)
+    assert stat.total_value == 150
+
+    stat.max_value = None
+    assert stat.total_value == 200
+
+
+def test_snapshot_tracks_stat_changes():
+    """스냅샷이 스탯 변경을 반영하고 사본을 반환하는지 테스트"""
+    manager = _make_manager()
+    snapshot = manager.snapshot()
+    assert snapshot == {"hp": 100, "strength": 10}
+
+    snapshot["hp"] = 0
+    assert manager.snapshot()["hp"] == 100
+
+    version = manager.version
+    manager.add_bonus("hp", "trait", 1000)
+    assert manager.version > version
+    assert manager.snapshot()["hp"] == 500
+
+    manager.add_stat("luck", 7)
+    manager.remove_stat("strength")
+    assert manager.snapshot() == {"hp": 500, "luck": 7}
+
+
+def test_from_dict_restores_cached_manager():
+    """저장 데이터에서 복원한 매니저도 변경 통지가 연결되는지 테스트"""
+    manager = _make_manager()
+    manager.add_bonus("strength", "equipment", 4)
+
+    restored = StatManager.from_dict(manager.to_dict())
+    assert restored.get_value("strength") == pytest.approx(14)
+
+    restored.modify("strength", 1)
+    assert restored.snapshot()["strength"] == pytest.approx(15)
@@ -0,0 +1,42 @@
+"""
+전투 테스트 공통 도우미
+"""
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str, speed: int = 10, attack: int = 20, hp: int = 100):
+        self.name = name
+        self.speed = speed
+        self.level = 1
+
+        self.physical_attack = attack
+        self.physical_defense = 10
+        self.magic_attack = 15
+        self.magic_defense = 8
+        self.luck = 5
+
+        self.current_hp = hp
+        self.max_hp = hp
+        self.current_mp = 50
+        self.max_mp = 50
+
+        self.current_brv = 0
+        self.int_brv = 100
+        self.max_brv = 300
+        self.is_broken = False
+
+        self.is_enemy = False
+        self.is_alive = True
+        self.accuracy = 200
+        self.evasion = 0
+        self.active_traits = []
+
+    def take_damage(self, damage: int) -> int:
+        actual_damage = min(damage, self.current_hp)
+        self.current_hp -= actual_damage
+        if self.current_hp <= 0:
+            self.current_hp = 0
+            self.is_alive = False
+        return actual_damage
+
@@ -168,3 +168,96 @@ def test_get_atb_system_singleton():
     system2 = get_atb_system()
 
     assert system1 is system2
+
+
+def test_advance_to_next_ready_matches_ticking():
+    """다음 행동 시점으로 건너뛴 결과가 틱 단위 진행과 같은지 테스트"""
+    ticking = ATBSystem()
+    jumping = ATBSystem()
+    ticking_chars = [MockCharacter("A", 13), MockCharacter("B", 7)]
+    jumping_chars = [MockCharacter("A", 13), MockCharacter("B", 7)]
+    for char in ticking_chars:
+        ticking.register_combatant(char)
+    for char in jumping_chars:
+        jumping.register_combatant(char)
+
+    ticks = 0
+    while not ticking.get_action_order():
+        ticking.update(1.0)
+        ticks += 1
+
+    assert jumping.advance_to_next_ready(1.0) == ticks
+    assert [c.name for c in jumping.get_action_order()] == ["A"]
+    for ticking_char, jumping_char in zip(ticking_chars, jumping_chars):
+        assert jumping.get_gauge(jumping_char).current == pytest.approx(
+            ticking.get_gauge(ticking_char).current
+        )
+
+    # 이미 행동 가능한 전투원이 있으면 진행하지 않음
+    assert jumping.advance_to_next_ready(1.0) == 0
+
+
+def test_advance_to_next_ready_reschedules_on_change():
+    """ATB 소비/헤이스트로 입력이 바뀌면 다시 스케줄되는지 테스트"""
+    system = ATBSystem()
+    char = MockCharacter("Test", 10)
+    system.register_combatant(char)
+
+    assert system.ticks_until_next_ready() == 1000
+    system.advance_to_next_ready(1.0)
+    system.consume_atb(char)
+    assert system.ticks_until_next_ready() == 1000
+
+    system.apply_status_effect(char, "haste")
+    assert system.ticks_until_next_ready() == 667
+
+
+def test_advance_to_next_ready_respects_max_ticks():
+    """아무도 행동할 수 없으면 max_ticks만큼만 진행하는지 테스트"""
+    system = ATBSystem()
+    char = MockCharacter("Frozen", 0)
+    system.register_combatant(char)
+
+    assert system.ticks_until_next_ready() is None
+    assert system.advance_to_next_ready(1.0) == 0
+    assert system.advance_to_next_ready(1.0, max_ticks=50) == 50
+    assert system.clock == 50
+
+
+def test_ready_queue_reschedules_only_dirty_combatants(monkeypatch):
+    """변경 훅으로 표시된 전투원만 다시 스케줄되는지 테스트"""
+    from src.combat.casting_system import get_casting_system
+
+    casting = get_casting_system()
+    casting.clear()
+    system = ATBSystem()
+    fast, slow = MockCharacter("Fast", 13), MockCharacter("Slow", 7)
+    system.register_combatant(fast)
+    system.register_combatant(slow)
+    system.ticks_until_next_ready()
+
+    rescheduled = []
+    original = ATBSystem._ready_signature
+    monkeypatch.setattr(
+        ATBSystem, "_ready_signature",
+        lambda self, c, *args: rescheduled.append(c.name) or original(self, c, *args)
+    )
+
+    # 변경이 없으면 전체 재검사 없이 기존 예정 시각을 사용
+    system.ticks_until_next_ready()
+    assert rescheduled == []
+
+    system.get_gauge(slow).current = 500
+    system.ticks_until_next_ready()
+    assert rescheduled == ["Slow"]
+
+    # 캐스팅 시작/취소는 캐스팅 시스템 리스너로 시전자만 표시
+    rescheduled.clear()
+    casting.start_cast(fast, object(), None, 0.5)
+    system.ticks_until_next_ready()
+    assert rescheduled == ["Fast"]
+    rescheduled.clear()
+    casting.cancel_cast(fast)
+    system.ticks_until_next_ready()
+    assert rescheduled == ["Fast"]
+    casting.clear()
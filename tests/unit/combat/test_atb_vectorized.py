@@ -0,0 +1,107 @@
+"""
+Vectorized ATB System 테스트
+"""
+
+import pytest
+from src.combat.atb_system import ATBSystem
+from src.combat.atb_vectorized import VectorizedATBSystem, ArrayATBGauge
+from src.combat.casting_system import get_casting_system
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str, speed: int = 10):
+        self.name = name
+        self.speed = speed
+        self.is_enemy = False
+        self.is_alive = True
+        self.active_buffs = {}
+
+
+def _make_party():
+    return [
+        MockCharacter("Fast", 30),
+        MockCharacter("Normal", 12),
+        MockCharacter("Slow", 7),
+        MockCharacter("Buffed", 10),
+    ]
+
+
+def test_vectorized_gauge_is_array_view():
+    """게이지 뷰가 배열 값을 읽고 쓰는지 테스트"""
+    atb = VectorizedATBSystem()
+    char = MockCharacter("Test")
+    atb.register_combatant(char)
+
+    gauge = atb.get_gauge(char)
+    assert isinstance(gauge, ArrayATBGauge)
+
+    gauge.current = 750
+    assert atb.arrays.current[gauge.index] == 750
+    assert gauge.percentage == pytest.approx(750 / 2000)
+
+
+def test_vectorized_matches_default_backend():
+    """기본 ATBSystem과 같은 게이지 값과 행동 순서를 내는지 테스트"""
+    get_casting_system().clear()
+    default_party = _make_party()
+    vector_party = _make_party()
+    default_party[3].active_buffs = {"speed_up": {"value": 0.5}}
+    vector_party[3].active_buffs = {"speed_up": {"value": 0.5}}
+
+    default_atb = ATBSystem()
+    vector_atb = VectorizedATBSystem()
+    for char in default_party:
+        default_atb.register_combatant(char)
+    for char in vector_party:
+        vector_atb.register_combatant(char)
+
+    default_atb.apply_status_effect(default_party[1], "haste")
+    vector_atb.apply_status_effect(vector_party[1], "haste")
+    default_atb.apply_status_effect(default_party[2], "slow")
+    vector_atb.apply_status_effect(vector_party[2], "slow")
+
+    for _ in range(400):
+        default_atb.update(1.0)
+        vector_atb.update(1.0)
+
+    for default_char, vector_char in zip(default_party, vector_party):
+        assert vector_atb.get_gauge(vector_char).current == pytest.approx(
+            default_atb.get_gauge(default_char).current
+        )
+
+    default_order = [c.name for c in default_atb.get_action_order()]
+    vector_order = [c.name for c in vector_atb.get_action_order()]
+    assert vector_order == default_order
+
+
+def test_vectorized_ready_mask_and_dead_combatants():
+    """행동 가능 마스크와 사망자 ATB 처리 테스트"""
+    atb = VectorizedATBSystem()
+    fast = MockCharacter("Fast", 100)
+    dead = MockCharacter("Dead", 100)
+    atb.register_combatant(fast)
+    atb.register_combatant(dead)
+    atb.get_gauge(dead).current = 500
+    dead.is_alive = False
+
+    mask = atb.advance(100.0)
+
+    assert list(mask) == [True, False]
+    assert atb.get_gauge(dead).current == 0
+    assert atb.get_action_order() == [fast]
+
+
+def test_vectorized_unregister_keeps_views_consistent():
+    """전투원 제거 후에도 게이지 뷰가 올바른 슬롯을 가리키는지 테스트"""
+    atb = VectorizedATBSystem()
+    chars = [MockCharacter(f"C{i}", 10 + i) for i in range(3)]
+    for index, char in enumerate(chars):
+        atb.register_combatant(char)
+        atb.get_gauge(char).current = 100 * (index + 1)
+
+    atb.unregister_combatant(chars[0])
+
+    assert atb.combatants == chars[1:]
+    assert atb.get_gauge(chars[1]).current == 200
+    assert atb.get_gauge(chars[2]).current == 300
@@ -0,0 +1,116 @@
+"""
+Balance Sweep 테스트
+"""
+
+import numpy as np
+import pytest
+from src.combat import balance_sweep
+from src.combat.balance_sweep import (
+    build_sweep,
+    SweepResults,
+    BATTLE_COLUMNS,
+    COMPOSITION_MIXED,
+)
+
+
+def _make_row(job: str, floor: int, victory: bool, turns: int, damage: int, hits: int) -> dict:
+    row = {name: 0 for name in BATTLE_COLUMNS}
+    row.update({
+        "job": job,
+        "party": job,
+        "floor": floor,
+        "difficulty": "보통",
+        "victory": victory,
+        "timed_out": False,
+        "turns": turns,
+        "ally_damage_total": damage,
+        "ally_hits": hits,
+        "ally_hit_max": damage,
+        "ally_breaks": 1,
+        "elapsed": 0.0,
+    })
+    return row
+
+
+def test_build_sweep_counts_and_seeds():
+    """조합 수만큼 명세가 생성되고 시드가 겹치지 않는지 테스트"""
+    specs = build_sweep(
+        jobs=["warrior", "archmage"],
+        floors=(1, 5),
+        difficulties=["보통"],
+        battles_per_cell=3,
+        base_seed=100
+    )
+
+    assert len(specs) == 2 * 2 * 3
+    assert [spec.seed for spec in specs] == list(range(100, 112))
+    assert specs[0].party == ("warrior",) * 4
+    assert specs[3].level == 5
+
+
+def test_build_sweep_mixed_composition_is_deterministic():
+    """혼합 파티 구성이 시드로 고정되는지 테스트"""
+    first = build_sweep(jobs=["warrior"], floors=(1,), difficulties=["보통"],
+                        battles_per_cell=5, composition=COMPOSITION_MIXED)
+    second = build_sweep(jobs=["warrior"], floors=(1,), difficulties=["보통"],
+                         battles_per_cell=5, composition=COMPOSITION_MIXED)
+
+    assert [s.party for s in first] == [s.party for s in second]
+    assert all(spec.party[0] == "warrior" for spec in first)
+
+
+def test_build_sweep_rejects_unknown_composition():
+    """알 수 없는 구성 모드는 거부되는지 테스트"""
+    with pytest.raises(ValueError):
+        build_sweep(jobs=["warrior"], composition="unknown")
+
+
+def test_summarize_groups_by_job_and_floor():
+    """직업/층별 승률과 처치 턴이 집계되는지 테스트"""
+    results = SweepResults([
+        _make_row("warrior", 1, True, 10, 100, 4),
+        _make_row("warrior", 1, False, 30, 50, 5),
+        _make_row("archmage", 1, True, 6, 300, 3),
+    ])
+
+    summary = results.summarize()
+
+    assert list(summary["job"]) == ["archmage", "warrior"]
+    assert summary["win_rate"][1] == pytest.approx(0.5)
+    assert summary["turns_mean"][1] == pytest.approx(10.0)
+    assert summary["hit_mean"][0] == pytest.approx(100.0)
+    assert summary["ally_breaks_mean"][0] == pytest.approx(1.0)
+
+
+def test_failed_battles_are_kept_and_reported(monkeypatch):
+    """예외로 끝난 전투가 error 행으로 남고 집계에서는 실패 수로만 보고되는지 테스트"""
+    specs = build_sweep(jobs=["warrior"], floors=(1,), difficulties=["보통"], battles_per_cell=3)
+
+    def flaky_battle(spec):
+        if spec.seed == specs[1].seed:
+            raise RuntimeError("boom")
+        return _make_row("warrior", 1, True, 10, 100, 4)
+
+    monkeypatch.setattr(balance_sweep, "run_battle", flaky_battle)
+    rows = balance_sweep._run_chunk(specs)
+
+    assert len(rows) == 3
+    assert rows[1]["error"] == "RuntimeError: boom" and rows[1]["seed"] == specs[1].seed
+
+    results = SweepResults(rows)
+    summary = results.summarize()
+    assert results.failure_count == 1
+    assert summary["battles"][0] == 3 and summary["failures"][0] == 1
+    assert summary["win_rate"][0] == pytest.approx(1.0)
+
+
+def test_results_round_trip(tmp_path):
+    """열 단위 저장/불러오기 테스트"""
+    results = SweepResults([_make_row("warrior", 1, True, 10, 100, 4)])
+    path = tmp_path / "sweep.npz"
+
+    results.save(str(path))
+    loaded = SweepResults.load(str(path))
+
+    assert len(loaded) == 1
+    assert np.array_equal(loaded.columns["turns"], results.columns["turns"])
@@ -0,0 +1,94 @@
+"""
+공유 전장 분석 테스트
+"""
+
+from src.ai.enemy_ai import EnemyAI
+from src.combat.combat_manager import ActionType, CombatManager
+from src.combat.combat_simulator import headless_mode
+from src.core.event_bus import Events, event_bus
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str, hp: int = 1000, job_name: str = "전사"):
+        self.name = name
+        self.job_name = job_name
+        self.speed = 10
+        self.level = 1
+
+        self.physical_attack = 40
+        self.physical_defense = 10
+        self.magic_attack = 15
+        self.magic_defense = 8
+
+        self.current_hp = hp
+        self.max_hp = 1000
+        self.current_mp = 50
+        self.max_mp = 50
+
+        self.current_brv = 100
+        self.int_brv = 100
+        self.max_brv = 3000
+        self.is_broken = False
+
+        self.is_enemy = False
+        self.is_alive = True
+        self.active_buffs = {}
+
+    def take_damage(self, damage: int) -> int:
+        actual_damage = min(damage, self.current_hp)
+        self.current_hp -= actual_damage
+        if self.current_hp <= 0:
+            self.current_hp = 0
+            self.is_alive = False
+        return actual_damage
+
+
+def _start_battle():
+    heroes = [MockCharacter("Knight", hp=900), MockCharacter("Cleric", hp=300, job_name="백마도사"),
+              MockCharacter("Thief", hp=600)]
+    foes = [MockCharacter("Goblin"), MockCharacter("Orc")]
+    for foe in foes:
+        foe.is_enemy = True
+    manager = CombatManager()
+    manager.start_combat(heroes, foes)
+    return manager, heroes, foes
+
+
+def test_analysis_shared_until_change():
+    """분석을 재사용하다가 HP 변화 이벤트나 행동 실행 후 다시 계산하는지 테스트"""
+    with headless_mode():
+        manager, heroes, foes = _start_battle()
+
+        analysis = manager.get_battlefield_analysis()
+        assert manager.get_battlefield_analysis() is analysis
+        party = analysis.side(manager.allies)
+        assert party.weakest is heroes[1] and party.strongest is heroes[0]
+        assert party.is_support[id(heroes[1])] and not party.is_support[id(heroes[0])]
+        assert party.hp_avg == 600
+
+        event_bus.publish(Events.CHARACTER_HP_CHANGE, {"character": heroes[0]})
+        refreshed = manager.get_battlefield_analysis()
+        assert refreshed is not analysis and refreshed.version > analysis.version
+
+        manager.execute_action(foes[0], ActionType.BRV_ATTACK, target=heroes[2])
+        assert manager.get_battlefield_analysis() is not refreshed
+        manager.cleanup()
+
+
+def test_enemy_ai_uses_shared_analysis():
+    """적 AI가 공유 분석의 진영 정보로 상황을 판단하는지 테스트"""
+    with headless_mode():
+        manager, heroes, foes = _start_battle()
+        analysis = manager.get_battlefield_analysis()
+
+        ai = EnemyAI(foes[0], "지옥")
+        decision = ai.decide_action(manager.enemies, manager.allies, analysis)
+        context = ai._analyze_situation(manager.enemies, manager.allies)
+
+        assert ai.battlefield is analysis
+        assert context["weakest_enemy"] is heroes[1]
+        assert context["alive_enemies"] == 3 and context["alive_allies"] == 2
+        # 지옥 난이도: 힐러이면서 HP가 가장 낮은 대상을 항상 노림
+        assert decision["target"] is heroes[1]
+        manager.cleanup()
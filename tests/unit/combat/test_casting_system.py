@@ -0,0 +1,82 @@
+"""
+CastingSystem 테스트
+"""
+
+from src.combat.atb_system import ATBSystem
+from src.combat.casting_system import CastingState, CastingSystem, get_casting_system
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str, speed: int = 10):
+        self.name = name
+        self.speed = speed
+        self.is_enemy = False
+        self.is_alive = True
+        self.active_buffs = {}
+
+
+class MockSkill:
+    """테스트용 스킬"""
+    def __init__(self, name: str = "Meteor"):
+        self.name = name
+
+
+def test_completions_pop_in_order_with_lazy_cancel():
+    """완료 틱 순서대로 꺼내고 취소/재시전된 항목은 무시하는지 테스트"""
+    casting = CastingSystem()
+    slow, fast, cancelled = MockCharacter("Slow"), MockCharacter("Fast"), MockCharacter("Cancelled")
+
+    casting.start_cast(slow, MockSkill(), None, 0.5)       # 500 / 10 = 50틱
+    casting.start_cast(fast, MockSkill(), None, 0.3)       # 300 / 20 = 15틱
+    casting.start_cast(cancelled, MockSkill(), None, 0.1)  # 100 / 10 = 10틱
+    casting.set_rate(slow, 10)
+    casting.set_rate(fast, 20)
+    casting.set_rate(cancelled, 10)
+
+    casting.advance(5)
+    assert casting.get_cast_info(fast).accumulated_atb == 100
+    casting.cancel_cast(cancelled)
+
+    assert casting.advance(9) == 0
+    assert casting.advance(1) == 1
+    assert [info.caster for info in casting.get_completed_casts()] == [fast]
+
+    # 속도가 바뀌면 남은 양으로 다시 스케줄 (150 + 10 × 35 = 500)
+    casting.set_rate(slow, 35)
+    assert casting.get_cast_info(slow).accumulated_atb == 150
+    casting.advance(10)
+    completed = casting.get_completed_casts()
+    assert [info.caster for info in completed] == [slow]
+    assert completed[0].state == CastingState.CAST_COMPLETE
+    assert not casting.is_casting(slow) and not casting.is_casting(cancelled)
+
+
+def test_atb_update_drives_casting():
+    """ATB 업데이트가 시전자만 진행시키고 완료 후 게이지 증가로 돌아가는지 테스트"""
+    casting = get_casting_system()
+    casting.clear()
+    caster, other = MockCharacter("Caster", speed=20), MockCharacter("Other", speed=20)
+    atb = ATBSystem()
+    atb.register_combatant(caster)
+    atb.register_combatant(other)
+
+    casting.start_cast(caster, MockSkill(), None, 0.1)  # 100 / 2 = 50틱
+    for _ in range(49):
+        atb.update(1.0)
+    assert casting.get_cast_info(caster).accumulated_atb == 98
+    assert atb.get_gauge(caster).current == 0
+    assert atb.get_gauge(other).current == 98
+
+    caster.is_alive = False
+    atb.update(1.0)
+    assert casting.is_casting(caster)
+
+    caster.is_alive = True
+    atb.update(1.0)
+    assert not casting.is_casting(caster)
+    assert len(casting.get_completed_casts()) == 1
+
+    atb.update(1.0)
+    assert atb.get_gauge(caster).current == 2
+    casting.clear()
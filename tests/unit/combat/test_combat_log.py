@@ -0,0 +1,60 @@
+"""
+구조화된 전투 로그 테스트
+"""
+
+from src.combat.combat_log import CombatLog, CombatLogFlag, CombatLogKind
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str):
+        self.name = name
+
+
+def test_ring_buffer_formats_lazily():
+    """용량을 넘으면 오래된 레코드를 덮어쓰고 텍스트는 요청될 때만 만드는지 테스트"""
+    log = CombatLog(capacity=3)
+    seen = []
+    log.add_sink(lambda combat_log, record: seen.append(record.seq))
+
+    knight, goblin = MockCharacter("Knight"), MockCharacter("Goblin")
+    log.record(CombatLogKind.TURN_START, actor=knight)
+    log.record(CombatLogKind.BRV_ATTACK, amount=120, flags=CombatLogFlag.CRITICAL | CombatLogFlag.BREAK)
+    log.record(CombatLogKind.MISS, goblin, knight, flags=CombatLogFlag.TARGET_ALLY)
+    log.message("도망칠 수 없다!", (255, 100, 100))
+
+    assert len(log) == 3 and seen == [0, 1, 2, 3]
+    records = log.records()
+    assert [r.seq for r in records] == [1, 2, 3]
+    assert records[0].text is None and records[1].text is None
+
+    assert log.format(records[0]) == "BRV 공격! 120 데미지 [크리티컬!] [BREAK!]"
+    assert log.color_of(records[0]) == (255, 255, 100)
+    assert records[1].text is None
+    assert log.format_lines(2) == [
+        "[빗나감] 적 Goblin의 공격이 아군 Knight에게 빗나갔다!",
+        "도망칠 수 없다!",
+    ]
+    assert log.records(1, 2) == [records[1]]
+
+
+def test_binary_dump_round_trip():
+    """바이너리 덤프에서 복원한 로그가 같은 텍스트와 색상을 내는지 테스트"""
+    log = CombatLog(capacity=8)
+    hero = MockCharacter("용사")
+    log.record(CombatLogKind.WOUND, target=hero, amount=40, extra=90, total=300)
+    log.record(CombatLogKind.STATUS_PROC, target=hero, note="기절", extra=30)
+    log.record(CombatLogKind.HP_ATTACK, amount=2 ** 40, flags=CombatLogFlag.KO)
+    log.message("방어 자세!", (100, 200, 255))
+
+    data = log.dumps()
+    restored = CombatLog.loads(data)
+
+    assert len(restored) == 4 and restored.capacity == 8
+    assert restored.format_lines()[:2] == ["상처 축적: 용사 +40 (총 90/300)", "[기절] 용사 기절! (30% 확률)"]
+    assert restored.format_lines()[2] == "HP 공격! 2147483647 HP 데미지 [격파!]"
+    last = restored.records()[-1]
+    assert restored.format(last) == "방어 자세!" and restored.color_of(last) == (100, 200, 255)
+
+    restored.record(CombatLogKind.DEFEND)
+    assert restored.records()[-1].seq == 4
@@ -0,0 +1,146 @@
+"""
+전투 입력 기록/재생 및 난수 스트림 테스트
+"""
+
+from src.combat.combat_manager import ActionType, CombatManager, CombatState
+from src.combat.combat_recorder import CombatRecorder, CombatRecording, CombatReplayer
+from src.combat.atb_system import get_atb_system
+from src.combat.combat_simulator import CombatSimulator, headless_mode
+from src.core.rng import RngManager, RngStreams, get_rng_manager
+
+from conftest import MockCharacter
+
+
+def _make_party():
+    allies = [MockCharacter("Hero", speed=12, attack=30), MockCharacter("Mage", speed=9, attack=25)]
+    enemies = [MockCharacter("Wolf", speed=11, hp=150), MockCharacter("Bat", speed=14, hp=80)]
+    for enemy in enemies:
+        enemy.is_enemy = True
+    return allies, enemies
+
+
+def _record_battle(seed: int):
+    """BRV 두 번 → HP 한 번 순서로 행동하는 전투를 기록 (기록, 최종 HP)"""
+    allies, enemies = _make_party()
+    manager = CombatManager()
+    manager.recorder = CombatRecorder(seed=seed)
+    turns = 0
+    with headless_mode(True):
+        try:
+            manager.start_combat(allies, enemies)
+            for _ in range(5000):
+                if manager.state not in (CombatState.IN_PROGRESS, CombatState.PLAYER_TURN):
+                    break
+                manager.update(delta_time=1.0)
+                for actor in manager.atb.get_action_order():
+                    if manager.state not in (CombatState.IN_PROGRESS, CombatState.PLAYER_TURN):
+                        break
+                    opponents = manager.allies if actor in manager.enemies else manager.enemies
+                    targets = [c for c in opponents if c.is_alive]
+                    if not targets:
+                        break
+                    action = ActionType.HP_ATTACK if turns % 3 == 2 else ActionType.BRV_ATTACK
+                    manager.execute_action(actor, action, target=targets[0])
+                    turns += 1
+        finally:
+            manager.cleanup()
+    return manager.recorder.recording, [c.current_hp for c in allies + enemies]
+
+
+def test_rng_streams_are_named_and_reseed_in_place():
+    """이름별 스트림이 서로 독립적이고 재시드해도 같은 객체로 같은 수열을 내는지 테스트"""
+    manager = RngManager(seed=1234)
+    damage = manager.stream(RngStreams.DAMAGE)
+    atb = manager.stream(RngStreams.ATB)
+    first = [damage.random() for _ in range(3)]
+
+    # 다른 스트림 소비는 데미지 스트림에 영향 없음
+    manager.reseed(1234)
+    [atb.random() for _ in range(10)]
+    assert manager.stream(RngStreams.DAMAGE) is damage
+    assert [damage.random() for _ in range(3)] == first
+
+    # 상태 저장/복원과 층 시드별 전투 시드
+    state = manager.get_state()
+    value = damage.random()
+    manager.set_state(state)
+    assert damage.random() == value
+    manager.reseed(99)
+    combat_seeds = [manager.next_combat_seed(), manager.next_combat_seed()]
+    manager.reseed(99)
+    assert [manager.next_combat_seed(), manager.next_combat_seed()] == combat_seeds
+    assert combat_seeds[0] != combat_seeds[1]
+
+
+def test_replay_reproduces_recorded_battle(tmp_path):
+    """기록된 전투를 새 전투원으로 재생하면 같은 결과가 나오고 중간에 멈출 수 있는지 테스트"""
+    recording, final_hp = _record_battle(seed=77)
+    assert recording.action_count > 0
+    recording.save(tmp_path / "battle.json")
+    loaded = CombatRecording.load(tmp_path / "battle.json")
+
+    allies, enemies = _make_party()
+    result = CombatReplayer(loaded).run(allies, enemies)
+    assert result.in_sync
+    assert result.actions == recording.action_count
+    assert result.outcome in (CombatState.VICTORY, CombatState.DEFEAT)
+
+    assert [c.current_hp for c in allies + enemies] == final_hp
+
+    # stop_at: 지정한 행동 직전에서 멈추고 콜백으로 상태 조사
+    seen = []
+    allies, enemies = _make_party()
+    partial = CombatReplayer(loaded, stop_at=2, on_stop=lambda m: seen.append(m.turn_count)).run(allies, enemies)
+    assert partial.actions == 2 and partial.in_sync
+    assert len(seen) == 1
+
+
+def test_recorder_reseeds_only_combat_streams():
+    """기록 시작이 전투 스트림만 고정하고 탐험 스트림/층 시드/전투 카운터는 유지하는지 테스트"""
+    rng = get_rng_manager()
+    rng.reseed(4321)
+    exploration = rng.stream(RngStreams.EXPLORATION)
+    damage = rng.stream(RngStreams.DAMAGE)
+    expected_exploration = exploration.getstate()
+    expected_combat_seeds = [rng.next_combat_seed() for _ in range(2)]
+
+    rng.reseed(4321)
+    recorder = CombatRecorder()
+    recorder.begin()
+    assert recorder.recording.seed == expected_combat_seeds[0]
+    assert exploration.getstate() == expected_exploration
+    assert rng.seed == 4321
+    assert rng.next_combat_seed() == expected_combat_seeds[1]
+
+    # 같은 전투 시드면 전투 스트림은 같은 수열
+    first = [damage.random() for _ in range(3)]
+    CombatRecorder(seed=recorder.recording.seed).begin()
+    assert [damage.random() for _ in range(3)] == first
+    rng.reseed(None)
+
+
+def test_event_driven_simulation_replays_with_skipped_ticks():
+    """이벤트 기반 시뮬레이터가 건너뛴 틱도 기록되어 재생 결과/틱 수/승패가 같은지 테스트"""
+    allies, enemies = _make_party()
+    manager = CombatManager()
+    manager.recorder = CombatRecorder(seed=31)
+    with headless_mode(True):
+        try:
+            simulated = CombatSimulator(event_driven=True)._run_battle(manager, allies, enemies)
+        finally:
+            manager.cleanup()
+    recording = manager.recorder.recording
+    final_hp = [c.current_hp for c in allies + enemies]
+    assert any(entry[0] == "idle" for entry in recording.entries)
+    assert recording.meta["outcome"] == simulated.outcome.value
+
+    for _ in range(2):
+        allies, enemies = _make_party()
+        result = CombatReplayer(recording).run(allies, enemies)
+        assert result.in_sync
+        assert result.ticks == simulated.ticks
+        assert result.outcome == simulated.outcome
+        assert [c.current_hp for c in allies + enemies] == final_hp
+        # 재생한 전투원이 전역 ATB에 남지 않음
+        assert not get_atb_system().gauges
+
@@ -0,0 +1,146 @@
+"""
+Combat Simulator 테스트
+"""
+
+import pytest
+from src.combat.combat_manager import CombatState
+from src.combat.combat_simulator import (
+    CombatSimulator,
+    CombatPolicy,
+    BasicAllyPolicy,
+    EnemyAIPolicy,
+    SimulationResult,
+)
+
+from conftest import MockCharacter
+
+
+class AlwaysAttackPolicy(CombatPolicy):
+    """항상 첫 번째 대상에게 BRV 공격"""
+    def __init__(self):
+        self.calls = 0
+
+    def decide(self, manager, actor):
+        self.calls += 1
+        targets = [e for e in manager.allies if e.is_alive]
+        return {"type": "attack", "target": targets[0]}
+
+
+def _make_enemy(name: str, **kwargs) -> MockCharacter:
+    enemy = MockCharacter(name, **kwargs)
+    enemy.is_enemy = True
+    return enemy
+
+
+def test_simulator_runs_battle_to_completion():
+    """전투가 승리/패배로 끝까지 진행되는지 테스트"""
+    simulator = CombatSimulator(ally_policy=BasicAllyPolicy(skill_chance=0.0))
+    allies = [MockCharacter("Hero", speed=12, attack=40)]
+    enemies = [_make_enemy("Slime", speed=8, hp=60)]
+
+    result = simulator.run(allies, enemies, seed=1)
+
+    assert isinstance(result, SimulationResult)
+    assert result.outcome in (CombatState.VICTORY, CombatState.DEFEAT)
+    assert not result.timed_out
+    assert result.actions > 0
+    assert result.ticks > 0
+
+
+def test_simulator_victory_records_damage():
+    """압도적인 아군은 승리하고 피해량이 기록되는지 테스트"""
+    simulator = CombatSimulator(ally_policy=BasicAllyPolicy(skill_chance=0.0))
+    allies = [MockCharacter("Hero", speed=30, attack=200, hp=5000)]
+    enemies = [_make_enemy("Slime", speed=5, attack=1, hp=50)]
+
+    result = simulator.run(allies, enemies, seed=2)
+
+    assert result.victory
+    assert result.enemies_alive == 0
+    assert sum(result.ally_damage) >= 50
+
+
+def test_simulator_uses_custom_enemy_policy():
+    """사용자 정의 적 정책이 호출되는지 테스트"""
+    policy = AlwaysAttackPolicy()
+    simulator = CombatSimulator(
+        ally_policy=BasicAllyPolicy(skill_chance=0.0),
+        enemy_policy=policy
+    )
+    allies = [MockCharacter("Hero", speed=5, hp=5000)]
+    enemies = [_make_enemy("Goblin", speed=20, hp=2000)]
+
+    simulator.run(allies, enemies, seed=3)
+
+    assert policy.calls > 0
+
+
+def test_simulator_is_deterministic_with_seed():
+    """같은 시드는 같은 결과를 내는지 테스트"""
+    def run_once():
+        simulator = CombatSimulator(ally_policy=BasicAllyPolicy(skill_chance=0.0))
+        allies = [MockCharacter("Hero", speed=12, attack=30)]
+        enemies = [_make_enemy("Wolf", speed=11, hp=120)]
+        return simulator.run(allies, enemies, seed=42)
+
+    first = run_once()
+    second = run_once()
+
+    assert first.outcome == second.outcome
+    assert first.ticks == second.ticks
+    assert first.ally_damage == second.ally_damage
+
+
+def test_simulator_respects_tick_limit():
+    """틱 제한에 도달하면 결판 없이 종료되는지 테스트"""
+    simulator = CombatSimulator(max_ticks=5)
+    allies = [MockCharacter("Hero", speed=1, hp=5000)]
+    enemies = [_make_enemy("Golem", speed=1, hp=5000)]
+
+    result = simulator.run(allies, enemies, seed=4)
+
+    assert result.ticks == 5
+    assert result.timed_out
+
+
+class SelfHealPolicy(EnemyAIPolicy):
+    """첫 턴에 HealEffect 스킬로 자신을 회복, 이후 기본 적 AI"""
+    def __init__(self):
+        super().__init__()
+        from src.character.skills.effects.heal_effect import HealEffect
+        from src.character.skills.skill import Skill
+        from src.character.skills.skill_manager import get_skill_manager
+
+        self.heal_skill = Skill("test_self_heal", "자가 회복")
+        self.heal_skill.target_type = "self"
+        self.heal_skill.effects = [HealEffect(fixed_amount=15)]
+        get_skill_manager().register_skill(self.heal_skill)
+        self.heals = 0
+
+    def decide(self, manager, actor):
+        if not self.heals:
+            self.heals += 1
+            return {"type": "skill", "skill": self.heal_skill, "target": actor}
+        return super().decide(manager, actor)
+
+
+def test_simulator_finishes_battle_with_healer_enemy():
+    """HealEffect 스킬을 쓰는 적(SimpleEnemy)과의 전투도 끝까지 진행되는지 테스트"""
+    from src.core.rng import seed_all
+    from src.world.enemy_generator import ENEMY_TEMPLATES, SimpleEnemy
+
+    def run_once():
+        seed_all(7)  # 적 스탯 편차도 고정
+        policy = SelfHealPolicy()
+        simulator = CombatSimulator(ally_policy=BasicAllyPolicy(skill_chance=0.0), enemy_policy=policy)
+        allies = [MockCharacter("Hero", speed=5, attack=60, hp=3000)]
+        enemies = [SimpleEnemy(ENEMY_TEMPLATES["slime"])]
+        return simulator.run(allies, enemies, seed=7), policy
+
+    result, policy = run_once()
+    assert policy.heals == 1
+    assert result.outcome in (CombatState.VICTORY, CombatState.DEFEAT)
+    assert not result.timed_out
+
+    again, _ = run_once()
+    assert (again.outcome, again.ticks, again.ally_damage) == (result.outcome, result.ticks, result.ally_damage)
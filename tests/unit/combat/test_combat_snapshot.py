@@ -0,0 +1,150 @@
+"""
+Combat Snapshot 테스트
+"""
+
+import random
+
+from src.combat.combat_manager import CombatManager, CombatState
+from src.combat.combat_snapshot import CombatSnapshot, lookahead, simulate_action
+from src.combat.combat_simulator import CombatSimulator, headless_mode
+from src.combat.status_effects import StatusEffect, StatusManager, StatusType
+from src.core.event_bus import event_bus, Events
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str, hp: int = 500, attack: int = 40):
+        self.name = name
+        self.speed = 10
+        self.level = 1
+
+        self.physical_attack = attack
+        self.physical_defense = 10
+        self.magic_attack = 15
+        self.magic_defense = 8
+        self.luck = 5
+
+        self.current_hp = hp
+        self.max_hp = hp
+        self.current_mp = 50
+        self.max_mp = 50
+
+        self.current_brv = 200
+        self.int_brv = 100
+        self.max_brv = 300
+        self.is_broken = False
+
+        self.is_enemy = False
+        self.is_alive = True
+        self.accuracy = 200
+        self.evasion = 0
+        self.active_traits = []
+        self.active_buffs = {"attack_up": {"value": 0.2, "duration": 3}}
+
+    def take_damage(self, damage: int) -> int:
+        actual_damage = min(damage, self.current_hp)
+        self.current_hp -= actual_damage
+        if self.current_hp <= 0:
+            self.current_hp = 0
+            self.is_alive = False
+        return actual_damage
+
+
+def _start_battle(enemy_hp: int = 500):
+    hero = MockCharacter("Hero")
+    hero.status_manager = StatusManager(owner_name="Hero", owner=hero)
+    hero.status_effects = hero.status_manager.status_effects
+    hero.status_manager.add_status(StatusEffect(name="독", status_type=StatusType.POISON, duration=3))
+    enemy = MockCharacter("Slime", hp=enemy_hp)
+    enemy.is_enemy = True
+
+    manager = CombatManager()
+    manager.start_combat([hero], [enemy])
+    manager.atb.get_gauge(hero).current = 1200
+    return manager, hero, enemy
+
+
+def _state(manager, hero, enemy):
+    return (
+        hero.current_hp, hero.current_brv, enemy.current_hp, enemy.current_brv,
+        enemy.is_alive, hero.active_buffs["attack_up"]["duration"],
+        [(e.status_type, e.duration) for e in hero.status_manager.status_effects],
+        manager.atb.get_gauge(hero).current, manager.state, manager.turn_count,
+    )
+
+
+def test_restore_returns_to_captured_state():
+    """행동을 실행한 뒤 복원하면 HP/BRV/ATB/상태이상/난수가 캡처 시점으로 돌아오는지 테스트"""
+    with headless_mode():
+        manager, hero, enemy = _start_battle()
+        random.seed(5)
+        before = _state(manager, hero, enemy)
+        snapshot = CombatSnapshot.capture(manager)
+        expected_roll = random.random()
+        snapshot.restore()
+
+        for action in ("hp_attack", "attack"):
+            CombatSimulator.execute_decision(manager, hero, {"type": action, "target": enemy})
+            hero.active_buffs["attack_up"]["duration"] -= 1
+            hero.status_manager.update_duration()
+            hero.trial_marker = True
+            assert _state(manager, hero, enemy) != before
+
+            snapshot.restore()
+            assert _state(manager, hero, enemy) == before
+            assert not hasattr(hero, "trial_marker")
+            assert hero.status_effects is hero.status_manager.status_effects
+            assert random.random() == expected_roll
+            snapshot.restore()
+
+        manager.cleanup()
+
+
+def test_lookahead_blocks_events_and_combat_end():
+    """시험 실행 중 전투가 끝나도 이벤트/종료 콜백 없이 원래 상태로 돌아오는지 테스트"""
+    received = []
+    ended = []
+
+    def on_brv_change(data):
+        received.append(data)
+
+    event_bus.subscribe(Events.CHARACTER_BRV_CHANGE, on_brv_change)
+    try:
+        with headless_mode():
+            manager, hero, enemy = _start_battle(enemy_hp=1)
+            manager.on_combat_end = ended.append
+            before = _state(manager, hero, enemy)
+            received.clear()
+
+            with lookahead(manager):
+                CombatSimulator.execute_decision(manager, hero, {"type": "hp_attack", "target": enemy})
+                manager._check_battle_end()
+                assert manager.state == CombatState.VICTORY
+
+            assert _state(manager, hero, enemy) == before
+            assert manager.atb.get_gauge(hero) is not None
+            assert received == []
+            assert ended == []
+            assert manager.on_combat_end is not None
+
+            CombatSimulator.execute_decision(manager, hero, {"type": "hp_attack", "target": enemy})
+            assert received
+            manager.cleanup()
+    finally:
+        event_bus.unsubscribe(Events.CHARACTER_BRV_CHANGE, on_brv_change)
+
+
+def test_simulate_action_evaluates_and_rolls_back():
+    """simulate_action이 평가 결과를 반환하고 상태는 바꾸지 않는지 테스트"""
+    with headless_mode():
+        manager, hero, enemy = _start_battle()
+        before = _state(manager, hero, enemy)
+
+        enemy_hp = simulate_action(
+            manager, hero, {"type": "hp_attack", "target": enemy},
+            evaluate=lambda m: m.enemies[0].current_hp
+        )
+
+        assert enemy_hp < enemy.current_hp
+        assert _state(manager, hero, enemy) == before
+        manager.cleanup()
@@ -2,8 +2,10 @@
 Damage Calculator 테스트
 """
 
+
 import pytest
 from src.combat.damage_calculator import DamageCalculator, DamageResult, get_damage_calculator
+from src.core.rng import seed_all
 
 
 class MockCharacter:
@@ -203,3 +205,38 @@ def test_get_damage_calculator_singleton():
     calc2 = get_damage_calculator()
 
     assert calc1 is calc2
+
+
+def test_brv_damage_batch_matches_sequential():
+    """일괄 BRV 데미지가 같은 시드의 개별 계산 결과와 같은지 테스트"""
+    calc = DamageCalculator()
+    attacker = MockCharacter("Attacker")
+    defenders = [MockCharacter(f"Defender{i}") for i in range(4)]
+    for i, defender in enumerate(defenders):
+        defender.physical_defense = 20 + i * 30
+
+    seed_all(42)
+    sequential = [calc.calculate_brv_damage(attacker, d, skill_multiplier=1.5) for d in defenders]
+    seed_all(42)
+    batch = calc.calculate_brv_damage_batch(attacker, defenders, skill_multiplier=1.5)
+
+    assert batch == sequential
+
+
+def test_hp_damage_batch_per_target_break():
+    """일괄 HP 데미지에서 대상별 BREAK 여부가 반영되는지 테스트"""
+    calc = DamageCalculator()
+    attacker = MockCharacter("Attacker")
+    defenders = [MockCharacter("Broken"), MockCharacter("Normal")]
+
+    seed_all(7)
+    sequential = [
+        calc.calculate_hp_damage(attacker, defenders[0], brv_points=500, is_break=True),
+        calc.calculate_hp_damage(attacker, defenders[1], brv_points=500, is_break=False),
+    ]
+    seed_all(7)
+    batch = calc.calculate_hp_damage_batch(attacker, defenders, brv_points=500, is_break=[True, False])
+
+    assert batch == sequential
+    assert batch[0][0].details["is_break"] is True
+    assert batch[1][0].details["is_break"] is False
@@ -0,0 +1,80 @@
+"""
+EnemySkillDatabase 테스트
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.combat.enemy_skills import EnemySkillDatabase, SkillTargetType
+
+
+def test_templates_built_lazily_per_enemy_type():
+    """인덱스만 먼저 만들고 요청된 적 타입의 스킬만 템플릿으로 생성하는지 테스트"""
+    EnemySkillDatabase.reset()
+    EnemySkillDatabase.initialize()
+    assert EnemySkillDatabase.SKILLS == {}
+    assert EnemySkillDatabase.get_skill_ids_for_enemy_type("Goblin") == ["poison_stab", "goblin_flee"]
+
+    skills = EnemySkillDatabase.get_skills_for_enemy_type("goblin")
+
+    assert [s.skill_id for s in skills] == ["poison_stab", "goblin_flee"]
+    assert set(EnemySkillDatabase.SKILLS) == {"poison_stab", "goblin_flee"}
+    assert skills[0].status_effects == ["poison"]
+    assert skills[1].target_type == SkillTargetType.SELF
+    assert EnemySkillDatabase.get_skills_for_enemy_type("unknown") == []
+
+
+def test_instances_do_not_share_mutable_fields():
+    """적마다 받은 스킬이 템플릿과 목록/딕셔너리, 쿨다운을 공유하지 않는지 테스트"""
+    first = EnemySkillDatabase.get_skill("heavy_strike")
+    second = EnemySkillDatabase.get_skill("heavy_strike")
+    template = EnemySkillDatabase.get_template("heavy_strike")
+
+    first.activate_cooldown()
+    first.status_effects.append("stun")
+    first.buff_stats["strength"] = 2.0
+
+    assert first.current_cooldown == template.values["cooldown"] > 0
+    assert second.current_cooldown == 0 and template.values["current_cooldown"] == 0
+    assert second.status_effects == list(template.values["status_effects"])
+    assert "stun" not in template.values["status_effects"] and second.buff_stats == {}
+    assert first.sfx == ("combat", "damage_high")
+    assert EnemySkillDatabase.get_skill("no_such_skill") is None
+
+    with pytest.raises(FrozenInstanceError):
+        template.skill_id = "other"
+    with pytest.raises(TypeError):
+        template.values["cooldown"] = 0
+
+
+def test_data_file_errors(tmp_path, monkeypatch):
+    """잘못된 구조는 바로 실패하고, 읽지 못한 파일은 로드 완료로 표시하지 않는지 테스트"""
+    path = tmp_path / "enemy_skills.yaml"
+    monkeypatch.setattr(EnemySkillDatabase, "DATA_PATH", path)
+    EnemySkillDatabase.reset()
+    try:
+        EnemySkillDatabase.initialize()
+        assert not EnemySkillDatabase._loaded
+        assert EnemySkillDatabase.get_skills_for_enemy_type("goblin") == []
+
+        path.write_text("skills:\n  jab:\n    name: Jab\n    description: ''\n"
+                        "enemy_types:\n  goblin: [jab, missing]\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="missing"):
+            EnemySkillDatabase.initialize()
+
+        path.write_text("skills:\n  jab:\n    name: Jab\n    description: ''\n"
+                        "  - stray\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            EnemySkillDatabase.initialize()
+
+        path.write_text("skills:\n  jab:\n    name: Jab\n    description: ''\n    dmage: 3\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="dmage"):
+            EnemySkillDatabase.initialize()
+        assert not EnemySkillDatabase._loaded
+
+        path.write_text("skills:\n  jab:\n    name: Jab\n    description: ''\n"
+                        "enemy_types:\n  goblin: [jab]\n", encoding="utf-8")
+        assert [s.name for s in EnemySkillDatabase.get_skills_for_enemy_type("goblin")] == ["Jab"]
+    finally:
+        EnemySkillDatabase.reset()
@@ -0,0 +1,57 @@
+"""
+파티 전투원 풀 테스트
+"""
+
+from src.combat.party_combatants import PartyCombatantPool
+from src.core.event_bus import Events, event_bus
+from src.ui.party_setup import PartyMember
+
+
+def _make_member(name: str = "Aria", job_id: str = "warrior") -> PartyMember:
+    return PartyMember(job_id=job_id, job_name=job_id, character_name=name, stats={"hp": 100})
+
+
+def test_pool_reuses_character_across_combats():
+    """같은 멤버는 한 번만 Character로 만들고 전투 간 상태가 유지되는지 테스트"""
+    pool = PartyCombatantPool()
+    member = _make_member()
+    created = []
+    handler = lambda data: created.append(data["name"])
+    event_bus.subscribe(Events.CHARACTER_CREATED, handler)
+    try:
+        first = pool.convert([member, "not-a-member"])
+        first[0].current_hp -= 10
+        second = pool.convert([member])
+    finally:
+        event_bus.unsubscribe(Events.CHARACTER_CREATED, handler)
+
+    assert first[1] == "not-a-member"
+    assert second[0] is first[0]
+    assert second[0].current_hp == second[0].max_hp - 10
+    assert created == ["Aria"]
+    assert pool.created == 1 and pool.synced == 1
+
+
+def test_pool_syncs_changed_fields_and_rebuilds_on_job_change():
+    """이름/플레이어/특성 변경은 그 자리에서 반영하고 직업 변경 시에만 다시 만드는지 테스트"""
+    pool = PartyCombatantPool()
+    member = _make_member()
+    member.selected_traits = ["adaptive_combat"]
+    character = pool.get_character(member)
+    assert "adaptive_combat" in character.active_traits
+
+    member.character_name = "Bran"
+    member.player_id = "p2"
+    member.selected_traits = ["combat_instinct"]
+    assert pool.get_character(member) is character
+    assert character.name == "Bran" and character.player_id == "p2"
+    assert character.active_traits == ["combat_instinct"]
+
+    member.job_id = "knight"
+    rebuilt = pool.get_character(member)
+    assert rebuilt is not character
+    assert rebuilt.job_id == "knight" and rebuilt.name == "Bran"
+    assert pool.created == 2 and len(pool) == 1
+
+    del member
+    assert len(pool) == 0
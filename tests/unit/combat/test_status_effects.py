@@ -525,3 +525,43 @@ class TestEdgeCases:
         # duration이 음수가 되어 만료됨
         assert len(expired) == 1
         assert len(manager.status_effects) == 0
+
+
+class TestStatusIndex:
+    """상태 타입 인덱스/캐시 테스트"""
+
+    def test_active_mask_follows_add_and_remove(self):
+        """추가/제거 시 비트마스크가 갱신됨"""
+        manager = StatusManager("TestChar")
+        manager.add_status(create_status_effect("기절", StatusType.STUN, 2))
+        assert not manager.can_act()
+
+        manager.remove_status(StatusType.STUN)
+        assert manager.can_act()
+        assert manager.active_mask == 0
+
+    def test_direct_list_mutation_invalidates_index(self):
+        """리스트를 직접 수정해도 인덱스가 어긋나지 않음"""
+        manager = StatusManager("TestChar")
+        assert manager.can_use_skills()
+
+        manager.status_effects.append(create_status_effect("침묵", StatusType.SILENCE, 2))
+        assert manager.has_status(StatusType.SILENCE)
+        assert not manager.can_use_skills()
+
+        manager.status_effects = []
+        assert manager.can_use_skills()
+
+    def test_stat_modifiers_cached_until_change(self):
+        """스탯 배율은 캐시되고 추가/갱신/만료 시 다시 계산됨"""
+        manager = StatusManager("TestChar")
+        manager.add_status(create_status_effect("공격력 증가", StatusType.BOOST_ATK, 1, intensity=1.0))
+        first = manager.get_stat_modifiers()
+        first['physical_attack'] = 99.0
+        assert manager.get_stat_modifiers()['physical_attack'] == pytest.approx(1.2)
+
+        manager.add_status(create_status_effect("공격력 증가", StatusType.BOOST_ATK, 1, intensity=2.0))
+        assert manager.get_stat_modifiers()['physical_attack'] == pytest.approx(1.4)
+
+        manager.update_duration()
+        assert manager.get_stat_modifiers()['physical_attack'] == pytest.approx(1.0)
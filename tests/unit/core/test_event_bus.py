@@ -0,0 +1,141 @@
+"""
+EventBus 테스트
+"""
+
+from src.core.event_bus import EventBus
+
+
+def test_subscribe_dedup_and_priority_order():
+    """중복 구독은 무시되고 우선순위 높은 순으로 호출되는지 테스트"""
+    bus = EventBus()
+    calls = []
+
+    def low(data):
+        calls.append("low")
+
+    def first(data):
+        calls.append("first")
+
+    def second(data):
+        calls.append("second")
+
+    def high(data):
+        calls.append("high")
+
+    bus.subscribe("test", low, priority=-1)
+    bus.subscribe("test", first)
+    bus.subscribe("test", second)
+    bus.subscribe("test", first)
+    bus.subscribe("test", high, priority=10)
+
+    bus.publish("test")
+
+    assert calls == ["high", "first", "second", "low"]
+
+
+def test_history_is_bounded():
+    """히스토리가 최대 개수만 유지되는지 테스트"""
+    bus = EventBus()
+    for i in range(bus._max_history + 20):
+        bus.publish("tick", i)
+
+    history = bus.get_event_history("tick")
+    assert len(history) == bus._max_history
+    assert history[0] == ("tick", 20)
+
+
+def test_unsubscribe_during_dispatch():
+    """전달 중 구독 해제해도 이번 전달은 모든 구독자에게 가는지 테스트"""
+    bus = EventBus()
+    calls = []
+
+    def first(data):
+        calls.append("first")
+        bus.unsubscribe("test", second)
+
+    def second(data):
+        calls.append("second")
+
+    bus.subscribe("test", first)
+    bus.subscribe("test", second)
+
+    bus.publish("test")
+    bus.publish("test")
+
+    assert calls == ["first", "second", "first"]
+
+
+def test_deferred_events_flush_in_order():
+    """지연 블록의 이벤트가 블록 종료 시 발행 순서대로 전달되는지 테스트"""
+    bus = EventBus()
+    received = []
+    bus.subscribe("a", lambda data: received.append(("a", data)))
+    bus.subscribe("b", lambda data: received.append(("b", data)))
+
+    with bus.deferred():
+        bus.publish("a", 1)
+        with bus.deferred():
+            bus.publish("b", 2)
+        assert received == []
+        bus.publish("a", 3)
+
+    assert received == [("a", 1), ("b", 2), ("a", 3)]
+    assert len(bus.get_event_history()) == 3
+
+
+def test_profiling_records_counts_latency_and_errors():
+    """프로파일링 모드에서 발행 횟수/구독자 통계/실패 횟수가 기록되는지 테스트"""
+    bus = EventBus()
+
+    def ok(data):
+        pass
+
+    def broken(data):
+        raise ValueError("boom")
+
+    bus.subscribe("hit", ok)
+    bus.subscribe("hit", broken)
+    bus.enable_profiling()
+
+    bus.publish("hit", 1)
+    bus.publish("hit", 2)
+    bus.publish("miss")
+
+    stats = bus.get_profile_stats()
+    assert stats["publish_counts"] == {"hit": 2, "miss": 1}
+    assert stats["errors"] == {"hit": 2}
+
+    by_name = {entry["callback"].rsplit(".", 1)[-1]: entry for entry in stats["subscribers"]}
+    assert by_name["ok"]["calls"] == 2
+    assert by_name["broken"]["errors"] == 2
+    assert by_name["ok"]["max_time"] <= by_name["ok"]["total_time"]
+
+    report = bus.get_profile_report()
+    assert "hit" in report and "broken" in report
+
+
+def test_errors_counted_without_profiling():
+    """프로파일링이 꺼져 있어도 콜백 실패는 집계되는지 테스트"""
+    bus = EventBus()
+    bus.subscribe("hit", lambda data: 1 / 0)
+
+    bus.publish("hit")
+
+    assert bus.error_counts["hit"] == 1
+    assert bus.get_profile_stats()["publish_counts"] == {}
+
+
+def test_suppressed_events_are_dropped():
+    """차단 블록 안에서 발행된 이벤트는 전달/기록되지 않고 지연된 이벤트는 유지되는지 테스트"""
+    bus = EventBus()
+    received = []
+    bus.subscribe("a", received.append)
+
+    with bus.deferred():
+        bus.publish("a", 1)
+        with bus.suppressed():
+            bus.publish("a", 2)
+    bus.publish("a", 3)
+
+    assert received == [1, 3]
+    assert bus.get_event_history() == [("a", 1), ("a", 3)]
@@ -0,0 +1,82 @@
+"""
+플로우 필드(Dijkstra 거리 맵) 테스트
+"""
+
+from src.world.dungeon_generator import DungeonMap
+from src.world.exploration import Enemy, ExplorationSystem
+from src.world.flow_field import FlowField
+from src.world.tile import TileType
+
+
+def _make_room(width: int = 20, height: int = 12) -> DungeonMap:
+    """벽으로 둘러싼 방, x=8에 위쪽(y=1)만 뚫린 세로 벽"""
+    dungeon = DungeonMap(width, height)
+    for y in range(height):
+        for x in range(width):
+            edge = x in (0, width - 1) or y in (0, height - 1)
+            dungeon.set_tile(x, y, TileType.WALL if edge or (x == 8 and y >= 2) else TileType.FLOOR)
+    return dungeon
+
+
+def test_flow_field_routes_around_walls_from_all_goals():
+    """여러 목표 중 가까운 쪽으로, 벽을 돌아가는 거리를 계산하는지 테스트"""
+    dungeon = _make_room()
+    field = FlowField.toward(dungeon, [(10, 8), (3, 3), (99, 99)])
+
+    assert field.distance_at(10, 8) == 0 and field.distance_at(3, 3) == 0
+    assert field.distance_at(4, 3) == 1
+    # (7, 8)은 벽 너머 (10, 8)보다 같은 쪽 (3, 3)이 가까움
+    assert field.distance_at(7, 8) == 4 + 5
+    assert field.distance_at(8, 5) is None  # 벽
+    assert field.steps(3, 3) == []
+
+    # 벽 오른쪽에서 출발하면 위쪽 통로로 돌아감
+    lone = FlowField.toward(dungeon, [(3, 8)])
+    assert lone.steps(9, 8) == [(9, 7)]
+    assert lone.distance_at(9, 8) == 7 + 6 + 7  # 위로, 통로 지나 왼쪽으로, 아래로
+
+    dungeon.set_tile(8, 1, TileType.LOCKED_DOOR)
+    assert FlowField.toward(dungeon, [(3, 8)]).steps(9, 8) == []
+
+
+def test_chasing_enemies_share_one_field_per_tick(monkeypatch):
+    """추적 중인 적들이 벽을 돌아 플레이어에게 다가가고 거리 맵은 틱마다 한 번만 계산되는지 테스트"""
+    dungeon = _make_room()
+    exploration = ExplorationSystem(dungeon, [])
+    exploration.player.x, exploration.player.y = 3, 8
+    exploration.enemies = [
+        Enemy(x=9, y=8, level=1, detection_range=20, max_chase_distance=40, max_chase_turns=40),
+        Enemy(x=12, y=9, level=1, detection_range=20, max_chase_distance=40, max_chase_turns=40),
+    ]
+
+    built = []
+    original = FlowField.toward
+    monkeypatch.setattr(FlowField, "toward", classmethod(lambda cls, d, goals: built.append(1) or original(d, goals)))
+    exploration._move_all_enemies()
+    monkeypatch.undo()
+    assert len(built) == 1
+    assert exploration._chase_field is None
+
+    first = exploration.enemies[0]
+    assert (first.x, first.y) == (9, 7)
+    for _ in range(40):
+        exploration._move_all_enemies()
+    assert (first.x, first.y) == (3, 8)
+
+
+def test_returning_enemy_heads_to_spawn_not_player(monkeypatch):
+    """추적하지 않는 적은 플레이어 거리 맵 대신 스폰 위치로 돌아가는지 테스트"""
+    dungeon = _make_room()
+    exploration = ExplorationSystem(dungeon, [])
+    exploration.player.x, exploration.player.y = 3, 8
+    enemy = Enemy(x=12, y=5, level=1, detection_range=2)
+    enemy.spawn_x, enemy.spawn_y = 15, 5
+    exploration.enemies = [enemy]
+
+    built = []
+    original = FlowField.toward
+    monkeypatch.setattr(FlowField, "toward", classmethod(lambda cls, d, goals: built.append(1) or original(d, goals)))
+    for _ in range(3):
+        exploration._move_all_enemies()
+    assert (enemy.x, enemy.y) == (15, 5)
+    assert not enemy.is_chasing and built == []
@@ -0,0 +1,58 @@
+"""
+FOV 시스템 테스트
+"""
+
+import numpy as np
+
+from src.world.dungeon_generator import DungeonMap
+from src.world.fov import FOVSystem
+from src.world.tile import TileType
+
+
+def _make_room(width: int = 30, height: int = 20) -> DungeonMap:
+    """벽으로 둘러싼 빈 방, (15, 2)~(15, 17) 세로 벽 하나"""
+    dungeon = DungeonMap(width, height)
+    for y in range(height):
+        for x in range(width):
+            edge = x in (0, width - 1) or y in (0, height - 1)
+            dungeon.set_tile(x, y, TileType.WALL if edge or (x == 15 and 2 <= y < 18) else TileType.FLOOR)
+    return dungeon
+
+
+def test_fov_updates_only_changed_cells():
+    """이동 시 시야 차이만 반영되어 visible이 현재 시야와 정확히 같은지 테스트"""
+    dungeon = _make_room()
+    dungeon.set_tile(5, 5, TileType.CHEST, loot_id="gold_chest")
+    chest = dungeon.get_tile(5, 5)
+    fov = FOVSystem(default_radius=4)
+
+    visible = fov.compute_fov(dungeon, 5, 8)
+    assert (5, 8) in visible and (5, 5) in visible and chest.visible
+    assert not any(x > 15 for x, _ in visible)
+
+    visible = fov.compute_fov(dungeon, 8, 12)
+    assert (dungeon.grid.visible == fov.compute_fov_mask(dungeon, 8, 12)).all()
+    assert set(zip(*np.nonzero(dungeon.grid.visible)[::-1])) == visible
+    assert fov.last_gained > 0 and fov.last_lost > 0
+    # 더 이상 보이지 않아도 탐험 기록은 남음
+    assert not chest.visible and chest.explored
+    assert dungeon.grid.explored.sum() > dungeon.grid.visible.sum()
+
+
+def test_fov_handles_map_change_and_clear():
+    """다른 맵으로 바뀌면 한 번 전체 초기화하고 clear_visibility 후에도 차이 갱신이 이어지는지 테스트"""
+    fov = FOVSystem(default_radius=3)
+    first = _make_room()
+    fov.compute_fov(first, 3, 3)
+
+    second = _make_room()
+    second.grid.visible[:] = True  # 외부에서 남긴 가시성
+    fov.compute_fov(second, 20, 10)
+    assert not second.grid.visible[3, 3]
+    assert second.grid.visible[10, 20]
+
+    fov.clear_visibility(second)
+    assert not second.grid.visible.any() and fov.visible_tiles == set()
+    fov.compute_fov(second, 21, 10)
+    assert fov.last_lost == 0
+    assert (second.grid.visible == fov.compute_fov_mask(second, 21, 10)).all()
@@ -0,0 +1,96 @@
+"""
+맵 렌더러 테스트
+"""
+
+import tcod
+
+from src.world.dungeon_generator import DungeonMap
+from src.world.environmental_effects import (
+    EnvironmentalEffect, EnvironmentalEffectManager, EnvironmentalEffectType
+)
+from src.world.fov import FOVSystem
+from src.world.map_renderer import MapRenderer
+from src.world.tile import TileType
+
+
+def _make_map() -> DungeonMap:
+    dungeon = DungeonMap(12, 8)
+    for y in range(8):
+        for x in range(12):
+            dungeon.set_tile(x, y, TileType.WALL if y in (0, 7) else TileType.FLOOR)
+    dungeon.set_tile(3, 3, TileType.SPIKE_TRAP)
+    dungeon.set_tile(4, 3, TileType.CHEST, loot_id="gold")
+    dungeon.set_tile(5, 3, TileType.PUZZLE, puzzle_solved=True)
+    return dungeon
+
+
+def test_render_writes_explored_cells_with_dimming():
+    """탐험한 셀만 쓰고, 함정/해결된 퍼즐은 바닥으로, 시야 밖은 1/4 밝기로 그리는지 테스트"""
+    dungeon = _make_map()
+    dungeon.grid.explored[:, :6] = True
+    dungeon.grid.visible[:, :4] = True
+
+    console = tcod.console.Console(20, 12)
+    console.rgb["ch"] = ord("~")
+    MapRenderer(map_x=1, map_y=2).render(console, dungeon, view_width=20, view_height=8)
+
+    rgb = console.rgb
+    assert chr(rgb["ch"][2, 1]) == "#"
+    assert chr(rgb["ch"][5, 4]) == "." and tuple(rgb["fg"][5, 4]) == (100, 100, 100)  # 함정
+    assert chr(rgb["ch"][5, 5]) == "C" and tuple(rgb["fg"][5, 5]) == (255 // 4, 215 // 4, 0)
+    assert chr(rgb["ch"][5, 6]) == "." and tuple(rgb["fg"][5, 6]) == (25, 25, 25)  # 해결된 퍼즐
+    assert chr(rgb["ch"][5, 7]) == "~"  # 탐험하지 않은 셀은 그대로
+    assert chr(rgb["ch"][0, 0]) == "~"
+
+
+def test_overlay_layer_uses_first_effect_and_tracks_changes():
+    """오버레이 레이어가 먼저 추가된 효과 색을 쓰고 효과 변경 시 다시 계산되는지 테스트"""
+    dungeon = _make_map()
+    dungeon.grid.explored[:] = True
+    dungeon.grid.visible[:] = True
+    manager = EnvironmentalEffectManager()
+    manager.add_effect(EnvironmentalEffect(EnvironmentalEffectType.BLOOD_MOON, affected_tiles={(2, 2), (6, 6)}))
+    manager.add_effect(EnvironmentalEffect(EnvironmentalEffectType.DARKNESS, affected_tiles={(2, 2), (3, 2)}))
+    dungeon.environment_effect_manager = manager
+
+    console = tcod.console.Console(12, 8)
+    MapRenderer(map_x=0, map_y=0).render(console, dungeon, view_width=12, view_height=8)
+    # 바닥 (100,100,100) + 피의 달 (150,0,0)
+    assert tuple(console.rgb["fg"][2, 2]) == (125, 50, 50)
+    assert tuple(console.rgb["bg"][2, 2]) == (45, 0, 0)
+    assert tuple(console.rgb["fg"][2, 3]) == (60, 60, 60)
+
+    manager.remove_effect(EnvironmentalEffectType.BLOOD_MOON)
+    mask, colors = manager.color_layer(dungeon.width, dungeon.height)
+    assert not mask[6, 6] and tuple(colors[2, 2]) == (20, 20, 20)
+    assert manager.color_layer(dungeon.width, dungeon.height)[0] is mask
+
+
+def test_static_layer_redraws_only_dirty_regions():
+    """정적 레이어를 캐시하고 타일 변경/FOV 변화 영역만 다시 계산하는지 테스트"""
+    dungeon = _make_map()
+    dungeon.grid.explored[:] = True
+    renderer = MapRenderer(map_x=0, map_y=0)
+    console = tcod.console.Console(12, 8)
+
+    renderer.render(console, dungeon, view_width=12, view_height=8)
+    assert renderer.last_rebuilt == 12 * 8
+    renderer.render(console, dungeon, view_width=12, view_height=8)
+    assert renderer.last_rebuilt == 0
+
+    # 퍼즐/상자 같은 드문 타일의 필드 변경도 더티 영역으로 기록
+    dungeon.get_tile(4, 3).char = "c"
+    dungeon.set_tile(8, 4, TileType.WALL)
+    dungeon.get_tile(8, 4).explored = True
+    renderer.render(console, dungeon, view_width=12, view_height=8)
+    assert renderer.last_rebuilt == 2
+    assert chr(console.rgb["ch"][3, 4]) == "c" and chr(console.rgb["ch"][4, 8]) == "#"
+
+    fov = FOVSystem(default_radius=2)
+    fov.compute_fov(dungeon, 2, 4)
+    renderer.render(console, dungeon, view_width=12, view_height=8)
+    fov.compute_fov(dungeon, 3, 4)
+    renderer.render(console, dungeon, view_width=12, view_height=8)
+    assert 0 < renderer.last_rebuilt < 12 * 8
+    assert tuple(console.rgb["fg"][4, 5]) == (100, 100, 100)
+    assert tuple(console.rgb["fg"][4, 0]) == (25, 25, 25)
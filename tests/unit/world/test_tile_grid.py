@@ -0,0 +1,87 @@
+"""
+배열 기반 타일 그리드 테스트
+"""
+
+from src.world.dungeon_generator import DungeonMap
+from src.world.tile import Tile, TileType
+from src.world.tile_grid import TileView
+
+
+def test_plain_tiles_are_array_backed_views():
+    """일반 타일은 배열을 읽고 쓰는 프록시이고 Tile과 같은 값을 내는지 테스트"""
+    dungeon = DungeonMap(20, 10)
+    dungeon.set_tile(3, 4, TileType.FLOOR)
+    dungeon.set_tile(5, 4, TileType.LOCKED_DOOR)
+
+    floor = dungeon.get_tile(3, 4)
+    assert isinstance(floor, TileView)
+    reference = Tile(TileType.FLOOR, 3, 4)
+    assert (floor.tile_type, floor.walkable, floor.char, floor.fg_color) == (
+        reference.tile_type, reference.walkable, reference.char, reference.fg_color
+    )
+    assert not hasattr(floor, "building")
+
+    floor.explored = True
+    assert dungeon.grid.explored[4, 3] and dungeon.tiles[4][3].explored
+    assert dungeon.grid.type_mask(TileType.FLOOR).sum() == 1
+
+    # 잠긴 문 해제: 배열과 표시 문자 모두 Tile.unlock과 같게
+    assert not dungeon.is_walkable(5, 4)
+    dungeon.get_tile(5, 4).unlock()
+    door = dungeon.get_tile(5, 4)
+    assert dungeon.is_walkable(5, 4)
+    assert door.tile_type == TileType.DOOR and door.char == "+" and door.fg_color == (200, 150, 50)
+    assert dungeon.grid.nbytes == 6 * 20 * 10
+
+
+def test_rare_tiles_keep_payload_and_tile_semantics():
+    """개별 데이터가 있는 타일은 Tile 객체로 보관되고 교체 전 참조가 값을 유지하는지 테스트"""
+    dungeon = DungeonMap(10, 10)
+    dungeon.set_tile(2, 2, TileType.NPC, npc_id="merchant", npc_subtype="trader")
+    npc = dungeon.get_tile(2, 2)
+    assert isinstance(npc, Tile) and dungeon.get_tile(2, 2) is npc
+
+    # 타입만 바꿔도 문자는 그대로 (기존 Tile과 같은 동작)
+    dungeon.set_tile(1, 1, TileType.FLOOR)
+    plain = dungeon.get_tile(1, 1)
+    plain.tile_type = TileType.DROPPED_ITEM
+    plain.dropped_item = "potion"
+    promoted = dungeon.get_tile(1, 1)
+    assert isinstance(promoted, Tile)
+    assert promoted.char == "." and promoted.dropped_item == "potion"
+    assert dungeon.grid.type_mask(TileType.DROPPED_ITEM)[1, 1]
+
+    # 셀 교체 후에도 이전 참조는 예전 값을 유지하고 새 셀에 영향을 주지 않음
+    dungeon.set_tile(2, 2, TileType.FLOOR)
+    assert npc.npc_id == "merchant"
+    npc.walkable = False
+    assert dungeon.is_walkable(2, 2) and dungeon.get_tile(2, 2).npc_id is None
+
+    # tiles[y][x] 대입 호환
+    dungeon.tiles[3][4] = Tile(TileType.WALL, 4, 3)
+    assert dungeon.get_tile(4, 3).tile_type == TileType.WALL
+    assert not dungeon.grid.walkable[3, 4]
+    assert len(dungeon.tiles) == 10 and len(dungeon.tiles[0]) == 10
+    assert dungeon.tiles is dungeon.tiles
+
+
+def test_rare_tiles_follow_bulk_array_writes():
+    """배열을 일괄로 바꿔도 드문 타일의 visible/explored가 배열과 같게 읽히는지 테스트"""
+    dungeon = DungeonMap(8, 8)
+    dungeon.set_tile(2, 3, TileType.CHEST, loot_id="gold_chest")
+    chest = dungeon.get_tile(2, 3)
+    chest.visible = True
+    assert dungeon.grid.visible[3, 2]
+
+    # 시야 초기화처럼 배열 전체를 직접 쓰는 경우
+    dungeon.grid.visible[:] = False
+    assert not chest.visible and not dungeon.get_tile(2, 3).visible
+    dungeon.grid.visible[:] = True
+    dungeon.grid.explored[:] = True
+    assert chest.visible and chest.explored
+
+    # 교체된 뒤에는 그 시점 값을 유지하고 배열 변경을 따라가지 않음
+    dungeon.set_tile(2, 3, TileType.FLOOR)
+    dungeon.grid.visible[:] = False
+    assert chest.visible and chest.explored
+    assert not dungeon.get_tile(2, 3).visible